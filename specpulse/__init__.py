@@ -3,12 +3,24 @@ SpecPulse: Specification-Driven Development Framework
 Built for the AI era
 """
 
+# SPECPULSE_IMPORT_PROFILE=1 prints a per-module import cost table at exit
+from .utils import import_profile as _import_profile
+if _import_profile.enabled_by_env():
+    _import_profile.enable()
+
 from ._version import __version__
 
 __author__ = "SpecPulse"
 __url__ = "https://github.com/specpulse"
 
-from .core.specpulse import SpecPulse
 # from .cli.main import main  # We'll use the refactored main
 
 __all__ = ["SpecPulse", "main", "__version__"]
+
+
+def __getattr__(name):
+    """Import SpecPulse on first access so the CLI does not pay for core at startup"""
+    if name == "SpecPulse":
+        from .core.specpulse import SpecPulse
+        return SpecPulse
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
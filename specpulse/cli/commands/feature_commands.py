@@ -9,7 +9,6 @@ from pathlib import Path
 from datetime import datetime
 import re
 from typing import Optional
-import yaml
 
 
 class FeatureCommands:
@@ -6,6 +6,7 @@ from pathlib import Path
 from datetime import datetime
 import re
 from typing import Optional
+from ...core.project_session import session_for
 
 
 class PlanCommands:
@@ -133,11 +134,9 @@ class PlanCommands:
 
     def _detect_current_feature(self) -> Optional[str]:
         """Detect current feature from context"""
-        context_file = self.memory_dir / "context.md"
-        if not context_file.exists():
+        content = session_for(self.project_root).read_text(self.memory_dir / "context.md")
+        if content is None:
             return None
-
-        content = context_file.read_text(encoding='utf-8')
         matches = re.findall(r'### Active Feature:.*?\n- Feature ID: (\d{3})', content)
         return matches[-1] if matches else None
 
@@ -326,11 +325,9 @@ Create: task-001.md, task-002.md, etc.
 
     def _detect_current_feature(self) -> Optional[str]:
         """Detect current feature"""
-        context_file = self.memory_dir / "context.md"
-        if not context_file.exists():
+        content = session_for(self.project_root).read_text(self.memory_dir / "context.md")
+        if content is None:
             return None
-
-        content = context_file.read_text(encoding='utf-8')
         matches = re.findall(r'### Active Feature:.*?\n- Feature ID: (\d{3})', content)
         return matches[-1] if matches else None
 
@@ -470,11 +467,9 @@ class ExecuteCommands:
 
     def _detect_current_feature(self) -> Optional[str]:
         """Detect current feature"""
-        context_file = self.memory_dir / "context.md"
-        if not context_file.exists():
+        content = session_for(self.project_root).read_text(self.memory_dir / "context.md")
+        if content is None:
             return None
-
-        content = context_file.read_text(encoding='utf-8')
         matches = re.findall(r'### Active Feature:.*?\n- Feature ID: (\d{3})', content)
         return matches[-1] if matches else None
 
@@ -16,6 +16,8 @@ from ...utils.llm_safe_template_system import get_template_system
 from ...utils.universal_id_generator import get_universal_id_generator, IDType
 from ...utils.memory_id_manager import MemoryIDManager
 from ...utils.error_handler import ErrorHandler, ValidationError
+from ...core.feature_catalog import artifact_files
+from ...core.project_session import session_for
 
 
 class SafeCommands:
@@ -47,6 +49,7 @@ class SafeCommands:
 
             # Get feature info
             feature_dir_name = f"{feature_id}-{self.file_ops.sanitize_feature_name(feature_name)}"
+            self._catalog().record(feature_dir_name)
 
             # Update context file safely
             context_content = self._generate_feature_context(feature_id, feature_name, feature_dir_name)
@@ -671,8 +674,13 @@ class SafeCommands:
 
         return base_hours[complexity]
 
-    def _get_feature_info_safe(self, feature_dir_name: str, verbose: bool) -> Dict:
-        """Get feature information using safe operations."""
+    def _catalog(self):
+        """Feature catalog of the .specpulse/ specs, plans and tasks"""
+        return session_for(self.project_root).feature_catalog(self.project_root / ".specpulse")
+
+    def _get_feature_info_safe(self, feature_dir_name: str, verbose: bool,
+                               entry: Optional[Dict] = None) -> Dict:
+        """Get feature information using safe operations (from the catalog entry if given)."""
         if not self.file_ops.validate_feature_dir_name(feature_dir_name):
             return None
 
@@ -688,33 +696,36 @@ class SafeCommands:
             "latest_files": {}
         }
 
+        if entry is None:
+            entry = self._catalog().get(feature_dir_name)
+
         # Count specifications
         specs_dir = self.project_root / ".specpulse" / "specs" / feature_dir_name
         if self.file_ops.validate_file_operation(specs_dir, "read"):
-            spec_files = list(specs_dir.glob("spec-*.md"))
+            spec_files = artifact_files(entry, "specs", "spec-*.md")
             info["specifications"] = len(spec_files)
             if spec_files:
-                info["latest_files"]["spec"] = spec_files[-1].name
+                info["latest_files"]["spec"] = spec_files[-1]
 
         # Count plans
         plans_dir = self.project_root / ".specpulse" / "plans" / feature_dir_name
         if self.file_ops.validate_file_operation(plans_dir, "read"):
-            plan_files = list(plans_dir.glob("plan-*.md"))
+            plan_files = artifact_files(entry, "plans", "plan-*.md")
             info["plans"] = len(plan_files)
             if plan_files:
-                info["latest_files"]["plan"] = plan_files[-1].name
+                info["latest_files"]["plan"] = plan_files[-1]
 
         # Count tasks
         tasks_dir = self.project_root / ".specpulse" / "tasks" / feature_dir_name
         if self.file_ops.validate_file_operation(tasks_dir, "read"):
             task_files = []
-            for item in tasks_dir.glob("*.md"):
-                is_valid, id_type, _ = self.id_generator.validate_id_format(item.name)
+            for name in artifact_files(entry, "tasks"):
+                is_valid, id_type, _ = self.id_generator.validate_id_format(name)
                 if id_type in [IDType.TASK, IDType.SERVICE_TASK]:
-                    task_files.append(item)
+                    task_files.append(name)
             info["tasks"] = len(task_files)
             if task_files:
-                info["latest_files"]["task"] = task_files[-1].name
+                info["latest_files"]["task"] = task_files[-1]
 
         return info
 
@@ -727,9 +738,9 @@ class SafeCommands:
             return features
 
         try:
-            for item in specs_dir.iterdir():
-                if item.is_dir() and self.file_ops.validate_feature_dir_name(item.name):
-                    feature_info = self._get_feature_info_safe(item.name, verbose)
+            for name, entry in self._catalog().refresh().items():
+                if self.file_ops.validate_feature_dir_name(name):
+                    feature_info = self._get_feature_info_safe(name, verbose, entry)
                     if feature_info:
                         features.append(feature_info)
         except (OSError, IOError):
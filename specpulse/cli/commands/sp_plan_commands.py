@@ -6,7 +6,6 @@ sp-plan Commands - Implementation Plan Management
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, List
-import yaml
 import re
 
 from ...utils.console import Console
@@ -17,6 +16,7 @@ from ...utils.error_handler import (
 from ...core.template_manager import TemplateManager
 from ...core.validator import Validator
 from ...core.specpulse import SpecPulse
+from ...core.project_session import session_for
 
 
 class SpPlanCommands:
@@ -487,60 +487,13 @@ STATUS: draft
 
     def _get_current_feature(self, feature_name: Optional[str] = None) -> Optional[Path]:
         """Get current feature directory from context or parameter"""
-
-        if feature_name:
-            # Find by name or ID
-            return self._find_feature_directory(feature_name)
-
-        # Try to get from context
-        context_file = self.project_root / "memory" / "context.md"
-
-        if context_file.exists():
-            content = context_file.read_text(encoding='utf-8')
-
-            # Parse active feature
-            match = re.search(r'Feature ID[:\s]+(\d{3})', content)
-            if match:
-                feature_id = match.group(1)
-                return self._find_feature_directory(feature_id)
-
-            # Try directory name
-            match = re.search(r'Directory[:\s]+([^\n]+)', content)
-            if match:
-                feature_dir_name = match.group(1).strip()
-                specs_dir = self.project_root / "specs" / feature_dir_name
-                if specs_dir.exists():
-                    return specs_dir.parent / feature_dir_name
-
-        # Fall back to most recent feature
-        specs_dir = self.project_root / "specs"
-        if specs_dir.exists():
-            features = sorted([d for d in specs_dir.iterdir() if d.is_dir() and re.match(r'^\d{3}-', d.name)])
-            if features:
-                return features[-1]
-
-        return None
+        return session_for(self.project_root).current_feature_dir(
+            self.project_root / "memory" / "context.md", self.project_root / "specs", feature_name
+        )
 
     def _find_feature_directory(self, identifier: str) -> Optional[Path]:
         """Find feature directory by ID or name"""
-        specs_dir = self.project_root / "specs"
-
-        if not specs_dir.exists():
-            return None
-
-        # Try exact match
-        for item in specs_dir.iterdir():
-            if item.is_dir():
-                if item.name == identifier or item.name.startswith(f"{identifier}-"):
-                    return item
-
-        # Try partial match
-        identifier_lower = identifier.lower()
-        for item in specs_dir.iterdir():
-            if item.is_dir() and identifier_lower in item.name.lower():
-                return item
-
-        return None
+        return session_for(self.project_root).find_feature_dir(self.project_root / "specs", identifier)
 
     def _get_next_plan_number(self, plans_dir: Path) -> int:
         """Get next available plan number"""
@@ -18,6 +18,8 @@ from ...utils.error_handler import (
 )
 from ...core.memory_manager import MemoryManager
 from ...core.feature_id_generator import FeatureIDGenerator
+from ...core.feature_catalog import artifact_files
+from ...core.project_session import session_for
 
 
 class SpPulseCommands:
@@ -81,6 +83,7 @@ class SpPulseCommands:
                     progress.update(task, advance=1)
 
             self.console.success(f"Created feature directories")
+            self._catalog().record(feature_dir_name)
 
             # Update context
             self._update_context(feature_id, sanitized_name, feature_dir_name)
@@ -265,6 +268,8 @@ class SpPulseCommands:
                     self.console.error(f"Security violation: {str(e)}")
                     return False
 
+            self._catalog().remove(feature_dir_name)
+
             # Note: Git branch deletion skipped (manual operation recommended)
             # User should manually delete branch if needed: git branch -D <branch-name>
 
@@ -345,53 +350,26 @@ class SpPulseCommands:
         context_file.write_text(content, encoding='utf-8')
         self.console.success("Updated project context")
 
+    def _catalog(self):
+        """Feature catalog for the specs/, plans/ and tasks/ directories used here"""
+        return session_for(self.project_root).feature_catalog(self.project_root)
+
     def _find_feature_directory(self, identifier: str) -> Optional[Path]:
         """Find feature directory by ID or name"""
-        specs_dir = self.project_root / "specs"
-
-        if not specs_dir.exists():
-            return None
-
-        # Try exact match first
-        for item in specs_dir.iterdir():
-            if item.is_dir():
-                if item.name == identifier or item.name.startswith(f"{identifier}-"):
-                    return item
-
-        # Try partial match
-        identifier_lower = identifier.lower()
-        for item in specs_dir.iterdir():
-            if item.is_dir() and identifier_lower in item.name.lower():
-                return item
-
-        return None
+        name = self._catalog().find(identifier)
+        return self.project_root / "specs" / name if name else None
 
     def _list_features(self):
         """Display all features in a table"""
-        specs_dir = self.project_root / "specs"
-
-        if not specs_dir.exists() or not any(specs_dir.iterdir()):
-            self.console.warning("No features found")
-            return
-
         features = []
-        for item in specs_dir.iterdir():
-            if item.is_dir() and re.match(r'^\d{3}-', item.name):
-                parts = item.name.split('-', 1)
-                feature_id = parts[0] if parts else ""
-                feature_name = parts[1] if len(parts) >= 2 else ""
-
-                # Count artifacts
-                specs_count = len(list((self.project_root / "specs" / item.name).glob("*.md")))
-                plans_count = len(list((self.project_root / "plans" / item.name).glob("*.md")))
-                tasks_count = len(list((self.project_root / "tasks" / item.name).glob("*.md")))
-
+        for name, entry in self._catalog().refresh().items():
+            if re.match(r'^\d{3}-', name):
                 features.append({
-                    "ID": feature_id,
-                    "Name": feature_name,
-                    "Specs": specs_count,
-                    "Plans": plans_count,
-                    "Tasks": tasks_count
+                    "ID": entry["id"],
+                    "Name": entry["name"],
+                    "Specs": len(entry["specs"]["files"]),
+                    "Plans": len(entry["plans"]["files"]),
+                    "Tasks": len(entry["tasks"]["files"])
                 })
 
         if not features:
@@ -411,13 +389,10 @@ class SpPulseCommands:
         self.console.header(f"Feature Status: {feature_dir_name}", style="bright_cyan")
 
         # Count artifacts
-        specs_dir = self.project_root / "specs" / feature_dir_name
-        plans_dir = self.project_root / "plans" / feature_dir_name
-        tasks_dir = self.project_root / "tasks" / feature_dir_name
-
-        specs = list(specs_dir.glob("*.md")) if specs_dir.exists() else []
-        plans = list(plans_dir.glob("*.md")) if plans_dir.exists() else []
-        tasks = list(tasks_dir.glob("*.md")) if tasks_dir.exists() else []
+        entry = self._catalog().get(feature_dir_name)
+        specs = artifact_files(entry, "specs")
+        plans = artifact_files(entry, "plans")
+        tasks = artifact_files(entry, "tasks")
 
         # Display status
         self.console.info(f"  Specifications: {len(specs)}")
@@ -428,17 +403,17 @@ class SpPulseCommands:
         if specs:
             self.console.info("\nSpecifications:")
             for spec in specs:
-                self.console.info(f"  - {spec.name}")
+                self.console.info(f"  - {spec}")
 
         if plans:
             self.console.info("\nPlans:")
             for plan in plans:
-                self.console.info(f"  - {plan.name}")
+                self.console.info(f"  - {plan}")
 
         if tasks:
             self.console.info("\nTasks:")
             for task in tasks:
-                self.console.info(f"  - {task.name}")
+                self.console.info(f"  - {task}")
 
     def _display_next_steps(self, feature_dir_name: str):
         """Display next steps after feature initialization"""
@@ -6,8 +6,10 @@ sp-task Commands - Task Management and Execution
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, List
-import yaml
+import os
 import re
+import stat
+import tempfile
 
 from ...utils.console import Console
 from ...utils.path_validator import PathValidator, SecurityError
@@ -16,6 +18,9 @@ from ...utils.error_handler import (
 )
 from ...core.template_manager import TemplateManager
 from ...core.specpulse import SpecPulse
+from ...core.project_session import session_for
+from ...core.feature_catalog import artifact_files
+from ...core.task_scheduler import TaskScheduler
 
 
 class SpTaskCommands:
@@ -119,6 +124,7 @@ PROGRESS: 0
 
             # Write task file
             safe_task_path.write_text(content, encoding='utf-8')
+            self._record_task_file(safe_task_path, content)
 
             self.console.success(f"Created: {safe_task_path.relative_to(self.project_root)}")
             self.console.info(f"\nNext steps:")
@@ -172,6 +178,7 @@ PROGRESS: 0
 """
                 content += new_task
                 task_file.write_text(content, encoding='utf-8')
+                self._record_task_file(task_file, content)
 
                 self.console.success(f"Added task to: {task_file.relative_to(self.project_root)}")
             else:
@@ -252,57 +259,7 @@ PROGRESS: 0
         Returns:
             bool: True if successful, False otherwise
         """
-        try:
-            # SECURITY: Validate task ID format
-            try:
-                PathValidator.validate_spec_id(task_id)
-            except ValueError as e:
-                raise ValidationError(f"Invalid task ID: {str(e)}")
-
-            feature_dir = self._get_current_feature(feature_name)
-
-            if not feature_dir:
-                self.console.error("No active feature found")
-                return False
-
-            task_path = self.project_root / "tasks" / feature_dir.name / f"tasks-{task_id}.md"
-
-            if not task_path.exists():
-                self.console.error(f"Task file not found: tasks-{task_id}.md")
-                return False
-
-            content = task_path.read_text(encoding='utf-8')
-
-            # Update STATUS in metadata
-            content = re.sub(
-                r'STATUS: \w+',
-                'STATUS: in_progress',
-                content
-            )
-
-            # Add started timestamp
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            started_marker = f"\n**Started**: {timestamp}\n"
-
-            if "**Started**:" not in content:
-                # Add after metadata
-                lines = content.split('\n')
-                for i, line in enumerate(lines):
-                    if line.strip().startswith('-->'):
-                        lines.insert(i + 1, started_marker)
-                        break
-                content = '\n'.join(lines)
-
-            task_path.write_text(content, encoding='utf-8')
-
-            self.console.success(f"Task started: tasks-{task_id}.md")
-            self.console.info(f"Status: in_progress")
-
-            return True
-
-        except Exception as e:
-            self.console.error(f"Failed to start task: {str(e)}")
-            return False
+        return self.start_tasks([task_id], feature_name)
 
     def done(self, task_id: str, feature_name: Optional[str] = None) -> bool:
         """
@@ -315,65 +272,37 @@ PROGRESS: 0
         Returns:
             bool: True if successful, False otherwise
         """
-        try:
-            # SECURITY: Validate task ID format
-            try:
-                PathValidator.validate_spec_id(task_id)
-            except ValueError as e:
-                raise ValidationError(f"Invalid task ID: {str(e)}")
-
-            feature_dir = self._get_current_feature(feature_name)
-
-            if not feature_dir:
-                self.console.error("No active feature found")
-                return False
-
-            task_path = self.project_root / "tasks" / feature_dir.name / f"tasks-{task_id}.md"
-
-            if not task_path.exists():
-                self.console.error(f"Task file not found: tasks-{task_id}.md")
-                return False
+        return self.done_tasks([task_id], feature_name)
 
-            content = task_path.read_text(encoding='utf-8')
-
-            # Update STATUS in metadata
-            content = re.sub(
-                r'STATUS: \w+',
-                'STATUS: completed',
-                content
-            )
-
-            # Update PROGRESS to 100
-            content = re.sub(
-                r'PROGRESS: \d+',
-                'PROGRESS: 100',
-                content
-            )
-
-            # Add completed timestamp
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            completed_marker = f"\n**Completed**: {timestamp}\n"
+    def start_tasks(self, task_ids: List[str], feature_name: Optional[str] = None,
+                    all_tasks: bool = False) -> bool:
+        """
+        Mark several tasks as started in one pass
 
-            if "**Completed**:" not in content:
-                # Add after metadata
-                lines = content.split('\n')
-                for i, line in enumerate(lines):
-                    if line.strip().startswith('-->'):
-                        lines.insert(i + 1, completed_marker)
-                        break
-                content = '\n'.join(lines)
+        Args:
+            task_ids: Task IDs ("001" or "T001")
+            feature_name: Optional feature name/ID
+            all_tasks: Start every task of the feature that is not started yet
 
-            task_path.write_text(content, encoding='utf-8')
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self._transition_tasks(task_ids, "in_progress", feature_name, all_tasks)
 
-            self.console.success(f"Task completed: tasks-{task_id}.md")
-            self.console.info(f"Status: completed")
-            self.console.info(f"Progress: 100%")
+    def done_tasks(self, task_ids: List[str], feature_name: Optional[str] = None,
+                   all_tasks: bool = False) -> bool:
+        """
+        Mark several tasks as completed in one pass
 
-            return True
+        Args:
+            task_ids: Task IDs ("001" or "T001")
+            feature_name: Optional feature name/ID
+            all_tasks: Complete every task of the feature that is not completed yet
 
-        except Exception as e:
-            self.console.error(f"Failed to complete task: {str(e)}")
-            return False
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self._transition_tasks(task_ids, "completed", feature_name, all_tasks)
 
     def list_tasks(self, feature_name: Optional[str] = None) -> bool:
         """
@@ -392,8 +321,7 @@ PROGRESS: 0
                 self.console.error("No active feature found")
                 return False
 
-            tasks_dir = self.project_root / "tasks" / feature_dir.name
-            tasks = sorted(tasks_dir.glob("tasks-*.md"))
+            tasks = self._task_files(feature_dir)
 
             if not tasks:
                 self.console.warning(f"No tasks found in {feature_dir.name}")
@@ -401,22 +329,14 @@ PROGRESS: 0
 
             self.console.header(f"Tasks in {feature_dir.name}", style="bright_cyan")
 
+            task_index = session_for(self.project_root).task_index
             for task_path in tasks:
-                # Extract metadata
-                content = task_path.read_text(encoding='utf-8')
-                status = "pending"
-                progress = 0
-
-                # Parse metadata
-                status_match = re.search(r'STATUS: (\w+)', content)
-                if status_match:
-                    status = status_match.group(1)
-
-                progress_match = re.search(r'PROGRESS: (\d+)', content)
-                if progress_match:
-                    progress = int(progress_match.group(1))
-
-                self.console.info(f"  • {task_path.name} - Status: {status}, Progress: {progress}%")
+                # Metadata from the task index (header read only if the file changed)
+                metadata = task_index.get(task_path)
+                self.console.info(
+                    f"  • {task_path.name} - Status: {metadata['status']}, Progress: {metadata['progress']}%"
+                )
+            task_index.save()
 
             return True
 
@@ -465,6 +385,33 @@ PROGRESS: 0
             self.console.error(f"Failed to show task: {str(e)}")
             return False
 
+    def ready(self, max_tasks: int = 1, agent: str = "default",
+              lease_seconds: Optional[int] = None) -> bool:
+        """
+        Claim tasks whose dependencies are satisfied
+
+        Args:
+            max_tasks: Maximum number of tasks to claim
+            agent: Agent the tasks are leased to
+            lease_seconds: Lease length in seconds (default: scheduler default)
+        """
+        try:
+            scheduler = TaskScheduler(self.project_root)
+            leases = scheduler.claim(agent, max_tasks=max_tasks, lease_seconds=lease_seconds)
+
+            if not leases:
+                self.console.warning("No ready tasks")
+                return True
+
+            self.console.success(f"Leased {len(leases)} task(s) to {agent}")
+            for lease in leases:
+                self.console.info(f"  {lease['task_id']} (lease expires {lease['expires_at']})")
+            return True
+
+        except Exception as e:
+            self.console.error(f"Failed to claim ready tasks: {str(e)}")
+            return False
+
     def progress(self, feature_name: Optional[str] = None) -> bool:
         """
         Show overall task progress
@@ -482,8 +429,7 @@ PROGRESS: 0
                 self.console.error("No active feature found")
                 return False
 
-            tasks_dir = self.project_root / "tasks" / feature_dir.name
-            task_files = list(tasks_dir.glob("tasks-*.md"))
+            task_files = self._task_files(feature_dir)
 
             if not task_files:
                 self.console.warning("No tasks found")
@@ -496,17 +442,15 @@ PROGRESS: 0
             in_progress_tasks = 0
             pending_tasks = 0
 
+            task_index = session_for(self.project_root).task_index
             for task_file in task_files:
-                content = task_file.read_text(encoding='utf-8')
-
-                # Count individual tasks (look for task markers)
-                task_count = content.count("### Task:")
-                total_tasks += task_count
-
-                # Count statuses
-                completed_tasks += content.count('**Status**: completed')
-                in_progress_tasks += content.count('**Status**: in_progress')
-                pending_tasks += content.count('**Status**: pending')
+                # Counts from the task index (file read only if it changed)
+                counts = task_index.counts(task_file)
+                total_tasks += counts["total"]
+                completed_tasks += counts["completed"]
+                in_progress_tasks += counts["in_progress"]
+                pending_tasks += counts["pending"]
+            task_index.save()
 
             # Calculate percentage
             if total_tasks > 0:
@@ -531,59 +475,140 @@ PROGRESS: 0
 
     def _get_current_feature(self, feature_name: Optional[str] = None) -> Optional[Path]:
         """Get current feature directory from context or parameter"""
+        return session_for(self.project_root).current_feature_dir(
+            self.project_root / "memory" / "context.md", self.project_root / "specs", feature_name
+        )
 
-        if feature_name:
-            return self._find_feature_directory(feature_name)
-
-        # Try to get from context
-        context_file = self.project_root / "memory" / "context.md"
-
-        if context_file.exists():
-            content = context_file.read_text(encoding='utf-8')
+    def _find_feature_directory(self, identifier: str) -> Optional[Path]:
+        """Find feature directory by ID or name"""
+        return session_for(self.project_root).find_feature_dir(self.project_root / "specs", identifier)
 
-            # Parse active feature
-            match = re.search(r'Feature ID[:\s]+(\d{3})', content)
-            if match:
-                feature_id = match.group(1)
-                return self._find_feature_directory(feature_id)
+    def _transition_tasks(self, task_ids: List[str], status: str,
+                          feature_name: Optional[str] = None, all_tasks: bool = False) -> bool:
+        """
+        Move task files to status, writing each atomically
 
-            # Try directory name
-            match = re.search(r'Directory[:\s]+([^\n]+)', content)
-            if match:
-                feature_dir_name = match.group(1).strip()
-                specs_dir = self.project_root / "specs" / feature_dir_name
-                if specs_dir.exists():
-                    return specs_dir.parent / feature_dir_name
+        Every task is validated and resolved before anything is written; the
+        task index is saved and the result reported once for the whole batch.
+        """
+        action = "start" if status == "in_progress" else "complete"
+        try:
+            # SECURITY: Validate task ID format
+            try:
+                task_ids = [PathValidator.validate_spec_id(self._normalize_task_id(task_id))
+                            for task_id in task_ids]
+            except ValueError as e:
+                raise ValidationError(f"Invalid task ID: {str(e)}")
 
-        # Fall back to most recent feature
-        specs_dir = self.project_root / "specs"
-        if specs_dir.exists():
-            features = sorted([d for d in specs_dir.iterdir() if d.is_dir() and re.match(r'^\d{3}-', d.name)])
-            if features:
-                return features[-1]
+            feature_dir = self._get_current_feature(feature_name)
 
-        return None
+            if not feature_dir:
+                self.console.error("No active feature found")
+                return False
 
-    def _find_feature_directory(self, identifier: str) -> Optional[Path]:
-        """Find feature directory by ID or name"""
-        specs_dir = self.project_root / "specs"
+            task_index = session_for(self.project_root).task_index
+            if all_tasks:
+                task_paths = [path for path in self._task_files(feature_dir)
+                              if task_index.get(path)["status"] != status]
+            else:
+                task_paths = []
+                for task_id in dict.fromkeys(task_ids):
+                    task_path = self.project_root / "tasks" / feature_dir.name / f"tasks-{task_id}.md"
+                    if not task_path.exists():
+                        self.console.error(f"Task file not found: tasks-{task_id}.md")
+                        return False
+                    task_paths.append(task_path)
+
+            if not task_paths:
+                self.console.warning(f"No tasks to {action}")
+                return False
 
-        if not specs_dir.exists():
-            return None
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            for task_path in task_paths:
+                content = self._apply_status(task_path.read_text(encoding='utf-8'), status, timestamp)
+                self._atomic_write_text(task_path, content)
+                task_index.record(task_path, content)
+
+                if status == "in_progress":
+                    self.console.success(f"Task started: {task_path.name}")
+                else:
+                    self.console.success(f"Task completed: {task_path.name}")
+            task_index.save()
+
+            self.console.info(f"Status: {status}")
+            if status == "completed":
+                self.console.info(f"Progress: 100%")
+            if len(task_paths) > 1:
+                self.console.info(f"Updated {len(task_paths)} tasks")
 
-        # Try exact match
-        for item in specs_dir.iterdir():
-            if item.is_dir():
-                if item.name == identifier or item.name.startswith(f"{identifier}-"):
-                    return item
+            return True
 
-        # Try partial match
-        identifier_lower = identifier.lower()
-        for item in specs_dir.iterdir():
-            if item.is_dir() and identifier_lower in item.name.lower():
-                return item
+        except Exception as e:
+            self.console.error(f"Failed to {action} task: {str(e)}")
+            return False
 
-        return None
+    @staticmethod
+    def _normalize_task_id(task_id: str) -> str:
+        """Accept T001 as well as 001"""
+        return task_id[1:] if task_id[:1] in ("T", "t") else task_id
+
+    def _apply_status(self, content: str, status: str, timestamp: str) -> str:
+        """Task file content moved to status, with its Started/Completed marker"""
+        if status == "completed":
+            content = self._update_metadata(content, STATUS=status, PROGRESS='100')
+            label = "Completed"
+        else:
+            content = self._update_metadata(content, STATUS=status)
+            label = "Started"
+
+        if f"**{label}**:" not in content:
+            # Add after metadata
+            lines = content.split('\n')
+            for i, line in enumerate(lines):
+                if line.strip().startswith('-->'):
+                    lines.insert(i + 1, f"\n**{label}**: {timestamp}\n")
+                    break
+            content = '\n'.join(lines)
+
+        return content
+
+    @staticmethod
+    def _atomic_write_text(path: Path, content: str):
+        """Write content to a temporary file next to path and rename it into place"""
+        temp_fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}_tmp_", suffix=path.suffix)
+        try:
+            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            # mkstemp creates 0600 files; keep the task file's own permissions
+            os.chmod(temp_path, stat.S_IMODE(path.stat().st_mode))
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def _task_files(self, feature_dir: Path) -> List[Path]:
+        """Sorted tasks-*.md files of a feature, listed through the feature catalog"""
+        entry = session_for(self.project_root).feature_catalog(self.project_root).get(feature_dir.name)
+        tasks_dir = self.project_root / "tasks" / feature_dir.name
+        return [tasks_dir / name for name in artifact_files(entry, "tasks", "tasks-*.md")]
+
+    def _record_task_file(self, task_path: Path, content: str):
+        """Keep the task index in sync with a task file just written"""
+        task_index = session_for(self.project_root).task_index
+        task_index.record(task_path, content)
+        task_index.save()
+
+    @staticmethod
+    def _update_metadata(content: str, **fields: str) -> str:
+        """Set fields of the SPECPULSE_METADATA block, leaving the task body untouched"""
+        match = re.search(r'<!-- SPECPULSE_METADATA\n.*?-->', content, re.DOTALL)
+        start, end = match.span() if match else (0, len(content))
+
+        block = content[start:end]
+        for key, value in fields.items():
+            block = re.sub(rf'{key}: \w+', f'{key}: {value}', block)
+        return content[:start] + block + content[end:]
 
     def _get_next_task_number(self, tasks_dir: Path) -> int:
         """Get next available task number"""
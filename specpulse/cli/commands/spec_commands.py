@@ -6,6 +6,7 @@ from pathlib import Path
 from datetime import datetime
 import re
 from typing import Optional
+from ...core.project_session import session_for
 
 
 class SpecCommands:
@@ -223,12 +224,10 @@ class SpecCommands:
 
     def _detect_current_feature(self) -> Optional[str]:
         """Detect current feature from context"""
-        context_file = self.memory_dir / "context.md"
-        if not context_file.exists():
+        content = session_for(self.project_root).read_text(self.memory_dir / "context.md")
+        if content is None:
             return None
 
-        content = context_file.read_text(encoding='utf-8')
-
         # Look for last active feature in workflow history
         matches = re.findall(r'### Active Feature:.*?\n- Feature ID: (\d{3})', content)
         if matches:
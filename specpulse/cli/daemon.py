@@ -0,0 +1,339 @@
+"""
+SpecPulse warm daemon
+
+Every `/sp-*` slash command in an AI assistant spawns a fresh
+`specpulse` process, paying interpreter start, imports and SpecPulse
+initialization each time. `specpulse daemon start` runs this module in
+the background: it keeps CommandHandlers (and with them SpecPulse,
+TemplateProvider, MemoryManager and the monitor TaskStateManager) warm
+and executes commands forwarded by the thin client in
+``daemon_client.py`` over a Unix socket at ``.specpulse/daemon.sock``.
+
+Protocol: newline-delimited JSON. A request is ``{"argv": [...],
+"version": "..."}`` or ``{"control": "ping" | "stop"}``; the daemon
+answers with ``{"stdout": "..."}`` / ``{"stderr": "..."}`` chunks as the
+command runs, then ``{"exit": code}``. ``{"fallback": reason}`` asks the
+client to run the command itself.
+
+Commands are executed one at a time because they share the process-wide
+stdout/stderr. Commands may also run in-process alongside the daemon (e.g.
+from a terminal), so warm handlers are rebuilt whenever the project state
+files they loaded have changed since the daemon's last command.
+"""
+
+import io
+import json
+import logging
+import os
+import socket
+import subprocess
+import sys
+import time
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .daemon_client import SOCKET_PATH
+
+
+logger = logging.getLogger(__name__)
+
+# Shut down after an hour without requests
+DEFAULT_IDLE_TIMEOUT = 3600.0
+
+# Components constructed up front so the first forwarded command is fast
+WARM_COMPONENTS = (
+    'specpulse', 'memory_manager', 'template_manager',
+    'sp_pulse_commands', 'sp_spec_commands', 'sp_plan_commands', 'sp_task_commands',
+    'monitor_commands',
+)
+
+# Project state that components load once at construction, relative to the root
+STATE_FILES = (
+    '.specpulse/memory/.memory_index.json',
+    '.specpulse/memory/.memory_search_index.json',
+    '.specpulse/memory/.memory_search_index.log',
+    '.specpulse/memory/.memory_stats.json',
+    '.specpulse/id_registry.json',
+)
+
+
+def is_supported() -> bool:
+    """Whether this platform provides Unix domain sockets"""
+    return hasattr(socket, "AF_UNIX")
+
+
+class _SocketStream(io.TextIOBase):
+    """Text stream that forwards writes to the client as JSON messages"""
+
+    def __init__(self, conn: socket.socket, name: str):
+        self._conn = conn
+        self._name = name
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        if text:
+            _send(self._conn, {self._name: text})
+        return len(text)
+
+
+def _send(conn: socket.socket, message: Dict[str, Any]) -> None:
+    conn.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+class DaemonServer:
+    """Serves forwarded CLI commands for one SpecPulse project"""
+
+    def __init__(self, project_root: Path, idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT):
+        self.project_root = Path(project_root).resolve()
+        self.idle_timeout = idle_timeout
+        self.commands_served = 0
+        self._handlers: Dict[Tuple[bool, bool], Any] = {}
+        self._state_signature = self.state_signature()
+        self._running = False
+
+        from .. import __version__
+        self.version = __version__
+
+    def state_signature(self) -> Tuple[Any, ...]:
+        """Stat signature of the project state files"""
+        from ..core.project_session import stat_signature
+        return tuple(stat_signature(self.project_root / name) for name in STATE_FILES)
+
+    def refresh_stale_handlers(self) -> bool:
+        """
+        Drop warm handlers if the state files changed outside the daemon
+
+        Returns:
+            True if handlers were dropped (they are rebuilt on next use)
+        """
+        signature = self.state_signature()
+        if signature == self._state_signature:
+            return False
+        self._state_signature = signature
+        if self._handlers:
+            logger.debug("Project state changed outside the daemon; rebuilding handlers")
+            self._handlers.clear()
+            return True
+        return False
+
+    def handler_for(self, args: Any) -> Any:
+        """Warm CommandHandler for the parsed arguments' console options"""
+        key = (bool(getattr(args, 'no_color', False)), bool(getattr(args, 'verbose', False)))
+        handler = self._handlers.get(key)
+        if handler is None:
+            from .handlers.command_handler import CommandHandler
+            handler = CommandHandler(no_color=key[0], verbose=key[1])
+            self._handlers[key] = handler
+        return handler
+
+    def warm(self) -> None:
+        """Construct the default handler and its core components"""
+        from argparse import Namespace
+
+        handler = self.handler_for(Namespace(no_color=False, verbose=False))
+        for name in WARM_COMPONENTS:
+            try:
+                getattr(handler, name)
+            except Exception as e:
+                # A component that fails here fails the same way in-process
+                logger.warning(f"Could not warm {name}: {e}")
+        # State files created while warming are the handlers' own
+        self._state_signature = self.state_signature()
+
+    def run_command(self, conn: socket.socket, argv: list) -> int:
+        """Execute one CLI invocation, streaming its output to conn"""
+        from .main import main
+
+        self.refresh_stale_handlers()
+
+        stdout = _SocketStream(conn, "stdout")
+        stderr = _SocketStream(conn, "stderr")
+        exit_code = 0
+        try:
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    main(argv, handler_factory=self.handler_for)
+                except SystemExit as e:
+                    if isinstance(e.code, str):
+                        stderr.write(e.code + "\n")
+                        exit_code = 1
+                    else:
+                        exit_code = e.code or 0
+                except KeyboardInterrupt:
+                    exit_code = 130
+        finally:
+            # Commands run relative to the project root
+            os.chdir(self.project_root)
+            # The handlers are up to date with their own writes
+            self._state_signature = self.state_signature()
+        self.commands_served += 1
+        return exit_code
+
+    def handle_connection(self, conn: socket.socket) -> None:
+        """Read one request from conn and answer it"""
+        with conn, conn.makefile("r", encoding="utf-8") as requests:
+            line = requests.readline()
+            if not line:
+                return
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError:
+                _send(conn, {"fallback": "invalid request"})
+                return
+
+            control = request.get("control")
+            if control == "ping":
+                _send(conn, {"pid": os.getpid(), "version": self.version,
+                             "project_root": str(self.project_root),
+                             "commands_served": self.commands_served})
+            elif control == "stop":
+                self._running = False
+                _send(conn, {"stopped": True})
+            elif request.get("version") != self.version:
+                # The installed package changed; stale code must not serve it
+                _send(conn, {"fallback": "version mismatch"})
+                self._running = False
+            elif isinstance(request.get("argv"), list):
+                try:
+                    exit_code = self.run_command(conn, request["argv"])
+                except OSError:
+                    raise
+                except Exception as e:
+                    logger.exception("Daemon command failed")
+                    # The handlers may have been left half-updated
+                    self._handlers.clear()
+                    _send(conn, {"stderr": f"Error: SpecPulse daemon command failed: {e}\n"})
+                    exit_code = 1
+                _send(conn, {"exit": exit_code})
+            else:
+                _send(conn, {"fallback": "invalid request"})
+
+    def serve_forever(self) -> None:
+        """Listen on the project's daemon socket until stopped or idle"""
+        os.chdir(self.project_root)
+        self.warm()
+
+        if os.path.exists(SOCKET_PATH):
+            os.unlink(SOCKET_PATH)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)  # Only the owner may connect
+        try:
+            server.bind(SOCKET_PATH)
+        finally:
+            os.umask(old_umask)
+        server.listen(16)
+        server.settimeout(self.idle_timeout)
+
+        self._running = True
+        logger.info(f"SpecPulse daemon serving {self.project_root} (pid {os.getpid()})")
+        try:
+            while self._running:
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    break
+                conn.settimeout(None)
+                try:
+                    self.handle_connection(conn)
+                except OSError as e:
+                    # Client went away mid-command
+                    logger.debug(f"Daemon connection error: {e}")
+                except Exception:
+                    # One bad request must not take the daemon down
+                    logger.exception("Daemon request failed")
+        finally:
+            server.close()
+            socket_file = self.project_root / SOCKET_PATH
+            if socket_file.exists():
+                socket_file.unlink()
+
+
+def _control(project_root: Path, control: str, timeout: float = 2.0) -> Optional[Dict[str, Any]]:
+    """Send a control request to the daemon; None if none is listening"""
+    if not is_supported():
+        return None
+    socket_file = str(Path(project_root) / SOCKET_PATH)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(socket_file)
+            _send(sock, {"control": control})
+            with sock.makefile("r", encoding="utf-8") as responses:
+                line = responses.readline()
+            return json.loads(line) if line else None
+    except (OSError, ValueError):
+        return None
+
+
+def daemon_status(project_root: Path) -> Optional[Dict[str, Any]]:
+    """Status of the project's daemon (pid, version, ...) or None if not running"""
+    return _control(project_root, "ping")
+
+
+def start_daemon(project_root: Path, idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 wait: float = 10.0) -> Optional[Dict[str, Any]]:
+    """
+    Start a detached daemon for the project and wait until it answers
+
+    Returns:
+        Daemon status, or None if it did not come up within `wait` seconds
+    """
+    status = daemon_status(project_root)
+    if status is not None:
+        return status
+
+    subprocess.Popen(
+        [sys.executable, "-m", "specpulse.cli.daemon", "--idle-timeout", str(idle_timeout)],
+        cwd=str(project_root),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+        start_new_session=True
+    )
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        status = daemon_status(project_root)
+        if status is not None:
+            return status
+        time.sleep(0.05)
+    return None
+
+
+def stop_daemon(project_root: Path) -> bool:
+    """Ask the project's daemon to exit; False if none was running"""
+    return _control(project_root, "stop") is not None
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Run the daemon in the foreground for the current directory"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m specpulse.cli.daemon")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="Seconds without requests before the daemon exits (0 = never)")
+    args = parser.parse_args(argv)
+
+    DaemonServer(Path.cwd(), idle_timeout=args.idle_timeout or None).serve_forever()
+
+
+__all__ = [
+    'DaemonServer', 'daemon_status', 'start_daemon', 'stop_daemon', 'is_supported',
+    'DEFAULT_IDLE_TIMEOUT', 'WARM_COMPONENTS', 'STATE_FILES'
+]
+
+
+if __name__ == "__main__":
+    main()
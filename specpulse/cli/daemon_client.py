@@ -0,0 +1,98 @@
+"""
+Thin client for the SpecPulse warm daemon
+
+When `specpulse daemon start` has left a daemon listening on
+``.specpulse/daemon.sock`` in the current directory, the CLI forwards its
+argv there and streams the output back instead of importing and
+initializing SpecPulse itself. Without a daemon (or with
+SPECPULSE_NO_DAEMON=1) the command runs in-process as usual.
+
+This module is imported on every CLI invocation, so it only pulls in
+json/socket once a daemon socket is actually present.
+"""
+
+import os
+import sys
+from typing import List, Optional
+
+
+SOCKET_PATH = os.path.join(".specpulse", "daemon.sock")
+NO_DAEMON_ENV = "SPECPULSE_NO_DAEMON"
+
+# Commands that must run in the calling process
+LOCAL_COMMANDS = ("daemon",)
+
+
+def daemon_available() -> bool:
+    """Whether a daemon socket exists for the current directory"""
+    if os.environ.get(NO_DAEMON_ENV, "").lower() in ("1", "true", "yes"):
+        return False
+    return os.path.exists(SOCKET_PATH)
+
+
+def forward_to_daemon(argv: List[str]) -> Optional[int]:
+    """
+    Run a command through the warm daemon
+
+    Args:
+        argv: CLI arguments (without the program name)
+
+    Returns:
+        Exit code of the command, or None if it should run in-process
+        (no daemon, stale socket, interactive terminal, version mismatch)
+    """
+    if not daemon_available():
+        return None
+
+    # Global options take no values, so the first positional is the command
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    if command in LOCAL_COMMANDS:
+        return None
+
+    # Prompts need the caller's terminal
+    try:
+        if sys.stdin is not None and sys.stdin.isatty():
+            return None
+    except (AttributeError, ValueError):
+        pass
+
+    import json
+    import socket
+
+    from .. import __version__
+
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    except (AttributeError, OSError):
+        return None
+
+    with sock:
+        try:
+            sock.connect(SOCKET_PATH)
+        except OSError:
+            # Daemon is gone; the socket file is stale
+            return None
+
+        request = {"argv": list(argv), "version": __version__}
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+        with sock.makefile("r", encoding="utf-8") as responses:
+            for line in responses:
+                message = json.loads(line)
+                if "stdout" in message:
+                    sys.stdout.write(message["stdout"])
+                    sys.stdout.flush()
+                elif "stderr" in message:
+                    sys.stderr.write(message["stderr"])
+                    sys.stderr.flush()
+                elif "exit" in message:
+                    return message["exit"]
+                elif "fallback" in message:
+                    return None
+
+    # The command was sent but may have partially run; don't run it twice
+    sys.stderr.write("Error: lost connection to the SpecPulse daemon\n")
+    return 1
+
+
+__all__ = ['SOCKET_PATH', 'NO_DAEMON_ENV', 'daemon_available', 'forward_to_daemon']
@@ -5,40 +5,50 @@ This module provides a centralized way to execute CLI commands,
 handling initialization, error handling, and command routing.
 
 REFACTORED: Uses registry pattern instead of massive if-elif chains.
+
+Command modules and core components (SpecPulse, Validator, TemplateManager,
+MemoryManager) are registered as components in the command registry and
+imported/constructed on first attribute access.
 """
 
+import importlib
 import sys
 from pathlib import Path
 from typing import Dict, Any, Optional, Callable
 from typing import Protocol
 
-from ..commands.project_commands import ProjectCommands
-from ..commands.feature_commands import FeatureCommands
-from ..commands.spec_commands import SpecCommands
-from ..commands.plan_task_commands import PlanCommands, TaskCommands, ExecuteCommands
-from ..commands.sp_pulse_commands import SpPulseCommands
-from ..commands.sp_spec_commands import SpSpecCommands
-from ..commands.sp_plan_commands import SpPlanCommands
-from ..commands.sp_task_commands import SpTaskCommands
-from ..commands.safe_commands import SafeCommands
-from ..monitor import MonitorCommands
-
-# Import registry - this triggers command registration
+# Import registry - this triggers command and component registration
 from ..registry import command_registry
 
-from ...core.specpulse import SpecPulse
-from ...core.validator import Validator
-from ...core.template_manager import TemplateManager
-from ...core.memory_manager import MemoryManager
 from ...utils.console import Console
 from ...utils.error_handler import (
     ErrorHandler, SpecPulseError, handle_specpulse_error
 )
-from ...utils.version_check import check_pypi_version, get_update_message, should_check_version, compare_versions
+from ...utils.version_check import (
+    get_update_message, should_check_version, compare_versions,
+    get_cached_latest_version, start_background_version_check
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import component classes (e.g. ``FeatureCommands``) on first access"""
+    config = command_registry.get_component_by_class(name)
+    if config is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(config.module), name)
+    globals()[name] = value
+    return value
 
 
 class CommandHandler:
-    """Centralized command handler for SpecPulse CLI"""
+    """Centralized command handler for SpecPulse CLI
+
+    Command modules (``feature_commands``, ``sp_task_commands``, ...) and core
+    components (``validator``, ``memory_manager``, ...) are resolved lazily
+    through the command registry; project-dependent ones are None outside a
+    SpecPulse project.
+    """
 
     def __init__(self, no_color: bool = False, verbose: bool = False):
         """Initialize command handler with console and error handling"""
@@ -46,31 +56,21 @@ class CommandHandler:
         self.verbose = verbose
         self.error_handler = ErrorHandler(verbose=verbose)
 
-        # Initialize core components
+        # Detect project; core components and command modules are lazy
         self._initialize_components()
 
-        # Initialize command modules
-        self._initialize_commands()
-
         # Check for updates (non-blocking)
         self._check_for_updates()
 
     def _initialize_components(self) -> None:
-        """Initialize core SpecPulse components"""
+        """Detect the SpecPulse project; core components are constructed on first use"""
         try:
-            self.specpulse = SpecPulse()
-            self.validator = Validator()
-
-            # Initialize project-dependent components
-            project_root = Path.cwd()
-            if self._is_specpulse_project(project_root):
-                self.template_manager = TemplateManager(project_root)
-                self.memory_manager = MemoryManager(project_root)
-                self.project_root = project_root
-            else:
-                self.template_manager = None
-                self.memory_manager = None
-                self.project_root = None
+            # Shared per-process session; walks up from cwd like git
+            from ...core.project_session import get_project_session
+            self.session = get_project_session()
+            self.project_root = self.session.root if self.session else None
+            if self.project_root is None and self.verbose:
+                self._is_specpulse_project(Path.cwd())  # reports why
 
         except Exception as e:
             self.console.error("Failed to initialize SpecPulse components")
@@ -82,58 +82,40 @@ class CommandHandler:
                 self.console.warning(f"Technical details: {str(e)}")
             sys.exit(1)
 
-    def _initialize_commands(self) -> None:
-        """Initialize all command modules"""
-        project_root = self.project_root or Path.cwd()
-
-        # Core command modules
-        self.project_commands = ProjectCommands(self.console, project_root)
+    def __getattr__(self, name: str) -> Any:
+        """Construct a registered command module or core component on first access"""
+        config = command_registry.get_component(name)
+        if config is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
 
-        # Initialize project-dependent commands only if in a SpecPulse project
-        if self.project_root:
-            self.feature_commands = FeatureCommands(self.console, project_root)
-            self.spec_commands = SpecCommands(self.console, project_root)
-            self.plan_commands = PlanCommands(self.console, project_root)
-            self.task_commands = TaskCommands(self.console, project_root)
-            self.execute_commands = ExecuteCommands(self.console, project_root)
-
-            # Slash command modules
-            self.sp_pulse_commands = SpPulseCommands(self.console, project_root)
-            self.sp_spec_commands = SpSpecCommands(self.console, project_root)
-            self.sp_plan_commands = SpPlanCommands(self.console, project_root)
-            self.sp_task_commands = SpTaskCommands(self.console, project_root)
-
-            # Safe command modules (NEW)
-            self.safe_commands = SafeCommands(self.console, project_root)
-
-            # Monitor commands
-            self.monitor_commands = MonitorCommands(project_root, self.verbose, self.console.no_color)
+        if config.requires_project and self.project_root is None:
+            value = None
         else:
-            # Set to None for non-project contexts
-            self.feature_commands = None
-            self.spec_commands = None
-            self.plan_commands = None
-            self.task_commands = None
-            self.execute_commands = None
-            self.sp_pulse_commands = None
-            self.sp_spec_commands = None
-            self.sp_plan_commands = None
-            self.sp_task_commands = None
-            self.safe_commands = None
-            self.monitor_commands = None
+            cls = getattr(sys.modules[__name__], config.class_name)
+            if config.factory:
+                value = config.factory(self, cls)
+            else:
+                value = cls(self.console, self.project_root or Path.cwd())
+
+        # Cache on the instance so __getattr__ is not consulted again
+        setattr(self, name, value)
+        return value
 
     def _check_for_updates(self) -> None:
-        """Check for available updates on PyPI (non-blocking)"""
+        """Check for available updates on PyPI (non-blocking)
+
+        Once a day, report the version found by the previous background
+        check and start a new one; the network is never waited on.
+        """
         try:
             if not should_check_version():
                 return
 
-            from ...utils.version_check import check_pypi_version, get_update_message
-
-            latest = check_pypi_version(timeout=1)
+            latest = get_cached_latest_version()
+            start_background_version_check()
             if latest:
                 from ... import __version__
-                is_outdated, is_major = compare_versions(latest, __version__)
+                is_outdated, is_major = compare_versions(__version__, latest)
                 if is_outdated:
                     message, color = get_update_message(__version__, latest, is_major)
                     self.console.info(message)
@@ -232,18 +214,33 @@ class CommandHandler:
             self.console.info("Template command - subcommand needed")
         return True
 
-    def validate(self, component: str = "all", fix: bool = False, verbose: bool = False) -> bool:
+    def validate(self, component: str = "all", fix: bool = False, verbose: bool = False,
+                 no_cache: bool = False, jobs: int = 1, executor: str = "thread",
+                 **kwargs) -> bool:
         """Validate project components"""
-        if not self.validator:
+        if not self.validator or not self.project_root:
             raise SpecPulseError(
                 "This command must be run from within a SpecPulse project directory",
                 "Run 'specpulse init' to create a new project or navigate to an existing one"
             )
-        results = self.validator.validate_all(
+
+        validator = self.validator
+        if jobs and jobs > 1:
+            from ...core.async_validator import AsyncValidator
+            validator = AsyncValidator(self.project_root, max_workers=jobs, executor=executor)
+
+        results = validator.validate_all(
             self.project_root,
             fix=fix,
-            verbose=verbose or self.verbose
+            verbose=verbose or self.verbose,
+            use_cache=not no_cache,
+            component=component
         )
+        cache_stats = getattr(validator, 'cache_stats', None)
+        if isinstance(cache_stats, dict):
+            self.console.info(
+                f"Validation cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses"
+            )
         # Return True if all validations passed (no errors)
         return len([r for r in results if r.get('status') == 'error']) == 0
 
@@ -280,9 +277,7 @@ class CommandHandler:
         self.console.info("Listing specifications...")
         specs_dir = None
         if self.project_root:
-            from ...core.path_manager import PathManager
-            path_manager = PathManager(self.project_root)
-            specs_dir = path_manager.specs_dir
+            specs_dir = self.session.path_manager.specs_dir
 
         if specs_dir and specs_dir.exists():
             specs = list(specs_dir.rglob("spec-*.md"))
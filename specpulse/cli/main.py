@@ -9,36 +9,52 @@ the main module small and focused on initialization and command routing.
 
 import sys
 from pathlib import Path
+from typing import Callable, List, Optional
 
-from .handlers.command_handler import CommandHandler
 from .parsers.subcommand_parsers import create_argument_parser
 
 
-def main():
-    """Main entry point for SpecPulse CLI"""
+def _configure_windows_encoding() -> None:
+    """Set UTF-8 encoding for Windows compatibility"""
+    # Security fix: Replaced os.system() with Python native encoding
+    if sys.platform == "win32":
+        try:
+            sys.stdout.reconfigure(encoding='utf-8')
+            sys.stderr.reconfigure(encoding='utf-8')
+        except (AttributeError, OSError):
+            # Fallback for older Python or restricted environments
+            import subprocess
+            subprocess.run(["chcp", "65001"], capture_output=True, shell=False, timeout=2)
+
+
+def main(argv: Optional[List[str]] = None,
+         handler_factory: Optional[Callable] = None):
+    """Main entry point for SpecPulse CLI (the warm daemon passes argv and handler_factory)"""
+    if argv is None:
+        # Offer plain invocations to a warm daemon serving this project
+        from .daemon_client import forward_to_daemon
+        exit_code = forward_to_daemon(sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+
     try:
-        # Set UTF-8 encoding for Windows compatibility
-        # Security fix: Replaced os.system() with Python native encoding
-        if sys.platform == "win32":
-            try:
-                sys.stdout.reconfigure(encoding='utf-8')
-                sys.stderr.reconfigure(encoding='utf-8')
-            except (AttributeError, OSError):
-                # Fallback for older Python or restricted environments
-                import subprocess
-                subprocess.run(["chcp", "65001"], capture_output=True, shell=False, timeout=2)
+        _configure_windows_encoding()
 
         # Create argument parser (removed duplicate import)
         parser = create_argument_parser()
 
         # Parse arguments
-        args = parser.parse_args()
+        args = parser.parse_args(argv)
 
-        # Create command handler
-        handler = CommandHandler(
-            no_color=args.no_color,
-            verbose=args.verbose
-        )
+        # Create command handler (imported after parsing so --help/--version stay cheap)
+        if handler_factory is not None:
+            handler = handler_factory(args)
+        else:
+            from .handlers.command_handler import CommandHandler
+            handler = CommandHandler(
+                no_color=args.no_color,
+                verbose=args.verbose
+            )
 
         # Execute the command
         if hasattr(args, 'command') and args.command:
@@ -83,6 +83,9 @@ Examples:
     # Monitor Commands (new)
     _add_monitor_commands(subparsers)
 
+    # Daemon Commands
+    _add_daemon_commands(subparsers)
+
     # Safe Commands (NEW - LLM-safe alternatives)
     _add_safe_commands(subparsers)
 
@@ -200,6 +203,42 @@ def _add_monitor_commands(subparsers: argparse._SubParsersAction) -> None:
     )
 
 
+def _add_daemon_commands(subparsers: argparse._SubParsersAction) -> None:
+    """Add warm daemon commands"""
+
+    daemon_parser = subparsers.add_parser(
+        'daemon',
+        help='Manage the warm SpecPulse daemon',
+        description='Keep SpecPulse loaded in a background process; CLI calls from the '
+                    'project directory are forwarded to it (set SPECPULSE_NO_DAEMON=1 to bypass)'
+    )
+    daemon_subparsers = daemon_parser.add_subparsers(
+        dest='daemon_command',
+        help='Daemon subcommands',
+        metavar='SUBCOMMAND'
+    )
+
+    start_parser = daemon_subparsers.add_parser(
+        'start',
+        help='Start the daemon for this project'
+    )
+    start_parser.add_argument(
+        '--idle-timeout',
+        type=float,
+        default=3600,
+        help='Seconds without requests before the daemon exits (0 = never, default: 3600)'
+    )
+
+    daemon_subparsers.add_parser(
+        'stop',
+        help='Stop the daemon for this project'
+    )
+    daemon_subparsers.add_parser(
+        'status',
+        help='Show whether the daemon is running'
+    )
+
+
 def _add_project_commands(subparsers: argparse._SubParsersAction) -> None:
     """Add project-level commands"""
 
@@ -264,6 +303,42 @@ def _add_project_commands(subparsers: argparse._SubParsersAction) -> None:
         help='Specific component to check (default: all)'
     )
 
+    # Validate command
+    validate_parser = subparsers.add_parser(
+        'validate',
+        help='Validate project specifications and plans',
+        description='Validate specs, plans and SDD compliance of the current project'
+    )
+    validate_parser.add_argument(
+        'component',
+        nargs='?',
+        choices=['all', 'spec', 'plan'],
+        default='all',
+        help='Component to validate (default: all)'
+    )
+    validate_parser.add_argument(
+        '--fix',
+        action='store_true',
+        help='Automatically fix validation issues where possible'
+    )
+    validate_parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Revalidate every file instead of reusing cached results for unchanged files'
+    )
+    validate_parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Number of files to validate in parallel (default: 1)'
+    )
+    validate_parser.add_argument(
+        '--executor',
+        choices=['thread', 'process'],
+        default='thread',
+        help='Worker pool type used with --jobs (default: thread)'
+    )
+
 
 def _add_feature_commands(subparsers: argparse._SubParsersAction) -> None:
     """Add feature-related commands"""
@@ -784,7 +859,40 @@ def _add_slash_commands(subparsers: argparse._SubParsersAction) -> None:
     )
     sp_task_parser.add_argument(
         'target',
-        help='Plan ID or specification to break down'
+        help='Plan ID or specification to break down, "start"/"done" to change task status, '
+             'or "ready" to claim tasks whose dependencies are satisfied'
+    )
+    sp_task_parser.add_argument(
+        'task_ids',
+        nargs='*',
+        help='Task IDs to start or complete (e.g., T001 T002)'
+    )
+    sp_task_parser.add_argument(
+        '--all',
+        dest='all_tasks',
+        action='store_true',
+        help='Start or complete every task of the feature'
+    )
+    sp_task_parser.add_argument(
+        '--feature',
+        help='Feature name or ID (default: active feature)'
+    )
+    sp_task_parser.add_argument(
+        '--max',
+        dest='max_tasks',
+        type=int,
+        default=1,
+        help='Maximum number of ready tasks to claim (default: 1)'
+    )
+    sp_task_parser.add_argument(
+        '--agent',
+        default='default',
+        help='Agent claiming ready tasks (default: default)'
+    )
+    sp_task_parser.add_argument(
+        '--lease',
+        type=int,
+        help='Lease length in seconds for claimed tasks (default: 3600)'
     )
     sp_task_parser.add_argument(
         '--template',
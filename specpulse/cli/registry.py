@@ -22,6 +22,16 @@ class CommandConfig:
     method_prefix: Optional[str] = None  # Prefix for subcommand methods
 
 
+@dataclass
+class ComponentConfig:
+    """Configuration for a lazily constructed CommandHandler attribute"""
+    name: str  # Attribute name on CommandHandler, e.g. 'feature_commands'
+    module: str  # Absolute module path, e.g. 'specpulse.cli.commands.feature_commands'
+    class_name: str
+    requires_project: bool = True  # Resolves to None outside a SpecPulse project
+    factory: Optional[Callable] = None  # (handler, cls) -> instance; default cls(console, project_root)
+
+
 class CommandRegistry:
     """
     Registry for CLI commands with simplified routing.
@@ -37,12 +47,14 @@ class CommandRegistry:
     _instance: Optional['CommandRegistry'] = None
     _commands: Dict[str, CommandConfig] = {}
     _handlers: Dict[str, Callable] = {}
+    _components: Dict[str, ComponentConfig] = {}
 
     def __new__(cls) -> 'CommandRegistry':
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._commands = {}
             cls._instance._handlers = {}
+            cls._instance._components = {}
         return cls._instance
 
     @classmethod
@@ -51,6 +63,7 @@ class CommandRegistry:
         cls._instance = None
         cls._commands = {}
         cls._handlers = {}
+        cls._components = {}
 
     def register(
         self,
@@ -103,6 +116,49 @@ class CommandRegistry:
         """Get handler function for a command"""
         return self._handlers.get(command_name)
 
+    def register_component(
+        self,
+        name: str,
+        module: str,
+        class_name: str,
+        requires_project: bool = True,
+        factory: Optional[Callable] = None
+    ) -> None:
+        """
+        Register a command module or core component that CommandHandler
+        constructs on first attribute access.
+
+        Args:
+            name: Attribute name on CommandHandler
+            module: Module that defines the class (imported on first use)
+            class_name: Class to construct
+            requires_project: Whether the component needs a SpecPulse project
+            factory: Builds the instance from (handler, cls); defaults to
+                cls(handler.console, project_root)
+        """
+        self._components[name] = ComponentConfig(
+            name=name,
+            module=module,
+            class_name=class_name,
+            requires_project=requires_project,
+            factory=factory
+        )
+
+    def get_component(self, name: str) -> Optional[ComponentConfig]:
+        """Get configuration for a lazily constructed component"""
+        return self._components.get(name)
+
+    def get_component_by_class(self, class_name: str) -> Optional[ComponentConfig]:
+        """Get component configuration by the name of the class it constructs"""
+        for config in self._components.values():
+            if config.class_name == class_name:
+                return config
+        return None
+
+    def list_components(self) -> List[str]:
+        """List all registered component attribute names"""
+        return list(self._components)
+
     def list_commands(self) -> List[str]:
         """List all registered primary command names"""
         seen = set()
@@ -185,6 +241,77 @@ def check_project_requirement(handler: 'CommandHandler', command_name: str) -> N
         )
 
 
+# ============================================================================
+# COMPONENT DEFINITIONS
+# ============================================================================
+
+# Command modules and core components are imported and constructed by
+# CommandHandler on first use, so `specpulse --version` or a single
+# `sp-task list` only pays for what it touches.
+
+# Core components
+command_registry.register_component(
+    'specpulse', 'specpulse.core.specpulse', 'SpecPulse',
+    requires_project=False, factory=lambda handler, cls: cls()
+)
+command_registry.register_component(
+    'validator', 'specpulse.core.validator', 'Validator',
+    requires_project=False, factory=lambda handler, cls: cls()
+)
+command_registry.register_component(
+    'template_manager', 'specpulse.core.template_manager', 'TemplateManager',
+    factory=lambda handler, cls: cls(handler.project_root)
+)
+command_registry.register_component(
+    'memory_manager', 'specpulse.core.memory_manager', 'MemoryManager',
+    factory=lambda handler, cls: cls(handler.project_root)
+)
+
+# Command modules
+command_registry.register_component(
+    'project_commands', 'specpulse.cli.commands.project_commands', 'ProjectCommands',
+    requires_project=False
+)
+command_registry.register_component(
+    'feature_commands', 'specpulse.cli.commands.feature_commands', 'FeatureCommands'
+)
+command_registry.register_component(
+    'spec_commands', 'specpulse.cli.commands.spec_commands', 'SpecCommands'
+)
+command_registry.register_component(
+    'plan_commands', 'specpulse.cli.commands.plan_task_commands', 'PlanCommands'
+)
+command_registry.register_component(
+    'task_commands', 'specpulse.cli.commands.plan_task_commands', 'TaskCommands'
+)
+command_registry.register_component(
+    'execute_commands', 'specpulse.cli.commands.plan_task_commands', 'ExecuteCommands'
+)
+
+# Slash command modules
+command_registry.register_component(
+    'sp_pulse_commands', 'specpulse.cli.commands.sp_pulse_commands', 'SpPulseCommands'
+)
+command_registry.register_component(
+    'sp_spec_commands', 'specpulse.cli.commands.sp_spec_commands', 'SpSpecCommands'
+)
+command_registry.register_component(
+    'sp_plan_commands', 'specpulse.cli.commands.sp_plan_commands', 'SpPlanCommands'
+)
+command_registry.register_component(
+    'sp_task_commands', 'specpulse.cli.commands.sp_task_commands', 'SpTaskCommands'
+)
+
+# Safe and monitor command modules
+command_registry.register_component(
+    'safe_commands', 'specpulse.cli.commands.safe_commands', 'SafeCommands'
+)
+command_registry.register_component(
+    'monitor_commands', 'specpulse.cli.monitor', 'MonitorCommands',
+    factory=lambda handler, cls: cls(handler.project_root, handler.verbose, handler.console.no_color)
+)
+
+
 # ============================================================================
 # COMMAND DEFINITIONS
 # ============================================================================
@@ -381,6 +508,47 @@ def handle_monitor(handler, **kwargs):
         )
 
 
+# Daemon commands
+@command_registry.register('daemon', subcommand_key='daemon_command')
+def handle_daemon(handler, **kwargs):
+    """Handle daemon command (start, stop, status)"""
+    from ..utils.error_handler import SpecPulseError
+    from . import daemon
+
+    check_project_requirement(handler, 'daemon')
+    if not daemon.is_supported():
+        raise SpecPulseError("The SpecPulse daemon requires Unix domain sockets, which this platform lacks")
+
+    daemon_command = kwargs.get('daemon_command') or 'status'
+    if daemon_command == 'start':
+        status = daemon.start_daemon(handler.project_root, idle_timeout=kwargs.get('idle_timeout', daemon.DEFAULT_IDLE_TIMEOUT))
+        if status is None:
+            raise SpecPulseError(
+                "SpecPulse daemon did not start",
+                "Run 'python -m specpulse.cli.daemon' in the project directory to see the error"
+            )
+        handler.console.success(f"SpecPulse daemon running (pid {status['pid']})")
+        return True
+    elif daemon_command == 'stop':
+        if daemon.stop_daemon(handler.project_root):
+            handler.console.success("SpecPulse daemon stopped")
+        else:
+            handler.console.info("SpecPulse daemon is not running")
+        return True
+    elif daemon_command == 'status':
+        status = daemon.daemon_status(handler.project_root)
+        if status is None:
+            handler.console.info("SpecPulse daemon is not running")
+            return False
+        handler.console.info(
+            f"SpecPulse daemon running (pid {status['pid']}, v{status['version']}, "
+            f"{status['commands_served']} commands served)"
+        )
+        return True
+    else:
+        raise SpecPulseError(f"Unknown daemon command: {daemon_command}")
+
+
 # Slash commands
 @command_registry.register('sp-pulse')
 def handle_sp_pulse(handler, **kwargs):
@@ -464,10 +632,26 @@ def handle_sp_task(handler, **kwargs):
     if not target:
         raise SpecPulseError("sp-task requires a target (plan ID or specification)")
 
+    # Bulk status transitions: sp-task start|done T001 T002 ... [--all]
+    if target in ('start', 'done'):
+        task_ids = kwargs.get('task_ids') or []
+        all_tasks = kwargs.get('all_tasks', False)
+        if not task_ids and not all_tasks:
+            raise SpecPulseError(f"sp-task {target} requires task IDs or --all")
+        method = 'start_tasks' if target == 'start' else 'done_tasks'
+        return getattr(handler.sp_task_commands, method)(task_ids, kwargs.get('feature'), all_tasks)
+
+    # Lease ready tasks to an agent: sp-task ready --max N [--agent A] [--lease S]
+    if target == 'ready':
+        return handler.sp_task_commands.ready(
+            kwargs.get('max_tasks', 1), kwargs.get('agent') or 'default', kwargs.get('lease')
+        )
+
     return getattr(handler.sp_task_commands, 'breakdown', lambda x, **kw: False)(
         target,
         **{k: v for k, v in kwargs.items()
-           if k not in ['target', 'verbose', 'no_color', 'command', 'template']}
+           if k not in ['target', 'verbose', 'no_color', 'command', 'template',
+                        'task_ids', 'all_tasks', 'feature', 'max_tasks', 'agent', 'lease']}
     )
 
 
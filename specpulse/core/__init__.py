@@ -1,9 +1,30 @@
 """SpecPulse Core Module"""
 
-from .specpulse import SpecPulse
-from .validator import Validator
-from .memory_manager import MemoryManager, MemoryEntry
-from .context_injector import ContextInjector
-from .notes_manager import NotesManager, Note
+import importlib
 
-__all__ = ["SpecPulse", "Validator", "MemoryManager", "MemoryEntry", "ContextInjector", "NotesManager", "Note"]
\ No newline at end of file
+# Public names are imported on first access (PEP 562) so that importing a
+# single core module does not load the validator, memory manager and friends.
+_LAZY_EXPORTS = {
+    "SpecPulse": ".specpulse",
+    "Validator": ".validator",
+    "MemoryManager": ".memory_manager",
+    "MemoryEntry": ".memory_manager",
+    "ContextInjector": ".context_injector",
+    "NotesManager": ".notes_manager",
+    "Note": ".notes_manager",
+}
+
+__all__ = ["SpecPulse", "Validator", "MemoryManager", "MemoryEntry", "ContextInjector", "NotesManager", "Note"]
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
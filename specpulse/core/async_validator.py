@@ -1,19 +1,27 @@
 """
-Parallel Validation System with ThreadPoolExecutor
+Parallel Validation System
 
 Provides 3-5x faster validation for projects with many specs/plans/tasks
 through concurrent validation instead of sequential processing.
+
+Each worker validates one file and returns its own result list; results are
+merged in file order so parallel output is identical to sequential output.
+Workers run in a thread pool by default, or in a process pool for the
+GIL-bound, regex-heavy rule sets.
 """
 
 from pathlib import Path
-from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Tuple, Callable
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import logging
 
 from .validator import Validator
 
 logger = logging.getLogger(__name__)
 
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+
 
 class AsyncValidator(Validator):
     """
@@ -21,18 +29,34 @@ class AsyncValidator(Validator):
 
     Extends base Validator with concurrent validation capabilities:
     - Validates multiple specs/plans/tasks in parallel
-    - Caches file content to reduce I/O
+    - Caches file content (keyed by mtime/size) to reduce I/O
+    - Thread or process pool execution
     - 3-5x faster for 50+ files
 
     Example:
-        >>> validator = AsyncValidator(project_root, max_workers=4)
+        >>> validator = AsyncValidator(project_root, max_workers=4, executor="process")
         >>> results = validator.validate_all_parallel(project_root)
     """
 
-    def __init__(self, project_root: Optional[Path] = None, max_workers: int = 4):
+    def __init__(self, project_root: Optional[Path] = None, max_workers: int = 4,
+                 executor: str = EXECUTOR_THREAD):
         super().__init__(project_root)
-        self.max_workers = max_workers
-        self._file_cache: Dict[Path, str] = {}
+        if executor not in (EXECUTOR_THREAD, EXECUTOR_PROCESS):
+            raise ValueError(f"Unknown executor type: {executor}")
+        self.max_workers = max(1, max_workers)
+        self.executor = executor
+        self._file_cache: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+
+    def validate_all_parallel(self, project_path: Path, fix: bool = False,
+                              verbose: bool = False, strictness: str = "standard",
+                              use_cache: bool = True) -> List[Dict]:
+        """
+        Validate entire project, validating files in parallel.
+
+        Returns the same results, in the same order, as Validator.validate_all.
+        """
+        return self.validate_all(project_path, fix=fix, verbose=verbose,
+                                 strictness=strictness, use_cache=use_cache)
 
     def validate_specs_parallel(self, project_path: Path, fix: bool = False) -> List[Dict]:
         """
@@ -45,37 +69,72 @@ class AsyncValidator(Validator):
         Returns:
             List of validation results
         """
-        specs_dir = project_path / "specs"
-        if not specs_dir.exists():
-            return []
-
-        # Collect all spec paths
-        spec_paths = [
-            spec_dir / "spec.md"
-            for spec_dir in specs_dir.iterdir()
-            if spec_dir.is_dir() and (spec_dir / "spec.md").exists()
-        ]
-
-        results = []
-
-        # Parallel validation
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(self._validate_single_spec, spec_path, fix, False): spec_path
-                for spec_path in spec_paths
-            }
-
-            for future in as_completed(futures):
+        self.results = []
+        self._validate_specs(project_path, fix, False)
+        return self.results
+
+    def validate_plans_parallel(self, project_path: Path, fix: bool = False) -> List[Dict]:
+        """Validate all plans in parallel"""
+        self.results = []
+        self._validate_plans(project_path, fix, False)
+        return self.results
+
+    def validate_tasks_parallel(self, project_path: Path, fix: bool = False) -> List[Dict]:
+        """Validate all task breakdowns in parallel"""
+        self.results = []
+        self._validate_tasks(project_path, fix, False)
+        return self.results
+
+    def _run_file_jobs(self, collector: Callable, jobs: List[Tuple[Path, str]],
+                       fix: bool) -> List[List[Dict]]:
+        """Run per-file collectors in a worker pool, keeping job order"""
+        if self.max_workers == 1 or len(jobs) <= 1:
+            return super()._run_file_jobs(collector, jobs, fix)
+
+        if self.executor == EXECUTOR_PROCESS:
+            pool_class = ProcessPoolExecutor
+            # Workers use their own copy of the global registry
+            registry = None
+        else:
+            pool_class = ThreadPoolExecutor
+            registry = self.rules_registry
+
+        workers = min(self.max_workers, len(jobs))
+        with pool_class(max_workers=workers) as executor:
+            futures = [
+                executor.submit(collector, path, content, fix, registry)
+                for path, content in jobs
+            ]
+
+            merged = []
+            for (path, _), future in zip(jobs, futures):
                 try:
-                    future.result()  # Results stored in self.results
+                    merged.append(future.result())
                 except Exception as e:
-                    logger.error(f"Validation error: {e}")
+                    logger.error(f"Validation error for {path}: {e}")
+                    merged.append([{
+                        "status": "error",
+                        "message": f"{path.parent.name}: Failed to validate - {str(e)}"
+                    }])
 
-        return self.results
+        return merged
+
+    def _read_file(self, file_path: Path) -> str:
+        """Read a file, reusing cached content while its mtime and size are unchanged"""
+        stat = file_path.stat()
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._file_cache.get(file_path)
+        if cached and cached[0] == fingerprint:
+            return cached[1]
+
+        content = super()._read_file(file_path)
+        self._file_cache[file_path] = (fingerprint, content)
+        return content
 
     def clear_cache(self):
         """Clear file content cache"""
         self._file_cache.clear()
 
 
-__all__ = ['AsyncValidator']
+__all__ = ['AsyncValidator', 'EXECUTOR_THREAD', 'EXECUTOR_PROCESS']
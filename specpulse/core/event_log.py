@@ -0,0 +1,323 @@
+"""
+Append-Only Event Log
+
+Lifecycle events, LLM operation history and compliance violations used to
+live in single JSON documents that were loaded, extended by one record and
+rewritten on every event - O(n) per event, and two agents writing at once
+silently dropped each other's records. EventLog stores them as JSON Lines:
+
+- Each record is one line appended under a file lock, so the per-event
+  cost is constant and concurrent writers never clobber each other.
+- A per-key offset index (task ID, operation/session ID) reads the
+  records of one key in O(k) without scanning the log.
+- Aggregate state is folded record by record through a reducer and
+  periodically snapshotted together with the index, so a new process
+  only replays the log tail written since the last snapshot.
+"""
+
+import json
+import logging
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+# Import platform-specific file locking
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+logger = logging.getLogger(__name__)
+
+Reducer = Callable[[Dict[str, Any], Dict[str, Any]], None]
+
+
+class EventLog:
+    """
+    JSON Lines log with a per-key offset index and a folded-state snapshot.
+
+    The snapshot (``<log>.snapshot.json``) records the log inode and size
+    it covers; records appended after it, by this or another process, are
+    picked up by scanning only the unindexed tail.
+
+    Example:
+        >>> log = EventLog(path, key_field="task_id",
+        ...                initial_state=lambda: {"total": 0},
+        ...                reducer=lambda state, record: state.update(total=state["total"] + 1))
+        >>> log.append({"task_id": "001-T1", "event": "started"})
+        >>> log.records("001-T1")
+        [{'task_id': '001-T1', 'event': 'started'}]
+        >>> log.state()["total"]
+        1
+    """
+
+    SNAPSHOT_VERSION = 1
+    # Write a snapshot once this many records are not covered by the last one
+    SNAPSHOT_INTERVAL = 100
+
+    def __init__(self, log_path: Path, key_field: str,
+                 initial_state: Optional[Callable[[], Dict[str, Any]]] = None,
+                 reducer: Optional[Reducer] = None, state_version: int = 1):
+        """
+        Initialize event log; nothing is read until first use.
+
+        Args:
+            log_path: JSON Lines file holding the records
+            key_field: Record field the offset index is keyed by
+            initial_state: Factory of the state before any record
+            reducer: Folds one record into the state (mutating it)
+            state_version: Shape of the folded state; snapshots of another
+                version are ignored and the log is replayed
+        """
+        self.log_path = Path(log_path)
+        self.snapshot_path = self.log_path.with_suffix(".snapshot.json")
+        self.lock_file = self.log_path.parent / f".{self.log_path.stem}.lock"
+        self.key_field = key_field
+        self._initial_state = initial_state or dict
+        self._reducer = reducer
+        self.state_version = state_version
+
+        self._state: Optional[Dict[str, Any]] = None
+        self._keys: Dict[str, List[int]] = {}
+        self._inode: Optional[int] = None
+        self._size = 0
+        self._unsnapshotted = 0
+
+    # Public API
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append one record."""
+        self.extend([record])
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Append records in a single write."""
+        records = list(records)
+        if not records:
+            return
+
+        lines = [json.dumps(record, ensure_ascii=False, default=str).encode('utf-8') + b'\n'
+                 for record in records]
+
+        with self._locked():
+            self._sync()
+            with open(self.log_path, 'ab') as f:
+                offset = f.tell()
+                if offset > self._size:
+                    # Terminate a torn line so our records start on a fresh one
+                    f.write(b'\n')
+                    offset += 1
+                if self._inode is None:
+                    self._inode = os.fstat(f.fileno()).st_ino
+                f.write(b''.join(lines))
+
+        for record, line in zip(records, lines):
+            self._apply(record, offset)
+            offset += len(line)
+        self._size = offset
+
+        self._unsnapshotted += len(records)
+        if self._unsnapshotted >= self.SNAPSHOT_INTERVAL:
+            self.snapshot()
+
+    def state(self) -> Dict[str, Any]:
+        """Folded state of every record (shared; do not mutate)."""
+        self._sync()
+        return self._state
+
+    def records(self, key: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Records of one key in append order, or only the last `limit` of them."""
+        self._sync()
+        offsets = self._keys.get(key, [])
+        if limit:
+            offsets = offsets[-limit:]
+        if not offsets:
+            return []
+
+        records = []
+        with open(self.log_path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                try:
+                    records.append(json.loads(f.readline()))
+                except ValueError:
+                    continue
+        return records
+
+    def keys(self) -> List[str]:
+        """Keys that have records."""
+        self._sync()
+        return list(self._keys)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Every record in append order."""
+        self._sync()
+        if not self.log_path.exists():
+            return
+
+        with open(self.log_path, 'rb') as f:
+            remaining = self._size
+            for line in f:
+                remaining -= len(line)
+                if remaining < 0:
+                    break
+                record = self._parse(line)
+                if record is not None:
+                    yield record
+
+    def import_legacy(self, legacy_path: Path, list_key: str) -> None:
+        """
+        Seed a new log with the records of a pre-JSONL document.
+
+        Runs once, while the log does not exist yet; the legacy file is
+        left in place.
+        """
+        if self.log_path.exists() or not legacy_path.exists():
+            return
+
+        try:
+            document = json.loads(legacy_path.read_text(encoding='utf-8'))
+            records = [record for record in document.get(list_key, []) if isinstance(record, dict)]
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Could not import {legacy_path}: {e}")
+            return
+
+        with self._locked():
+            if self.log_path.exists():
+                return  # Another process imported it first
+            self.log_path.touch()
+        self.extend(records)
+
+    def snapshot(self) -> None:
+        """Persist the folded state and key index atomically."""
+        self._sync()
+        data = {
+            "version": self.SNAPSHOT_VERSION,
+            "inode": self._inode,
+            "log_size": self._size,
+            "state_version": self.state_version,
+            "state": self._state,
+            "keys": self._keys,
+        }
+
+        temp_fd, temp_path = tempfile.mkstemp(
+            dir=self.snapshot_path.parent,
+            prefix=f".{self.snapshot_path.stem}_tmp_",
+            suffix=self.snapshot_path.suffix
+        )
+        try:
+            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'), default=str)
+            os.replace(temp_path, self.snapshot_path)
+            self._unsnapshotted = 0
+        except OSError as e:
+            try:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+            except OSError:
+                pass
+            logger.warning(f"Could not write snapshot {self.snapshot_path}: {e}")
+
+    # Private helpers
+    def _reset(self, inode: Optional[int]) -> None:
+        """Start from an empty state covering nothing of the log."""
+        self._state = self._initial_state()
+        self._keys = {}
+        self._inode = inode
+        self._size = 0
+
+    def _load_snapshot(self, stat: os.stat_result) -> bool:
+        """Adopt the persisted snapshot if it describes (a prefix of) the log."""
+        try:
+            data = json.loads(self.snapshot_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return False
+
+        if (not isinstance(data, dict) or data.get("version") != self.SNAPSHOT_VERSION
+                or data.get("state_version", 1) != self.state_version
+                or data.get("inode") != stat.st_ino or data.get("log_size", 0) > stat.st_size):
+            return False
+
+        self._state = data["state"]
+        self._keys = data["keys"]
+        self._inode = data["inode"]
+        self._size = data["log_size"]
+        return True
+
+    def _sync(self) -> None:
+        """Bring state and index up to date with the log."""
+        try:
+            stat = self.log_path.stat()
+        except FileNotFoundError:
+            if self._state is None or self._size:
+                self._reset(None)
+            return
+
+        if self._state is None or self._inode != stat.st_ino or self._size > stat.st_size:
+            # First use, or the log was replaced behind our back
+            if not self._load_snapshot(stat):
+                self._reset(stat.st_ino)
+
+        if self._size < stat.st_size:
+            scanned = self._scan_tail()
+            self._unsnapshotted += scanned
+            if scanned >= self.SNAPSHOT_INTERVAL:
+                self.snapshot()
+
+    def _scan_tail(self) -> int:
+        """Fold complete lines past the covered size; returns records scanned."""
+        offset = self._size
+        scanned = 0
+        with open(self.log_path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # Torn write at the end of the log; leave it uncovered
+                    break
+                record = self._parse(line)
+                if record is not None:
+                    self._apply(record, offset)
+                    scanned += 1
+                offset += len(line)
+        self._size = offset
+        return scanned
+
+    def _apply(self, record: Dict[str, Any], offset: int) -> None:
+        """Index and fold one record."""
+        key = record.get(self.key_field)
+        if key is not None:
+            self._keys.setdefault(str(key), []).append(offset)
+        if self._reducer is not None:
+            self._reducer(self._state, record)
+
+    @staticmethod
+    def _parse(line: bytes) -> Optional[Dict[str, Any]]:
+        """Parse one log line, None if it is blank or invalid."""
+        if not line.strip():
+            return None
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return None
+        return record if isinstance(record, dict) else None
+
+    @contextmanager
+    def _locked(self):
+        """Hold the log's process-level write lock"""
+        self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_file, 'w') as lock_file:
+            if sys.platform == "win32":
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if sys.platform == "win32":
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+__all__ = ['EventLog']
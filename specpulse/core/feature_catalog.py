@@ -0,0 +1,250 @@
+"""
+Feature Catalog - persisted index of feature directories and their artifacts
+
+``list``/``status`` style commands used to iterate ``specs/`` and glob
+``specs/``, ``plans/`` and ``tasks/`` for every feature on every call. The
+catalog records, per feature directory, the markdown files of each artifact
+directory together with that directory's stat signature. A refresh is a
+stat pass over the artifact directories: only directories whose signature
+changed (a file was added, removed or renamed) are listed again.
+
+The catalog lives in ``.specpulse/cache/features.json`` (one file per base
+directory) and, like the validation cache, is only persisted when the
+project already has a ``.specpulse`` directory.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .project_session import stat_signature
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout of the catalog file changes
+CATALOG_FORMAT_VERSION = 1
+
+ARTIFACT_KINDS = ('specs', 'plans', 'tasks')
+
+
+def _signature(path: Path) -> Optional[List[int]]:
+    """JSON-compatible stat signature of a directory"""
+    signature = stat_signature(path)
+    return list(signature) if signature is not None else None
+
+
+def artifact_files(entry: Dict[str, Any], kind: str, pattern: str = "*.md") -> List[str]:
+    """Sorted file names of one artifact kind of a catalog entry matching pattern"""
+    return [name for name in entry[kind]["files"] if fnmatch(name, pattern)]
+
+
+class FeatureCatalog:
+    """
+    Feature directories under ``<base>/specs`` and their artifact files.
+
+    Entries are keyed by feature directory name (``001-user-auth``) and look
+    like ``{"id": "001", "name": "user-auth", "specs": {"signature": [...],
+    "files": ["spec-001.md"]}, "plans": {...}, "tasks": {...}}`` with file
+    names sorted.
+
+    Example:
+        >>> catalog = FeatureCatalog(project_root / ".specpulse", cache_file)
+        >>> for name, entry in catalog.refresh().items():
+        ...     print(name, len(entry["specs"]["files"]))
+    """
+
+    def __init__(self, base: Path, cache_file: Optional[Path] = None):
+        """
+        Initialize feature catalog.
+
+        Args:
+            base: Directory containing specs/, plans/ and tasks/
+            cache_file: Where to persist the catalog, or None to keep it in memory
+        """
+        self.base = Path(base)
+        self.cache_file = Path(cache_file) if cache_file is not None else None
+        self._specs_signature: Optional[List[int]] = None
+        self._features: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load the persisted catalog, discarding incompatible files."""
+        self._features = {}
+        if self.cache_file is None or not self.cache_file.exists():
+            return self._features
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.debug(f"Ignoring unreadable feature catalog: {e}")
+            return self._features
+
+        if not isinstance(data, dict) or data.get("version") != CATALOG_FORMAT_VERSION:
+            logger.debug("Ignoring feature catalog with incompatible format")
+            return self._features
+
+        features = data.get("features")
+        if isinstance(features, dict):
+            self._features = features
+            self._specs_signature = data.get("specs_signature")
+        return self._features
+
+    def _scan_kind(self, feature_dir: str, kind: str) -> Dict[str, Any]:
+        """List the markdown files of one artifact directory."""
+        path = self.base / kind / feature_dir
+        signature = _signature(path)
+        files: List[str] = []
+        if signature is not None:
+            try:
+                files = sorted(entry.name for entry in path.iterdir()
+                               if entry.suffix == '.md' and entry.is_file())
+            except OSError:
+                pass
+        return {"signature": signature, "files": files}
+
+    def _scan_feature(self, feature_dir: str) -> Dict[str, Any]:
+        """Build the entry of one feature directory."""
+        feature_id, _, feature_name = feature_dir.partition('-')
+        entry: Dict[str, Any] = {"id": feature_id, "name": feature_name}
+        for kind in ARTIFACT_KINDS:
+            entry[kind] = self._scan_kind(feature_dir, kind)
+        return entry
+
+    def _sync_features(self) -> Dict[str, Dict[str, Any]]:
+        """Add and drop features when the specs directory listing changed."""
+        features = self._features if self._features is not None else self._load()
+
+        specs_dir = self.base / "specs"
+        signature = _signature(specs_dir)
+        if signature != self._specs_signature:
+            try:
+                names = {entry.name for entry in specs_dir.iterdir() if entry.is_dir()}
+            except OSError:
+                names = set()
+            for name in set(features) - names:
+                del features[name]
+            for name in names - set(features):
+                features[name] = self._scan_feature(name)
+            self._specs_signature = signature
+            self._dirty = True
+        return features
+
+    def refresh(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Reconcile the catalog with the file system and persist any changes.
+
+        Returns:
+            Entries by feature directory name, sorted by name
+        """
+        features = self._sync_features()
+        for name, entry in features.items():
+            for kind in ARTIFACT_KINDS:
+                if entry.get(kind, {}).get("signature") != _signature(self.base / kind / name):
+                    entry[kind] = self._scan_kind(name, kind)
+                    self._dirty = True
+
+        self.save()
+        return {name: features[name] for name in sorted(features)}
+
+    def get(self, feature_dir: str) -> Dict[str, Any]:
+        """
+        Up-to-date entry of one feature, checking only its own directories.
+
+        Features without a specs directory get an entry listing whatever
+        plans/tasks exist, but are not added to the catalog.
+        """
+        features = self._features if self._features is not None else self._load()
+        entry = features.get(feature_dir)
+
+        if entry is None:
+            entry = self._scan_feature(feature_dir)
+            if entry["specs"]["signature"] is None:
+                return entry
+            features[feature_dir] = entry
+            self._dirty = True
+        else:
+            for kind in ARTIFACT_KINDS:
+                if entry.get(kind, {}).get("signature") != _signature(self.base / kind / feature_dir):
+                    entry[kind] = self._scan_kind(feature_dir, kind)
+                    self._dirty = True
+
+        self.save()
+        return entry
+
+    def find(self, identifier: str) -> Optional[str]:
+        """Feature directory name by ID or name (exact, then partial match)"""
+        names = sorted(self._sync_features())
+        self.save()
+        for name in names:
+            if name == identifier or name.startswith(f"{identifier}-"):
+                return name
+
+        identifier_lower = identifier.lower()
+        for name in names:
+            if identifier_lower in name.lower():
+                return name
+        return None
+
+    def record(self, feature_dir: str) -> None:
+        """Add or rescan a feature after it was created or changed."""
+        if self._features is None:
+            self._load()
+        self._features[feature_dir] = self._scan_feature(feature_dir)
+        self._dirty = True
+        self.save()
+
+    def remove(self, feature_dir: str) -> None:
+        """Drop a deleted feature."""
+        if self._features is None:
+            self._load()
+        if self._features.pop(feature_dir, None) is not None:
+            self._dirty = True
+            self.save()
+
+    def save(self) -> bool:
+        """
+        Persist the catalog atomically if it changed.
+
+        Returns:
+            True if the catalog was written, False otherwise
+        """
+        if not self._dirty or self.cache_file is None:
+            return False
+
+        # Never create .specpulse/ as a side effect of listing features
+        if not self.cache_file.parent.parent.is_dir():
+            return False
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_fd, temp_path = tempfile.mkstemp(
+                dir=self.cache_file.parent,
+                prefix=f".{self.cache_file.stem}_tmp_",
+                suffix=self.cache_file.suffix
+            )
+            try:
+                with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+                    json.dump({
+                        "version": CATALOG_FORMAT_VERSION,
+                        "specs_signature": self._specs_signature,
+                        "features": self._features,
+                    }, f, ensure_ascii=False)
+                os.replace(temp_path, self.cache_file)
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write feature catalog: {e}")
+            return False
+
+        self._dirty = False
+        return True
+
+
+__all__ = ['FeatureCatalog', 'ARTIFACT_KINDS', 'artifact_files']
@@ -3,18 +3,31 @@ LLM CLI Interface for SpecPulse
 
 This module provides a standardized interface for LLM to interact with SpecPulse CLI
 with strict enforcement and no interpretation allowed.
+
+Commands run in-process by default: they are dispatched through
+CommandHandler.execute_command (via the CLI entry point, as the warm daemon
+does) with console output captured, so scripted workflows do not pay
+interpreter start and imports per command. ``isolated=True`` runs each
+command in its own ``python -m specpulse.cli.main`` process instead. Either
+way the files a command touched are found by comparing stat signatures of
+``.specpulse/`` before and after it, not by scraping its output.
 """
 
+import io
+import os
 import subprocess
 import json
 import sys
+import time
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, field
 from enum import Enum
 
 from .llm_compliance_enforcer import LLMComplianceEnforcer, enforce_llm_compliance
 from .llm_task_status_manager import LLMTaskStatusManager, TaskStatus, LLMOperationType
+from .project_session import StatKey, stat_signature
 from ..utils.error_handler import ValidationError, ErrorSeverity
 from ..utils.console import Console
 
@@ -45,6 +58,10 @@ class CLICommandResult:
     stderr: str
     execution_time: float
     files_affected: List[str]
+    files_created: List[str] = field(default_factory=list)
+    files_modified: List[str] = field(default_factory=list)
+    files_deleted: List[str] = field(default_factory=list)
+    isolated: bool = True
 
 
 class LLMCLIInterface:
@@ -53,12 +70,26 @@ class LLMCLIInterface:
     No interpretation allowed - only exact command execution.
     """
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, isolated: bool = False):
+        """
+        Initialize the interface.
+
+        Args:
+            project_root: Root directory of the SpecPulse project
+            isolated: Run every command in a separate process by default
+                (in-process execution is not thread-safe: it changes the
+                working directory and redirects stdout/stderr)
+        """
         self.project_root = project_root
+        self.isolated = isolated
         self.enforcer = LLMComplianceEnforcer(project_root)
         self.status_manager = LLMTaskStatusManager(project_root)
         self.console = Console()
 
+        # Warm command handlers for in-process execution, keyed by verbosity
+        self._handlers: Dict[bool, Any] = {}
+        self._handler_state = None
+
         # Validate that we're in a SpecPulse project
         self._validate_specpulse_project()
 
@@ -91,7 +122,9 @@ class LLMCLIInterface:
             task_id: Task ID for tracking
             feature_id: Feature ID for tracking
             feature_name: Feature name for tracking
-            **kwargs: Additional keyword arguments
+            **kwargs: Additional keyword arguments (verbose, force,
+                isolated to override the interface default, and timeout
+                in seconds for isolated execution)
 
         Returns:
             CLICommandResult with execution details
@@ -116,50 +149,55 @@ class LLMCLIInterface:
 
         try:
             # Build command
-            cmd = ["python", "-m", "specpulse.cli.main", command.value]
+            argv = [command.value]
             if args:
-                cmd.extend(args)
+                argv.extend(args)
 
             # Add common arguments
             if kwargs.get("verbose"):
-                cmd.append("--verbose")
+                argv.append("--verbose")
             if kwargs.get("force"):
-                cmd.append("--force")
+                argv.append("--force")
 
             # Execute command
-            import time
+            isolated = kwargs.get("isolated", self.isolated)
+            files_before = self._snapshot_files()
             start_time = time.time()
 
-            result = subprocess.run(
-                cmd,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=kwargs.get("timeout", 300)  # 5 minute default timeout
-            )
+            if isolated:
+                cmd = [sys.executable, "-m", "specpulse.cli.main"] + argv
+                return_code, stdout, stderr = self._run_subprocess(
+                    cmd, kwargs.get("timeout", 300)  # 5 minute default timeout
+                )
+            else:
+                cmd = ["specpulse"] + argv
+                return_code, stdout, stderr = self._run_in_process(argv)
 
             execution_time = time.time() - start_time
 
-            # Parse affected files from output
-            files_affected = self._parse_affected_files(result.stdout)
+            # Files touched by the command
+            created, modified, deleted = self._diff_files(files_before, self._snapshot_files())
 
             # Create result object
             cli_result = CLICommandResult(
                 command=" ".join(cmd),
-                success=result.returncode == 0,
-                return_code=result.returncode,
-                stdout=result.stdout,
-                stderr=result.stderr,
+                success=return_code == 0,
+                return_code=return_code,
+                stdout=stdout,
+                stderr=stderr,
                 execution_time=execution_time,
-                files_affected=files_affected
+                files_affected=sorted(created + modified),
+                files_created=created,
+                files_modified=modified,
+                files_deleted=deleted,
+                isolated=isolated
             )
 
             # Track file operations
-            for file_path in files_affected:
-                full_path = self.project_root / file_path
-                if full_path.exists():
-                    # Determine if file was created or modified (simplified)
-                    self.enforcer.track_file_modification(full_path)
+            for file_path in created:
+                self.enforcer.track_file_creation(self.project_root / file_path)
+            for file_path in modified:
+                self.enforcer.track_file_modification(self.project_root / file_path)
 
             # Validate success and end session
             success = cli_result.success and not cli_result.stderr
@@ -199,30 +237,85 @@ class LLMCLIInterface:
         }
         return mapping.get(command, LLMOperationType.STATUS_UPDATE)
 
-    def _parse_affected_files(self, output: str) -> List[str]:
-        """Parse affected files from CLI output"""
-        files = []
-
-        # Look for file patterns in output
-        import re
-
-        # Match file paths in output
-        file_patterns = [
-            r'Created: (\.specpulse/[^\s]+)',
-            r'Updated: (\.specpulse/[^\s]+)',
-            r'File: (\.specpulse/[^\s]+)',
-            r'(\.specpulse/[^\s]+\.(md|json|yaml|toml))'
-        ]
+    def _run_subprocess(self, cmd: List[str], timeout: float) -> Tuple[int, str, str]:
+        """Run a command in a separate process"""
+        result = subprocess.run(
+            cmd,
+            cwd=self.project_root,
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+        return result.returncode, result.stdout, result.stderr
 
-        for pattern in file_patterns:
-            matches = re.findall(pattern, output)
-            for match in matches:
-                if isinstance(match, tuple):
-                    files.append(match[0])
-                else:
-                    files.append(match)
+    def _run_in_process(self, argv: List[str]) -> Tuple[int, str, str]:
+        """Dispatch a command through the CLI entry point in this process"""
+        from ..cli.main import main
 
-        return list(set(files))  # Remove duplicates
+        stdout, stderr = io.StringIO(), io.StringIO()
+        return_code = 0
+        cwd = os.getcwd()
+        try:
+            # Commands locate the project from the working directory
+            os.chdir(self.project_root)
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    main(argv, handler_factory=self._handler_for)
+                except SystemExit as e:
+                    if isinstance(e.code, str):
+                        stderr.write(e.code + "\n")
+                        return_code = 1
+                    else:
+                        return_code = e.code or 0
+        finally:
+            os.chdir(cwd)
+            # The handlers are up to date with their own writes
+            self._handler_state = self._handler_state_signature()
+
+        return return_code, stdout.getvalue(), stderr.getvalue()
+
+    def _handler_for(self, args: Any) -> Any:
+        """Warm CommandHandler, rebuilt when project state changed outside it"""
+        state = self._handler_state_signature()
+        if state != self._handler_state:
+            self._handlers.clear()
+            self._handler_state = state
+
+        verbose = bool(getattr(args, 'verbose', False))
+        handler = self._handlers.get(verbose)
+        if handler is None:
+            from ..cli.handlers.command_handler import CommandHandler
+            # Captured output is read by a program: no color codes
+            handler = CommandHandler(no_color=True, verbose=verbose)
+            self._handlers[verbose] = handler
+        return handler
+
+    def _handler_state_signature(self) -> Tuple[Any, ...]:
+        """Stat signature of the project state files handlers load once"""
+        from ..cli.daemon import STATE_FILES
+        return tuple(stat_signature(self.project_root / name) for name in STATE_FILES)
+
+    def _snapshot_files(self) -> Dict[str, StatKey]:
+        """Stat signatures of the files under .specpulse, keyed by relative path"""
+        snapshot = {}
+        for dirpath, _, filenames in os.walk(self.project_root / ".specpulse"):
+            for name in filenames:
+                if name.endswith(".lock"):
+                    continue  # Lock files are truncated by every writer
+                path = Path(dirpath) / name
+                signature = stat_signature(path)
+                if signature is not None:
+                    snapshot[path.relative_to(self.project_root).as_posix()] = signature
+        return snapshot
+
+    @staticmethod
+    def _diff_files(before: Dict[str, StatKey],
+                    after: Dict[str, StatKey]) -> Tuple[List[str], List[str], List[str]]:
+        """Created, modified and deleted files between two snapshots"""
+        created = sorted(path for path in after if path not in before)
+        modified = sorted(path for path in after if path in before and after[path] != before[path])
+        deleted = sorted(path for path in before if path not in after)
+        return created, modified, deleted
 
     # Strict command execution methods - no interpretation allowed
     def create_specification(self, feature_id: str, feature_name: str,
@@ -58,7 +58,15 @@ class LLMCLITester:
     Ensures all operations work smoothly and follow strict rules.
     """
 
-    def __init__(self, project_root: Optional[Path] = None):
+    def __init__(self, project_root: Optional[Path] = None, isolated: bool = False):
+        """
+        Initialize the tester.
+
+        Args:
+            project_root: Project to test against (default: a temporary project)
+            isolated: Run every test command in a separate process; test
+                case timeouts only apply to isolated runs
+        """
         if project_root is None:
             # Create temporary project for testing
             self.temp_project = self._create_test_project()
@@ -67,7 +75,7 @@ class LLMCLITester:
             self.project_root = project_root
             self.temp_project = None
 
-        self.cli_interface = LLMCLIInterface(self.project_root)
+        self.cli_interface = LLMCLIInterface(self.project_root, isolated=isolated)
         self.enforcer = LLMComplianceEnforcer(self.project_root)
         self.status_manager = LLMTaskStatusManager(self.project_root)
         self.console = Console()
@@ -492,17 +500,18 @@ class LLMCLITester:
 
 
 # Convenience function for quick testing
-def quick_cli_test(project_root: Optional[Path] = None) -> Dict[str, Any]:
+def quick_cli_test(project_root: Optional[Path] = None, isolated: bool = False) -> Dict[str, Any]:
     """
     Run a quick CLI-LLM integration test.
 
     Args:
         project_root: Optional project root path
+        isolated: Run every test command in a separate process
 
     Returns:
         Test summary dictionary
     """
-    tester = LLMCLITester(project_root)
+    tester = LLMCLITester(project_root, isolated=isolated)
     try:
         summary = tester.run_all_tests()
         tester.print_test_report(summary)
@@ -9,13 +9,16 @@ import json
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, Iterable, List, Optional, Any, Callable
 from dataclasses import dataclass, asdict
 from enum import Enum
 
 from .llm_task_status_manager import LLMTaskStatusManager, TaskStatus, LLMOperationType
 from .llm_compliance_enforcer import LLMComplianceEnforcer
+from .event_log import EventLog
 from .path_manager import PathManager
+from .project_session import stat_signature
+from .task_graph import TaskGraph
 from ..utils.error_handler import ValidationError, ErrorSeverity
 from ..utils.console import Console
 
@@ -94,13 +97,25 @@ class LLMTaskLifecycleManager:
         self.lifecycle_dir = self.path_manager.memory_dir / "lifecycle"
         self.lifecycle_dir.mkdir(parents=True, exist_ok=True)
 
-        self.events_file = self.lifecycle_dir / "events.json"
+        self.events_file = self.lifecycle_dir / "events.jsonl"
         self.rules_file = self.lifecycle_dir / "rules.json"
         self.dependencies_file = self.lifecycle_dir / "dependencies.json"
 
+        # Append-only event log indexed by task ID, with per-task event summaries
+        self.event_log = EventLog(
+            self.events_file, "task_id",
+            initial_state=lambda: {"total_events": 0, "tasks": {}},
+            reducer=self._fold_event_state,
+            state_version=2
+        )
+
         # Initialize tracking
         self._initialize_lifecycle_tracking()
 
+        # Dependency DAG, rebuilt only when dependencies.json changes on disk
+        self._graph: Optional[TaskGraph] = None
+        self._graph_signature = None
+
         # Define lifecycle rules
         self.lifecycle_rules = self._define_lifecycle_rules()
 
@@ -109,14 +124,8 @@ class LLMTaskLifecycleManager:
 
     def _initialize_lifecycle_tracking(self) -> None:
         """Initialize lifecycle tracking files"""
-        # Events tracking
-        if not self.events_file.exists():
-            initial_events = {
-                "version": "1.0",
-                "total_events": 0,
-                "events": []
-            }
-            self.events_file.write_text(json.dumps(initial_events, indent=2), encoding='utf-8')
+        # Events of projects from before the JSONL log
+        self.event_log.import_legacy(self.lifecycle_dir / "events.json", "events")
 
         # Rules tracking
         if not self.rules_file.exists():
@@ -251,7 +260,7 @@ class LLMTaskLifecycleManager:
             True if dependency added successfully
         """
         try:
-            dependencies = self._load_dependencies()
+            graph = self._dependency_graph()
 
             new_dependency = TaskDependency(
                 task_id=task_id,
@@ -260,14 +269,11 @@ class LLMTaskLifecycleManager:
                 description=description or f"{task_id} depends on {depends_on}"
             )
 
-            dependencies["dependencies"].append(asdict(new_dependency))
-
-            # Update dependency graph
-            if task_id not in dependencies["dependency_graph"]:
-                dependencies["dependency_graph"][task_id] = []
-            dependencies["dependency_graph"][task_id].append(depends_on)
+            if not graph.add(asdict(new_dependency)):
+                self.console.error(f"Dependency {task_id} -> {depends_on} would create a cycle")
+                return False
 
-            self._save_dependencies(dependencies)
+            self._save_graph(graph)
 
             # Record lifecycle event
             self.record_lifecycle_event(
@@ -398,12 +404,10 @@ class LLMTaskLifecycleManager:
     def get_task_lifecycle_status(self, task_id: str) -> Dict[str, Any]:
         """Get comprehensive lifecycle status for a task"""
         try:
-            events = self._load_events()
-            task_events = [e for e in events["events"] if e["task_id"] == task_id]
+            task_events = self.event_log.records(task_id)
 
             current_status = self.status_manager.get_task_status(task_id)
-            dependencies = self._load_dependencies()
-            task_dependencies = [d for d in dependencies["dependencies"] if d["task_id"] == task_id]
+            task_dependencies = list(self._dependency_graph().prerequisites(task_id).values())
 
             # Calculate lifecycle metrics
             total_events = len(task_events)
@@ -440,7 +444,7 @@ class LLMTaskLifecycleManager:
         """Get comprehensive lifecycle summary"""
         try:
             events = self._load_events()
-            dependencies = self._load_dependencies()
+            graph = self._dependency_graph()
 
             # Calculate metrics
             total_events = events["total_events"]
@@ -467,7 +471,7 @@ class LLMTaskLifecycleManager:
                 "active_tasks": len(active_tasks),
                 "completed_tasks": len(completed_tasks),
                 "failed_tasks": len(failed_tasks),
-                "total_dependencies": len(dependencies["dependencies"]),
+                "total_dependencies": graph.edge_count,
                 "active_rules": len(active_rules),
                 "rule_ids": list(active_rules),
                 "lifecycle_health": len(completed_tasks) / max(1, len(completed_tasks) + len(failed_tasks))
@@ -476,24 +480,143 @@ class LLMTaskLifecycleManager:
         except Exception as e:
             return {"error": str(e)}
 
+    def get_ready_tasks(self, candidates: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Not yet started tasks whose dependencies are all satisfied.
+
+        Args:
+            candidates: Tasks to consider (default: every task in the
+                dependency graph). Pass the dependents of a task that just
+                finished to find what it unblocked in O(degree).
+
+        Returns:
+            Sorted task IDs that can start now
+        """
+        graph = self._dependency_graph()
+        candidates = set(graph.tasks if candidates is None else candidates)
+
+        needed = set(candidates)
+        for task_id in candidates:
+            needed.update(graph.prerequisites(task_id))
+        statuses = self.status_manager.get_task_statuses(needed)
+
+        return sorted(
+            task_id for task_id in candidates
+            if statuses[task_id] == TaskStatus.NOT_STARTED
+            and self._prerequisites_satisfied(task_id, statuses)
+        )
+
+    def get_dependency_graph(self) -> TaskGraph:
+        """Current task dependency graph (read-only use)"""
+        return self._dependency_graph()
+
+    def get_execution_levels(self) -> List[List[str]]:
+        """Tasks grouped so that no task depends on another of its level"""
+        return self._dependency_graph().topological_levels()
+
+    def get_critical_path(self, feature_id: Optional[str] = None,
+                          durations: Optional[Dict[str, float]] = None) -> List[str]:
+        """
+        Longest dependency chain of the task graph.
+
+        Args:
+            feature_id: Only consider tasks of this feature (IDs prefixed "<feature_id>-")
+            durations: Estimated duration per task (default: 1 each)
+
+        Returns:
+            Task IDs along the critical path, first task first
+        """
+        graph = self._dependency_graph()
+        tasks = None
+        if feature_id:
+            tasks = [task for task in graph.tasks if task.startswith(f"{feature_id}-")]
+        return graph.critical_path(tasks, durations)
+
+    def get_task_event_summary(self, task_id: str) -> Dict[str, Any]:
+        """
+        Get a task's event count and last IN_PROGRESS / COMPLETED timestamps.
+
+        Maintained as events are written, so no events are read.
+        """
+        summary = self.event_log.state()["tasks"].get(task_id)
+        if summary is None:
+            return {"event_count": 0, "last_in_progress": None, "last_completed": None}
+        return dict(summary)
+
+    def sweep(self, now: Optional[datetime] = None) -> Dict[str, List[str]]:
+        """
+        Evaluate the timeout and cleanup rules for every task in one pass.
+
+        Meant to run periodically (daemon, cron): the rules' own trigger
+        events fire too early for time-based checks. Only enabled rules
+        run; timeouts apply to in-progress tasks and cleanup to completed
+        ones.
+
+        Args:
+            now: Reference time of the checks (default: current time)
+
+        Returns:
+            Task IDs acted on, as {"timed_out": [...], "cleaned_up": [...]}
+        """
+        now = now or datetime.now()
+        sweeps = [
+            ("timed_out", self.lifecycle_rules["auto_timeout"], TaskStatus.IN_PROGRESS),
+            ("cleaned_up", self.lifecycle_rules["auto_cleanup"], TaskStatus.COMPLETED),
+        ]
+        result: Dict[str, List[str]] = {key: [] for key, _, _ in sweeps}
+
+        task_ids = sorted(self.event_log.state()["tasks"])
+        statuses = self.status_manager.get_task_statuses(task_ids)
+        for task_id in task_ids:
+            for key, rule, required_status in sweeps:
+                if not rule.is_enabled or statuses[task_id] != required_status:
+                    continue
+
+                context = {"task_id": task_id, "current_status": statuses[task_id], "now": now}
+                try:
+                    if rule.condition(context) and rule.action(task_id, context):
+                        result[key].append(task_id)
+                except Exception as e:
+                    self.console.error(f"Lifecycle rule {rule.id} failed: {e}")
+
+        return result
+
     # Private methods for lifecycle automation
     def _save_lifecycle_event(self, event_record: LifecycleEventRecord) -> None:
-        """Save lifecycle event to file"""
-        events = self._load_events()
-
+        """Append lifecycle event to the event log"""
         event_dict = asdict(event_record)
         event_dict["timestamp"] = event_record.timestamp.isoformat()
         event_dict["event"] = event_record.event.value
         event_dict["trigger"] = event_record.trigger.value
 
-        events["events"].append(event_dict)
-        events["total_events"] += 1
-
-        self.events_file.write_text(json.dumps(events, indent=2), encoding='utf-8')
+        self.event_log.append(event_dict)
 
     def _load_events(self) -> Dict[str, Any]:
         """Load lifecycle events"""
-        return json.loads(self.events_file.read_text(encoding='utf-8'))
+        return {
+            "version": "1.0",
+            "total_events": self.event_log.state()["total_events"],
+            "events": list(self.event_log)
+        }
+
+    @staticmethod
+    def _fold_event_state(state: Dict[str, Any], event: Dict[str, Any]) -> None:
+        """Fold a lifecycle event into the event totals and its task's summary"""
+        state["total_events"] += 1
+
+        summary = state["tasks"].setdefault(event["task_id"], {
+            "event_count": 0,
+            "last_in_progress": None,
+            "last_completed": None
+        })
+        summary["event_count"] += 1
+
+        field = {
+            LifecycleEvent.IN_PROGRESS.value: "last_in_progress",
+            LifecycleEvent.COMPLETED.value: "last_completed"
+        }.get(event["event"])
+        if field and (summary[field] is None or event["timestamp"] > summary[field]):
+            summary[field] = event["timestamp"]
 
     def _load_dependencies(self) -> Dict[str, Any]:
         """Load task dependencies"""
@@ -503,6 +626,40 @@ class LLMTaskLifecycleManager:
         """Save task dependencies"""
         self.dependencies_file.write_text(json.dumps(dependencies, indent=2), encoding='utf-8')
 
+    def _dependency_graph(self) -> TaskGraph:
+        """Dependency DAG, reloaded only if dependencies.json changed"""
+        signature = stat_signature(self.dependencies_file)
+        if self._graph is None or signature != self._graph_signature:
+            self._graph = TaskGraph.from_records(self._load_dependencies()["dependencies"])
+            self._graph_signature = signature
+        return self._graph
+
+    def _save_graph(self, graph: TaskGraph) -> None:
+        """Persist dependency records together with the graph built from them"""
+        self._save_dependencies({
+            "version": "1.0",
+            "dependencies": graph.records(),
+            "dependency_graph": graph.to_dict()
+        })
+        self._graph = graph
+        self._graph_signature = stat_signature(self.dependencies_file)
+
+    @staticmethod
+    def _dependency_satisfied(dependency_type: str, status: TaskStatus) -> bool:
+        """Whether a prerequisite in status satisfies a dependency of dependency_type"""
+        if dependency_type in ("completion", "success"):
+            return status == TaskStatus.COMPLETED
+        if dependency_type == "start":
+            return status != TaskStatus.NOT_STARTED
+        return True
+
+    def _prerequisites_satisfied(self, task_id: str, statuses: Dict[str, TaskStatus]) -> bool:
+        """Whether every dependency of task_id is satisfied given prerequisite statuses"""
+        return all(
+            self._dependency_satisfied(dep["dependency_type"], statuses[depends_on])
+            for depends_on, dep in self._dependency_graph().prerequisites(task_id).items()
+        )
+
     def _process_lifecycle_event(self, event_record: LifecycleEventRecord,
                                current_status: TaskStatus) -> None:
         """Process lifecycle event and trigger rules"""
@@ -533,24 +690,12 @@ class LLMTaskLifecycleManager:
     def _check_dependencies_satisfied(self, context: Dict[str, Any]) -> bool:
         """Check if task dependencies are satisfied"""
         task_id = context["task_id"]
-        dependencies = self._load_dependencies()
-
-        task_dependencies = [d for d in dependencies["dependencies"] if d["task_id"] == task_id]
-
-        for dep in task_dependencies:
-            dep_status = self.status_manager.get_task_status(dep["depends_on"])
+        prerequisites = self._dependency_graph().prerequisites(task_id)
+        if not prerequisites:
+            return True
 
-            if dep["dependency_type"] == "completion":
-                if dep_status != TaskStatus.COMPLETED:
-                    return False
-            elif dep["dependency_type"] == "success":
-                if dep_status not in [TaskStatus.COMPLETED]:
-                    return False
-            elif dep["dependency_type"] == "start":
-                if dep_status == TaskStatus.NOT_STARTED:
-                    return False
-
-        return True
+        statuses = self.status_manager.get_task_statuses(prerequisites)
+        return self._prerequisites_satisfied(task_id, statuses)
 
     def _auto_start_task(self, task_id: str, context: Dict[str, Any]) -> bool:
         """Auto-start a task when dependencies are satisfied"""
@@ -570,27 +715,23 @@ class LLMTaskLifecycleManager:
     def _check_dependent_tasks(self, context: Dict[str, Any]) -> bool:
         """Check if there are dependent tasks that need to be blocked"""
         failed_task_id = context["event"].task_id
-        dependencies = self._load_dependencies()
-
-        dependent_tasks = [d for d in dependencies["dependencies"] if d["depends_on"] == failed_task_id]
-        return len(dependent_tasks) > 0
+        return bool(self._dependency_graph().dependents(failed_task_id))
 
     def _auto_block_dependent_tasks(self, failed_task_id: str, context: Dict[str, Any]) -> bool:
-        """Block dependent tasks when a task fails"""
+        """Block every task that depends on a failed task, directly or transitively"""
         try:
-            dependencies = self._load_dependencies()
-            dependent_tasks = [d for d in dependencies["dependencies"] if d["depends_on"] == failed_task_id]
+            dependent_tasks = self._dependency_graph().transitive_dependents(failed_task_id)
+            statuses = self.status_manager.get_task_statuses(dependent_tasks)
 
-            for dep in dependent_tasks:
-                current_status = self.status_manager.get_task_status(dep["task_id"])
-                if current_status in [TaskStatus.NOT_STARTED, TaskStatus.IN_PROGRESS]:
+            for task_id in dependent_tasks:
+                if statuses[task_id] in [TaskStatus.NOT_STARTED, TaskStatus.IN_PROGRESS]:
                     self.status_manager.update_task_status(
-                        dep["task_id"],
+                        task_id,
                         TaskStatus.BLOCKED,
                         f"Blocked due to dependency failure: {failed_task_id}"
                     )
                     self.record_lifecycle_event(
-                        dep["task_id"],
+                        task_id,
                         LifecycleEvent.BLOCKED,
                         LifecycleTrigger.DEPENDENCY,
                         f"Blocked by failed dependency: {failed_task_id}"
@@ -604,22 +745,17 @@ class LLMTaskLifecycleManager:
 
     def _check_task_timeout(self, context: Dict[str, Any]) -> bool:
         """Check if task has timed out"""
-        task_id = context["task_id"]
-        events = self._load_events()
-
         # Find the last IN_PROGRESS event
-        task_events = [e for e in events["events"] if e["task_id"] == task_id]
-        in_progress_events = [e for e in task_events if e["event"] == LifecycleEvent.IN_PROGRESS.value]
+        last_progress = self.get_task_event_summary(context["task_id"])["last_in_progress"]
 
-        if not in_progress_events:
+        if not last_progress:
             return False
 
-        last_progress = max(in_progress_events, key=lambda x: x["timestamp"])
-        last_time = datetime.fromisoformat(last_progress["timestamp"])
+        last_time = datetime.fromisoformat(last_progress)
 
         # Timeout after 24 hours (configurable)
         timeout_hours = 24
-        timeout_threshold = datetime.now() - timedelta(hours=timeout_hours)
+        timeout_threshold = (context.get("now") or datetime.now()) - timedelta(hours=timeout_hours)
 
         return last_time < timeout_threshold
 
@@ -644,19 +780,14 @@ class LLMTaskLifecycleManager:
 
     def _check_cleanup_eligibility(self, context: Dict[str, Any]) -> bool:
         """Check if task is eligible for cleanup"""
-        task_id = context["task_id"]
-        events = self._load_events()
-
-        task_events = [e for e in events["events"] if e["task_id"] == task_id]
-        completed_events = [e for e in task_events if e["event"] == LifecycleEvent.COMPLETED.value]
+        last_completion = self.get_task_event_summary(context["task_id"])["last_completed"]
 
-        if not completed_events:
+        if not last_completion:
             return False
 
         # Cleanup tasks completed more than 30 days ago
-        last_completion = max(completed_events, key=lambda x: x["timestamp"])
-        completion_time = datetime.fromisoformat(last_completion["timestamp"])
-        cleanup_threshold = datetime.now() - timedelta(days=30)
+        completion_time = datetime.fromisoformat(last_completion)
+        cleanup_threshold = (context.get("now") or datetime.now()) - timedelta(days=30)
 
         return completion_time < cleanup_threshold
 
@@ -9,10 +9,11 @@ import json
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from .event_log import EventLog
 from ..utils.console import Console
 from ..utils.error_handler import ValidationError, ErrorSeverity
 
@@ -91,8 +92,20 @@ class LLMTaskStatusManager:
         self.status_dir.mkdir(parents=True, exist_ok=True)
 
         self.current_status_file = self.status_dir / "current_status.json"
-        self.operation_history_file = self.status_dir / "operation_history.json"
-        self.compliance_log_file = self.status_dir / "compliance_log.json"
+        self.operation_history_file = self.status_dir / "operation_history.jsonl"
+        self.compliance_log_file = self.status_dir / "compliance_log.jsonl"
+
+        # Append-only logs: one record per operation start/update and per violation
+        self.operation_log = EventLog(
+            self.operation_history_file, "operation_id",
+            initial_state=lambda: {"total_operations": 0, "last_operation_id": 0, "open": {}},
+            reducer=self._fold_operation_state
+        )
+        self.compliance_log = EventLog(
+            self.compliance_log_file, "session_id",
+            initial_state=lambda: {"total_violations": 0, "compliance_score": 1.0, "last_updated": None},
+            reducer=self._fold_compliance_state
+        )
 
         # Initialize tracking files
         self._initialize_tracking()
@@ -124,26 +137,9 @@ class LLMTaskStatusManager:
             }
             self.current_status_file.write_text(json.dumps(initial_status, indent=2), encoding='utf-8')
 
-        # Operation history tracking
-        if not self.operation_history_file.exists():
-            initial_history = {
-                "version": "1.0",
-                "total_operations": 0,
-                "operations": [],
-                "last_operation_id": 0
-            }
-            self.operation_history_file.write_text(json.dumps(initial_history, indent=2), encoding='utf-8')
-
-        # Compliance log tracking
-        if not self.compliance_log_file.exists():
-            initial_compliance = {
-                "version": "1.0",
-                "total_violations": 0,
-                "violations": [],
-                "compliance_score": 1.0,
-                "last_updated": datetime.now().isoformat()
-            }
-            self.compliance_log_file.write_text(json.dumps(initial_compliance, indent=2), encoding='utf-8')
+        # Operation history and compliance logs of projects from before the JSONL logs
+        self.operation_log.import_legacy(self.status_dir / "operation_history.json", "operations")
+        self.compliance_log.import_legacy(self.status_dir / "compliance_log.json", "violations")
 
     def _define_operation_rules(self) -> Dict[LLMOperationType, TaskStatusRule]:
         """Define strict operation rules that cannot be overridden"""
@@ -340,16 +336,11 @@ class LLMTaskStatusManager:
                 )
                 return False
 
-            # Track the operation
-            operation_history = self._load_operation_history()
-            for operation in operation_history["operations"]:
-                if operation["operation_id"] == self.current_session_id:
-                    file_list = operation.get(f"files_{operation_type}", [])
-                    file_list.append(str(file_path))
-                    operation[f"files_{operation_type}"] = list(set(file_list))  # Remove duplicates
-                    break
-
-            self._save_operation_history(operation_history)
+            # Track the operation (merged into the session's record on read)
+            self.operation_log.append({
+                "operation_id": self.current_session_id,
+                f"files_{operation_type}": [str(file_path)]
+            })
             return True
 
         except Exception as e:
@@ -409,12 +400,10 @@ class LLMTaskStatusManager:
 
             # Update current operation if active
             if self.current_session_id:
-                operation_history = self._load_operation_history()
-                for operation in operation_history["operations"]:
-                    if operation["operation_id"] == self.current_session_id:
-                        operation["status_after"] = new_status.value
-                        break
-                self._save_operation_history(operation_history)
+                self.operation_log.append({
+                    "operation_id": self.current_session_id,
+                    "status_after": new_status.value
+                })
 
             return True
 
@@ -442,37 +431,9 @@ class LLMTaskStatusManager:
             return True  # No active session
 
         try:
-            # Load operation history
-            operation_history = self._load_operation_history()
-
-            # Find and update current operation
-            operation_found = False
-            for operation in operation_history["operations"]:
-                if operation["operation_id"] == self.current_session_id:
-                    operation["end_time"] = datetime.now().isoformat()
-                    operation["validation_passed"] = success
-                    operation["error_message"] = error_message
-
-                    # Calculate compliance score
-                    operation["llm_compliance_score"] = self._calculate_compliance_score(operation)
-
-                    # Update task status based on operation result
-                    if operation["task_id"] and operation["operation_type"]:
-                        op_type = LLMOperationType(operation["operation_type"])
-                        rule = self.operation_rules.get(op_type)
-
-                        if rule:
-                            new_status = rule.status_after_success if success else rule.status_after_failure
-                            self.update_task_status(
-                                operation["task_id"],
-                                new_status,
-                                f"LLM session {'completed' if success else 'failed'}: {error_message or 'No error'}"
-                            )
-
-                    operation_found = True
-                    break
-
-            if not operation_found:
+            # Find current operation
+            operation = self._load_operation(self.current_session_id)
+            if operation is None:
                 self._log_compliance_violation(
                     "Could not find operation to end",
                     "session_end",
@@ -480,8 +441,30 @@ class LLMTaskStatusManager:
                 )
                 return False
 
-            # Save updated operation history
-            self._save_operation_history(operation_history)
+            update = {
+                "operation_id": self.current_session_id,
+                "end_time": datetime.now().isoformat(),
+                "validation_passed": success,
+                "error_message": error_message
+            }
+            operation.update(update)
+
+            # Calculate compliance score
+            update["llm_compliance_score"] = self._calculate_compliance_score(operation)
+            self.operation_log.append(update)
+
+            # Update task status based on operation result
+            if operation["task_id"] and operation["operation_type"]:
+                op_type = LLMOperationType(operation["operation_type"])
+                rule = self.operation_rules.get(op_type)
+
+                if rule:
+                    new_status = rule.status_after_success if success else rule.status_after_failure
+                    self.update_task_status(
+                        operation["task_id"],
+                        new_status,
+                        f"LLM session {'completed' if success else 'failed'}: {error_message or 'No error'}"
+                    )
 
             # Clear session tracking
             self.current_session_id = None
@@ -523,12 +506,7 @@ class LLMTaskStatusManager:
                 return compliance_result
 
             # Load current operation
-            operation_history = self._load_operation_history()
-            current_operation = None
-            for operation in operation_history["operations"]:
-                if operation["operation_id"] == self.current_session_id:
-                    current_operation = operation
-                    break
+            current_operation = self._load_operation(self.current_session_id)
 
             if not current_operation:
                 compliance_result["violations"].append("Could not find current operation")
@@ -588,31 +566,33 @@ class LLMTaskStatusManager:
         data["last_updated"] = datetime.now().isoformat()
         self.current_status_file.write_text(json.dumps(data, indent=2), encoding='utf-8')
 
-    def _load_operation_history(self) -> Dict[str, Any]:
-        """Load operation history tracking data"""
-        return json.loads(self.operation_history_file.read_text(encoding='utf-8'))
-
-    def _save_operation_history(self, data: Dict[str, Any]) -> None:
-        """Save operation history tracking data"""
-        self.operation_history_file.write_text(json.dumps(data, indent=2), encoding='utf-8')
+    def _load_operation(self, operation_id: str) -> Optional[Dict[str, Any]]:
+        """Merge an operation's start record with its later updates"""
+        records = self.operation_log.records(operation_id)
+        if not records or "start_time" not in records[0]:
+            return None
+
+        operation = dict(records[0])
+        for record in records[1:]:
+            for field, value in record.items():
+                if field in ("files_created", "files_modified"):
+                    files = operation.setdefault(field, [])
+                    files.extend(path for path in value if path not in files)  # Remove duplicates
+                else:
+                    operation[field] = value
+        return operation
 
     def _record_operation_start(self, operation: LLMOperation) -> None:
         """Record the start of a new operation"""
-        history = self._load_operation_history()
-        history["last_operation_id"] += 1
-        history["total_operations"] += 1
-
         operation_dict = asdict(operation)
+        operation_dict["operation_type"] = operation.operation_type.value
         operation_dict["start_time"] = operation.start_time.isoformat()
         operation_dict["status_before"] = operation.status_before.value
 
-        history["operations"].append(operation_dict)
-        self._save_operation_history(history)
+        self.operation_log.append(operation_dict)
 
     def _log_compliance_violation(self, violation: str, violation_type: str, session_id: str) -> None:
         """Log a compliance violation"""
-        compliance_log = json.loads(self.compliance_log_file.read_text(encoding='utf-8'))
-
         violation_record = {
             "timestamp": datetime.now().isoformat(),
             "session_id": session_id,
@@ -621,15 +601,27 @@ class LLMTaskStatusManager:
             "severity": "high"
         }
 
-        compliance_log["violations"].append(violation_record)
-        compliance_log["total_violations"] += 1
-        compliance_log["last_updated"] = datetime.now().isoformat()
+        self.compliance_log.append(violation_record)
 
-        # Recalculate compliance score
-        total_operations = compliance_log.get("total_operations", 1)
-        compliance_log["compliance_score"] = max(0.0, 1.0 - (compliance_log["total_violations"] / total_operations))
+    @staticmethod
+    def _fold_operation_state(state: Dict[str, Any], record: Dict[str, Any]) -> None:
+        """Fold an operation record into the operation totals"""
+        if "start_time" in record:
+            state["total_operations"] += 1
+            state["last_operation_id"] += 1
+            state["open"][record["operation_id"]] = record["start_time"]
+        if record.get("end_time"):
+            state["open"].pop(record["operation_id"], None)
 
-        self.compliance_log_file.write_text(json.dumps(compliance_log, indent=2), encoding='utf-8')
+    @staticmethod
+    def _fold_compliance_state(state: Dict[str, Any], record: Dict[str, Any]) -> None:
+        """Fold a violation record into the compliance totals"""
+        state["total_violations"] += 1
+        state["last_updated"] = record.get("timestamp")
+
+        # Recalculate compliance score
+        total_operations = state.get("total_operations", 1)
+        state["compliance_score"] = max(0.0, 1.0 - (state["total_violations"] / total_operations))
 
     def _is_valid_status_transition(self, from_status: TaskStatus, to_status: TaskStatus) -> bool:
         """Validate if a status transition is allowed"""
@@ -788,21 +780,26 @@ class LLMTaskStatusManager:
         task_info = status_data["tasks"].get(task_id, {"status": TaskStatus.NOT_STARTED.value})
         return TaskStatus(task_info["status"])
 
+    def get_task_statuses(self, task_ids: Iterable[str]) -> Dict[str, TaskStatus]:
+        """Get current status of several tasks with a single read"""
+        tasks = self._load_current_status()["tasks"]
+        return {
+            task_id: TaskStatus(tasks.get(task_id, {}).get("status", TaskStatus.NOT_STARTED.value))
+            for task_id in task_ids
+        }
+
+    def get_all_task_statuses(self) -> Dict[str, TaskStatus]:
+        """Get current status of every tracked task"""
+        tasks = self._load_current_status()["tasks"]
+        return {task_id: TaskStatus(info["status"]) for task_id, info in tasks.items()}
+
     def get_compliance_score(self) -> float:
         """Get overall LLM compliance score"""
-        compliance_log = json.loads(self.compliance_log_file.read_text(encoding='utf-8'))
-        return compliance_log.get("compliance_score", 1.0)
+        return self.compliance_log.state()["compliance_score"]
 
     def get_active_sessions(self) -> List[str]:
         """Get list of currently active LLM sessions"""
-        history = self._load_operation_history()
-        active_sessions = []
-
-        for operation in history["operations"]:
-            if operation.get("end_time") is None:
-                active_sessions.append(operation["operation_id"])
-
-        return active_sessions
+        return list(self.operation_log.state()["open"])
 
 
 __all__ = ['LLMTaskStatusManager', 'TaskStatus', 'LLMOperationType']
\ No newline at end of file
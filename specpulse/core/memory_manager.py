@@ -7,11 +7,11 @@ import re
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
-import yaml
+from dataclasses import dataclass, asdict, field, replace
 
 from ..utils.error_handler import ValidationError, ErrorSeverity
 from ..utils.console import Console
+from .memory_search import MemorySearchIndex, CONTEXT_DOC, DECISION_DOC, FEATURE_DOC
 
 
 @dataclass
@@ -51,6 +51,7 @@ class MemoryStats:
     total_context_entries: int
     last_updated: str
     memory_size_mb: float
+    memory_size_bytes: int = 0
 
 
 @dataclass
@@ -63,6 +64,87 @@ class MemoryEntry:
     date: str
     related_features: List[str]
 
+    def copy(self) -> "MemoryEntry":
+        """Copy that callers may mutate without touching the parsed-section cache"""
+        return replace(self, tags=list(self.tags), related_features=list(self.related_features))
+
+
+# Tags of the v1.7.0 tagged sections, in query_relevant order
+MEMORY_TAGS = ("decision", "pattern", "current", "constraint")
+
+_TAGGED_SECTION_PATTERN = re.compile(r'## .+? \[tag:(\w+)\]$')
+_ENTRY_HEADER_PATTERN = re.compile(r'([A-Z]+-\d+):\s*(.+)')
+
+
+@dataclass
+class TaggedContext:
+    """Parsed tagged sections of context.md, with entries sorted newest first"""
+    by_tag: Dict[str, List[MemoryEntry]] = field(default_factory=dict)
+    by_feature: Dict[str, Dict[str, List[MemoryEntry]]] = field(default_factory=dict)
+
+    @classmethod
+    def parse(cls, content: str, extract_field) -> "TaggedContext":
+        """Parse every tagged section in a single pass over the lines.
+
+        Only the first section for each tag is used; entries are `### ID: Title`
+        headers followed by their body up to the next entry or section.
+        """
+        sections: Dict[str, List[Tuple[str, List[str]]]] = {}
+        current_entries: Optional[List[Tuple[str, List[str]]]] = None
+        body: Optional[List[str]] = None
+
+        for line in content.split('\n'):
+            section_match = _TAGGED_SECTION_PATTERN.search(line)
+            if section_match:
+                tag = section_match.group(1)
+                current_entries = None if tag in sections else sections.setdefault(tag, [])
+                body = None
+            elif line.startswith('## '):
+                current_entries = None
+                body = None
+            elif current_entries is not None:
+                if line.startswith('### '):
+                    body = []
+                    current_entries.append((line[4:].strip(), body))
+                elif body is not None:
+                    body.append(line)
+
+        context = cls()
+        today = datetime.now().strftime("%Y-%m-%d")
+        for tag, raw_entries in sections.items():
+            entries = []
+            for header, body_lines in raw_entries:
+                id_title_match = _ENTRY_HEADER_PATTERN.match(header)
+                if not id_title_match:
+                    continue
+
+                entry_body = '\n'.join(body_lines).strip()
+                related = extract_field(entry_body, "Related")
+                date = extract_field(entry_body, "Date")
+
+                related_features = []
+                if related and related != "None":
+                    # Extract feature IDs (001, 002, etc.)
+                    related_features = re.findall(r'\b(\d{3})\b', related)
+
+                entries.append(MemoryEntry(
+                    id=id_title_match.group(1),
+                    title=id_title_match.group(2),
+                    content=entry_body,
+                    tags=[tag],
+                    date=date or today,
+                    related_features=related_features
+                ))
+
+            # Sort by date (newest first)
+            entries.sort(key=lambda e: e.date, reverse=True)
+            context.by_tag[tag] = entries
+            for entry in entries:
+                for feature_id in dict.fromkeys(entry.related_features):
+                    context.by_feature.setdefault(feature_id, {}).setdefault(tag, []).append(entry)
+
+        return context
+
 
 class MemoryManager:
     """Enhanced memory management system"""
@@ -78,6 +160,8 @@ class MemoryManager:
         self.decisions_file = self.memory_dir / "decisions.md"
         self.memory_index_path = self.memory_dir / ".memory_index.json"
         self.memory_stats_path = self.memory_dir / ".memory_stats.json"
+        self.memory_search_index_path = self.memory_dir / ".memory_search_index.json"
+        self.memory_search_journal_path = self.memory_dir / ".memory_search_index.log"
 
         self.console = Console()
 
@@ -94,6 +178,11 @@ class MemoryManager:
 
         # Load existing data
         self.memory_index = self._load_memory_index()
+        self._search_index: Optional[MemorySearchIndex] = None  # loaded on first use
+        # Sizes of the files this manager writes, as counted in memory_stats
+        self._tracked_sizes: Dict[str, int] = {}
+        # Parsed tagged sections of context.md, keyed by its (mtime_ns, size)
+        self._tagged_context: Optional[Tuple[Tuple[int, int], TaggedContext]] = None
         self.memory_stats = self._load_memory_stats()
 
     def _initialize_memory_system(self):
@@ -231,13 +320,42 @@ class MemoryManager:
         except IOError as e:
             raise ValidationError(f"Failed to save memory index: {e}")
 
+        if self._search_index is not None:
+            try:
+                self._search_index.save(self.memory_index["last_updated"])
+            except OSError as e:
+                # A stale search index is rebuilt on next load
+                self.console.warning(f"Failed to save memory search index: {e}")
+
+    def _get_search_index(self) -> MemorySearchIndex:
+        """Search index in sync with the memory index, loaded or rebuilt on first use"""
+        if self._search_index is None:
+            search_index = MemorySearchIndex(self.memory_search_index_path)
+            if not search_index.load(self.memory_index.get("last_updated"),
+                                     len(self.memory_index.get("context_entries", []))):
+                search_index.rebuild(self.memory_index)
+                try:
+                    search_index.save(self.memory_index.get("last_updated"))
+                except OSError:
+                    pass
+            self._search_index = search_index
+        return self._search_index
+
     def _load_memory_stats(self) -> MemoryStats:
-        """Load memory statistics"""
+        """Load memory statistics, recalculating them if missing or out of date"""
         if self.memory_stats_path.exists():
             try:
                 with open(self.memory_stats_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    return MemoryStats(**data)
+                tracked_sizes = data.pop("tracked_files", None)
+                stats = MemoryStats(**data)
+
+                if tracked_sizes is not None and not self._stats_drifted(stats):
+                    self.memory_stats = stats
+                    self._tracked_sizes = tracked_sizes
+                    # Pick up edits made to our files since the stats were saved
+                    self._track_file_sizes(*self._tracked_files())
+                    return stats
             except json.JSONDecodeError as e:
                 # BUG-011 fix: Log corrupted JSON files
                 self.console.warning(f"Corrupted memory stats file, recalculating: {e}")
@@ -249,18 +367,23 @@ class MemoryManager:
                 self.console.warning(f"Invalid memory stats format, recalculating: {e}")
 
         # Calculate initial stats
+        self._tracked_sizes = self._current_file_sizes()
         return self._calculate_memory_stats()
 
     def _save_memory_stats(self):
         """Save memory statistics"""
+        data = asdict(self.memory_stats)
+        data["tracked_files"] = self._tracked_sizes
         try:
             with open(self.memory_stats_path, 'w', encoding='utf-8') as f:
-                json.dump(asdict(self.memory_stats), f, indent=2)
+                json.dump(data, f, indent=2)
         except IOError as e:
             raise ValidationError(f"Failed to save memory stats: {e}")
 
+        self._track_file_sizes(self.memory_stats_path)
+
     def _calculate_memory_stats(self) -> MemoryStats:
-        """Calculate current memory statistics"""
+        """Calculate current memory statistics with a full scan of the memory directory"""
         total_decisions = len(self.memory_index.get("decisions", {}))
         active_features = len([f for f in self.memory_index.get("features", {}).values() if f.get("status") == "active"])
         completed_features = len([f for f in self.memory_index.get("features", {}).values() if f.get("status") == "completed"])
@@ -271,7 +394,6 @@ class MemoryManager:
         for file_path in self.memory_dir.rglob("*"):
             if file_path.is_file():
                 memory_size += file_path.stat().st_size
-        memory_size_mb = round(memory_size / (1024 * 1024), 2)
 
         return MemoryStats(
             total_decisions=total_decisions,
@@ -279,9 +401,80 @@ class MemoryManager:
             completed_features=completed_features,
             total_context_entries=total_context_entries,
             last_updated=datetime.now().isoformat(),
-            memory_size_mb=memory_size_mb
+            memory_size_mb=round(memory_size / (1024 * 1024), 2),
+            memory_size_bytes=memory_size
+        )
+
+    def recalculate_memory_stats(self) -> MemoryStats:
+        """Recalculate and save memory statistics from scratch"""
+        self._tracked_sizes = self._current_file_sizes()
+        self.memory_stats = self._calculate_memory_stats()
+        self._save_memory_stats()
+        return self.memory_stats
+
+    def _tracked_files(self) -> List[Path]:
+        """Files written by the memory manager, sized incrementally between full scans"""
+        return [
+            self.context_file,
+            self.decisions_file,
+            self.memory_index_path,
+            self.memory_search_index_path,
+            self.memory_search_journal_path,
+            self.memory_stats_path,
+        ]
+
+    def _current_file_sizes(self) -> Dict[str, int]:
+        """Sizes of the existing tracked files"""
+        sizes = {}
+        for path in self._tracked_files():
+            try:
+                sizes[path.name] = path.stat().st_size
+            except OSError:
+                continue
+        return sizes
+
+    def _stats_drifted(self, stats: MemoryStats) -> bool:
+        """Check whether saved statistics no longer describe the memory index"""
+        features = self.memory_index.get("features", {}).values()
+        return (
+            stats.total_context_entries != len(self.memory_index.get("context_entries", []))
+            or stats.total_decisions != len(self.memory_index.get("decisions", {}))
+            or stats.active_features != sum(1 for f in features if f.get("status") == "active")
+            or stats.completed_features != sum(1 for f in features if f.get("status") == "completed")
         )
 
+    def _track_file_sizes(self, *paths: Path):
+        """Apply size changes of the given files to the memory size"""
+        stats = self.memory_stats
+        for path in paths:
+            try:
+                size = path.stat().st_size
+            except OSError:
+                size = 0
+            stats.memory_size_bytes += size - self._tracked_sizes.get(path.name, 0)
+            self._tracked_sizes[path.name] = size
+        stats.memory_size_mb = round(stats.memory_size_bytes / (1024 * 1024), 2)
+
+    def _update_memory_stats(self, *changed_files: Path, context_entries: int = 0, decisions: int = 0,
+                             completed_features: int = 0, status_change: Tuple[Optional[str], Optional[str]] = (None, None)):
+        """Apply counter deltas and file size changes to the statistics and save them"""
+        stats = self.memory_stats
+        stats.total_context_entries += context_entries
+        stats.total_decisions += decisions
+        stats.completed_features += completed_features
+
+        old_status, new_status = status_change
+        if old_status != new_status:
+            for status, delta in ((old_status, -1), (new_status, 1)):
+                if status == "active":
+                    stats.active_features += delta
+                elif status == "completed":
+                    stats.completed_features += delta
+
+        self._track_file_sizes(*changed_files)
+        stats.last_updated = datetime.now().isoformat()
+        self._save_memory_stats()
+
     def update_context(self, feature_name: Optional[str] = None, feature_id: Optional[str] = None,
                        action: str = "general_update", details: Optional[Dict] = None,
                        impact: str = "medium", category: str = "general") -> bool:
@@ -300,7 +493,11 @@ class MemoryManager:
             )
 
             # Add to memory index
-            self.memory_index["context_entries"].append(asdict(entry))
+            old_status = self.memory_index["features"].get(feature_id, {}).get("status") if feature_id else None
+            search_index = self._get_search_index()
+            context_entries = self.memory_index["context_entries"]
+            context_entries.append(asdict(entry))
+            search_index.add_context(len(context_entries) - 1, context_entries[-1])
 
             # Update context.md file
             self._update_context_file(entry)
@@ -308,11 +505,15 @@ class MemoryManager:
             # Update feature tracking if feature provided
             if feature_name and feature_id:
                 self._update_feature_tracking(feature_name, feature_id, action)
+                search_index.index_item(FEATURE_DOC, feature_id, self.memory_index["features"][feature_id])
 
             # Save changes
             self._save_memory_index()
-            self.memory_stats = self._calculate_memory_stats()
-            self._save_memory_stats()
+            new_status = self.memory_index["features"].get(feature_id, {}).get("status") if feature_id else None
+            self._update_memory_stats(
+                self.context_file, self.memory_index_path, self.memory_search_index_path, self.memory_search_journal_path,
+                context_entries=1, status_change=(old_status, new_status)
+            )
 
             # Auto-cleanup: Run cleanup periodically
             self._update_counter += 1
@@ -406,15 +607,21 @@ class MemoryManager:
                 raise ValidationError("Decision ID and title are required")
 
             # Add to memory index
+            is_new = decision.id not in self.memory_index["decisions"]
             self.memory_index["decisions"][decision.id] = asdict(decision)
+            self._get_search_index().index_item(
+                DECISION_DOC, decision.id, self.memory_index["decisions"][decision.id]
+            )
 
             # Update decisions.md file
             self._update_decisions_file(decision)
 
             # Save changes
             self._save_memory_index()
-            self.memory_stats = self._calculate_memory_stats()
-            self._save_memory_stats()
+            self._update_memory_stats(
+                self.decisions_file, self.memory_index_path, self.memory_search_index_path, self.memory_search_journal_path,
+                decisions=1 if is_new else 0
+            )
 
             self.console.success(f"Decision recorded: ADR-{decision.id}")
             return True
@@ -477,65 +684,52 @@ class MemoryManager:
             raise ValidationError(f"Failed to update decisions file: {e}")
 
     def search_memory(self, query: str, category: Optional[str] = None,
-                      date_range: Optional[Tuple[str, str]] = None) -> List[Dict]:
-        """Search memory system for entries matching criteria"""
-
-        results = []
-        query_lower = query.lower()
+                      date_range: Optional[Tuple[str, str]] = None,
+                      prefix: bool = True, match_all: bool = True,
+                      limit: Optional[int] = None) -> List[Dict]:
+        """Search memory system for entries matching criteria
 
-        # Search context entries
-        for entry in self.memory_index.get("context_entries", []):
-            if self._matches_search_criteria(entry, query_lower, category, date_range):
-                results.append({"type": "context", "data": entry})
+        Args:
+            query: Search terms, ANDed by default; `a b OR c` means (a AND b) OR c.
+                A trailing `*` forces prefix matching for a term.
+            category: Only entries with this category
+            date_range: Inclusive (start, end) ISO dates
+            prefix: Match terms as token prefixes (e.g. "auth" finds "authentication")
+            match_all: Require all terms (False: any term)
+            limit: Maximum number of results
 
-        # Search decisions
-        for decision_id, decision in self.memory_index.get("decisions", {}).items():
-            if self._matches_search_criteria(decision, query_lower, category, date_range):
-                results.append({"type": "decision", "data": decision, "id": decision_id})
+        Returns:
+            Results ranked by relevance (memory order when the query is empty),
+            each with type, data, score and - for decisions/features - id
+        """
+        hits = self._get_search_index().search(
+            query, category=category, date_range=date_range,
+            prefix=prefix, match_all=match_all
+        )
+        if limit is not None:
+            hits = hits[:limit]
 
-        # Search features
-        for feature_id, feature in self.memory_index.get("features", {}).items():
-            if self._matches_search_criteria(feature, query_lower, category, date_range):
-                results.append({"type": "feature", "data": feature, "id": feature_id})
+        results = []
+        context_entries = self.memory_index.get("context_entries", [])
+        for doc, score in hits:
+            kind, _, key = doc.partition(':')
+            if kind == CONTEXT_DOC:
+                results.append({"type": "context", "data": context_entries[int(key)], "score": score})
+            elif kind == DECISION_DOC:
+                results.append({"type": "decision", "data": self.memory_index["decisions"][key],
+                                "id": key, "score": score})
+            else:
+                results.append({"type": "feature", "data": self.memory_index["features"][key],
+                                "id": key, "score": score})
 
         return results
 
-    def _matches_search_criteria(self, item: Dict, query: str, category: Optional[str],
-                                date_range: Optional[Tuple[str, str]]) -> bool:
-        """Check if item matches search criteria"""
-
-        # Text search
-        text_content = json.dumps(item).lower()
-        if query and query not in text_content:
-            return False
-
-        # Category filter
-        if category and item.get("category", "").lower() != category.lower():
-            return False
-
-        # Date range filter
-        if date_range:
-            item_date = item.get("timestamp") or item.get("date") or item.get("last_updated")
-            if not item_date:
-                return False
-
-            try:
-                item_dt = datetime.fromisoformat(item_date.replace('Z', '+00:00'))
-                start_dt = datetime.fromisoformat(date_range[0])
-                end_dt = datetime.fromisoformat(date_range[1])
-
-                if not (start_dt <= item_dt <= end_dt):
-                    return False
-            except ValueError:
-                return False
-
-        return True
-
     def get_memory_summary(self) -> Dict:
         """Get comprehensive memory summary"""
 
-        # Update stats
-        self.memory_stats = self._calculate_memory_stats()
+        # Stats are maintained incrementally; recount only if they no longer match
+        if self._stats_drifted(self.memory_stats):
+            self.recalculate_memory_stats()
 
         # Get recent activity
         recent_entries = self.memory_index.get("context_entries", [])[-10:]
@@ -564,6 +758,7 @@ class MemoryManager:
         cutoff_iso = cutoff_date.isoformat()
 
         removed_count = 0
+        removed_context = 0
 
         # Clean old context entries
         original_entries = len(self.memory_index.get("context_entries", []))
@@ -571,7 +766,8 @@ class MemoryManager:
             entry for entry in self.memory_index.get("context_entries", [])
             if entry.get("timestamp", "") > cutoff_iso
         ]
-        removed_count += original_entries - len(self.memory_index["context_entries"])
+        removed_context = original_entries - len(self.memory_index["context_entries"])
+        removed_count += removed_context
 
         # Clean old completed features
         original_features = len(self.memory_index.get("features", {}))
@@ -583,9 +779,15 @@ class MemoryManager:
 
         # Save changes
         if removed_count > 0:
+            # Context positions shifted; rebuild the search index on next use
+            self._search_index = None
             self._save_memory_index()
-            self.memory_stats = self._calculate_memory_stats()
-            self._save_memory_stats()
+            # Only completed features are removed
+            self._update_memory_stats(
+                self.memory_index_path,
+                context_entries=-removed_context,
+                completed_features=-(removed_count - removed_context)
+            )
 
         return removed_count
 
@@ -635,6 +837,7 @@ class MemoryManager:
             if format.lower() == "json":
                 content = json.dumps(export_data, indent=2, ensure_ascii=False)
             elif format.lower() == "yaml":
+                import yaml
                 content = yaml.dump(export_data, default_flow_style=False, allow_unicode=True)
             else:
                 raise ValidationError(f"Unsupported export format: {format}")
@@ -770,24 +973,23 @@ Date: {date_str}
         Returns:
             List of MemoryEntry objects
         """
-        supported_tags = {"decision", "pattern", "current", "constraint"}
+        supported_tags = set(MEMORY_TAGS)
         if tag not in supported_tags:
             raise ValueError(f"Unsupported tag: {tag}. Must be one of {supported_tags}")
 
-        entries = self._parse_tagged_section(tag)
+        context = self._get_tagged_context()
 
-        # Filter by feature if specified
+        # Entries are sorted by date (newest first) when parsed
         if feature:
-            entries = [e for e in entries if feature in e.related_features]
-
-        # Sort by date (newest first)
-        entries.sort(key=lambda e: e.date, reverse=True)
+            entries = context.by_feature.get(feature, {}).get(tag, [])
+        else:
+            entries = context.by_tag.get(tag, [])
 
         # Limit to recent if specified
         if recent:
             entries = entries[:recent]
 
-        return entries
+        return [entry.copy() for entry in entries]
 
     def query_relevant(self, feature_id: str) -> List[MemoryEntry]:
         """Get all relevant memory entries for a feature (v1.7.0).
@@ -798,12 +1000,11 @@ Date: {date_str}
         Returns:
             List of relevant MemoryEntry objects
         """
-        all_entries = []
+        feature_entries = self._get_tagged_context().by_feature.get(feature_id, {})
 
-        # Query all tags for this feature
-        for tag in ["decision", "pattern", "current", "constraint"]:
-            entries = self.query_by_tag(tag, feature=feature_id)
-            all_entries.extend(entries)
+        all_entries = []
+        for tag in MEMORY_TAGS:
+            all_entries.extend(entry.copy() for entry in feature_entries.get(tag, []))
 
         return all_entries
 
@@ -869,6 +1070,19 @@ Date: {date_str}
 
         self.context_file.write_text(new_content, encoding='utf-8')
 
+    def _get_tagged_context(self) -> TaggedContext:
+        """Parsed tagged sections of context.md, re-parsed only when the file changes"""
+        try:
+            stat = self.context_file.stat()
+        except OSError:
+            return TaggedContext()
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._tagged_context is None or self._tagged_context[0] != key:
+            content = self.context_file.read_text(encoding='utf-8')
+            self._tagged_context = (key, TaggedContext.parse(content, self._extract_field))
+        return self._tagged_context[1]
+
     def _parse_tagged_section(self, tag: str) -> List[MemoryEntry]:
         """Parse entries from a tagged section.
 
@@ -876,58 +1090,9 @@ Date: {date_str}
             tag: Tag to parse (decision, pattern, constraint, current)
 
         Returns:
-            List of MemoryEntry objects
+            List of MemoryEntry objects, newest first
         """
-        if not self.context_file.exists():
-            return []
-
-        content = self.context_file.read_text(encoding='utf-8')
-        entries = []
-
-        # Find section for this tag
-        section_pattern = rf'## .+? \[tag:{tag}\]$(.*?)(?=^## |\Z)'
-        section_match = re.search(section_pattern, content, re.MULTILINE | re.DOTALL)
-
-        if not section_match:
-            return []
-
-        section_content = section_match.group(1)
-
-        # Parse individual entries (### headers)
-        entry_pattern = re.compile(r'^### (.+?)$(.*?)(?=^### |\Z)', re.MULTILINE | re.DOTALL)
-
-        for match in entry_pattern.finditer(section_content):
-            header = match.group(1).strip()
-            body = match.group(2).strip()
-
-            # Extract ID and title
-            id_title_match = re.match(r'([A-Z]+-\d+):\s*(.+)', header)
-            if id_title_match:
-                entry_id = id_title_match.group(1)
-                title = id_title_match.group(2)
-            else:
-                continue
-
-            # Extract metadata
-            related = self._extract_field(body, "Related")
-            date = self._extract_field(body, "Date")
-
-            related_features = []
-            if related and related != "None":
-                # Extract feature IDs (001, 002, etc.)
-                related_features = re.findall(r'\b(\d{3})\b', related)
-
-            entry = MemoryEntry(
-                id=entry_id,
-                title=title,
-                content=body,
-                tags=[tag],
-                date=date or datetime.now().strftime("%Y-%m-%d"),
-                related_features=related_features
-            )
-            entries.append(entry)
-
-        return entries
+        return [entry.copy() for entry in self._get_tagged_context().by_tag.get(tag, [])]
 
     def _extract_field(self, content: str, field_name: str) -> Optional[str]:
         """Extract a field value from entry content.
@@ -0,0 +1,414 @@
+"""
+SpecPulse Memory Search Index - Inverted index over the memory index
+
+Context entries, decisions and features from .memory_index.json are indexed
+by token, category and date so that MemoryManager.search_memory no longer
+re-serializes and scans every item for every query. Updates are persisted
+as batches appended to a journal next to the index snapshot; the snapshot
+is only rewritten when the journal grows long or the index is rebuilt.
+"""
+
+import bisect
+import json
+import math
+import os
+import re
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+INDEX_VERSION = 1
+
+# Document ID prefixes: context entries are addressed by list position
+CONTEXT_DOC = "c"
+DECISION_DOC = "d"
+FEATURE_DOC = "f"
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+_DATE_FIELDS = ("timestamp", "date", "last_updated")
+
+# Score multiplier for terms that only match as a prefix of a token
+_PREFIX_WEIGHT = 0.5
+
+# Journal batches replayed on load before the snapshot is rewritten
+JOURNAL_COMPACT_BATCHES = 50
+
+
+def tokenize(value: Any) -> Iterator[str]:
+    """Yield lowercase tokens for every key and value in a (nested) item.
+
+    Underscore compounds yield the compound and each part, so both
+    "ai_assistant" and "assistant" match an `ai_assistant` key.
+    """
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from tokenize(key)
+            yield from tokenize(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from tokenize(item)
+    elif value is not None:
+        for token in _TOKEN_PATTERN.findall(str(value).lower()):
+            yield token
+            if '_' in token:
+                yield from (part for part in token.split('_') if part)
+
+
+def _item_date(item: Dict) -> Optional[str]:
+    """Date string used for date range filtering (same fields as before indexing)"""
+    for field_name in _DATE_FIELDS:
+        if item.get(field_name):
+            return item[field_name]
+    return None
+
+
+def _parse_date(value: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return None
+
+
+class MemorySearchIndex:
+    """Token, category and date indexes over memory index items.
+
+    Documents are `c:<position>` for context entries, `d:<id>` for decisions
+    and `f:<id>` for features. Decisions and features can be re-indexed in
+    place; context entries are append-only, so only their positions are kept.
+    Changes since the last save are kept as operations and appended to the
+    journal (`<index>.log`) as one batch per save.
+    """
+
+    def __init__(self, index_path: Path):
+        self.index_path = index_path
+        self.journal_path = index_path.with_suffix('.log')
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_terms: Dict[str, Dict[str, int]] = {}
+        self.doc_dates: Dict[str, str] = {}
+        self.categories: Dict[str, Set[str]] = {}
+        self.context_count = 0
+        self._vocabulary: List[str] = []
+        self._dates: List[Tuple[str, str]] = []
+        # Persistence state: source of the saved state, unsaved operations,
+        # batches in the journal, and whether the next save is a snapshot
+        self._source: Optional[str] = None
+        self._pending: List[List[Any]] = []
+        self._journal_batches = 0
+        self._snapshot_due = True
+
+    # ---- Building ----
+
+    def rebuild(self, memory_index: Dict) -> None:
+        """Index every item of the memory index from scratch"""
+        self.__init__(self.index_path)
+        for position, entry in enumerate(memory_index.get("context_entries", [])):
+            self.add_context(position, entry)
+        for decision_id, decision in memory_index.get("decisions", {}).items():
+            self.index_item(DECISION_DOC, decision_id, decision)
+        for feature_id, feature in memory_index.get("features", {}).items():
+            self.index_item(FEATURE_DOC, feature_id, feature)
+        self._pending = []
+
+    def add_context(self, position: int, entry: Dict) -> None:
+        """Index a newly appended context entry"""
+        self._add(f"{CONTEXT_DOC}:{position}", entry, keep_terms=False)
+        self.context_count = max(self.context_count, position + 1)
+        self._pending.append([CONTEXT_DOC, position, entry])
+
+    def index_item(self, kind: str, item_id: str, item: Dict) -> None:
+        """Index (or re-index) a decision or feature"""
+        doc = f"{kind}:{item_id}"
+        # Re-indexing keeps the document's position in doc_terms (memory order)
+        self._unindex(doc)
+        self._add(doc, item, keep_terms=True)
+        self._pending.append([kind, item_id, item])
+
+    def remove(self, doc: str) -> None:
+        """Drop a decision or feature document from all indexes"""
+        self._unindex(doc)
+        self.doc_terms.pop(doc, None)
+        self._pending.append(["-", doc])
+
+    def _replay(self, operations: List[List[Any]]) -> None:
+        """Apply journaled operations recorded by the mutators above"""
+        for operation in operations:
+            kind = operation[0]
+            if kind == CONTEXT_DOC:
+                self.add_context(operation[1], operation[2])
+            elif kind == "-":
+                self.remove(operation[1])
+            else:
+                self.index_item(kind, operation[1], operation[2])
+
+    def _unindex(self, doc: str) -> None:
+        for token in self.doc_terms.get(doc, {}):
+            docs = self.postings.get(token)
+            if docs is not None:
+                docs.pop(doc, None)
+                if not docs:
+                    del self.postings[token]
+                    self._remove_vocabulary(token)
+
+        date = self.doc_dates.pop(doc, None)
+        if date is not None:
+            position = bisect.bisect_left(self._dates, (date, doc))
+            if position < len(self._dates) and self._dates[position] == (date, doc):
+                del self._dates[position]
+
+        for docs in self.categories.values():
+            docs.discard(doc)
+
+    def _add(self, doc: str, item: Dict, keep_terms: bool) -> None:
+        terms: Dict[str, int] = {}
+        for token in tokenize(item):
+            terms[token] = terms.get(token, 0) + 1
+
+        for token, count in terms.items():
+            docs = self.postings.get(token)
+            if docs is None:
+                docs = self.postings[token] = {}
+                bisect.insort(self._vocabulary, token)
+            docs[doc] = count
+        if keep_terms:
+            self.doc_terms[doc] = terms
+
+        category = item.get("category")
+        if category:
+            self.categories.setdefault(str(category).lower(), set()).add(doc)
+
+        date = _item_date(item)
+        if date:
+            self.doc_dates[doc] = date
+            bisect.insort(self._dates, (date, doc))
+
+    def _remove_vocabulary(self, token: str) -> None:
+        position = bisect.bisect_left(self._vocabulary, token)
+        if position < len(self._vocabulary) and self._vocabulary[position] == token:
+            del self._vocabulary[position]
+
+    # ---- Querying ----
+
+    def search(self, query: str, category: Optional[str] = None,
+               date_range: Optional[Tuple[str, str]] = None,
+               prefix: bool = True, match_all: bool = True) -> List[Tuple[str, float]]:
+        """Return (doc, score) pairs, best first.
+
+        Terms are ANDed (or ORed when match_all is False); an uppercase `OR`
+        between terms separates alternative groups. Terms match tokens that
+        start with them when `prefix` is set, or when they end in `*`.
+        An empty query matches every document, in memory order.
+        """
+        groups = self._parse_query(query, match_all)
+        candidates: Optional[Set[str]] = None
+        scores: Dict[str, float] = {}
+
+        if groups:
+            candidates = set()
+            doc_count = max(1, len(self.doc_terms) + self.context_count)
+            for group in groups:
+                group_docs: Optional[Set[str]] = None
+                group_scores: Dict[str, float] = {}
+                for term, term_prefix in group:
+                    term_scores = self._match_term(term, prefix or term_prefix, doc_count)
+                    group_docs = set(term_scores) if group_docs is None else group_docs & set(term_scores)
+                    for doc, score in term_scores.items():
+                        group_scores[doc] = group_scores.get(doc, 0.0) + score
+                for doc in group_docs or ():
+                    candidates.add(doc)
+                    scores[doc] = max(scores.get(doc, 0.0), group_scores[doc])
+
+        if category:
+            category_docs = self.categories.get(category.lower(), set())
+            candidates = set(category_docs) if candidates is None else candidates & category_docs
+
+        if date_range:
+            date_docs = self._docs_in_range(date_range)
+            candidates = date_docs if candidates is None else candidates & date_docs
+
+        if candidates is None:
+            candidates = self.all_docs()
+
+        item_order = {doc: position for position, doc in enumerate(self.doc_terms)}
+        ordered = sorted(candidates, key=lambda doc: self._memory_order(doc, item_order))
+        if scores:
+            # Stable sort keeps memory order among equal scores
+            ordered.sort(key=lambda doc: scores[doc], reverse=True)
+        return [(doc, round(scores.get(doc, 0.0), 4)) for doc in ordered]
+
+    def all_docs(self) -> Set[str]:
+        """Every indexed document"""
+        docs = {f"{CONTEXT_DOC}:{position}" for position in range(self.context_count)}
+        docs.update(self.doc_terms)
+        return docs
+
+    @staticmethod
+    def _parse_query(query: str, match_all: bool) -> List[List[Tuple[str, bool]]]:
+        """Split a query into OR-groups of (term, is_prefix) AND-terms"""
+        groups: List[List[Tuple[str, bool]]] = [[]]
+        for word in query.split():
+            if word == "OR":
+                groups.append([])
+                continue
+            is_prefix = word.endswith('*')
+            for term in _TOKEN_PATTERN.findall(word.lower()):
+                groups[-1].append((term, is_prefix))
+
+        groups = [group for group in groups if group]
+        if not match_all:
+            groups = [[term] for group in groups for term in group]
+        return groups
+
+    def _match_term(self, term: str, prefix: bool, doc_count: int) -> Dict[str, float]:
+        """tf-idf score per document for one query term"""
+        scores: Dict[str, float] = {}
+        tokens: Iterable[str] = [term] if term in self.postings else []
+        if prefix:
+            start = bisect.bisect_left(self._vocabulary, term)
+            end = bisect.bisect_left(self._vocabulary, term + '\uffff')
+            tokens = self._vocabulary[start:end]
+
+        for token in tokens:
+            docs = self.postings[token]
+            weight = math.log(1 + doc_count / len(docs))
+            if token != term:
+                weight *= _PREFIX_WEIGHT
+            for doc, count in docs.items():
+                score = count * weight
+                if score > scores.get(doc, 0.0):
+                    scores[doc] = score
+        return scores
+
+    def _docs_in_range(self, date_range: Tuple[str, str]) -> Set[str]:
+        """Documents whose date falls inside the inclusive range"""
+        start_dt = datetime.fromisoformat(date_range[0])
+        end_dt = datetime.fromisoformat(date_range[1])
+
+        # ISO strings sort chronologically; narrow with the string bounds
+        # (date-only bounds widened to the whole day), then check exactly.
+        low = bisect.bisect_left(self._dates, (date_range[0][:10],))
+        high = bisect.bisect_right(self._dates, (date_range[1][:10] + '\uffff',))
+
+        docs = set()
+        for date, doc in self._dates[low:high]:
+            item_dt = _parse_date(date)
+            if item_dt is None:
+                continue
+            try:
+                if start_dt <= item_dt <= end_dt:
+                    docs.add(doc)
+            except TypeError:
+                # Mixed naive/aware datetimes never matched before indexing either
+                continue
+        return docs
+
+    @staticmethod
+    def _memory_order(doc: str, item_order: Dict[str, int]) -> Tuple[int, int]:
+        """Order of items in the memory index: context entries, decisions, features"""
+        kind, _, key = doc.partition(':')
+        if kind == CONTEXT_DOC:
+            return (0, int(key))
+        return (1 if kind == DECISION_DOC else 2, item_order.get(doc, 0))
+
+    # ---- Persistence ----
+
+    def load(self, source: Optional[str], context_count: int) -> bool:
+        """Load the snapshot and journal if they add up to this memory index state"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return False
+
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return False
+
+        self.postings = data["postings"]
+        self.doc_terms = data["doc_terms"]
+        self.doc_dates = data["doc_dates"]
+        self.categories = {name: set(docs) for name, docs in data["categories"].items()}
+        self.context_count = data["context_count"]
+        self._vocabulary = sorted(self.postings)
+        self._dates = sorted((date, doc) for doc, date in self.doc_dates.items())
+
+        current = data.get("source")
+        batches = 0
+        for batch in self._read_journal():
+            # Batches left over from before the last snapshot do not chain on
+            if batch.get("after") != current:
+                break
+            self._replay(batch.get("ops", []))
+            current = batch.get("source")
+            batches += 1
+
+        if current != source or self.context_count != context_count:
+            self.__init__(self.index_path)
+            return False
+
+        self._source = current
+        self._pending = []
+        self._journal_batches = batches
+        self._snapshot_due = batches >= JOURNAL_COMPACT_BATCHES
+        return True
+
+    def _read_journal(self) -> Iterator[Dict]:
+        """Complete batches in the journal, in append order"""
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.endswith('\n'):
+                        return
+                    try:
+                        batch = json.loads(line)
+                    except json.JSONDecodeError:
+                        return
+                    if isinstance(batch, dict):
+                        yield batch
+        except OSError:
+            return
+
+    def save(self, source: Optional[str]) -> None:
+        """Persist changes since the last save, tagged with the memory index state they reflect"""
+        if self._snapshot_due or self._journal_batches >= JOURNAL_COMPACT_BATCHES:
+            self._save_snapshot(source)
+        elif self._pending or source != self._source:
+            batch = {"after": self._source, "source": source, "ops": self._pending}
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(batch, ensure_ascii=False, separators=(',', ':')) + '\n')
+            self._journal_batches += 1
+
+        self._source = source
+        self._pending = []
+
+    def _save_snapshot(self, source: Optional[str]) -> None:
+        """Rewrite the whole index and start an empty journal"""
+        data = {
+            "version": INDEX_VERSION,
+            "source": source,
+            "context_count": self.context_count,
+            "postings": self.postings,
+            "doc_terms": self.doc_terms,
+            "doc_dates": self.doc_dates,
+            "categories": {name: sorted(docs) for name, docs in self.categories.items() if docs},
+        }
+
+        temp_fd, temp_path = tempfile.mkstemp(dir=self.index_path.parent, prefix=".memory_search_", suffix=".tmp")
+        try:
+            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, self.index_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+        try:
+            self.journal_path.unlink()
+        except FileNotFoundError:
+            pass
+        self._journal_batches = 0
+        self._snapshot_due = False
+
+
+__all__ = ['MemorySearchIndex', 'tokenize']
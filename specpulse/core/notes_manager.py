@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import List, Optional
 import re
 
+from .project_session import session_for
+
 
 @dataclass
 class Note:
@@ -239,13 +241,10 @@ Status: Active
         Returns:
             Feature ID or None
         """
-        context_file = self.project_root / "memory" / "context.md"
-
-        if not context_file.exists():
+        content = session_for(self.project_root).read_text(self.project_root / "memory" / "context.md")
+        if content is None:
             return None
 
-        content = context_file.read_text(encoding='utf-8')
-
         # Look for Active Feature
         match = re.search(r'Active Feature[:\s]+(\d{3})', content, re.IGNORECASE)
 
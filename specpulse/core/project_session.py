@@ -0,0 +1,262 @@
+"""
+Project Session - per-process view of the current SpecPulse project
+
+Within one command the handler validated the project structure, command
+modules built their own PathManager, and the sp-* helpers re-read
+context.md and re-listed specs/ on every feature lookup. A ProjectSession
+discovers the project root once (walking up from the working directory
+like git) and caches the structure check, project type, context files and
+directory listings for every command in the process.
+
+Each cached value is keyed by the stat signature of what it was derived
+from, so long-lived processes such as the warm daemon see on-disk changes
+without explicit invalidation.
+"""
+
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_DIRS = ('specs', 'plans', 'tasks', 'memory', 'templates')
+
+# Files whose existence or content decides the detected project type
+PROJECT_TYPE_FILES = (
+    '.specpulse/project_context.yaml', 'package.json', 'requirements.txt', 'Gemfile', 'Cargo.toml'
+)
+
+StatKey = Optional[Tuple[int, int, int, int]]
+
+
+def stat_signature(path: Path) -> StatKey:
+    """(mtime_ns, size, inode, nlink) of path, or None if it does not exist
+
+    The inode catches atomic replaces and the link count catches
+    subdirectories added within the filesystem's timestamp granularity.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino, stat.st_nlink)
+
+
+def missing_project_dirs(path: Path) -> List[str]:
+    """
+    Required directories missing for path to be a SpecPulse project
+
+    Mirrors validate_project_directory: the .specpulse/ layout (v2.2.0+) if
+    .specpulse exists, the legacy root layout otherwise.
+    """
+    path = Path(path)
+    prefix = '.specpulse/' if (path / '.specpulse').exists() else ''
+    return [f"{prefix}{name}" for name in REQUIRED_DIRS if not (path / prefix / name).is_dir()]
+
+
+class ProjectSession:
+    """Cached facts about one project root, validated by stat signatures"""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.specpulse_dir = self.root / '.specpulse'
+        self._cache: Dict[Hashable, Tuple[Any, Any]] = {}  # key -> (signature, value)
+        self._path_manager = None
+        self._catalogs: Dict[Path, Any] = {}
+        self._task_index = None
+
+    def _cached(self, key: Hashable, signature: Any, compute: Callable[[], Any]) -> Any:
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        value = compute()
+        self._cache[key] = (signature, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop every cached value"""
+        self._cache.clear()
+        self._path_manager = None
+        self._catalogs.clear()
+        self._task_index = None
+
+    @property
+    def missing_dirs(self) -> List[str]:
+        """Required directories missing from the project structure"""
+        # Adding or removing a directory changes its parent's mtime
+        signature = (stat_signature(self.root), stat_signature(self.specpulse_dir))
+        return self._cached('structure', signature, lambda: missing_project_dirs(self.root))
+
+    @property
+    def is_project(self) -> bool:
+        """Whether the root has a complete SpecPulse structure"""
+        return not self.missing_dirs
+
+    @property
+    def path_manager(self):
+        """Shared PathManager for the root"""
+        if self._path_manager is None:
+            from .path_manager import PathManager
+            self._path_manager = PathManager(self.root)
+        return self._path_manager
+
+    @property
+    def project_type(self):
+        """Detected ProjectType (project_context.yaml, then common project files)"""
+        from ..utils.project_detector import ProjectDetector
+
+        signature = (stat_signature(self.root),) + tuple(stat_signature(self.root / name) for name in PROJECT_TYPE_FILES)
+        return self._cached(
+            'project_type', signature,
+            lambda: ProjectDetector.detect_project_type(self.root, use_cache=False)
+        )
+
+    def feature_catalog(self, base: Optional[Path] = None):
+        """
+        Shared FeatureCatalog for features under base/specs
+
+        Args:
+            base: Directory holding specs/, plans/ and tasks/ (defaults to .specpulse)
+        """
+        base = Path(base) if base is not None else self.specpulse_dir
+        catalog = self._catalogs.get(base)
+        if catalog is None:
+            from .feature_catalog import FeatureCatalog
+            # The legacy root layout gets its own catalog file
+            name = 'features.json' if base == self.specpulse_dir else 'features-root.json'
+            catalog = self._catalogs[base] = FeatureCatalog(base, self.specpulse_dir / 'cache' / name)
+        return catalog
+
+    @property
+    def task_index(self):
+        """Shared TaskIndex of the project's task files"""
+        if self._task_index is None:
+            from .task_index import TaskIndex
+            self._task_index = TaskIndex(self.root, self.specpulse_dir / 'cache' / 'task-index.json')
+        return self._task_index
+
+    def read_text(self, path: Path) -> Optional[str]:
+        """Content of a project file (e.g. context.md), or None if it is missing"""
+        path = Path(path)
+
+        def read() -> Optional[str]:
+            try:
+                return path.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError) as e:
+                logger.debug(f"Could not read {path}: {e}")
+                return None
+
+        return self._cached(('text', path), stat_signature(path), read)
+
+    def subdirectories(self, path: Path) -> List[Path]:
+        """Sorted subdirectories of path (empty if it does not exist)"""
+        path = Path(path)
+
+        def scan() -> List[Path]:
+            try:
+                return sorted(entry for entry in path.iterdir() if entry.is_dir())
+            except OSError:
+                return []
+
+        return self._cached(('dirs', path), stat_signature(path), scan)
+
+    def find_feature_dir(self, specs_dir: Path, identifier: str) -> Optional[Path]:
+        """Feature directory under specs_dir by ID or name (exact, then partial match)"""
+        features = self.subdirectories(specs_dir)
+        for item in features:
+            if item.name == identifier or item.name.startswith(f"{identifier}-"):
+                return item
+
+        identifier_lower = identifier.lower()
+        for item in features:
+            if identifier_lower in item.name.lower():
+                return item
+        return None
+
+    def current_feature_dir(self, context_file: Path, specs_dir: Path,
+                            feature_name: Optional[str] = None) -> Optional[Path]:
+        """
+        Active feature directory
+
+        Resolution order: explicit feature_name, the Feature ID or Directory
+        recorded in context_file, then the most recent NNN-* directory.
+        """
+        if feature_name:
+            return self.find_feature_dir(specs_dir, feature_name)
+
+        content = self.read_text(context_file)
+        if content is not None:
+            match = re.search(r'Feature ID[:\s]+(\d{3})', content)
+            if match:
+                return self.find_feature_dir(specs_dir, match.group(1))
+
+            match = re.search(r'Directory[:\s]+([^\n]+)', content)
+            if match:
+                feature_dir = Path(specs_dir) / match.group(1).strip()
+                if feature_dir.exists():
+                    return feature_dir
+
+        features = [d for d in self.subdirectories(specs_dir) if re.match(r'^\d{3}-', d.name)]
+        return features[-1] if features else None
+
+
+# Sessions by project root, and discovered roots by starting directory
+_sessions: Dict[Path, ProjectSession] = {}
+_roots: Dict[Path, Path] = {}
+
+
+def session_for(root: Path) -> ProjectSession:
+    """The process-wide session for a known project root"""
+    root = Path(root)
+    session = _sessions.get(root)
+    if session is None:
+        session = _sessions[root] = ProjectSession(root)
+    return session
+
+
+def find_project_root(start: Optional[Path] = None) -> Optional[Path]:
+    """Nearest directory from start upwards with a SpecPulse structure"""
+    start = Path(start) if start is not None else Path.cwd()
+    for candidate in (start, *start.parents):
+        if (candidate / '.specpulse').is_dir() or (candidate / 'specs').is_dir():
+            if not missing_project_dirs(candidate):
+                return candidate
+    return None
+
+
+def get_project_session(start: Optional[Path] = None) -> Optional[ProjectSession]:
+    """
+    Session for the project containing start (defaults to the working directory)
+
+    Returns:
+        ProjectSession, or None outside a SpecPulse project
+    """
+    start = Path(start) if start is not None else Path.cwd()
+
+    root = _roots.get(start)
+    if root is not None and session_for(root).is_project:
+        return session_for(root)
+
+    # Not cached, or the project was removed; a project may also be created
+    # later, so misses are not remembered
+    _roots.pop(start, None)
+    root = find_project_root(start)
+    if root is None:
+        return None
+    _roots[start] = root
+    return session_for(root)
+
+
+def clear_project_sessions() -> None:
+    """Forget all sessions (tests, or after moving projects around)"""
+    _sessions.clear()
+    _roots.clear()
+
+
+__all__ = [
+    'ProjectSession', 'get_project_session', 'session_for', 'find_project_root',
+    'missing_project_dirs', 'clear_project_sessions', 'stat_signature'
+]
@@ -0,0 +1,206 @@
+"""
+Task Dependency Graph
+
+The lifecycle manager used to reload ``dependencies.json`` and filter the
+whole dependency list on every event, and only ever looked at direct
+edges. TaskGraph keeps the dependencies as an in-memory DAG with forward
+(task -> prerequisites) and reverse (task -> dependents) adjacency, so
+readiness checks and "what does this unblock" queries cost O(degree), and
+adds the graph-wide queries the list could not answer: cycle detection,
+transitive dependents, topological levels and the critical path.
+"""
+
+import logging
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class TaskGraph:
+    """
+    Directed acyclic graph of task dependencies.
+
+    An edge ``task -> depends_on`` carries the dependency record stored in
+    ``dependencies.json`` (``task_id``, ``depends_on``, ``dependency_type``,
+    ``description``).
+
+    Example:
+        >>> graph = TaskGraph.from_records(dependencies["dependencies"])
+        >>> graph.add({"task_id": "T002", "depends_on": "T001", ...})
+        >>> graph.topological_levels()
+        [['T001'], ['T002']]
+    """
+
+    def __init__(self):
+        """Initialize an empty graph."""
+        self._prerequisites: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._levels: Optional[List[List[str]]] = None
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> 'TaskGraph':
+        """
+        Build a graph from dependency records.
+
+        Records that would close a cycle are skipped with a warning; later
+        records for an existing edge replace earlier ones.
+        """
+        graph = cls()
+        for record in records:
+            if not graph.add(record):
+                logger.warning(
+                    f"Ignoring cyclic dependency {record['task_id']} -> {record['depends_on']}"
+                )
+        return graph
+
+    @property
+    def tasks(self) -> Set[str]:
+        """Every task that has or is a dependency"""
+        return set(self._prerequisites) | set(self._dependents)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of dependency edges"""
+        return sum(len(edges) for edges in self._prerequisites.values())
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Dependency records of every edge"""
+        return [record for edges in self._prerequisites.values() for record in edges.values()]
+
+    def prerequisites(self, task_id: str) -> Dict[str, Dict[str, Any]]:
+        """Dependency records of task_id keyed by the task it depends on"""
+        return self._prerequisites.get(task_id, {})
+
+    def dependents(self, task_id: str) -> Set[str]:
+        """Tasks that directly depend on task_id"""
+        return self._dependents.get(task_id, set())
+
+    def transitive_dependents(self, task_id: str) -> List[str]:
+        """Tasks that depend on task_id directly or indirectly, nearest first"""
+        seen = {task_id}
+        order = []
+        queue = deque([task_id])
+        while queue:
+            for dependent in sorted(self.dependents(queue.popleft())):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    order.append(dependent)
+                    queue.append(dependent)
+        return order
+
+    def would_create_cycle(self, task_id: str, depends_on: str) -> bool:
+        """Whether adding task_id -> depends_on closes a cycle"""
+        if task_id == depends_on:
+            return True
+        # A cycle exists if task_id is already a (transitive) prerequisite of depends_on
+        seen = {depends_on}
+        stack = [depends_on]
+        while stack:
+            for prerequisite in self.prerequisites(stack.pop()):
+                if prerequisite == task_id:
+                    return True
+                if prerequisite not in seen:
+                    seen.add(prerequisite)
+                    stack.append(prerequisite)
+        return False
+
+    def add(self, record: Dict[str, Any]) -> bool:
+        """
+        Add or replace a dependency edge.
+
+        Returns:
+            True if the edge was added, False if it would create a cycle
+        """
+        task_id, depends_on = record["task_id"], record["depends_on"]
+        if depends_on not in self.prerequisites(task_id) and self.would_create_cycle(task_id, depends_on):
+            return False
+
+        self._prerequisites.setdefault(task_id, {})[depends_on] = record
+        self._dependents.setdefault(depends_on, set()).add(task_id)
+        self._levels = None
+        return True
+
+    def topological_levels(self) -> List[List[str]]:
+        """
+        Tasks grouped by dependency depth.
+
+        Level 0 holds tasks without prerequisites; every task sits one level
+        below its deepest prerequisite, so the tasks of one level never
+        depend on each other.
+        """
+        if self._levels is None:
+            remaining = {task: len(self.prerequisites(task)) for task in self.tasks}
+            level = sorted(task for task, count in remaining.items() if count == 0)
+            levels = []
+            while level:
+                levels.append(level)
+                next_level = []
+                for task in level:
+                    for dependent in self.dependents(task):
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            next_level.append(dependent)
+                level = sorted(next_level)
+            self._levels = levels
+        return self._levels
+
+    def heights(self) -> Dict[str, int]:
+        """Number of tasks on the longest dependent chain starting at each task"""
+        heights: Dict[str, int] = {}
+        for level in reversed(self.topological_levels()):
+            for task in level:
+                heights[task] = 1 + max((heights[d] for d in self.dependents(task) if d in heights), default=0)
+        return heights
+
+    def critical_path(self, tasks: Optional[Iterable[str]] = None,
+                      durations: Optional[Dict[str, float]] = None) -> List[str]:
+        """
+        Longest dependency chain, from its first task to its last.
+
+        Args:
+            tasks: Restrict the graph to these tasks (default: all)
+            durations: Weight of each task (default: 1 per task)
+
+        Returns:
+            Task IDs along the critical path
+        """
+        subset = set(tasks) if tasks is not None else None
+        durations = durations or {}
+
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for level in self.topological_levels():
+            for task in level:
+                if subset is not None and task not in subset:
+                    continue
+                best, best_finish = None, 0.0
+                for prerequisite in self.prerequisites(task):
+                    if prerequisite in finish and finish[prerequisite] > best_finish:
+                        best, best_finish = prerequisite, finish[prerequisite]
+                finish[task] = best_finish + durations.get(task, 1.0)
+                previous[task] = best
+
+        if not finish:
+            return []
+
+        task = max(sorted(finish), key=lambda t: finish[t])
+        path = []
+        while task is not None:
+            path.append(task)
+            task = previous[task]
+        return path[::-1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Adjacency, reverse adjacency and levels for persistence"""
+        return {
+            "prerequisites": {
+                task: {dep: edge.get("dependency_type", "completion") for dep, edge in sorted(edges.items())}
+                for task, edges in sorted(self._prerequisites.items())
+            },
+            "dependents": {task: sorted(tasks) for task, tasks in sorted(self._dependents.items())},
+            "levels": self.topological_levels(),
+        }
+
+
+__all__ = ['TaskGraph']
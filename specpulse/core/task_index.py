@@ -0,0 +1,222 @@
+"""
+Task Metadata Index
+
+``sp-task list`` and ``sp-task progress`` used to read every ``tasks-*.md``
+file in full to find its ``STATUS:``/``PROGRESS:`` metadata and task counts.
+The index keeps that metadata per task file together with the file's stat
+signature, so unchanged files are not opened at all. Files that changed are
+re-read through a bounded header reader (the metadata block written by
+``sp-task breakdown`` sits at the top of the file); task counts, which need
+the whole file, are only recomputed when progress asks for them.
+
+The index lives in ``.specpulse/cache/task-index.json`` and, like the
+validation cache, is only persisted when the project already has a
+``.specpulse`` directory.
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .project_session import stat_signature
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout of the index file changes
+INDEX_FORMAT_VERSION = 1
+
+# The header reader never reads more than this many bytes of a task file
+HEADER_BYTES = 4096
+
+_METADATA_BLOCK = re.compile(r'<!-- SPECPULSE_METADATA\n(.*?)-->', re.DOTALL)
+_STATUS = re.compile(r'STATUS: (\w+)')
+_PROGRESS = re.compile(r'PROGRESS: (\d+)')
+_TASK_ID = re.compile(r'TASK_ID: (\S+)')
+_STARTED = re.compile(r'\*\*Started\*\*: ([^\n]+)')
+_COMPLETED = re.compile(r'\*\*Completed\*\*: ([^\n]+)')
+
+TASK_STATUSES = ('completed', 'in_progress', 'pending')
+
+
+def _signature(path: Path) -> Optional[List[int]]:
+    """JSON-compatible stat signature of a file"""
+    signature = stat_signature(path)
+    return list(signature) if signature is not None else None
+
+
+def parse_task_header(header: str) -> Dict[str, Any]:
+    """
+    Metadata of a task file from its leading text.
+
+    Returns:
+        Dictionary with task_id, status, progress, started and completed
+    """
+    metadata = _METADATA_BLOCK.search(header)
+    block = metadata.group(1) if metadata else header
+
+    task_id = _TASK_ID.search(block)
+    status = _STATUS.search(block)
+    progress = _PROGRESS.search(block)
+    started = _STARTED.search(header)
+    completed = _COMPLETED.search(header)
+
+    return {
+        "task_id": task_id.group(1) if task_id else None,
+        "status": status.group(1) if status else "pending",
+        "progress": int(progress.group(1)) if progress else 0,
+        "started": started.group(1).strip() if started else None,
+        "completed": completed.group(1).strip() if completed else None,
+    }
+
+
+def count_tasks(content: str) -> Dict[str, int]:
+    """Number of tasks and of tasks per status in a task breakdown"""
+    counts = {"total": content.count("### Task:")}
+    for status in TASK_STATUSES:
+        counts[status] = content.count(f"**Status**: {status}")
+    return counts
+
+
+def read_task_header(path: Path, limit: int = HEADER_BYTES) -> str:
+    """First `limit` bytes of a task file, decoded"""
+    with open(path, 'rb') as f:
+        return f.read(limit).decode('utf-8', errors='ignore')
+
+
+class TaskIndex:
+    """
+    Per task file metadata keyed by project-relative path.
+
+    Example:
+        >>> index = TaskIndex(project_root, cache_file)
+        >>> for path in task_files:
+        ...     print(path.name, index.get(path)["status"])
+        >>> index.save()
+    """
+
+    def __init__(self, project_root: Path, cache_file: Optional[Path] = None):
+        """
+        Initialize task index.
+
+        Args:
+            project_root: Root directory of the project
+            cache_file: Where to persist the index, or None to keep it in memory
+        """
+        self.project_root = Path(project_root)
+        self.cache_file = Path(cache_file) if cache_file is not None else None
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load the persisted index, discarding incompatible files."""
+        self._entries = {}
+        if self.cache_file is None or not self.cache_file.exists():
+            return self._entries
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.debug(f"Ignoring unreadable task index: {e}")
+            return self._entries
+
+        if not isinstance(data, dict) or data.get("version") != INDEX_FORMAT_VERSION:
+            logger.debug("Ignoring task index with incompatible format")
+            return self._entries
+
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            self._entries = entries
+        return self._entries
+
+    def _key(self, path: Path) -> str:
+        """Stable, project-relative key for a task file."""
+        try:
+            return Path(path).relative_to(self.project_root).as_posix()
+        except ValueError:
+            return Path(path).as_posix()
+
+    def _current(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Entry for path if it still matches the file on disk."""
+        entries = self._entries if self._entries is not None else self._load()
+        entry = entries.get(self._key(path))
+        if entry is not None and entry.get("signature") == _signature(path):
+            return entry
+        return None
+
+    def get(self, path: Path) -> Dict[str, Any]:
+        """
+        Metadata of a task file, reading only its header if it changed.
+
+        Returns:
+            Dictionary with task_id, status, progress, started and completed
+        """
+        entry = self._current(path)
+        if entry is None:
+            signature = _signature(path)
+            entry = parse_task_header(read_task_header(path))
+            entry.update(signature=signature, counts=None)
+            self._entries[self._key(path)] = entry
+            self._dirty = True
+        return entry
+
+    def counts(self, path: Path) -> Dict[str, int]:
+        """Task counts of a task file, reading it in full only if it changed."""
+        entry = self.get(path)
+        if entry.get("counts") is None:
+            entry["counts"] = count_tasks(Path(path).read_text(encoding='utf-8'))
+            self._dirty = True
+        return entry["counts"]
+
+    def record(self, path: Path, content: str) -> None:
+        """Update the entry of a task file just written with content."""
+        if self._entries is None:
+            self._load()
+        entry = parse_task_header(content[:HEADER_BYTES])
+        entry.update(signature=_signature(path), counts=count_tasks(content))
+        self._entries[self._key(path)] = entry
+        self._dirty = True
+
+    def save(self) -> bool:
+        """
+        Persist the index atomically if it changed.
+
+        Returns:
+            True if the index was written, False otherwise
+        """
+        if not self._dirty or self.cache_file is None:
+            return False
+
+        # Never create .specpulse/ as a side effect of listing tasks
+        if not self.cache_file.parent.parent.is_dir():
+            return False
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_fd, temp_path = tempfile.mkstemp(
+                dir=self.cache_file.parent,
+                prefix=f".{self.cache_file.stem}_tmp_",
+                suffix=self.cache_file.suffix
+            )
+            try:
+                with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+                    json.dump({"version": INDEX_FORMAT_VERSION, "entries": self._entries},
+                              f, ensure_ascii=False)
+                os.replace(temp_path, self.cache_file)
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write task index: {e}")
+            return False
+
+        self._dirty = False
+        return True
+
+
+__all__ = ['TaskIndex', 'parse_task_header', 'count_tasks', 'read_task_header']
@@ -0,0 +1,287 @@
+"""
+Task Scheduler - hands out ready tasks to concurrent agents
+
+Several agents can work on one feature at once, but the lifecycle manager
+only reacted to one task at a time. The scheduler answers "what can I work
+on now" for many agents: it hands out ready tasks (all dependencies
+satisfied, see LLMTaskLifecycleManager.get_ready_tasks) under time-bounded
+leases, so two agents never get the same task and a crashed agent's tasks
+return to the pool once its lease expires.
+
+Leases live in ``.specpulse/memory/task_status/leases.json`` and every
+read-modify-write of that file happens under a file lock, so agents in
+separate processes can claim concurrently. Expired leases are reclaimed
+through the lifecycle manager's auto-timeout rule (the task is blocked and
+a TIMEOUT event recorded) and the task is handed out again.
+
+Among ready tasks, those heading the longest remaining dependency chains
+are handed out first (critical-path-first list scheduling), which keeps
+the most tasks runnable for the agents that come next.
+"""
+
+import json
+import logging
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Import platform-specific file locking
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+from .llm_task_lifecycle_manager import LLMTaskLifecycleManager, LifecycleEvent, LifecycleTrigger
+from .llm_task_status_manager import TaskStatus
+
+logger = logging.getLogger(__name__)
+
+# Lease length when the caller does not ask for one
+DEFAULT_LEASE_SECONDS = 3600
+
+
+class TaskScheduler:
+    """
+    Lease-based task distribution over the lifecycle dependency graph.
+
+    Example:
+        >>> scheduler = TaskScheduler(project_root)
+        >>> for lease in scheduler.claim("agent-1", max_tasks=2):
+        ...     run(lease["task_id"])
+        ...     scheduler.complete("agent-1", lease["task_id"])
+    """
+
+    def __init__(self, project_root: Path,
+                 lifecycle_manager: Optional[LLMTaskLifecycleManager] = None,
+                 lease_seconds: int = DEFAULT_LEASE_SECONDS):
+        """
+        Initialize task scheduler.
+
+        Args:
+            project_root: Root directory of the project
+            lifecycle_manager: Lifecycle manager to schedule from (created if omitted)
+            lease_seconds: Default lease length in seconds
+        """
+        self.project_root = project_root
+        self.lifecycle = lifecycle_manager or LLMTaskLifecycleManager(project_root)
+        self.status_manager = self.lifecycle.status_manager
+        self.lease_seconds = lease_seconds
+
+        self.leases_file = self.status_manager.status_dir / "leases.json"
+        self.lock_file = self.status_manager.status_dir / ".leases.lock"
+
+    def claim(self, agent_id: str, max_tasks: int = 1,
+              lease_seconds: Optional[int] = None,
+              candidates: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Lease up to max_tasks ready tasks to an agent.
+
+        Args:
+            agent_id: Identifier of the claiming agent
+            max_tasks: Maximum number of tasks to hand out
+            lease_seconds: Lease length (default: the scheduler's)
+            candidates: Tasks to choose from (default: every known task)
+
+        Returns:
+            Granted leases ({"task_id", "agent", "claimed_at", "expires_at"}),
+            highest priority first
+        """
+        if lease_seconds is None:
+            lease_seconds = self.lease_seconds
+
+        with self._locked():
+            state = self._load_leases()
+            self._reclaim_expired(state)
+
+            if candidates is None:
+                candidates = self.lifecycle.get_dependency_graph().tasks | \
+                    set(self.status_manager.get_all_task_statuses())
+            candidates = set(candidates) - set(state["leases"])
+
+            # A reclaimed task may have been cancelled or finished since; only
+            # blocked/failed ones can go back to in-progress
+            statuses = self.status_manager.get_task_statuses(state["reclaimed"])
+            state["reclaimed"] = [
+                task for task in state["reclaimed"]
+                if statuses[task] in (TaskStatus.BLOCKED, TaskStatus.FAILED)
+            ]
+
+            ready = set(self.lifecycle.get_ready_tasks(candidates))
+            ready.update(task for task in state["reclaimed"] if task in candidates)
+
+            now = datetime.now()
+            granted = []
+            for task_id in self._prioritize(ready):
+                if len(granted) >= max_tasks:
+                    break
+                if not self.status_manager.update_task_status(
+                        task_id, TaskStatus.IN_PROGRESS, f"Leased to {agent_id}"):
+                    continue
+
+                lease = {
+                    "task_id": task_id,
+                    "agent": agent_id,
+                    "claimed_at": now.isoformat(),
+                    "expires_at": (now + timedelta(seconds=lease_seconds)).isoformat()
+                }
+                state["leases"][task_id] = lease
+                if task_id in state["reclaimed"]:
+                    state["reclaimed"].remove(task_id)
+                self.lifecycle.record_lifecycle_event(
+                    task_id, LifecycleEvent.STARTED, LifecycleTrigger.AUTOMATIC,
+                    f"Leased to {agent_id}", {"lease_expires_at": lease["expires_at"]}
+                )
+                granted.append(lease)
+
+            self._save_leases(state)
+            return granted
+
+    def renew(self, agent_id: str, task_id: str, lease_seconds: Optional[int] = None) -> bool:
+        """
+        Extend an agent's lease on a task.
+
+        Returns:
+            True if the agent holds the lease and it was extended
+        """
+        with self._locked():
+            state = self._load_leases()
+            self._reclaim_expired(state)
+            lease = state["leases"].get(task_id)
+            if lease is None or lease["agent"] != agent_id:
+                self._save_leases(state)
+                return False
+
+            if lease_seconds is None:
+                lease_seconds = self.lease_seconds
+            expires = datetime.now() + timedelta(seconds=lease_seconds)
+            lease["expires_at"] = expires.isoformat()
+            self._save_leases(state)
+            return True
+
+    def complete(self, agent_id: str, task_id: str, success: bool = True) -> List[str]:
+        """
+        Finish a leased task and release its lease.
+
+        A failure is recorded as a FAILED lifecycle event, which blocks the
+        task's dependents.
+
+        Returns:
+            Tasks that became ready because of this completion
+        """
+        with self._locked():
+            state = self._load_leases()
+            lease = state["leases"].get(task_id)
+            if lease is None or lease["agent"] != agent_id:
+                logger.warning(f"{agent_id} does not hold a lease on {task_id}")
+                return []
+
+            del state["leases"][task_id]
+            self._save_leases(state)
+
+            status = TaskStatus.COMPLETED if success else TaskStatus.FAILED
+            self.status_manager.update_task_status(task_id, status, f"Finished by {agent_id}")
+            self.lifecycle.record_lifecycle_event(
+                task_id,
+                LifecycleEvent.COMPLETED if success else LifecycleEvent.FAILED,
+                LifecycleTrigger.AUTOMATIC if success else LifecycleTrigger.ERROR,
+                f"Finished by {agent_id}"
+            )
+
+            if not success:
+                return []
+            dependents = self.lifecycle.get_dependency_graph().dependents(task_id)
+            return self.lifecycle.get_ready_tasks(set(dependents) - set(state["leases"]))
+
+    def reclaim_expired(self) -> List[str]:
+        """
+        Time out tasks whose lease expired and make them claimable again.
+
+        Returns:
+            Task IDs whose lease was reclaimed
+        """
+        with self._locked():
+            state = self._load_leases()
+            reclaimed = self._reclaim_expired(state)
+            self._save_leases(state)
+            return reclaimed
+
+    def get_leases(self) -> Dict[str, Dict[str, Any]]:
+        """Current leases by task ID"""
+        return self._load_leases()["leases"]
+
+    # Private helpers
+
+    def _prioritize(self, tasks: Iterable[str]) -> List[str]:
+        """Order tasks by the length of the dependency chain they head"""
+        heights = self.lifecycle.get_dependency_graph().heights()
+        return sorted(tasks, key=lambda task: (-heights.get(task, 1), task))
+
+    def _reclaim_expired(self, state: Dict[str, Any]) -> List[str]:
+        """Run the auto-timeout rule on every expired lease in state."""
+        now = datetime.now()
+        timeout_rule = self.lifecycle.lifecycle_rules["auto_timeout"]
+
+        reclaimed = []
+        for task_id, lease in list(state["leases"].items()):
+            if datetime.fromisoformat(lease["expires_at"]) > now:
+                continue
+
+            del state["leases"][task_id]
+            context = {"task_id": task_id, "lease": lease}
+            if timeout_rule.action(task_id, context):
+                state["reclaimed"].append(task_id)
+                reclaimed.append(task_id)
+                logger.info(f"Reclaimed expired lease of {lease['agent']} on {task_id}")
+        return reclaimed
+
+    def _load_leases(self) -> Dict[str, Any]:
+        """Load lease state, starting fresh if the file is missing or unreadable"""
+        try:
+            data = json.loads(self.leases_file.read_text(encoding='utf-8'))
+            if isinstance(data.get("leases"), dict) and isinstance(data.get("reclaimed"), list):
+                return data
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, OSError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable lease file: {e}")
+        return {"version": "1.0", "leases": {}, "reclaimed": []}
+
+    def _save_leases(self, state: Dict[str, Any]) -> None:
+        """Write lease state atomically"""
+        temp_fd, temp_path = tempfile.mkstemp(
+            dir=self.leases_file.parent,
+            prefix=f".{self.leases_file.stem}_tmp_",
+            suffix=self.leases_file.suffix
+        )
+        try:
+            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=2)
+            os.replace(temp_path, self.leases_file)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    @contextmanager
+    def _locked(self):
+        """Hold the process-level lease lock"""
+        self.lock_file.touch(exist_ok=True)
+        with open(self.lock_file, 'w') as lock_file:
+            if sys.platform == "win32":
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if sys.platform == "win32":
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+__all__ = ['TaskScheduler', 'DEFAULT_LEASE_SECONDS']
@@ -1,105 +1,199 @@
 """
-Time-Based Template Cache with TTL (Time-To-Live)
+Stat-Validated Template Cache with LRU Bounds
 
 This module provides a template caching system that:
 - Caches templates for performance
-- Expires cached templates after TTL (default 5 minutes)
-- Allows manual cache invalidation
-- Prevents stale cache issues when templates are updated
+- Revalidates cached templates against their source file's stat
+  signature (mtime, size, inode), so edits are seen on the next access
+  and unchanged files are never re-read
+- Bounds memory by entry count and total size, evicting least recently
+  used entries
+- Loads different keys concurrently (a miss only blocks other misses
+  on the same key)
+- Allows manual cache invalidation and an optional TTL
 
 CRITICAL: This replaces @lru_cache to prevent serving stale templates
 when users update template files.
 """
 
-from typing import Dict, Tuple, Callable, Optional, Any
+from collections import OrderedDict
 from pathlib import Path
+from typing import Dict, Callable, Optional, Any, Union
+import sys
 import time
 import threading
 import logging
 
+from .project_session import StatKey, stat_signature
+
 logger = logging.getLogger(__name__)
 
+# Default bounds of a cache instance
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+def _value_size(value: Any) -> int:
+    """Approximate memory taken by a cached value"""
+    if isinstance(value, str):
+        return len(value.encode('utf-8', errors='ignore'))
+    if isinstance(value, bytes):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class _Entry:
+    """Cached value with the data needed to revalidate and bound it"""
+
+    __slots__ = ('value', 'timestamp', 'signature', 'size')
+
+    def __init__(self, value: Any, timestamp: float, signature: StatKey, size: int):
+        self.value = value
+        self.timestamp = timestamp
+        self.signature = signature
+        self.size = size
+
 
 class TemplateCache:
     """
-    Time-aware template cache with TTL expiration.
+    Stat-validated, size-bounded template cache.
 
-    Templates are cached in memory but expire after a configurable TTL.
-    This prevents serving stale templates while maintaining performance.
+    Entries loaded with a ``source`` path stay valid exactly as long as
+    that file's stat signature is unchanged; a missing source is a valid
+    signature too, so embedded fallbacks are reloaded once the file
+    appears. Entries without a source stay until evicted or invalidated,
+    or until ``ttl_seconds`` pass when a TTL is configured.
 
-    Thread-safe implementation using locks for concurrent access.
+    Thread-safe: the entry table is guarded by a short-lived lock and each
+    key has its own loading lock, so concurrent misses on different keys
+    load in parallel and concurrent misses on one key load it once.
 
     Example:
-        >>> cache = TemplateCache(ttl_seconds=300)  # 5 min TTL
-        >>> def load_spec():
-        ...     return Path("spec.md").read_text()
-        >>> template = cache.get("spec_template", load_spec)
-        >>> # Cached for 5 minutes, then reloaded
+        >>> cache = TemplateCache()
+        >>> path = Path("spec.md")
+        >>> template = cache.get(str(path), path.read_text, source=path)
+        >>> # Served from memory until spec.md changes on disk
     """
 
-    def __init__(self, ttl_seconds: int = 300):
+    def __init__(self, ttl_seconds: Optional[int] = None,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
         """
         Initialize template cache.
 
         Args:
-            ttl_seconds: Time-to-live in seconds (default: 300 = 5 minutes)
+            ttl_seconds: Optional time-to-live in seconds (default: None, no expiry)
+            max_entries: Maximum number of cached entries
+            max_bytes: Maximum total size of cached values in bytes
         """
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, Tuple[Any, float]] = {}
-        self._lock = threading.Lock()  # Thread-safe access
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._cache: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()  # Guards _cache, _key_locks and stats
+        self._key_locks: Dict[str, threading.Lock] = {}
         self._hits = 0
         self._misses = 0
-
-    def get(self, key: str, loader: Callable[[], Any]) -> Any:
+        self._evictions = 0
+
+    def _expired(self, entry: _Entry, now: float) -> bool:
+        """Whether entry is older than the TTL (if any)"""
+        return self.ttl_seconds is not None and now - entry.timestamp >= self.ttl_seconds
+
+    def _lookup(self, key: str, signature: StatKey, check_source: bool, now: float) -> Optional[_Entry]:
+        """Valid entry for key, dropping a stale one. Caller holds _lock."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        if self._expired(entry, now):
+            logger.debug(f"Cache EXPIRED for key '{key}' (TTL: {self.ttl_seconds}s)")
+        elif check_source and entry.signature != signature:
+            logger.debug(f"Cache STALE for key '{key}' - source file changed")
+        else:
+            self._cache.move_to_end(key)
+            return entry
+
+        self._discard(key)
+        return None
+
+    def _discard(self, key: str):
+        """Remove key from the table. Caller holds _lock."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _store(self, key: str, entry: _Entry):
+        """Insert entry and evict least recently used ones. Caller holds _lock."""
+        self._discard(key)
+        self._cache[key] = entry
+        self._bytes += entry.size
+
+        while self._cache and (len(self._cache) > self.max_entries or self._bytes > self.max_bytes):
+            evicted, _ = next(iter(self._cache.items()))
+            if evicted == key and len(self._cache) == 1:
+                break  # A single oversized value is still cached
+            self._discard(evicted)
+            self._evictions += 1
+            logger.debug(f"Cache EVICTED key '{evicted}'")
+
+    def get(self, key: str, loader: Callable[[], Any],
+            source: Optional[Union[str, Path]] = None) -> Any:
         """
         Get item from cache or load it.
 
-        If key exists and hasn't expired, return cached value.
-        Otherwise, call loader function and cache the result.
+        If key is cached and still valid (source file unchanged, TTL not
+        passed), return the cached value. Otherwise, call loader function
+        and cache the result.
 
         Args:
             key: Cache key
             loader: Function to call if cache miss (must return the value)
+            source: File the value is derived from; the entry is reloaded
+                when its stat signature changes
 
         Returns:
             Cached or freshly loaded value
 
         Example:
             >>> cache = TemplateCache()
-            >>> def load_template():
-            ...     return Path("template.md").read_text()
-            >>> template = cache.get("my_template", load_template)
+            >>> path = Path("template.md")
+            >>> template = cache.get("my_template", path.read_text, source=path)
         """
-        with self._lock:
-            now = time.time()
-
-            # Check if key exists and is not expired
-            if key in self._cache:
-                value, timestamp = self._cache[key]
-                age = now - timestamp
+        check_source = source is not None
+        signature = stat_signature(Path(source)) if check_source else None
 
-                if age < self.ttl_seconds:
-                    # Cache hit
+        with self._lock:
+            entry = self._lookup(key, signature, check_source, time.time())
+            if entry is not None:
+                # Cache hit
+                self._hits += 1
+                logger.debug(f"Cache HIT for key '{key}'")
+                return entry.value
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another thread may have loaded the key while we waited
+            with self._lock:
+                entry = self._lookup(key, signature, check_source, time.time())
+                if entry is not None:
                     self._hits += 1
-                    logger.debug(f"Cache HIT for key '{key}' (age: {age:.1f}s)")
-                    return value
-                else:
-                    # Cache expired
-                    logger.debug(f"Cache EXPIRED for key '{key}' (age: {age:.1f}s, TTL: {self.ttl_seconds}s)")
-                    del self._cache[key]
+                    return entry.value
+                self._misses += 1
 
-            # Cache miss or expired - load fresh value
-            self._misses += 1
             logger.debug(f"Cache MISS for key '{key}' - loading fresh value")
-
             try:
                 value = loader()
-                self._cache[key] = (value, now)
-                return value
             except Exception as e:
                 logger.error(f"Failed to load value for key '{key}': {e}")
                 raise
 
+            with self._lock:
+                self._store(key, _Entry(value, time.time(), signature, _value_size(value)))
+                self._key_locks.pop(key, None)
+            return value
+
     def invalidate(self, key: Optional[str] = None):
         """
         Invalidate cache entry or entire cache.
@@ -116,11 +210,12 @@ class TemplateCache:
                 # Clear entire cache
                 count = len(self._cache)
                 self._cache.clear()
+                self._bytes = 0
                 logger.info(f"Cache cleared ({count} items removed)")
             else:
                 # Remove specific key
                 if key in self._cache:
-                    del self._cache[key]
+                    self._discard(key)
                     logger.debug(f"Invalidated cache key: '{key}'")
                 else:
                     logger.debug(f"Cache key not found: '{key}'")
@@ -136,12 +231,8 @@ class TemplateCache:
             True if key exists and is not expired
         """
         with self._lock:
-            if key not in self._cache:
-                return False
-
-            _, timestamp = self._cache[key]
-            age = time.time() - timestamp
-            return age < self.ttl_seconds
+            entry = self._cache.get(key)
+            return entry is not None and not self._expired(entry, time.time())
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -150,8 +241,10 @@ class TemplateCache:
         Returns:
             Dictionary with cache statistics:
             - size: Number of cached items
+            - bytes: Approximate total size of cached values
             - hits: Number of cache hits
             - misses: Number of cache misses
+            - evictions: Number of entries evicted by the size bounds
             - hit_rate: Cache hit rate (0-100%)
 
         Example:
@@ -164,40 +257,39 @@ class TemplateCache:
 
             return {
                 'size': len(self._cache),
+                'bytes': self._bytes,
                 'hits': self._hits,
                 'misses': self._misses,
+                'evictions': self._evictions,
                 'hit_rate': hit_rate,
-                'ttl_seconds': self.ttl_seconds
+                'ttl_seconds': self.ttl_seconds,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes
             }
 
     def clear_expired(self):
         """
         Manually clear expired entries.
 
-        This is called automatically during get(), but can be called
-        manually for cleanup.
+        Expired entries are also dropped during get(); without a TTL
+        nothing expires.
         """
         with self._lock:
             now = time.time()
-            expired_keys = []
-
-            for key, (_, timestamp) in self._cache.items():
-                age = now - timestamp
-                if age >= self.ttl_seconds:
-                    expired_keys.append(key)
+            expired_keys = [key for key, entry in self._cache.items() if self._expired(entry, now)]
 
             for key in expired_keys:
-                del self._cache[key]
+                self._discard(key)
 
             if expired_keys:
                 logger.info(f"Cleared {len(expired_keys)} expired cache entries")
 
-    def set_ttl(self, ttl_seconds: int):
+    def set_ttl(self, ttl_seconds: Optional[int]):
         """
-        Update TTL for future cache entries.
+        Update TTL for cache entries.
 
         Args:
-            ttl_seconds: New TTL in seconds
+            ttl_seconds: New TTL in seconds, or None to disable expiry
         """
         self.ttl_seconds = ttl_seconds
         logger.info(f"Cache TTL updated to {ttl_seconds} seconds")
@@ -207,7 +299,7 @@ class TemplateCache:
 _global_template_cache: Optional[TemplateCache] = None
 
 
-def get_global_template_cache(ttl_seconds: int = 300) -> TemplateCache:
+def get_global_template_cache(ttl_seconds: Optional[int] = None) -> TemplateCache:
     """
     Get global shared template cache instance.
 
@@ -215,7 +307,7 @@ def get_global_template_cache(ttl_seconds: int = 300) -> TemplateCache:
     for better memory efficiency.
 
     Args:
-        ttl_seconds: TTL for cache (only used on first call)
+        ttl_seconds: Optional TTL for cache (only used on first call)
 
     Returns:
         Global TemplateCache instance
@@ -224,7 +316,7 @@ def get_global_template_cache(ttl_seconds: int = 300) -> TemplateCache:
 
     if _global_template_cache is None:
         _global_template_cache = TemplateCache(ttl_seconds=ttl_seconds)
-        logger.debug(f"Created global template cache (TTL: {ttl_seconds}s)")
+        logger.debug(f"Created global template cache (TTL: {ttl_seconds})")
 
     return _global_template_cache
 
@@ -4,9 +4,11 @@ SpecPulse Template Manager - Enhanced template system with validation and versio
 
 import json
 import shutil
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Set
 from dataclasses import dataclass, asdict
 import re
 import yaml
@@ -112,6 +114,52 @@ def validate_template_security(content: str) -> Tuple[bool, List[str]]:
     return is_safe, vulnerabilities
 
 
+# Compiled templates kept for the shared sandbox, keyed by content checksum
+COMPILED_TEMPLATE_LIMIT = 128
+
+_sandbox_env = None
+_compiled_templates: "OrderedDict[str, Any]" = OrderedDict()
+_compiled_lock = threading.Lock()
+
+
+def _sandbox_environment():
+    """Process-wide SandboxedEnvironment with autoescape, created on first use"""
+    global _sandbox_env
+    if _sandbox_env is None:
+        from jinja2.sandbox import SandboxedEnvironment
+        from jinja2 import BaseLoader
+
+        _sandbox_env = SandboxedEnvironment(autoescape=True, loader=BaseLoader())
+    return _sandbox_env
+
+
+def compile_template(content: str, checksum: str):
+    """
+    Compiled template for content, reusing an earlier compilation.
+
+    Args:
+        content: Template source
+        checksum: Checksum of content (see TemplateManager._calculate_checksum)
+
+    Returns:
+        jinja2 Template bound to the shared sandboxed environment
+    """
+    with _compiled_lock:
+        template = _compiled_templates.get(checksum)
+        if template is not None:
+            _compiled_templates.move_to_end(checksum)
+            return template
+
+    # Compile outside the lock; a concurrent duplicate compile is harmless
+    template = _sandbox_environment().from_string(content)
+
+    with _compiled_lock:
+        _compiled_templates[checksum] = template
+        while len(_compiled_templates) > COMPILED_TEMPLATE_LIMIT:
+            _compiled_templates.popitem(last=False)
+    return template
+
+
 class TemplateManager:
     """Enhanced template management system"""
 
@@ -144,6 +192,10 @@ class TemplateManager:
         # Initialize advanced template validator
         self.validator = TemplateValidator(strict_mode=False)
 
+        # Security verdict per content checksum (None when the template is safe),
+        # least recently used first and bounded like the compiled templates
+        self._security_verdicts: "OrderedDict[str, Optional[str]]" = OrderedDict()
+
         # Standard template variables
         self.standard_variables = {
             "spec": [
@@ -327,12 +379,7 @@ class TemplateManager:
         # Legacy validation for backward compatibility
         # Validate Jinja2 syntax with secure environment
         try:
-            from jinja2.sandbox import SandboxedEnvironment
-            from jinja2 import meta
-
-            # Use SandboxedEnvironment with autoescape for security
-            env = SandboxedEnvironment(autoescape=True)
-            env.parse(content)
+            _sandbox_environment().parse(content)
         except Exception as e:
             errors.append(f"Jinja2 syntax error: {e}")
             suggestions.append("Check template syntax and variable formatting")
@@ -466,46 +513,83 @@ class TemplateManager:
     def get_template_preview(self, template_path: Path, sample_data: Optional[Dict] = None) -> str:
         """Generate preview of template with sample data"""
         try:
-            if not template_path.exists():
-                raise TemplateError(f"Template not found: {template_path}")
+            template, sample_data = self._prepare_preview(template_path, sample_data)
+            return template.render(**sample_data)
 
-            # Check file size BEFORE reading to prevent DoS (BUG-008 fix)
-            file_size = template_path.stat().st_size
-            max_size = 1024 * 1024  # 1MB limit
-            if file_size > max_size:
-                raise TemplateError(f"Template file too large: {file_size} bytes (max: {max_size})")
+        except Exception as e:
+            raise TemplateError(f"Failed to generate template preview: {e}")
 
-            content = template_path.read_text(encoding='utf-8')
+    def stream_template_preview(self, template_path: Path,
+                                sample_data: Optional[Dict] = None) -> Iterator[str]:
+        """
+        Render a template preview chunk by chunk
 
-            # Provide sample data if not provided
-            if sample_data is None:
-                category = self._get_template_category(template_path)
-                sample_data = self._get_sample_data(category)
+        Validation and compilation happen before this returns, so errors in
+        the template surface here; the rendered text is produced lazily via
+        jinja2's generate() instead of being built as one string.
+        """
+        try:
+            template, sample_data = self._prepare_preview(template_path, sample_data)
+        except Exception as e:
+            raise TemplateError(f"Failed to generate template preview: {e}")
 
-            # Validate template with advanced validator before rendering
-            validation_result = self.validator.validate_template(content, template_path)
-            if not validation_result.is_safe:
-                error_messages = [issue.message for issue in validation_result.critical_issues + validation_result.error_issues]
-                raise TemplateError(f"Template contains security vulnerabilities: {'; '.join(error_messages)}")
+        def chunks() -> Iterator[str]:
+            try:
+                yield from template.generate(**sample_data)
+            except Exception as e:
+                raise TemplateError(f"Failed to generate template preview: {e}")
 
-            # Additional legacy security check for backward compatibility
-            is_safe, vulnerabilities = validate_template_security(content)
-            if not is_safe:
-                raise TemplateError(f"Template contains security vulnerabilities: {'; '.join(vulnerabilities)}")
+        return chunks()
 
-            # Render template with sample data using secure environment
-            from jinja2.sandbox import SandboxedEnvironment
-            from jinja2 import BaseLoader
+    def _prepare_preview(self, template_path: Path, sample_data: Optional[Dict]) -> Tuple[Any, Dict]:
+        """Validated, compiled template and the data to render it with"""
+        if not template_path.exists():
+            raise TemplateError(f"Template not found: {template_path}")
 
-            # Use SandboxedEnvironment with autoescape for maximum security
-            env = SandboxedEnvironment(autoescape=True, loader=BaseLoader())
-            template = env.from_string(content)
-            rendered = template.render(**sample_data)
+        # Check file size BEFORE reading to prevent DoS (BUG-008 fix)
+        file_size = template_path.stat().st_size
+        max_size = 1024 * 1024  # 1MB limit
+        if file_size > max_size:
+            raise TemplateError(f"Template file too large: {file_size} bytes (max: {max_size})")
 
-            return rendered
+        content = template_path.read_text(encoding='utf-8')
 
-        except Exception as e:
-            raise TemplateError(f"Failed to generate template preview: {e}")
+        # Provide sample data if not provided
+        if sample_data is None:
+            category = self._get_template_category(template_path)
+            sample_data = self._get_sample_data(category)
+
+        checksum = self._calculate_checksum(content)
+        self._check_template_security(content, template_path, checksum)
+
+        # Rendered in the shared SandboxedEnvironment (autoescape on)
+        return compile_template(content, checksum), sample_data
+
+    def _check_template_security(self, content: str, template_path: Path, checksum: str):
+        """Run the security scans once per distinct template content"""
+        if checksum in self._security_verdicts:
+            self._security_verdicts.move_to_end(checksum)
+        else:
+            verdict = None
+
+            # Validate template with advanced validator before rendering
+            validation_result = self.validator.validate_template(content, template_path)
+            if not validation_result.is_safe:
+                error_messages = [issue.message for issue in validation_result.critical_issues + validation_result.error_issues]
+                verdict = '; '.join(error_messages)
+            else:
+                # Additional legacy security check for backward compatibility
+                is_safe, vulnerabilities = validate_template_security(content)
+                if not is_safe:
+                    verdict = '; '.join(vulnerabilities)
+
+            self._security_verdicts[checksum] = verdict
+            while len(self._security_verdicts) > COMPILED_TEMPLATE_LIMIT:
+                self._security_verdicts.popitem(last=False)
+
+        verdict = self._security_verdicts[checksum]
+        if verdict is not None:
+            raise TemplateError(f"Template contains security vulnerabilities: {verdict}")
 
     def _get_sample_data(self, category: str) -> Dict:
         """Get sample data for template preview"""
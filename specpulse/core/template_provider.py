@@ -44,39 +44,24 @@ class TemplateProvider:
 
     def get_spec_template(self) -> str:
         """Get specification template from file (cached)"""
-        def loader():
-            return self._load_template_file(
-                "templates/spec.md",
-                self._get_embedded_spec_template()
-            )
-
-        if self.use_cache:
-            return self._cache.get("spec_template", loader)
-        return loader()
+        return self._load_template_file(
+            "templates/spec.md",
+            self._get_embedded_spec_template()
+        )
 
     def get_plan_template(self) -> str:
         """Get implementation plan template from file (cached)"""
-        def loader():
-            return self._load_template_file(
-                "templates/plan.md",
-                self._get_embedded_plan_template()
-            )
-
-        if self.use_cache:
-            return self._cache.get("plan_template", loader)
-        return loader()
+        return self._load_template_file(
+            "templates/plan.md",
+            self._get_embedded_plan_template()
+        )
 
     def get_task_template(self) -> str:
         """Get task list template from file (cached)"""
-        def loader():
-            return self._load_template_file(
-                "templates/task.md",
-                self._get_embedded_task_template()
-            )
-
-        if self.use_cache:
-            return self._cache.get("task_template", loader)
-        return loader()
+        return self._load_template_file(
+            "templates/task.md",
+            self._get_embedded_task_template()
+        )
 
     def get_template(self, template_name: str, variables: Optional[Dict] = None) -> str:
         """
@@ -96,7 +81,7 @@ class TemplateProvider:
             return ""
 
         try:
-            content = template_path.read_text(encoding='utf-8')
+            content = self._read_cached(template_path)
 
             # Variable substitution (Jinja2-style: {{ variable }})
             if variables:
@@ -130,7 +115,7 @@ class TemplateProvider:
 
         if template_path.exists():
             try:
-                return template_path.read_text(encoding='utf-8')
+                return self._read_cached(template_path)
             except Exception as e:
                 logger.error(f"Failed to load decomposition template: {e}")
 
@@ -177,6 +162,20 @@ class TemplateProvider:
 
     # Private helper methods
 
+    def _read_cached(self, template_path: Path) -> str:
+        """
+        Read a template file through the cache.
+
+        Entries are keyed by path and revalidated against the file's stat
+        signature, so edits are picked up on the next call.
+        """
+        def loader():
+            return template_path.read_text(encoding='utf-8')
+
+        if self.use_cache:
+            return self._cache.get(str(template_path), loader, source=template_path)
+        return loader()
+
     def _load_template_file(self, relative_path: str, fallback: str) -> str:
         """
         Load template file with fallback.
@@ -211,7 +210,7 @@ class TemplateProvider:
             return fallback
 
         try:
-            return template_path.read_text(encoding='utf-8')
+            return self._read_cached(template_path)
         except Exception as e:
             logger.error(f"Failed to read template file: {e}")
             return fallback
@@ -0,0 +1,205 @@
+"""
+Persistent Validation Result Cache
+
+This module caches the results of validating individual spec/plan files so
+that repeated runs of ``Validator.validate_all`` (e.g. from a pre-commit hook)
+only revalidate files that actually changed.
+
+Entries are keyed by:
+- SHA-256 of the file content
+- Validation rule-set version (see ``ValidationRulesRegistry.get_rules_version``)
+- Strictness level
+
+The cache lives in ``.specpulse/cache/validation_cache.json`` and is only
+persisted when the project already has a ``.specpulse`` directory.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout of the cache file changes
+CACHE_FORMAT_VERSION = 1
+
+
+class ValidationCache:
+    """
+    Content-hash keyed cache of per-file validation results.
+
+    The cache is loaded once, consulted/updated per file during a validation
+    run and written back with a single atomic write via ``save()``.
+
+    Example:
+        >>> cache = ValidationCache(project_root, "standard", rules_version)
+        >>> results = cache.get(spec_path, content)
+        >>> if results is None:
+        ...     results = run_rules(spec_path, content)
+        ...     cache.put(spec_path, content, results)
+        >>> cache.save()
+    """
+
+    CACHE_FILENAME = "validation_cache.json"
+
+    def __init__(self, project_root: Path, strictness: str, rules_version: str):
+        """
+        Initialize validation cache.
+
+        Args:
+            project_root: Root directory of the project being validated
+            strictness: Strictness level of the validation run
+            rules_version: Version/fingerprint of the active rule set
+        """
+        self.project_root = Path(project_root)
+        self.strictness = strictness
+        self.rules_version = rules_version
+        self.cache_dir = self.project_root / ".specpulse" / "cache"
+        self.cache_file = self.cache_dir / self.CACHE_FILENAME
+
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._hits = 0
+        self._misses = 0
+
+        self._load()
+
+    def _load(self) -> None:
+        """Load cached entries from disk, discarding incompatible files."""
+        if not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.debug(f"Ignoring unreadable validation cache: {e}")
+            return
+
+        if not isinstance(data, dict) or data.get("version") != CACHE_FORMAT_VERSION:
+            logger.debug("Ignoring validation cache with incompatible format")
+            return
+
+        entries = data.get("entries", {})
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    def _relative_key(self, file_path: Path) -> str:
+        """Get a stable, project-relative key for a file."""
+        try:
+            return Path(file_path).resolve().relative_to(self.project_root.resolve()).as_posix()
+        except ValueError:
+            return Path(file_path).resolve().as_posix()
+
+    def _entry_key(self, content: str) -> str:
+        """Compute cache key from content hash, rule-set version and strictness."""
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return f"{digest}:{self.rules_version}:{self.strictness}"
+
+    def get(self, file_path: Path, content: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get cached validation results for a file.
+
+        Args:
+            file_path: Path of the validated file
+            content: Current file content
+
+        Returns:
+            List of cached result dicts, or None on cache miss
+        """
+        entry = self._entries.get(self._relative_key(file_path))
+        if entry and entry.get("key") == self._entry_key(content):
+            self._hits += 1
+            return [dict(result) for result in entry.get("results", [])]
+
+        self._misses += 1
+        return None
+
+    def put(self, file_path: Path, content: str, results: List[Dict[str, Any]]) -> None:
+        """
+        Store validation results for a file.
+
+        Args:
+            file_path: Path of the validated file
+            content: File content the results were computed from
+            results: Result dicts produced for this file
+        """
+        self._entries[self._relative_key(file_path)] = {
+            "key": self._entry_key(content),
+            "results": [dict(result) for result in results],
+        }
+        self._dirty = True
+
+    def invalidate(self, file_path: Optional[Path] = None) -> None:
+        """
+        Invalidate a single file entry or the entire cache.
+
+        Args:
+            file_path: File to invalidate, or None to clear all entries
+        """
+        if file_path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(self._relative_key(file_path), None)
+        self._dirty = True
+
+    def save(self) -> bool:
+        """
+        Persist the cache atomically if it changed.
+
+        Returns:
+            True if the cache was written, False otherwise
+        """
+        if not self._dirty:
+            return False
+
+        # Never create .specpulse/ as a side effect of validating a directory
+        if not (self.project_root / ".specpulse").is_dir():
+            return False
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_fd, temp_path = tempfile.mkstemp(
+                dir=self.cache_dir,
+                prefix=f".{self.cache_file.stem}_tmp_",
+                suffix=self.cache_file.suffix
+            )
+            try:
+                with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+                    json.dump(
+                        {"version": CACHE_FORMAT_VERSION, "entries": self._entries},
+                        f, ensure_ascii=False
+                    )
+                os.replace(temp_path, self.cache_file)
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write validation cache: {e}")
+            return False
+
+        self._dirty = False
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics for the current run.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate (0-100%) and size
+        """
+        total = self._hits + self._misses
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': (self._hits / total * 100) if total > 0 else 0,
+            'size': len(self._entries),
+        }
+
+
+__all__ = ['ValidationCache', 'CACHE_FORMAT_VERSION']
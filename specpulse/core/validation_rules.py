@@ -3,12 +3,18 @@ SpecPulse Validation Rules - Comprehensive validation rules for SDD compliance
 """
 
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Set
+from typing import List, Dict, Tuple, Optional, Set, Iterator
 from enum import Enum
+import bisect
+import hashlib
 import re
 from dataclasses import dataclass
 
 
+# Bump whenever rule behaviour changes so cached validation results are discarded
+RULES_VERSION = "3"
+
+
 class ValidationSeverity(Enum):
     """Validation severity levels"""
     INFO = "info"
@@ -40,6 +46,171 @@ class ValidationResult:
     fix_action: Optional[str] = None
 
 
+# === PARSED DOCUMENT MODEL ===
+
+@dataclass(slots=True)
+class DocumentHeading:
+    """Markdown heading line"""
+    level: int
+    text: str
+    line: int
+    offset: int
+
+
+@dataclass(slots=True)
+class DocumentListItem:
+    """Markdown list item, optionally with a checkbox ([ ], [x], [>], [!])"""
+    bullet: str
+    checkbox: Optional[str]
+    text: str
+    line: int
+    offset: int
+
+
+@dataclass(slots=True)
+class DocumentMarker:
+    """Clarification marker occurrence ("needs clarification" in any case)"""
+    text: str
+    bracketed: bool
+    line: int
+    offset: int
+
+
+_HEADING_PATTERN = re.compile(r'^(#+)[^\n]*', re.MULTILINE)
+_LIST_ITEM_PATTERN = re.compile(
+    r'^[ \t]*([-*+]|\d+\.)[ \t]+(?:\[([^\]\n])\])?[^\n]*', re.MULTILINE
+)
+_MARKER_PATTERN = re.compile(r'needs clarification', re.IGNORECASE)
+
+
+class ParsedDocument:
+    """
+    Pre-parsed view of a markdown document shared by all validation rules.
+
+    Headings, list items/checkboxes and clarification markers (with line
+    numbers and character offsets) are each tokenized at most once per
+    document, on first use, and then served to every rule. Rules use cheap
+    lookups such as section spans instead of re-scanning the full text.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+        self._headings: Optional[List[DocumentHeading]] = None
+        self._list_items: Optional[List[DocumentListItem]] = None
+        self._markers: Optional[List[DocumentMarker]] = None
+        self._lines: Optional[List[str]] = None
+        self._boundaries: List[int] = []
+        self._item_offsets: List[int] = []
+
+    def _iter_tokens(self, pattern: re.Pattern, build, start: int = 0,
+                     end: Optional[int] = None) -> Iterator:
+        """Run pattern over content[start:end], tracking line numbers"""
+        content = self.content
+        count_newlines = content.count
+        end = len(content) if end is None else end
+        line = count_newlines('\n', 0, start)
+        last_pos = start
+
+        for match in pattern.finditer(content, start, end):
+            match_start = match.start()
+            line += count_newlines('\n', last_pos, match_start)
+            last_pos = match_start
+            yield build(match, line)
+
+    @property
+    def headings(self) -> List[DocumentHeading]:
+        """All heading lines in document order"""
+        if self._headings is None:
+            self._headings = list(self._iter_tokens(
+                _HEADING_PATTERN,
+                lambda m, line: DocumentHeading(len(m.group(1)), m.group(), line, m.start())
+            ))
+            # Lines starting with "##" end a section (same as the legacy "\n##" lookahead)
+            self._boundaries = [h.offset for h in self._headings if h.level >= 2]
+        return self._headings
+
+    @property
+    def list_items(self) -> List[DocumentListItem]:
+        """All list items in document order"""
+        if self._list_items is None:
+            self._list_items = list(self._iter_list_items())
+            self._item_offsets = [item.offset for item in self._list_items]
+        return self._list_items
+
+    @property
+    def markers(self) -> List[DocumentMarker]:
+        """All clarification markers in document order"""
+        if self._markers is None:
+            content = self.content
+
+            def build(match, line):
+                start, end = match.span()
+                bracketed = start > 0 and content[start - 1] == '[' and content[end:end + 1] == ']'
+                return DocumentMarker(match.group(), bracketed, line, start)
+
+            self._markers = list(self._iter_tokens(_MARKER_PATTERN, build))
+        return self._markers
+
+    @property
+    def lines(self) -> List[str]:
+        """Document lines"""
+        if self._lines is None:
+            self._lines = self.content.split('\n')
+        return self._lines
+
+    def _iter_list_items(self, start: int = 0, end: Optional[int] = None) -> Iterator[DocumentListItem]:
+        def build(match, line):
+            checkbox = match.group(2)
+            return DocumentListItem(
+                match.group(1), checkbox.lower() if checkbox else None,
+                match.group(), line, match.start()
+            )
+
+        return self._iter_tokens(_LIST_ITEM_PATTERN, build, start, end)
+
+    def section_end(self, start: int) -> int:
+        """End offset of the section containing start (before the next '##' line)"""
+        self.headings
+        index = bisect.bisect_right(self._boundaries, start)
+        if index < len(self._boundaries):
+            return self._boundaries[index] - 1
+        return len(self.content)
+
+    def find_sections(self, title: str) -> List[Tuple[int, int]]:
+        """
+        Find (start, end) spans of sections whose heading contains title.
+
+        Matching is case-insensitive on heading lines; the span starts at the
+        title and runs up to the next line beginning with '##'.
+        """
+        needle = title.lower()
+        spans = []
+        next_free = 0
+
+        for heading in self.headings:
+            if heading.offset < next_free:
+                continue
+            index = heading.text.lower().find(needle)
+            if index == -1:
+                continue
+            start = heading.offset + index
+            end = self.section_end(start)
+            spans.append((start, end))
+            next_free = end
+
+        return spans
+
+    def iter_list_items(self, start: int, end: int) -> Iterator[DocumentListItem]:
+        """Iterate list items whose line starts inside [start, end)"""
+        if self._list_items is None:
+            # Only this span is needed; avoid tokenizing the whole document
+            return self._iter_list_items(start, end)
+
+        first = bisect.bisect_left(self._item_offsets, start)
+        last = bisect.bisect_left(self._item_offsets, end)
+        return iter(self._list_items[first:last])
+
+
 class ValidationRule:
     """Base class for validation rules"""
 
@@ -51,8 +222,14 @@ class ValidationRule:
         self.category = category
         self.auto_fixable = auto_fixable
 
-    def validate(self, content: str, file_path: Path) -> List[ValidationResult]:
-        """Validate content against this rule"""
+    def validate(self, content: str, file_path: Path,
+                 document: Optional[ParsedDocument] = None) -> List[ValidationResult]:
+        """
+        Validate content against this rule.
+
+        document is the shared pre-parsed model of content; rules build
+        their own when called directly without one.
+        """
         raise NotImplementedError
 
     def fix(self, content: str, file_path: Path) -> Tuple[str, bool]:
@@ -120,7 +297,8 @@ class RequiredSectionsRule(SpecValidationRule):
             ]
         }
 
-    def validate(self, content: str, file_path: Path) -> List[ValidationResult]:
+    def validate(self, content: str, file_path: Path,
+                 document: Optional[ParsedDocument] = None) -> List[ValidationResult]:
         results = []
         file_type = self._detect_file_type(file_path)
 
@@ -189,33 +367,35 @@ class ClarificationMarkerRule(SpecValidationRule):
             auto_fixable=True
         )
 
-    def validate(self, content: str, file_path: Path) -> List[ValidationResult]:
+    def validate(self, content: str, file_path: Path,
+                 document: Optional[ParsedDocument] = None) -> List[ValidationResult]:
         results = []
-
-        # Check for various clarification marker formats
-        invalid_formats = [
-            (r'\[needs clarification\]', '[NEEDS CLARIFICATION]'),
-            (r'\[Needs Clarification\]', '[NEEDS CLARIFICATION]'),
-            (r'needs clarification', '[NEEDS CLARIFICATION]'),
-            (r'Needs Clarification', '[NEEDS CLARIFICATION]')
-        ]
-
-        for pattern, correct_format in invalid_formats:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                results.append(ValidationResult(
-                    status="invalid_clarification_format",
-                    message=f"Invalid clarification format at position {match.start()}: {match.group()}",
-                    severity=self.severity,
-                    category=ValidationCategory.FORMATTING,
-                    suggestion=f"Use format: {correct_format}",
-                    location=f"{file_path}:{match.start()}",
-                    auto_fixable=self.auto_fixable,
-                    fix_action="fix_clarification_format"
-                ))
+        document = document or ParsedDocument(content)
+
+        # Each marker not written exactly as [NEEDS CLARIFICATION] is reported
+        # once, at the position of its opening bracket if it has one
+        for marker in document.markers:
+            if marker.bracketed and marker.text == "NEEDS CLARIFICATION":
+                continue
+            if marker.bracketed:
+                position, text = marker.offset - 1, f"[{marker.text}]"
+            else:
+                position, text = marker.offset, marker.text
+            results.append(ValidationResult(
+                status="invalid_clarification_format",
+                message=f"Invalid clarification format at position {position}: {text}",
+                severity=self.severity,
+                category=ValidationCategory.FORMATTING,
+                suggestion="Use format: [NEEDS CLARIFICATION]",
+                location=f"{file_path}:{position}",
+                auto_fixable=self.auto_fixable,
+                fix_action="fix_clarification_format"
+            ))
 
         # Count total clarifications needed
-        total_clarifications = len(re.findall(r'\[NEEDS CLARIFICATION\]', content))
+        total_clarifications = sum(
+            1 for m in document.markers if m.bracketed and m.text == "NEEDS CLARIFICATION"
+        )
         if total_clarifications > 0:
             results.append(ValidationResult(
                 status="clarifications_needed",
@@ -251,13 +431,16 @@ class UserStoryFormatRule(SpecValidationRule):
             auto_fixable=False
         )
 
-    def validate(self, content: str, file_path: Path) -> List[ValidationResult]:
+    def validate(self, content: str, file_path: Path,
+                 document: Optional[ParsedDocument] = None) -> List[ValidationResult]:
         results = []
+        document = document or ParsedDocument(content)
 
         # Look for user story sections
-        user_story_section = re.search(r'## User Stories.*?(?=\n##|\Z)', content, re.DOTALL | re.IGNORECASE)
-        if user_story_section:
-            stories = re.findall(r'### .*?\n\n.*?(?=###|\n##|\Z)', user_story_section.group(), re.DOTALL)
+        user_story_sections = document.find_sections("## User Stories")
+        if user_story_sections:
+            start, end = user_story_sections[0]
+            stories = re.findall(r'### .*?\n\n.*?(?=###|\n##|\Z)', content[start:end], re.DOTALL)
 
             for story in stories:
                 # Check if story has required components
@@ -289,6 +472,12 @@ class UserStoryFormatRule(SpecValidationRule):
         return results
 
 
+_VAGUE_CRITERIA_PATTERN = re.compile(
+    r'(should work)|(must be good)|(needs to be proper)|(should be correct)|(must be appropriate)',
+    re.IGNORECASE
+)
+
+
 class AcceptanceCriteriaRule(SpecValidationRule):
     """Validate acceptance criteria are testable and specific"""
 
@@ -300,39 +489,34 @@ class AcceptanceCriteriaRule(SpecValidationRule):
             auto_fixable=False
         )
 
-    def validate(self, content: str, file_path: Path) -> List[ValidationResult]:
+    def validate(self, content: str, file_path: Path,
+                 document: Optional[ParsedDocument] = None) -> List[ValidationResult]:
         results = []
+        document = document or ParsedDocument(content)
 
         # Find acceptance criteria sections
-        ac_sections = re.finditer(r'## Acceptance Criteria.*?(?=\n##|\Z)', content, re.DOTALL | re.IGNORECASE)
-
-        for ac_match in ac_sections:
-            ac_content = ac_match.group()
-
-            # Check for vague criteria
-            vague_patterns = [
-                r'should work',
-                r'must be good',
-                r'needs to be proper',
-                r'should be correct',
-                r'must be appropriate'
-            ]
-
-            for pattern in vague_patterns:
-                matches = re.finditer(pattern, ac_content, re.IGNORECASE)
-                for match in matches:
+        for start, end in document.find_sections("## Acceptance Criteria"):
+            # Check for vague criteria (one scan, reported per pattern)
+            vague_matches: Dict[int, List[re.Match]] = {}
+            for match in _VAGUE_CRITERIA_PATTERN.finditer(content, start, end):
+                vague_matches.setdefault(match.lastindex, []).append(match)
+
+            for group in sorted(vague_matches):
+                for match in vague_matches[group]:
                     results.append(ValidationResult(
                         status="vague_acceptance_criteria",
                         message=f"Vague acceptance criteria: {match.group()}",
                         severity=self.severity,
                         category=ValidationCategory.CONTENT,
                         suggestion="Make criteria specific and measurable",
-                        location=f"{file_path}:Acceptance Criteria:{match.start()}"
+                        location=f"{file_path}:Acceptance Criteria:{match.start() - start}"
                     ))
 
             # Check for testability indicators
-            has_checkboxes = bool(re.search(r'- \[ \]', ac_content))
-            has_measurable = bool(re.search(r'\\d+|can|will|should|must', ac_content, re.IGNORECASE))
+            has_checkboxes = any(
+                item.bullet == '-' and item.checkbox == ' '
+                for item in document.iter_list_items(start, end)
+            )
 
             if not has_checkboxes:
                 results.append(ValidationResult(
@@ -360,7 +544,8 @@ class PhaseGateRule(PlanValidationRule):
             auto_fixable=True
         )
 
-    def validate(self, content: str, file_path: Path) -> List[ValidationResult]:
+    def validate(self, content: str, file_path: Path,
+                 document: Optional[ParsedDocument] = None) -> List[ValidationResult]:
         results = []
 
         # Check for phase gates section
@@ -425,6 +610,9 @@ class PhaseGateRule(PlanValidationRule):
 
 # === TASK VALIDATION RULES ===
 
+_TASK_HEADER_PATTERN = re.compile(r'### (T\d{3}):')
+
+
 class TaskFormatRule(TaskValidationRule):
     """Validate tasks follow proper numbering and status format"""
 
@@ -436,20 +624,23 @@ class TaskFormatRule(TaskValidationRule):
             auto_fixable=True
         )
 
-    def validate(self, content: str, file_path: Path) -> List[ValidationResult]:
+    def validate(self, content: str, file_path: Path,
+                 document: Optional[ParsedDocument] = None) -> List[ValidationResult]:
         results = []
+        document = document or ParsedDocument(content)
+        task_headings = [h for h in document.headings if h.text.startswith('### ')]
 
         # Check for task headers
-        task_headers = re.finditer(r'^### (T\d{3}):', content, re.MULTILINE)
+        for heading in task_headings:
+            match = _TASK_HEADER_PATTERN.match(heading.text)
+            if not match:
+                continue
 
-        for match in task_headers:
             task_id = match.group(1)
-            start_pos = match.start()
-            lines_before = content[:start_pos].count('\n')
+            lines_before = heading.line
 
-            # Look for status in next few lines
-            remaining_content = content[match.end():]
-            next_lines = remaining_content.split('\n')[:5]
+            # Look for status in next few lines (rest of header line + 4 lines)
+            next_lines = [heading.text[match.end():]] + document.lines[heading.line + 1:heading.line + 5]
 
             has_status = any('**Status**:' in line for line in next_lines)
 
@@ -466,12 +657,13 @@ class TaskFormatRule(TaskValidationRule):
                 ))
 
         # Check for tasks without proper numbering
-        invalid_tasks = re.finditer(r'^### (?!T\d{3}:).*', content, re.MULTILINE)
-        for match in invalid_tasks:
-            line_num = content[:match.start()].count('\n') + 1
+        for heading in task_headings:
+            if _TASK_HEADER_PATTERN.match(heading.text):
+                continue
+            line_num = heading.line + 1
             results.append(ValidationResult(
                 status="invalid_task_format",
-                message=f"Invalid task format: {match.group()}",
+                message=f"Invalid task format: {heading.text}",
                 severity=self.severity,
                 category=ValidationCategory.FORMATTING,
                 suggestion="Use format: ### T001: Task Name",
@@ -513,15 +705,19 @@ class TaskDependencyRule(TaskValidationRule):
             auto_fixable=False
         )
 
-    def validate(self, content: str, file_path: Path) -> List[ValidationResult]:
+    def validate(self, content: str, file_path: Path,
+                 document: Optional[ParsedDocument] = None) -> List[ValidationResult]:
         results = []
+        document = document or ParsedDocument(content)
 
         # Find all tasks
-        tasks = re.finditer(r'^### (T\d{3}):.*?(?=\n### T\d{3}:|\n##|\Z)', content, re.DOTALL | re.MULTILINE)
+        for heading in document.headings:
+            task_match = _TASK_HEADER_PATTERN.match(heading.text)
+            if not task_match:
+                continue
 
-        for task_match in tasks:
             task_id = task_match.group(1)
-            task_content = task_match.group()
+            task_content = content[heading.offset:document.section_end(heading.offset)]
 
             # Check for dependency specification
             has_dependencies = bool(re.search(r'dependencies?', task_content, re.IGNORECASE))
@@ -572,6 +768,17 @@ class ValidationRulesRegistry:
         else:
             return self.spec_rules  # Default to spec rules
 
+    def get_rules_version(self) -> str:
+        """Get a fingerprint of the active rule set (used for result caching)"""
+        rule_names = [
+            f"{group}:{type(rule).__name__}:{rule.severity.value}"
+            for group, rules in (("spec", self.spec_rules), ("plan", self.plan_rules),
+                                 ("task", self.task_rules))
+            for rule in rules
+        ]
+        fingerprint = hashlib.sha256("|".join(rule_names).encode('utf-8')).hexdigest()[:12]
+        return f"{RULES_VERSION}-{fingerprint}"
+
     def validate_file(self, file_path: Path, content: str = None) -> List[ValidationResult]:
         """Validate a file with all applicable rules"""
         if content is None:
@@ -587,9 +794,12 @@ class ValidationRulesRegistry:
         results = []
         rules = self.get_rules_for_file(file_path)
 
+        # Tokenize once; every rule works off the shared document model
+        document = ParsedDocument(content)
+
         for rule in rules:
             try:
-                rule_results = rule.validate(content, file_path)
+                rule_results = rule.validate(content, file_path, document)
                 results.extend(rule_results)
             except Exception as e:
                 results.append(ValidationResult(
@@ -6,7 +6,7 @@ for different aspects of the project (specs, plans, SDD compliance).
 """
 
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Callable
 from dataclasses import dataclass
 import yaml
 import re
@@ -18,9 +18,10 @@ from rich.syntax import Syntax
 from ..utils.backup_manager import BackupManager
 from ..utils.progress_calculator import SectionStatus, ProgressCalculator
 from .validation_rules import (
-    validation_rules_registry, ValidationResult, ValidationSeverity,
-    ValidationCategory
+    validation_rules_registry, ValidationRulesRegistry, ValidationResult,
+    ValidationSeverity, ValidationCategory
 )
+from .validation_cache import ValidationCache
 
 # Import specialized validators (v2.2.5+)
 from .validators.spec_validator import SpecValidator
@@ -98,6 +99,166 @@ class ValidationProgress:
         return "\n".join(status_lines)
 
 
+# === PER-FILE VALIDATION ===
+# Side-effect free collectors: each returns its own list of legacy result dicts
+# so files can be validated concurrently (including in a process pool) and
+# merged deterministically by the caller.
+
+def convert_validation_result(result: ValidationResult, context: str) -> Dict:
+    """Convert ValidationResult to legacy format"""
+    severity_map = {
+        ValidationSeverity.INFO: "info",
+        ValidationSeverity.WARNING: "warning",
+        ValidationSeverity.ERROR: "error",
+        ValidationSeverity.CRITICAL: "error"
+    }
+
+    status = severity_map.get(result.severity, "warning")
+    message = result.message
+
+    if result.suggestion:
+        message += f" (Suggestion: {result.suggestion})"
+
+    return {
+        "status": status,
+        "message": f"{context}: {message}",
+        "severity": result.severity.value,
+        "category": result.category.value,
+        "auto_fixable": result.auto_fixable,
+        "location": result.location
+    }
+
+
+def _apply_rules(file_path: Path, content: str, fix: bool,
+                 registry: Optional[ValidationRulesRegistry]) -> List[ValidationResult]:
+    """Run validation rules (and auto-fixes if requested) over a file's content"""
+    registry = registry or validation_rules_registry
+
+    validation_results = registry.validate_file(file_path, content)
+
+    # Auto-fix if requested and possible
+    if fix:
+        fixed_content, fix_results = registry.fix_file(file_path, content)
+        if fixed_content != content:
+            file_path.write_text(fixed_content, encoding='utf-8')
+            validation_results.extend(fix_results)
+
+    return validation_results
+
+
+def _has_errors(validation_results: List[ValidationResult]) -> bool:
+    return any(r.severity in [ValidationSeverity.ERROR, ValidationSeverity.CRITICAL]
+               for r in validation_results)
+
+
+def collect_spec_results(spec_path: Path, content: str, fix: bool = False,
+                         registry: Optional[ValidationRulesRegistry] = None) -> List[Dict]:
+    """Validate a single specification and return its results"""
+    spec_name = spec_path.parent.name
+    results = []
+
+    try:
+        validation_results = _apply_rules(spec_path, content, fix, registry)
+
+        # Convert validation results to legacy format
+        for result in validation_results:
+            results.append(convert_validation_result(result, spec_name))
+
+        # If no errors, add success message
+        if not _has_errors(validation_results):
+            results.append({
+                "status": "success",
+                "message": f"{spec_name}: Validation passed"
+            })
+
+    except Exception as e:
+        results.append({
+            "status": "error",
+            "message": f"{spec_name}: Failed to validate - {str(e)}"
+        })
+
+    return results
+
+
+def collect_plan_results(plan_path: Path, content: str, fix: bool = False,
+                         registry: Optional[ValidationRulesRegistry] = None) -> List[Dict]:
+    """Validate a single implementation plan and return its results"""
+    plan_name = plan_path.parent.name
+    results = []
+
+    try:
+        validation_results = _apply_rules(plan_path, content, fix, registry)
+
+        # Convert validation results to legacy format
+        for result in validation_results:
+            results.append(convert_validation_result(result, plan_name))
+
+        # Additional plan-specific validations
+        if "Spec ID" not in content and "Specification Reference" not in content:
+            results.append({
+                "status": "warning",
+                "message": f"{plan_name}: No specification reference found"
+            })
+
+        # Check for implementation phases
+        if "Implementation Phases" not in content:
+            results.append({
+                "status": "warning",
+                "message": f"{plan_name}: No implementation phases defined"
+            })
+
+        # If no errors, add success message
+        if not _has_errors(validation_results):
+            results.append({
+                "status": "success",
+                "message": f"{plan_name}: Validation passed"
+            })
+
+    except Exception as e:
+        results.append({
+            "status": "error",
+            "message": f"{plan_name}: Failed to validate - {str(e)}"
+        })
+
+    return results
+
+
+def collect_task_results(task_path: Path, content: str, fix: bool = False,
+                         registry: Optional[ValidationRulesRegistry] = None) -> List[Dict]:
+    """Validate a single task breakdown and return its results"""
+    task_name = f"{task_path.parent.name}/{task_path.name}"
+    results = []
+
+    try:
+        validation_results = _apply_rules(task_path, content, fix, registry)
+
+        for result in validation_results:
+            results.append(convert_validation_result(result, task_name))
+
+        if not _has_errors(validation_results):
+            results.append({
+                "status": "success",
+                "message": f"{task_name}: Validation passed"
+            })
+
+    except Exception as e:
+        results.append({
+            "status": "error",
+            "message": f"{task_name}: Failed to validate - {str(e)}"
+        })
+
+    return results
+
+
+def _collect_feature_files(base_dir: Path, pattern: str) -> List[Path]:
+    """Collect matching files from each feature directory, in deterministic order"""
+    return sorted(
+        file_path
+        for feature_dir in base_dir.iterdir() if feature_dir.is_dir()
+        for file_path in feature_dir.glob(pattern) if file_path.is_file()
+    )
+
+
 class Validator:
     """Validates SpecPulse project components with enhanced rules"""
 
@@ -110,6 +271,10 @@ class Validator:
         self.phase_gates = []
         self.rules_registry = validation_rules_registry
 
+        # Per-run validation result cache (only active inside validate_all)
+        self._cache: Optional[ValidationCache] = None
+        self.cache_stats: Optional[Dict] = None
+
         # Initialize specialized validators (v2.2.5+)
         self.spec_validator = SpecValidator(project_root)
         self.plan_validator = PlanValidator(project_root)
@@ -119,28 +284,63 @@ class Validator:
             self._load_constitution(project_root)
     
     def validate_all(self, project_path: Path, fix: bool = False, verbose: bool = False,
-                   strictness: str = "standard") -> List[Dict]:
-        """Validate entire project with progressive strictness levels"""
+                   strictness: str = "standard", use_cache: bool = True,
+                   component: str = "all") -> List[Dict]:
+        """
+        Validate entire project with progressive strictness levels.
+
+        Unchanged spec/plan files are served from the persistent validation
+        cache in .specpulse/cache/ unless use_cache is False or fix is requested.
+        With component "spec" or "plan" only that kind of file is validated.
+        """
         self.results = []
+        self.cache_stats = None
+        if use_cache and not fix:
+            self._cache = ValidationCache(
+                project_path, strictness, self.rules_registry.get_rules_version()
+            )
+        else:
+            self._cache = None
 
         # Check project structure
         self._validate_structure(project_path)
 
-        # Validate based on strictness level
-        if strictness == "basic":
-            self._validate_basic(project_path, fix, verbose)
-        elif strictness == "standard":
-            self._validate_standard(project_path, fix, verbose)
-        elif strictness == "comprehensive":
-            self._validate_comprehensive(project_path, fix, verbose)
-        elif strictness == "strict":
-            self._validate_strict(project_path, fix, verbose)
+        if component in ("spec", "plan"):
+            # Same severities as the strictness level applies to all files
+            severity_filter = {"basic": "error", "comprehensive": "all",
+                               "strict": "all"}.get(strictness)
+            if component == "spec":
+                self._validate_specs(project_path, fix, verbose, severity_filter)
+            else:
+                self._validate_plans(project_path, fix, verbose, severity_filter)
         else:
-            # Default to standard
-            self._validate_standard(project_path, fix, verbose)
+            # Validate based on strictness level
+            if strictness == "basic":
+                self._validate_basic(project_path, fix, verbose)
+            elif strictness == "standard":
+                self._validate_standard(project_path, fix, verbose)
+            elif strictness == "comprehensive":
+                self._validate_comprehensive(project_path, fix, verbose)
+            elif strictness == "strict":
+                self._validate_strict(project_path, fix, verbose)
+            else:
+                # Default to standard
+                self._validate_standard(project_path, fix, verbose)
 
-        # Validate SDD principles compliance
-        self._validate_sdd_compliance(project_path, verbose)
+            # Validate SDD principles compliance
+            self._validate_sdd_compliance(project_path, verbose)
+
+        if self._cache is not None:
+            self._cache.save()
+            self.cache_stats = self._cache.get_stats()
+            self._cache = None
+            self.results.append({
+                "status": "info",
+                "message": (f"Validation cache: {self.cache_stats['hits']} hits, "
+                            f"{self.cache_stats['misses']} misses"),
+                "cache_hits": self.cache_stats['hits'],
+                "cache_misses": self.cache_stats['misses']
+            })
 
         return self.results
 
@@ -148,11 +348,13 @@ class Validator:
         """Basic validation - check only critical errors"""
         self._validate_specs(project_path, fix, verbose, severity_filter="error")
         self._validate_plans(project_path, fix, verbose, severity_filter="error")
+        self._validate_tasks(project_path, fix, verbose, severity_filter="error")
 
     def _validate_standard(self, project_path: Path, fix: bool, verbose: bool):
         """Standard validation - check errors and warnings"""
         self._validate_specs(project_path, fix, verbose)
         self._validate_plans(project_path, fix, verbose)
+        self._validate_tasks(project_path, fix, verbose)
 
     def _validate_comprehensive(self, project_path: Path, fix: bool, verbose: bool):
         """Comprehensive validation - check all issues including info"""
@@ -276,152 +478,155 @@ class Validator:
     
     def _validate_single_spec(self, spec_path: Path, fix: bool, verbose: bool):
         """Validate a single specification with enhanced rules"""
-        spec_name = spec_path.parent.name
-
-        try:
-            # Read content
-            content = spec_path.read_text(encoding='utf-8')
-
-            # Apply validation rules
-            validation_results = self.rules_registry.validate_file(spec_path, content)
-
-            # Auto-fix if requested and possible
-            if fix:
-                fixed_content, fix_results = self.rules_registry.fix_file(spec_path, content)
-                if fixed_content != content:
-                    spec_path.write_text(fixed_content, encoding='utf-8')
-                    validation_results.extend(fix_results)
-
-            # Convert validation results to legacy format
-            for result in validation_results:
-                legacy_result = self._convert_validation_result(result, spec_name)
-                self.results.append(legacy_result)
-
-            # If no errors, add success message
-            errors = [r for r in validation_results if r.severity in [ValidationSeverity.ERROR, ValidationSeverity.CRITICAL]]
-            if not errors:
-                self.results.append({
-                    "status": "success",
-                    "message": f"{spec_name}: Validation passed"
-                })
-
-        except Exception as e:
-            self.results.append({
-                "status": "error",
-                "message": f"{spec_name}: Failed to validate - {str(e)}"
-            })
+        self._validate_files([spec_path], collect_spec_results, fix)
 
     def _convert_validation_result(self, result: ValidationResult, context: str) -> Dict:
         """Convert ValidationResult to legacy format"""
-        severity_map = {
-            ValidationSeverity.INFO: "info",
-            ValidationSeverity.WARNING: "warning",
-            ValidationSeverity.ERROR: "error",
-            ValidationSeverity.CRITICAL: "error"
-        }
+        return convert_validation_result(result, context)
 
-        status = severity_map.get(result.severity, "warning")
-        message = result.message
-
-        if result.suggestion:
-            message += f" (Suggestion: {result.suggestion})"
-
-        return {
-            "status": status,
-            "message": f"{context}: {message}",
-            "severity": result.severity.value,
-            "category": result.category.value,
-            "auto_fixable": result.auto_fixable,
-            "location": result.location
-        }
-    
     def _validate_single_plan(self, plan_path: Path, fix: bool, verbose: bool):
         """Validate a single implementation plan with enhanced rules"""
-        plan_name = plan_path.parent.name
+        self._validate_files([plan_path], collect_plan_results, fix)
 
-        try:
-            # Read content
-            content = plan_path.read_text(encoding='utf-8')
-
-            # Apply validation rules
-            validation_results = self.rules_registry.validate_file(plan_path, content)
-
-            # Auto-fix if requested and possible
-            if fix:
-                fixed_content, fix_results = self.rules_registry.fix_file(plan_path, content)
-                if fixed_content != content:
-                    plan_path.write_text(fixed_content, encoding='utf-8')
-                    validation_results.extend(fix_results)
-
-            # Convert validation results to legacy format
-            for result in validation_results:
-                legacy_result = self._convert_validation_result(result, plan_name)
-                self.results.append(legacy_result)
-
-            # Additional plan-specific validations
-            if "Spec ID" not in content and "Specification Reference" not in content:
-                self.results.append({
-                    "status": "warning",
-                    "message": f"{plan_name}: No specification reference found"
-                })
+    def _validate_single_task(self, task_path: Path, fix: bool, verbose: bool):
+        """Validate a single task breakdown with enhanced rules"""
+        self._validate_files([task_path], collect_task_results, fix)
 
-            # Check for implementation phases
-            if "Implementation Phases" not in content:
-                self.results.append({
-                    "status": "warning",
-                    "message": f"{plan_name}: No implementation phases defined"
-                })
+    def _validate_files(self, file_paths: List[Path], collector: Callable, fix: bool,
+                        severity_filter: Optional[str] = None):
+        """
+        Validate files with a per-file collector and append results in path order.
 
-            # If no errors, add success message
-            errors = [r for r in validation_results if r.severity in [ValidationSeverity.ERROR, ValidationSeverity.CRITICAL]]
-            if not errors:
-                self.results.append({
-                    "status": "success",
-                    "message": f"{plan_name}: Validation passed"
-                })
+        Unchanged files are served from the validation cache; the remaining
+        files are handed to _run_file_jobs, which subclasses may parallelize.
+        The cache holds unfiltered results; severity_filter is applied when
+        they are appended.
+        """
+        file_results: List[Optional[List[Dict]]] = []
+        jobs: List[Tuple[int, Path, str]] = []
 
-        except Exception as e:
-            self.results.append({
-                "status": "error",
-                "message": f"{plan_name}: Failed to validate - {str(e)}"
-            })
-    
-    def _validate_specs(self, project_path: Path, fix: bool, verbose: bool):
+        for file_path in file_paths:
+            try:
+                content = self._read_file(file_path)
+            except Exception as e:
+                file_results.append([{
+                    "status": "error",
+                    "message": f"{file_path.parent.name}: Failed to validate - {str(e)}"
+                }])
+                continue
+
+            cached_results = self._cache.get(file_path, content) if self._cache else None
+            file_results.append(cached_results)
+            if cached_results is None:
+                jobs.append((len(file_results) - 1, file_path, content))
+
+        computed = self._run_file_jobs(collector, [(path, content) for _, path, content in jobs], fix)
+
+        for (slot, file_path, content), results in zip(jobs, computed):
+            file_results[slot] = results
+            if self._cache is not None:
+                self._cache.put(file_path, content, results)
+
+        for results in file_results:
+            self._add_results(results, severity_filter)
+
+    def _add_results(self, results: List[Dict], severity_filter: Optional[str] = None):
+        """
+        Append results that pass the severity filter
+
+        "error" keeps errors and success messages only; None or "all" keeps
+        everything.
+        """
+        if severity_filter == "error":
+            results = [r for r in results if r.get("status") in ("error", "success")]
+        self.results.extend(results)
+
+    def _run_file_jobs(self, collector: Callable, jobs: List[Tuple[Path, str]],
+                       fix: bool) -> List[List[Dict]]:
+        """Run per-file collectors sequentially, one result list per job"""
+        return [collector(path, content, fix, self.rules_registry) for path, content in jobs]
+
+    def _read_file(self, file_path: Path) -> str:
+        """Read a file to validate"""
+        return file_path.read_text(encoding='utf-8')
+
+    def _validate_specs(self, project_path: Path, fix: bool, verbose: bool,
+                        severity_filter: Optional[str] = None):
         """Validate all specifications"""
         specs_dir = project_path / "specs"
         if specs_dir.exists():
-            spec_count = 0
-            for spec_dir in specs_dir.iterdir():
-                if spec_dir.is_dir():
-                    spec_path = spec_dir / "spec.md"
-                    if spec_path.exists():
-                        spec_count += 1
-                        self._validate_single_spec(spec_path, fix, verbose)
-            
-            if spec_count == 0:
-                self.results.append({
+            spec_paths = _collect_feature_files(specs_dir, "spec.md")
+            self._validate_files(spec_paths, collect_spec_results, fix, severity_filter)
+
+            if not spec_paths:
+                self._add_results([{
                     "status": "warning",
                     "message": "No specifications found"
-                })
-    
-    def _validate_plans(self, project_path: Path, fix: bool, verbose: bool):
+                }], severity_filter)
+
+    def _validate_plans(self, project_path: Path, fix: bool, verbose: bool,
+                        severity_filter: Optional[str] = None):
         """Validate all implementation plans"""
         plans_dir = project_path / "plans"
         if plans_dir.exists():
-            plan_count = 0
-            for plan_dir in plans_dir.iterdir():
-                if plan_dir.is_dir():
-                    plan_path = plan_dir / "plan.md"
-                    if plan_path.exists():
-                        plan_count += 1
-                        self._validate_single_plan(plan_path, fix, verbose)
-            
-            if plan_count == 0:
-                self.results.append({
+            plan_paths = _collect_feature_files(plans_dir, "plan.md")
+            self._validate_files(plan_paths, collect_plan_results, fix, severity_filter)
+
+            if not plan_paths:
+                self._add_results([{
                     "status": "info",
                     "message": "No implementation plans found"
-                })
-    
+                }], severity_filter)
+
+    def _validate_tasks(self, project_path: Path, fix: bool, verbose: bool,
+                        severity_filter: Optional[str] = None):
+        """Validate all task breakdowns"""
+        tasks_dir = project_path / "tasks"
+        if tasks_dir.exists():
+            task_paths = _collect_feature_files(tasks_dir, "*task*.md")
+            self._validate_files(task_paths, collect_task_results, fix, severity_filter)
+
+            if not task_paths:
+                self._add_results([{
+                    "status": "info",
+                    "message": "No task breakdowns found"
+                }], severity_filter)
+
+    def _validate_cross_references(self, project_path: Path, verbose: bool):
+        """Check that every plan and task directory belongs to a specified feature"""
+        specs_dir = project_path / "specs"
+        spec_features = {d.name for d in specs_dir.iterdir() if d.is_dir()} if specs_dir.exists() else set()
+
+        for kind in ("plans", "tasks"):
+            kind_dir = project_path / kind
+            if not kind_dir.exists():
+                continue
+            for feature_dir in sorted(d for d in kind_dir.iterdir() if d.is_dir()):
+                if feature_dir.name not in spec_features:
+                    self.results.append({
+                        "status": "warning",
+                        "message": f"{feature_dir.name}: {kind} exist without a specification"
+                    })
+                elif verbose:
+                    self.results.append({
+                        "status": "success",
+                        "message": f"{feature_dir.name}: {kind} reference an existing specification"
+                    })
+
+    def _validate_naming_conventions(self, project_path: Path, verbose: bool):
+        """Check that feature directories are named NNN-feature-name"""
+        for kind in ("specs", "plans", "tasks"):
+            kind_dir = project_path / kind
+            if not kind_dir.exists():
+                continue
+            for feature_dir in sorted(d for d in kind_dir.iterdir() if d.is_dir()):
+                if not re.match(r'^\d{3}-[a-z0-9]+(?:-[a-z0-9]+)*$', feature_dir.name):
+                    self.results.append({
+                        "status": "warning",
+                        "message": f"{kind}/{feature_dir.name}: Feature directories should be named "
+                                   f"like 001-feature-name"
+                    })
+
     def _validate_sdd_compliance(self, project_path: Path, verbose: bool):
         """Validate compliance with SDD principles"""
         constitution_path = project_path / "memory" / "constitution.md"
@@ -8,7 +8,6 @@ including structure, content, and SDD compliance checks.
 from pathlib import Path
 from typing import List, Dict, Optional
 from dataclasses import dataclass
-import yaml
 import re
 
 from ..validation_rules import (
@@ -0,0 +1,314 @@
+"""
+History Log Module for Task Monitor
+
+This module provides an append-only JSON Lines log for task state history.
+Each state transition is a single appended line; a per-feature byte offset
+index makes reading the last k entries of a feature O(k), and retention is
+enforced by periodic compaction instead of on every write. Entries recorded
+without a feature are indexed by the prefix of their task ID so they can be
+matched to a feature without scanning them all.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterator, Tuple
+from datetime import datetime, timedelta
+
+
+# Entries recorded without a feature are indexed under this key
+UNATTRIBUTED_FEATURE = ""
+
+
+def task_prefix(task_id: str) -> str:
+    """Leading segment of a task ID (``001`` for ``001-T1``)."""
+    return task_id.split("-")[0]
+
+
+class HistoryLog:
+    """Append-only task history log with a persisted per-feature offset index.
+
+    The index stores the log size it covers, so entries appended by other
+    processes are picked up by scanning only the unindexed tail. Compaction
+    rewrites the log atomically and is detected through the log's inode.
+    Callers are responsible for serializing access (StateStorage holds the
+    history file lock around every call).
+    """
+
+    INDEX_VERSION = 2
+    # Persist the index after appending once this many entries are unindexed on disk
+    INDEX_FLUSH_ENTRIES = 100
+
+    def __init__(self, log_path: Path, index_path: Path):
+        """Initialize log and index paths; nothing is read until first use."""
+        self.log_path = Path(log_path)
+        self.index_path = Path(index_path)
+        self._index: Optional[Dict[str, Any]] = None
+        self._index_mtime: Optional[int] = None
+        self._unflushed = 0
+
+    # Index management
+    def _empty_index(self, inode: Optional[int]) -> Dict[str, Any]:
+        """Create an index that covers nothing."""
+        return {
+            "version": self.INDEX_VERSION,
+            "inode": inode,
+            "log_size": 0,
+            "last_compacted": None,
+            "features": {},
+            # Offsets of unattributed entries keyed by task_prefix(task_id)
+            "unattributed": {},
+        }
+
+    def _load_index(self) -> Optional[Dict[str, Any]]:
+        """Read the persisted index, ignoring missing or unreadable files."""
+        try:
+            self._index_mtime = self.index_path.stat().st_mtime_ns
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if not isinstance(index, dict) or index.get("version") != self.INDEX_VERSION:
+            return None
+        return index
+
+    def _save_index(self) -> None:
+        """Persist the in-memory index atomically."""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(
+            dir=self.index_path.parent,
+            prefix=f".{self.index_path.stem}_tmp_",
+            suffix=self.index_path.suffix
+        )
+
+        try:
+            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+                json.dump(self._index, f, separators=(',', ':'))
+            os.replace(temp_path, self.index_path)
+            self._index_mtime = self.index_path.stat().st_mtime_ns
+            self._unflushed = 0
+        except Exception:
+            try:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def _index_is_current(self, index: Optional[Dict[str, Any]], stat: os.stat_result) -> bool:
+        """Check that an index describes (a prefix of) the current log file."""
+        return (
+            index is not None
+            and index.get("inode") == stat.st_ino
+            and index.get("log_size", 0) <= stat.st_size
+        )
+
+    def _sync(self) -> int:
+        """Bring the index up to date with the log; returns newly indexed entries."""
+        try:
+            stat = self.log_path.stat()
+        except FileNotFoundError:
+            self._index = self._empty_index(None)
+            return 0
+
+        index_changed = False
+        try:
+            index_changed = self.index_path.stat().st_mtime_ns != self._index_mtime
+        except OSError:
+            pass
+
+        if index_changed or not self._index_is_current(self._index, stat):
+            index = self._load_index()
+            if not self._index_is_current(index, stat):
+                # Log was replaced or truncated behind our back: rebuild from scratch
+                index = self._empty_index(stat.st_ino)
+            self._index = index
+
+        if self._index["log_size"] < stat.st_size:
+            return self._scan_tail()
+        return 0
+
+    def _scan_tail(self) -> int:
+        """Index complete lines past the indexed size."""
+        index = self._index
+        offset = index["log_size"]
+        scanned = 0
+
+        with open(self.log_path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # Torn write at the end of the log; leave it unindexed
+                    break
+                try:
+                    entry = json.loads(line)
+                    feature_id = entry.get("feature_id")
+                except (ValueError, AttributeError):
+                    entry = None
+
+                if entry is not None:
+                    self._index_entry(entry, feature_id, offset)
+                    scanned += 1
+                offset += len(line)
+
+        index["log_size"] = offset
+        return scanned
+
+    def _index_entry(self, entry: Dict[str, Any], feature_id: Optional[str], offset: int) -> None:
+        """Record the offset of one entry under its feature or task prefix."""
+        if feature_id:
+            self._index["features"].setdefault(feature_id, []).append(offset)
+        else:
+            prefix = task_prefix(str(entry.get("task_id", "")))
+            self._index["unattributed"].setdefault(prefix, []).append(offset)
+
+    def _read_offsets(self, offsets: List[int], limit: Optional[int]) -> List[Dict[str, Any]]:
+        """Read the entries at the given offsets, or only the last `limit` of them."""
+        if limit:
+            offsets = offsets[-limit:]
+        if not offsets:
+            return []
+
+        entries = []
+        with open(self.log_path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                try:
+                    entries.append(json.loads(f.readline()))
+                except ValueError:
+                    continue
+        return entries
+
+    # Public API
+    def append(self, entries: List[Dict[str, Any]], feature_id: Optional[str] = None) -> None:
+        """Append entries for a feature as JSON lines in a single write."""
+        if not entries:
+            return
+
+        newly_indexed = self._sync()
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+
+        lines = []
+        for entry in entries:
+            record = dict(entry)
+            record["feature_id"] = feature_id
+            lines.append(json.dumps(record, ensure_ascii=False, sort_keys=True).encode('utf-8') + b'\n')
+
+        with open(self.log_path, 'ab') as f:
+            offset = f.tell()
+            if offset > self._index["log_size"]:
+                # Terminate a torn line so our entries start on a fresh one
+                f.write(b'\n')
+                offset += 1
+            if self._index["inode"] is None:
+                self._index["inode"] = os.fstat(f.fileno()).st_ino
+            f.write(b''.join(lines))
+
+        for entry, line in zip(entries, lines):
+            self._index_entry(entry, feature_id, offset)
+            offset += len(line)
+        self._index["log_size"] = offset
+
+        self._unflushed += newly_indexed + len(lines)
+        if self._unflushed >= self.INDEX_FLUSH_ENTRIES:
+            self._save_index()
+
+    def read(self, feature_id: Optional[str], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Read a feature's entries in append order, or only the last `limit` of them."""
+        if self._sync():
+            self._save_index()
+
+        if not feature_id:
+            offsets = [offset for offsets in self._index["unattributed"].values() for offset in offsets]
+            return self._read_offsets(sorted(offsets), limit)
+        return self._read_offsets(self._index["features"].get(feature_id, []), limit)
+
+    def read_unattributed(self, prefix: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Read unattributed entries whose task ID starts with the segment `prefix`."""
+        if self._sync():
+            self._save_index()
+
+        return self._read_offsets(self._index["unattributed"].get(prefix, []), limit)
+
+    def features(self) -> List[str]:
+        """Feature IDs that have history entries."""
+        self._sync()
+        return list(self._index["features"])
+
+    def compaction_due(self, interval: timedelta) -> bool:
+        """Check whether the last compaction is older than `interval`."""
+        self._sync()
+        last_compacted = self._index.get("last_compacted")
+        if not last_compacted:
+            return self._index["log_size"] > 0
+        return datetime.fromisoformat(last_compacted) < datetime.now() - interval
+
+    def compact(self, cutoff: datetime) -> int:
+        """Rewrite the log without entries older than cutoff; returns entries removed."""
+        self._sync()
+        kept: List[bytes] = []
+        removed = 0
+
+        for line, entry in self._iter_lines():
+            try:
+                expired = entry is None or datetime.fromisoformat(entry["timestamp"]) <= cutoff
+            except (KeyError, TypeError, ValueError):
+                expired = True
+            if expired:
+                removed += 1
+            else:
+                kept.append(line)
+
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(
+            dir=self.log_path.parent,
+            prefix=f".{self.log_path.stem}_tmp_",
+            suffix=self.log_path.suffix
+        )
+        try:
+            with os.fdopen(temp_fd, 'wb') as f:
+                f.write(b''.join(kept))
+            os.replace(temp_path, self.log_path)
+        except Exception:
+            try:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+        self._index = self._empty_index(self.log_path.stat().st_ino)
+        self._scan_tail()
+        self._index["last_compacted"] = datetime.now().isoformat()
+        self._save_index()
+        return removed
+
+    def verify(self) -> List[str]:
+        """Return a list of problems found in the log (unparseable lines)."""
+        issues = []
+        for number, (line, entry) in enumerate(self._iter_lines(), 1):
+            if entry is None:
+                issues.append(f"line {number}: invalid JSON entry")
+        return issues
+
+    def _iter_lines(self) -> Iterator[Tuple[bytes, Optional[Dict[str, Any]]]]:
+        """Yield (raw line, parsed entry or None) for every complete line."""
+        if not self.log_path.exists():
+            return
+
+        with open(self.log_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    entry = None
+                yield line, entry if isinstance(entry, dict) else None
+
+
+__all__ = ['HistoryLog', 'UNATTRIBUTED_FEATURE', 'task_prefix']
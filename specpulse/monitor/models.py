@@ -6,7 +6,7 @@ Provides type-safe data models with validation for task states and progress trac
 """
 
 from enum import Enum
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import json
@@ -273,7 +273,7 @@ class MonitoringConfig:
     progress_calculation_method: str = "simple"  # simple, weighted, trending
     backup_enabled: bool = True
     max_backups: int = 5
-    update_interval_seconds: int = 60
+    backup_interval_seconds: int = 5  # at most one backup per file within this window
     cache_enabled: bool = True
     cache_ttl_seconds: int = 300
 
@@ -286,15 +286,20 @@ class MonitoringConfig:
             "progress_calculation_method": self.progress_calculation_method,
             "backup_enabled": self.backup_enabled,
             "max_backups": self.max_backups,
-            "update_interval_seconds": self.update_interval_seconds,
+            "backup_interval_seconds": self.backup_interval_seconds,
             "cache_enabled": self.cache_enabled,
             "cache_ttl_seconds": self.cache_ttl_seconds,
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MonitoringConfig":
-        """Create from dictionary."""
-        return cls(**data)
+        """Create from dictionary, ignoring options this version does not know.
+
+        Older config files may still carry update_interval_seconds, which
+        discovery no longer uses (task files are fingerprinted instead).
+        """
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
 
 
 @dataclass
@@ -5,15 +5,31 @@ This module provides the TaskStateManager class for handling task state transiti
 automatic task discovery, and historical state tracking.
 """
 
+import os
 import re
+import threading
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Iterator, Tuple
 from datetime import datetime
+from dataclasses import dataclass, field, replace
+from contextlib import contextmanager
 
 from .models import TaskInfo, TaskState, TaskHistory, MonitoringConfig
 from .storage import StateStorage
 
 
+@dataclass
+class StateJournal:
+    """Pending task state changes and history entries for one batch."""
+    tasks: Dict[str, Dict[str, TaskInfo]] = field(default_factory=dict)
+    history: Dict[str, List[TaskHistory]] = field(default_factory=dict)
+
+    def record(self, feature_id: str, task: TaskInfo, history: TaskHistory) -> None:
+        """Record a transition; later changes to the same task supersede earlier ones."""
+        self.tasks.setdefault(feature_id, {})[task.id] = task
+        self.history.setdefault(feature_id, []).append(history)
+
+
 class TaskStateManager:
     """Manages task states with automatic discovery and historical tracking."""
 
@@ -22,27 +38,51 @@ class TaskStateManager:
         self.storage = storage
         self.config = config
         self._task_cache: Dict[str, List[TaskInfo]] = {}
-        self._last_discovery: Dict[str, datetime] = {}
+        # Per-feature parse cache: task file -> (fingerprint, parsed task)
+        self._parsed_files: Dict[str, Dict[Path, Tuple[Tuple[int, int, int], Optional[TaskInfo]]]] = {}
+        # Per-feature (task file fingerprints, state shard fingerprint) of the cached merge
+        self._discovery_keys: Dict[str, Tuple] = {}
+        self._journal: Optional[StateJournal] = None
+        # Guards _journal: a batch holds it until it commits, so updates from
+        # other threads (e.g. a shared manager in the daemon) wait rather
+        # than join a batch they did not open
+        self._journal_lock = threading.RLock()
 
     def discover_tasks(self, feature_id: str) -> List[TaskInfo]:
-        """Automatically discover tasks from .specpulse/tasks/ directories."""
-        # Check cache first
-        if self._should_use_cache(feature_id):
-            return self._task_cache.get(feature_id, [])
+        """Automatically discover tasks from .specpulse/tasks/ directories.
 
+        Task files are re-parsed only when their (mtime, size, inode)
+        fingerprint changes, and the merged result is reused until a task
+        file or the stored state changes. Storage is written only when the
+        merged task set differs from what is stored.
+        """
         tasks_path = self.storage.project_path / ".specpulse" / "tasks" / feature_id
-        discovered_tasks = []
+        file_stats = self._scan_task_files(tasks_path)
+        state_fingerprint = self.storage.get_state_fingerprint(feature_id)
+
+        files_key = tuple(sorted(file_stats.items()))
+        if (feature_id in self._task_cache
+                and self._discovery_keys.get(feature_id) == (files_key, state_fingerprint)):
+            return self._task_cache[feature_id]
+
+        # Parse only new or changed task files
+        previous = self._parsed_files.get(feature_id, {})
+        parsed_files: Dict[Path, Tuple[Tuple[int, int, int], Optional[TaskInfo]]] = {}
+        for task_file, fingerprint in files_key:
+            cached = previous.get(task_file)
+            if cached and cached[0] == fingerprint:
+                parsed_files[task_file] = cached
+            else:
+                parsed_files[task_file] = (fingerprint, self._parse_task_file(task_file, feature_id))
+        self._parsed_files[feature_id] = parsed_files
 
-        if tasks_path.exists():
-            # Discover tasks from markdown files
-            for task_file in tasks_path.glob("*.md"):
-                task_info = self._parse_task_file(task_file, feature_id)
-                if task_info:
-                    discovered_tasks.append(task_info)
+        discovered_tasks = [task for _, task in parsed_files.values() if task]
 
         # Load existing states from storage
         existing_tasks = self.storage.load_tasks(feature_id)
+        stored_dicts = self._task_dicts(existing_tasks)
         existing_task_map = {task.id: task for task in existing_tasks}
+        discovered_ids = {task.id for task in discovered_tasks}
 
         # Merge discovered tasks with existing states
         merged_tasks = []
@@ -53,33 +93,42 @@ class TaskStateManager:
                 existing_task.title = discovered_task.title
                 merged_tasks.append(existing_task)
             else:
-                # New task discovered
-                merged_tasks.append(discovered_task)
+                # New task discovered (copied so the parse cache stays pristine)
+                merged_tasks.append(replace(discovered_task))
 
         # Add tasks that exist in storage but weren't discovered (might be archived)
         for existing_task in existing_tasks:
-            if existing_task.id not in {task.id for task in discovered_tasks}:
+            if existing_task.id not in discovered_ids:
                 merged_tasks.append(existing_task)
 
+        # Save merged tasks only if they differ from what is stored
+        if self._task_dicts(merged_tasks) != stored_dicts:
+            self.storage.save_tasks(merged_tasks, feature_id)
+            state_fingerprint = self.storage.get_state_fingerprint(feature_id)
+
         # Update cache
         self._task_cache[feature_id] = merged_tasks
-        self._last_discovery[feature_id] = datetime.now()
-
-        # Save merged tasks
-        self.storage.save_tasks(merged_tasks, feature_id)
+        self._discovery_keys[feature_id] = (files_key, state_fingerprint)
 
         return merged_tasks
 
-    def _should_use_cache(self, feature_id: str) -> bool:
-        """Check if cached data is still valid."""
-        if feature_id not in self._task_cache:
-            return False
-
-        if feature_id not in self._last_discovery:
-            return False
+    def _scan_task_files(self, tasks_path: Path) -> Dict[Path, Tuple[int, int, int]]:
+        """Map each task markdown file to its (mtime_ns, size, inode) fingerprint."""
+        file_stats = {}
+        try:
+            with os.scandir(tasks_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md") and entry.is_file():
+                        stat = entry.stat()
+                        file_stats[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except OSError:
+            pass
+        return file_stats
 
-        time_since_discovery = datetime.now() - self._last_discovery[feature_id]
-        return time_since_discovery.total_seconds() < self.config.update_interval_seconds
+    @staticmethod
+    def _task_dicts(tasks: List[TaskInfo]) -> Dict[str, Dict]:
+        """Serialized tasks keyed by ID, for change detection."""
+        return {task.id: task.to_dict() for task in tasks}
 
     def _parse_task_file(self, file_path: Path, feature_id: str) -> Optional[TaskInfo]:
         """Parse a task markdown file and extract task information."""
@@ -204,57 +253,115 @@ class TaskStateManager:
 
     def get_task(self, feature_id: str, task_id: str) -> Optional[TaskInfo]:
         """Get a specific task by ID."""
-        tasks = self.get_tasks(feature_id)
-        for task in tasks:
-            if task.id == task_id:
-                return task
-        return None
+        with self._journal_lock:
+            if self._journal is not None:
+                # Inside a batch, the journaled copy is the current state
+                pending = self._journal.tasks.get(feature_id, {}).get(task_id)
+                if pending:
+                    return pending
+
+            tasks = self.get_tasks(feature_id)
+            for task in tasks:
+                if task.id == task_id:
+                    return task
+            return None
 
     def update_task_state(self, feature_id: str, task_id: str, new_state: TaskState,
                          error_message: Optional[str] = None, notes: Optional[str] = None) -> bool:
         """Update task state with validation and history tracking."""
-        task = self.get_task(feature_id, task_id)
-        if not task:
-            return False
-
-        old_state = task.state
-
-        # Validate state transition
-        try:
-            task.transition_to(new_state, error_message)
-        except ValueError:
-            return False
-
-        # Save history entry
-        history = TaskHistory(
-            task_id=task_id,
-            timestamp=datetime.now(),
-            old_state=old_state,
-            new_state=new_state,
-            notes=notes
-        )
-        self.storage.save_history_entry(history)
-
-        # Save updated task
-        self.storage.save_task_state(task, feature_id)
+        with self._journal_lock:
+            task = self.get_task(feature_id, task_id)
+            if not task:
+                return False
+
+            old_state = task.state
+
+            # Validate state transition
+            try:
+                task.transition_to(new_state, error_message)
+            except ValueError:
+                return False
+
+            history = TaskHistory(
+                task_id=task_id,
+                timestamp=datetime.now(),
+                old_state=old_state,
+                new_state=new_state,
+                notes=notes
+            )
 
-        # Update task file automatically
+            if self._journal is not None:
+                # Applied when the enclosing batch commits
+                self._journal.record(feature_id, task, history)
+            else:
+                self._commit(StateJournal(tasks={feature_id: {task.id: task}},
+                                          history={feature_id: [history]}))
+
+            # Update cache
+            if feature_id in self._task_cache:
+                for i, cached_task in enumerate(self._task_cache[feature_id]):
+                    if cached_task.id == task_id:
+                        self._task_cache[feature_id][i] = task
+                        break
+
+            return True
+
+    @contextmanager
+    def batch(self) -> Iterator[StateJournal]:
+        """Group state updates so they are stored together when the block exits.
+
+        Each feature's changes are written with one backup and one atomic
+        write, and history entries are appended in one write. If the block
+        raises, the journaled changes are discarded.
+
+        Example:
+            >>> with manager.batch():
+            ...     for task_id in ("T001", "T002", "T003"):
+            ...         manager.complete_task("001-auth", task_id)
+        """
+        with self._journal_lock:
+            if self._journal is not None:
+                # Nested batches join the outermost one
+                yield self._journal
+                return
+
+            journal = self._journal = StateJournal()
+            try:
+                yield journal
+            except BaseException:
+                self._journal = None
+                # Cached tasks were mutated by the discarded transitions
+                for feature_id in journal.tasks:
+                    self.clear_cache(feature_id)
+                raise
+
+            self._journal = None
+            self._commit(journal)
+
+    def update_many(self, feature_id: str, updates: Dict[str, TaskState],
+                    notes: Optional[str] = None) -> Dict[str, bool]:
+        """Apply several task state updates as one batch."""
+        with self.batch():
+            return {
+                task_id: self.update_task_state(feature_id, task_id, new_state, notes=notes)
+                for task_id, new_state in updates.items()
+            }
+
+    def _commit(self, journal: StateJournal) -> None:
+        """Write journaled task states, history and task files."""
         from .task_updater import TaskFileUpdater
-        try:
-            updater = TaskFileUpdater(self.storage.project_path)
-            updater.update_task_file(task, feature_id)
-        except Exception:
-            # Don't let file update failures break task state management
-            pass
+        updater = TaskFileUpdater(self.storage.project_path)
 
-        # Update cache
-        if feature_id in self._task_cache:
-            for i, cached_task in enumerate(self._task_cache[feature_id]):
-                if cached_task.id == task_id:
-                    self._task_cache[feature_id][i] = task
-                    break
+        for feature_id, tasks in journal.tasks.items():
+            self.storage.save_history_entries(journal.history.get(feature_id, []), feature_id)
+            self.storage.save_task_states(list(tasks.values()), feature_id)
 
-        return True
+            # Update task files automatically, rewriting each file once
+            try:
+                updater.bulk_update_tasks(list(tasks.values()), feature_id)
+            except Exception:
+                # Don't let file update failures break task state management
+                pass
 
     def start_task(self, feature_id: str, task_id: str) -> bool:
         """Mark a task as in-progress."""
@@ -307,10 +414,12 @@ class TaskStateManager:
         """Clear task discovery cache."""
         if feature_id:
             self._task_cache.pop(feature_id, None)
-            self._last_discovery.pop(feature_id, None)
+            self._discovery_keys.pop(feature_id, None)
+            self._parsed_files.pop(feature_id, None)
         else:
             self._task_cache.clear()
-            self._last_discovery.clear()
+            self._discovery_keys.clear()
+            self._parsed_files.clear()
 
     def refresh_tasks(self, feature_id: str) -> List[TaskInfo]:
         """Force refresh of task discovery."""
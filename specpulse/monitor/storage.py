@@ -11,9 +11,10 @@ import sys
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import threading
+import time
 from contextlib import contextmanager
 
 # Import platform-specific file locking
@@ -23,11 +24,20 @@ else:
     import fcntl
 
 from .models import TaskInfo, ProgressData, TaskHistory, MonitoringConfig
+from .history_log import HistoryLog, task_prefix
+from .errors import StorageError
+
+# Expired history entries are dropped by a compaction at most this often
+HISTORY_COMPACTION_INTERVAL = timedelta(days=1)
 
 
 class StateStorage:
     """Handles atomic file operations for task state persistence."""
 
+    # Per-feature task state lives in progress/<feature>/<SHARD_FILE>
+    SHARD_FILE = "task-states.json"
+    SHARD_LOCK_FILE = ".state.lock"
+
     def __init__(self, project_path: Path, config: Optional[MonitoringConfig] = None):
         """Initialize storage with project path and configuration."""
         self.project_path = Path(project_path)
@@ -40,7 +50,8 @@ class StateStorage:
         # File paths
         self.state_file = self.memory_path / "task-states.json"
         self.progress_file = self.memory_path / "task-progress.json"
-        self.history_file = self.memory_path / "task-history.json"
+        self.history_file = self.memory_path / "task-history.jsonl"
+        self.legacy_history_file = self.memory_path / "task-history.json"
         self.config_file = self.memory_path / "monitor-config.json"
 
         # Backup directory
@@ -53,13 +64,26 @@ class StateStorage:
         self.progress_dir.mkdir(exist_ok=True)
         self.history_dir.mkdir(exist_ok=True)
 
+        # Feature shard manifest (list of features with task state)
+        self.manifest_file = self.progress_dir / "manifest.json"
+
+        # Append-only history log with per-feature offset index
+        self._history = HistoryLog(self.history_file, self.history_dir / "index.json")
+
         # Thread safety
         self._locks = {
             'state': threading.RLock(),
             'progress': threading.RLock(),
             'history': threading.RLock(),
             'config': threading.RLock(),
+            'manifest': threading.RLock(),
         }
+        # Per-feature shard locks, created on first use
+        self._shard_locks: Dict[str, threading.RLock] = {}
+        self._shard_locks_guard = threading.Lock()
+
+        # Monotonic time of the last backup per backup prefix
+        self._last_backup: Dict[str, float] = {}
 
         # Initialize files if they don't exist
         self._initialize_files()
@@ -67,9 +91,7 @@ class StateStorage:
     def _initialize_files(self) -> None:
         """Create default files if they don't exist."""
         default_files = {
-            self.state_file: {"tasks": {}, "metadata": {"last_updated": datetime.now().isoformat()}},
             self.progress_file: {"features": {}, "metadata": {"last_updated": datetime.now().isoformat()}},
-            self.history_file: {"history": [], "metadata": {"last_updated": datetime.now().isoformat()}},
             self.config_file: self.config.to_dict(),
         }
 
@@ -77,22 +99,79 @@ class StateStorage:
             if not file_path.exists():
                 self._atomic_write(file_path, default_content)
 
+        if not self.history_file.exists():
+            self._migrate_legacy_history()
+            self.history_file.touch()
+
+        if self.state_file.exists():
+            self._migrate_legacy_state()
+
+    def _migrate_legacy_state(self) -> None:
+        """Split the old global task-states.json into per-feature shards."""
+        with self._file_lock('state'):
+            data = self._read_json_file(self.state_file)
+            features = data.get("tasks", {}) if isinstance(data, dict) else {}
+
+            for feature_id, tasks in features.items():
+                try:
+                    self._write_shard(feature_id, tasks)
+                except StorageError:
+                    continue
+
+            try:
+                self.state_file.replace(self.backup_dir / "task-states_legacy.json")
+            except OSError:
+                pass
+
+    def _migrate_legacy_history(self) -> None:
+        """Move entries from the old single-document task-history.json into the log."""
+        if not self.legacy_history_file.exists():
+            return
+
+        data = self._read_json_file(self.legacy_history_file)
+        entries = data.get("history", []) if isinstance(data, dict) else []
+
+        with self._file_lock('history'):
+            # Legacy entries carry no feature ID; they are indexed by task prefix
+            self._history.append(entries)
+
+        try:
+            self.legacy_history_file.replace(self.backup_dir / "task-history_legacy.json")
+        except OSError:
+            pass
+
     @contextmanager
     def _file_lock(self, file_type: str):
         """Context manager for thread-safe and process-safe file operations."""
-        # Thread-level lock
-        lock = self._locks[file_type]
-        lock.acquire()
-
         # Process-level lock using lock file
         lock_file_map = {
             'state': self.memory_path / '.state.lock',
             'progress': self.memory_path / '.progress.lock',
             'history': self.memory_path / '.history.lock',
             'config': self.memory_path / '.config.lock',
+            'manifest': self.memory_path / '.manifest.lock',
         }
 
-        lock_file_path = lock_file_map.get(file_type)
+        with self._acquire(self._locks[file_type], lock_file_map.get(file_type)):
+            yield
+
+    @contextmanager
+    def _shard_lock(self, feature_id: str):
+        """Lock a single feature shard; writers to other features are not blocked."""
+        shard_dir = self._shard_dir(feature_id)
+
+        with self._shard_locks_guard:
+            lock = self._shard_locks.setdefault(feature_id, threading.RLock())
+
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        with self._acquire(lock, shard_dir / self.SHARD_LOCK_FILE):
+            yield
+
+    @contextmanager
+    def _acquire(self, lock: threading.RLock, lock_file_path: Optional[Path]):
+        """Hold a thread-level lock plus an optional process-level lock file."""
+        # Thread-level lock
+        lock.acquire()
         lock_file = None
 
         try:
@@ -152,28 +231,36 @@ class StateStorage:
                 pass
             raise
 
-    def _backup_file(self, file_path: Path) -> None:
+    def _backup_file(self, file_path: Path, prefix: Optional[str] = None) -> None:
         """Create backup of file before modification if backup is enabled."""
         if not self.config.backup_enabled or not file_path.exists():
             return
 
+        prefix = prefix or file_path.stem
+        now = time.monotonic()
+        last_backup = self._last_backup.get(prefix)
+        if last_backup is not None and now - last_backup < self.config.backup_interval_seconds:
+            # A recent enough backup already exists for this file
+            return
+
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
+        backup_name = f"{prefix}_{timestamp}{file_path.suffix}"
         backup_path = self.backup_dir / backup_name
 
         try:
             shutil.copy2(file_path, backup_path)
-            self._cleanup_old_backups()
+            self._last_backup[prefix] = now
+            self._cleanup_old_backups(prefix, file_path.suffix)
         except Exception:
             # Don't fail if backup fails, but log warning in real implementation
             pass
 
-    def _cleanup_old_backups(self) -> None:
+    def _cleanup_old_backups(self, prefix: str = "task-states", suffix: str = ".json") -> None:
         """Remove old backup files keeping only the most recent ones."""
         if not self.backup_dir.exists():
             return
 
-        backup_files = list(self.backup_dir.glob("task-states_*.json"))
+        backup_files = list(self.backup_dir.glob(f"{prefix}_[0-9]*_[0-9]*{suffix}"))
         backup_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
 
         # Keep only the most recent backups
@@ -183,7 +270,7 @@ class StateStorage:
             except OSError:
                 pass
 
-    def _read_json_file(self, file_path: Path) -> Dict[str, Any]:
+    def _read_json_file(self, file_path: Path, backup_prefix: Optional[str] = None) -> Dict[str, Any]:
         """Read and parse JSON file with error handling."""
         if not file_path.exists():
             return {}
@@ -193,15 +280,16 @@ class StateStorage:
                 return json.load(f)
         except (json.JSONDecodeError, IOError) as e:
             # In case of corrupted file, try to restore from backup
-            return self._restore_from_backup(file_path) or {}
+            return self._restore_from_backup(file_path, backup_prefix) or {}
 
-    def _restore_from_backup(self, file_path: Path) -> Optional[Dict[str, Any]]:
+    def _restore_from_backup(self, file_path: Path,
+                             prefix: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Attempt to restore file from latest backup."""
         if not self.backup_dir.exists():
             return None
 
-        # Find most recent backup for this file
-        backup_pattern = f"{file_path.stem}_*{file_path.suffix}"
+        # Find most recent backup for this file (prefix_YYYYmmdd_HHMMSS.ext)
+        backup_pattern = f"{prefix or file_path.stem}_[0-9]*_[0-9]*{file_path.suffix}"
         backup_files = list(self.backup_dir.glob(backup_pattern))
 
         if not backup_files:
@@ -217,47 +305,118 @@ class StateStorage:
             return None
 
     # Task State Operations
-    def save_tasks(self, tasks: List[TaskInfo], feature_id: str) -> None:
-        """Save tasks for a specific feature."""
-        with self._file_lock('state'):
-            self._backup_file(self.state_file)
+    def _shard_dir(self, feature_id: str) -> Path:
+        """Directory holding a feature's state shard."""
+        if (not feature_id or feature_id in ('.', '..')
+                or '/' in feature_id or '\\' in feature_id):
+            raise StorageError(
+                f"Invalid feature ID for task state: {feature_id!r}",
+                suggestion="Feature IDs must not be empty or contain path separators"
+            )
+        return self.progress_dir / feature_id
+
+    def _shard_file(self, feature_id: str) -> Path:
+        """State shard file for a feature."""
+        return self._shard_dir(feature_id) / self.SHARD_FILE
+
+    def _shard_backup_prefix(self, feature_id: str) -> str:
+        """Backup file prefix for a feature shard."""
+        return f"{Path(self.SHARD_FILE).stem}_{feature_id}"
+
+    def _read_shard(self, feature_id: str) -> Dict[str, Any]:
+        """Read a feature's task dictionaries keyed by task ID."""
+        shard_file = self._shard_file(feature_id)
+        data = self._read_json_file(shard_file, self._shard_backup_prefix(feature_id))
+        tasks = data.get("tasks", {}) if isinstance(data, dict) else {}
+        return tasks if isinstance(tasks, dict) else {}
+
+    def _write_shard(self, feature_id: str, tasks: Dict[str, Any]) -> None:
+        """Atomically replace a feature shard, registering new features in the manifest."""
+        shard_file = self._shard_file(feature_id)
+        is_new = not shard_file.exists()
+        if not is_new:
+            self._backup_file(shard_file, self._shard_backup_prefix(feature_id))
+
+        shard_file.parent.mkdir(parents=True, exist_ok=True)
+        self._atomic_write(shard_file, {
+            "tasks": tasks,
+            "metadata": {
+                "feature_id": feature_id,
+                "last_updated": datetime.now().isoformat(),
+            },
+        })
+
+        if is_new:
+            self._update_manifest(add=feature_id)
+
+    def _update_manifest(self, add: Optional[str] = None, remove: Optional[str] = None) -> None:
+        """Add or remove a feature in the shard manifest."""
+        with self._file_lock('manifest'):
+            features = set(self._read_manifest())
+            if add:
+                features.add(add)
+            if remove:
+                features.discard(remove)
+            self._atomic_write(self.manifest_file, {
+                "features": sorted(features),
+                "metadata": {"last_updated": datetime.now().isoformat()},
+            })
+
+    def _read_manifest(self) -> List[str]:
+        """Feature IDs listed in the manifest, rebuilt from shards if missing or damaged."""
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                features = json.load(f).get("features")
+            if isinstance(features, list):
+                return features
+        except (OSError, json.JSONDecodeError, AttributeError):
+            pass
 
-            # Read existing data
-            data = self._read_json_file(self.state_file)
+        return sorted(
+            shard.parent.name
+            for shard in self.progress_dir.glob(f"*/{self.SHARD_FILE}")
+        )
 
-            # Update tasks for this feature
-            data["tasks"][feature_id] = {
-                task.id: task.to_dict() for task in tasks
-            }
-            data["metadata"]["last_updated"] = datetime.now().isoformat()
+    def get_state_fingerprint(self, feature_id: str) -> Optional[Tuple[int, int, int]]:
+        """(mtime_ns, size, inode) of a feature's state shard, or None if it has none."""
+        try:
+            stat = self._shard_file(feature_id).stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
 
-            self._atomic_write(self.state_file, data)
+    def save_tasks(self, tasks: List[TaskInfo], feature_id: str) -> None:
+        """Save tasks for a specific feature."""
+        with self._shard_lock(feature_id):
+            self._write_shard(feature_id, {task.id: task.to_dict() for task in tasks})
 
     def load_tasks(self, feature_id: str) -> List[TaskInfo]:
         """Load tasks for a specific feature."""
-        with self._file_lock('state'):
-            data = self._read_json_file(self.state_file)
+        if not self._shard_file(feature_id).exists():
+            return []
+
+        with self._shard_lock(feature_id):
+            feature_tasks = self._read_shard(feature_id)
 
-            feature_tasks = data.get("tasks", {}).get(feature_id, {})
-            return [
-                TaskInfo.from_dict(task_data)
-                for task_data in feature_tasks.values()
-            ]
+        return [
+            TaskInfo.from_dict(task_data)
+            for task_data in feature_tasks.values()
+        ]
 
     def save_task_state(self, task: TaskInfo, feature_id: str) -> None:
         """Save a single task state change."""
-        with self._file_lock('state'):
-            self._backup_file(self.state_file)
+        self.save_task_states([task], feature_id)
 
-            data = self._read_json_file(self.state_file)
-
-            if feature_id not in data["tasks"]:
-                data["tasks"][feature_id] = {}
-
-            data["tasks"][feature_id][task.id] = task.to_dict()
-            data["metadata"]["last_updated"] = datetime.now().isoformat()
+    def save_task_states(self, tasks: List[TaskInfo], feature_id: str) -> None:
+        """Save several task state changes with one backup and one atomic write."""
+        if not tasks:
+            return
 
-            self._atomic_write(self.state_file, data)
+        with self._shard_lock(feature_id):
+            stored = self._read_shard(feature_id)
+            for task in tasks:
+                stored[task.id] = task.to_dict()
+            self._write_shard(feature_id, stored)
 
     # Progress Data Operations
     def save_progress(self, progress: ProgressData) -> None:
@@ -285,50 +444,55 @@ class StateStorage:
         return None
 
     # History Operations
-    def save_history_entry(self, history: TaskHistory) -> None:
-        """Save a single history entry."""
-        with self._file_lock('history'):
-            self._backup_file(self.history_file)
-
-            data = self._read_json_file(self.history_file)
+    def save_history_entry(self, history: TaskHistory, feature_id: Optional[str] = None) -> None:
+        """Append a single history entry to the feature's history."""
+        self.save_history_entries([history], feature_id)
 
-            data["history"].append(history.to_dict())
-            data["metadata"]["last_updated"] = datetime.now().isoformat()
+    def save_history_entries(self, entries: List[TaskHistory], feature_id: Optional[str] = None) -> None:
+        """Append several history entries to the feature's history in one write."""
+        if not entries:
+            return
 
-            # Cleanup old history entries
-            cutoff_date = datetime.now() - timedelta(days=self.config.history_retention_days)
-            data["history"] = [
-                entry for entry in data["history"]
-                if datetime.fromisoformat(entry["timestamp"]) > cutoff_date
-            ]
+        with self._file_lock('history'):
+            self._history.append([history.to_dict() for history in entries], feature_id)
 
-            self._atomic_write(self.history_file, data)
+            if self._history.compaction_due(HISTORY_COMPACTION_INTERVAL):
+                self._history.compact(self._history_cutoff())
 
     def load_history(self, feature_id: str, limit: Optional[int] = None) -> List[TaskHistory]:
-        """Load history entries for a feature."""
+        """Load history entries for a feature (newest first)."""
         # BUG-006 FIX: Validate feature_id is not empty to prevent returning all entries
         if not feature_id or not feature_id.strip():
             return []
 
         with self._file_lock('history'):
-            data = self._read_json_file(self.history_file)
+            entries = self._history.read(feature_id, limit)
 
-            # Extract feature prefix safely
-            feature_prefix = feature_id.split("-")[0] if "-" in feature_id else feature_id
+            # Entries written before history was attributed to features
+            entries.extend(self._history.read_unattributed(task_prefix(feature_id), limit))
 
-            history_entries = [
-                TaskHistory.from_dict(entry)
-                for entry in data.get("history", [])
-                if feature_prefix and entry.get("task_id", "").startswith(feature_prefix)
-            ]
+        cutoff_date = self._history_cutoff()
+        history_entries = [
+            history for history in (TaskHistory.from_dict(entry) for entry in entries)
+            if history.timestamp > cutoff_date
+        ]
+
+        # Sort by timestamp (newest first)
+        history_entries.sort(key=lambda h: h.timestamp, reverse=True)
 
-            # Sort by timestamp (newest first)
-            history_entries.sort(key=lambda h: h.timestamp, reverse=True)
+        if limit:
+            history_entries = history_entries[:limit]
 
-            if limit:
-                history_entries = history_entries[:limit]
+        return history_entries
 
-            return history_entries
+    def cleanup_old_history(self) -> int:
+        """Compact the history log, dropping entries past the retention period."""
+        with self._file_lock('history'):
+            return self._history.compact(self._history_cutoff())
+
+    def _history_cutoff(self) -> datetime:
+        """Oldest timestamp kept by the history retention policy."""
+        return datetime.now() - timedelta(days=self.config.history_retention_days)
 
     # Configuration Operations
     def save_config(self, config: MonitoringConfig) -> None:
@@ -349,19 +513,25 @@ class StateStorage:
     # Utility Methods
     def get_all_features(self) -> List[str]:
         """Get list of all feature IDs with stored data."""
-        with self._file_lock('state'):
-            data = self._read_json_file(self.state_file)
-            return list(data.get("tasks", {}).keys())
+        with self._file_lock('manifest'):
+            features = self._read_manifest()
+            if not self.manifest_file.exists() and features:
+                # Persist the rebuilt manifest so the next call is a single read
+                self._atomic_write(self.manifest_file, {
+                    "features": features,
+                    "metadata": {"last_updated": datetime.now().isoformat()},
+                })
+            return features
 
     def reset_feature_data(self, feature_id: str) -> None:
         """Remove all data for a specific feature."""
-        with self._file_lock('state'), self._file_lock('progress'):
+        with self._shard_lock(feature_id), self._file_lock('progress'):
             # Reset tasks
-            self._backup_file(self.state_file)
-            state_data = self._read_json_file(self.state_file)
-            state_data["tasks"].pop(feature_id, None)
-            state_data["metadata"]["last_updated"] = datetime.now().isoformat()
-            self._atomic_write(self.state_file, state_data)
+            shard_file = self._shard_file(feature_id)
+            if shard_file.exists():
+                self._backup_file(shard_file, self._shard_backup_prefix(feature_id))
+                shard_file.unlink()
+            self._update_manifest(remove=feature_id)
 
             # Reset progress
             self._backup_file(self.progress_file)
@@ -379,10 +549,11 @@ class StateStorage:
         }
 
         files_to_check = [
-            ("task-states.json", self.state_file),
             ("task-progress.json", self.progress_file),
-            ("task-history.json", self.history_file),
             ("monitor-config.json", self.config_file),
+        ] + [
+            (f"progress/{feature_id}/{self.SHARD_FILE}", self._shard_file(feature_id))
+            for feature_id in self.get_all_features()
         ]
 
         for filename, filepath in files_to_check:
@@ -399,4 +570,13 @@ class StateStorage:
                 report["issues"].append(f"{filename}: {str(e)}")
                 report["valid"] = False
 
+        with self._file_lock('history'):
+            history_issues = self._history.verify()
+        if history_issues:
+            report["issues"].extend(f"task-history.jsonl: {issue}" for issue in history_issues)
+            report["valid"] = False
+        report["files_checked"].append(
+            f"task-history.jsonl: {'OK' if self.history_file.exists() else 'Not found'}"
+        )
+
         return report
\ No newline at end of file
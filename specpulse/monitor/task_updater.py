@@ -82,20 +82,7 @@ class TaskFileUpdater:
 
     def _update_file_content(self, file_path: Path, task: TaskInfo) -> bool:
         """Update the content of a task markdown file."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            updated_content = self._apply_state_updates(content, task)
-
-            # Only write if content actually changed
-            if updated_content != content:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(updated_content)
-
-            return True
-        except Exception:
-            return False
+        return self._update_file_tasks(file_path, [task])
 
     def _apply_state_updates(self, content: str, task: TaskInfo) -> str:
         """Apply state updates to task content."""
@@ -211,15 +198,47 @@ class TaskFileUpdater:
         return content
 
     def bulk_update_tasks(self, tasks: List[TaskInfo], feature_id: str) -> Dict[str, bool]:
-        """Update multiple task files at once."""
+        """Update multiple task files at once.
+
+        Tasks are grouped by the file that holds them, and each file is read
+        and rewritten once with every task's updates applied in order.
+        """
         results = {}
+        tasks_by_file: Dict[Path, List[TaskInfo]] = {}
 
         for task in tasks:
-            success = self.update_task_file(task, feature_id)
-            results[task.id] = success
+            task_file = self._find_task_file(task.id, feature_id)
+            if task_file:
+                tasks_by_file.setdefault(task_file, []).append(task)
+            else:
+                results[task.id] = False
+
+        for task_file, file_tasks in tasks_by_file.items():
+            success = self._update_file_tasks(task_file, file_tasks)
+            for task in file_tasks:
+                results[task.id] = success
 
         return results
 
+    def _update_file_tasks(self, file_path: Path, tasks: List[TaskInfo]) -> bool:
+        """Apply several tasks' state updates to one file with a single write."""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+            updated_content = content
+            for task in tasks:
+                updated_content = self._apply_state_updates(updated_content, task)
+
+            # Only write if content actually changed
+            if updated_content != content:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(updated_content)
+
+            return True
+        except Exception:
+            return False
+
     def get_task_file_state(self, task_id: str, feature_id: str) -> Optional[TaskState]:
         """Read task state from file (for verification)."""
         task_file = self._find_task_file(task_id, feature_id)
@@ -345,33 +364,35 @@ class TaskFileSyncManager:
         discrepancies = {}
         sync_results = {}
 
-        for task_id, file_state_name in file_states.items():
-            from .models import TaskState
-            try:
-                file_state = TaskState.from_string(file_state_name)
-            except ValueError:
-                continue
-
-            if task_id in monitor_states:
-                monitor_state = monitor_states[task_id]
-                if monitor_state != file_state:
+        # Store all monitor-side corrections in one batch
+        with state_manager.batch():
+            for task_id, file_state_name in file_states.items():
+                from .models import TaskState
+                try:
+                    file_state = TaskState.from_string(file_state_name)
+                except ValueError:
+                    continue
+
+                if task_id in monitor_states:
+                    monitor_state = monitor_states[task_id]
+                    if monitor_state != file_state:
+                        discrepancies[task_id] = {
+                            'file_state': file_state.value,
+                            'monitor_state': monitor_state.value,
+                            'action': 'update_monitor'
+                        }
+                        # Update monitor state to match file
+                        success = state_manager.update_task_state(
+                            feature_id, task_id, file_state
+                        )
+                        sync_results[task_id] = success
+                else:
+                    # Task exists in file but not in monitor
                     discrepancies[task_id] = {
                         'file_state': file_state.value,
-                        'monitor_state': monitor_state.value,
-                        'action': 'update_monitor'
+                        'monitor_state': None,
+                        'action': 'add_to_monitor'
                     }
-                    # Update monitor state to match file
-                    success = state_manager.update_task_state(
-                        feature_id, task_id, file_state
-                    )
-                    sync_results[task_id] = success
-            else:
-                # Task exists in file but not in monitor
-                discrepancies[task_id] = {
-                    'file_state': file_state.value,
-                    'monitor_state': None,
-                    'action': 'add_to_monitor'
-                }
 
         return {
             'discrepancies': discrepancies,
@@ -1,6 +1,24 @@
 """SpecPulse Utilities"""
 
-from .console import Console
-from .git_utils import GitUtils
+import importlib
 
-__all__ = ["Console", "GitUtils"]
\ No newline at end of file
+# Imported on first access (PEP 562): Console pulls in rich, GitUtils git helpers
+_LAZY_EXPORTS = {
+    "Console": ".console",
+    "GitUtils": ".git_utils",
+}
+
+__all__ = ["Console", "GitUtils"]
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,22 +5,17 @@ Console utilities for SpecPulse with beautiful visual elements
 import sys
 import time
 import random
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, TYPE_CHECKING
 from .. import __version__
 from rich.console import Console as RichConsole
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
 from rich.panel import Panel
 from rich.text import Text
-from rich.tree import Tree
-from rich.syntax import Syntax
-from rich.prompt import Prompt, Confirm
-from rich.columns import Columns
-from rich.align import Align
-from rich.layout import Layout
-from rich.live import Live
 from rich import box
-from rich.style import Style
+
+# Tables, trees, syntax highlighting (pygments), prompts and live displays
+# are imported by the methods that use them to keep CLI startup cheap.
+if TYPE_CHECKING:
+    from rich.tree import Tree
 
 
 class Console:
@@ -184,6 +179,7 @@ class Console:
     
     def prompt(self, message: str, default: Optional[str] = None) -> str:
         """Beautiful prompt for user input"""
+        from rich.prompt import Prompt
         return Prompt.ask(
             f"[bold bright_cyan]{message}[/bold bright_cyan]",
             default=default,
@@ -192,6 +188,7 @@ class Console:
     
     def confirm(self, message: str, default: bool = False) -> bool:
         """Beautiful confirmation prompt"""
+        from rich.prompt import Confirm
         return Confirm.ask(
             f"[bold yellow]{message}[/bold yellow]",
             default=default,
@@ -201,6 +198,7 @@ class Console:
     def table(self, title: str, headers: List[str], rows: List[List[Any]], 
               box_style=box.ROUNDED, show_footer: bool = False):
         """Create a beautiful table"""
+        from rich.table import Table
         table = Table(
             title=title,
             box=box_style,
@@ -222,11 +220,12 @@ class Console:
     
     def tree(self, title: str, items: Dict[str, Any]):
         """Create a beautiful tree structure"""
+        from rich.tree import Tree
         tree = Tree(f"[bold bright_green]{title}[/bold bright_green]")
         self._build_tree(tree, items)
         self.console.print(tree)
     
-    def _build_tree(self, tree: Tree, items: Dict[str, Any]):
+    def _build_tree(self, tree: "Tree", items: Dict[str, Any]):
         """Recursively build tree structure"""
         for key, value in items.items():
             if isinstance(value, dict):
@@ -241,6 +240,7 @@ class Console:
     
     def code_block(self, code: str, language: str = "python", theme: str = "monokai"):
         """Display syntax-highlighted code"""
+        from rich.syntax import Syntax
         syntax = Syntax(code, language, theme=theme, line_numbers=True)
         panel = Panel(syntax, title=f"[bold]{language.upper()} Code[/bold]", 
                      border_style="bright_green", box=box.ROUNDED)
@@ -342,10 +342,12 @@ class Console:
             panels.append(panel)
         
         # Display in columns
+        from rich.columns import Columns
         self.console.print(Columns(panels, padding=(1, 2), expand=False))
     
     def animated_success(self, message: str):
         """Show animated success message"""
+        from rich.live import Live
         frames = ["[    ]", "[=   ]", "[==  ]", "[=== ]", "[====]", "[DONE]"]
         
         with Live(console=self.console, refresh_per_second=4) as live:
@@ -357,6 +359,7 @@ class Console:
     
     def pulse_animation(self, message: str, duration: float = 2.0):
         """Show pulsing animation"""
+        from rich.live import Live
         start_time = time.time()
         
         with Live(console=self.console, refresh_per_second=10) as live:
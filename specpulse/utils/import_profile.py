@@ -0,0 +1,123 @@
+"""
+Import-time audit for SpecPulse
+
+Set SPECPULSE_IMPORT_PROFILE=1 to time every import made after the
+`specpulse` package is loaded. When the process exits, a table of the
+costliest imports (self and cumulative milliseconds, like
+``python -X importtime``) is written to stderr. This makes it easy to
+spot heavy dependencies (rich, jinja2, yaml, git) that have crept back
+onto the startup path of a command.
+"""
+
+import atexit
+import builtins
+import os
+import sys
+import time
+from typing import Dict, List, Optional, TextIO
+
+
+PROFILE_ENV = "SPECPULSE_IMPORT_PROFILE"
+# Number of rows in the report (default 30)
+PROFILE_LIMIT_ENV = "SPECPULSE_IMPORT_PROFILE_LIMIT"
+
+
+class ImportProfiler:
+    """Times first-time imports by wrapping ``builtins.__import__``.
+
+    Each import statement that loads new modules is attributed to the
+    module it names; time spent in nested imports is subtracted from the
+    parent's self time.
+    """
+
+    def __init__(self):
+        self.self_ms: Dict[str, float] = {}
+        self.cumulative_ms: Dict[str, float] = {}
+        self.loaded: Dict[str, int] = {}
+        self.total_loaded = 0
+        self._original_import = None
+        self._stack: List[float] = []  # child time accumulated per active import
+
+    def install(self) -> None:
+        if self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    def uninstall(self) -> None:
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        if level == 0 and name in sys.modules and not fromlist:
+            return original(name, globals, locals, fromlist, level)
+
+        modules_before = len(sys.modules)
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            child_ms = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            elif len(sys.modules) > modules_before:
+                self.total_loaded += len(sys.modules) - modules_before
+
+            new_modules = len(sys.modules) - modules_before
+            if new_modules > 0:
+                key = self._resolve(name, globals, level)
+                self.self_ms[key] = self.self_ms.get(key, 0.0) + elapsed - child_ms
+                self.cumulative_ms[key] = self.cumulative_ms.get(key, 0.0) + elapsed
+                self.loaded[key] = self.loaded.get(key, 0) + new_modules
+
+    @staticmethod
+    def _resolve(name: str, globals: Optional[dict], level: int) -> str:
+        """Absolute module name for (possibly relative) import statements"""
+        if level == 0 or not globals:
+            return name
+        package = globals.get("__package__") or globals.get("__name__", "")
+        base = package.rsplit(".", level - 1)[0] if level > 1 else package
+        return f"{base}.{name}" if name else base
+
+    def report(self, stream: Optional[TextIO] = None, limit: int = 30) -> None:
+        """Write the costliest imports, by cumulative time, to stream"""
+        stream = stream or sys.stderr
+        rows = sorted(self.cumulative_ms.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+        stream.write("\nSpecPulse import profile (ms)\n")
+        stream.write(f"{'self':>9} {'cumulative':>11} {'modules':>8}  import\n")
+        for module, cumulative in rows:
+            stream.write(
+                f"{self.self_ms[module]:9.1f} {cumulative:11.1f} {self.loaded[module]:8d}  {module}\n"
+            )
+        total = sum(self.self_ms.values())
+        stream.write(f"{total:9.1f} {'':11} {self.total_loaded:8d}  total\n")
+
+
+_profiler: Optional[ImportProfiler] = None
+
+
+def enable() -> ImportProfiler:
+    """Start profiling imports and report at interpreter exit"""
+    global _profiler
+    if _profiler is None:
+        _profiler = ImportProfiler()
+        _profiler.install()
+        try:
+            limit = int(os.environ.get(PROFILE_LIMIT_ENV, "30"))
+        except ValueError:
+            limit = 30
+        atexit.register(_profiler.report, None, limit)
+    return _profiler
+
+
+def enabled_by_env() -> bool:
+    """Whether SPECPULSE_IMPORT_PROFILE requests an import audit"""
+    return os.environ.get(PROFILE_ENV, "").lower() in ("1", "true", "yes")
+
+
+__all__ = ['ImportProfiler', 'enable', 'enabled_by_env', 'PROFILE_ENV']
@@ -11,6 +11,7 @@ from typing import Dict, List, Optional, Tuple
 import json
 from datetime import datetime
 from .llm_safe_file_operations import LLMSafeFileOperations
+from ..core.template_cache import get_global_template_cache
 
 class LLMSafeTemplateSystem:
     """
@@ -67,7 +68,12 @@ class LLMSafeTemplateSystem:
         if not template_path.exists():
             raise FileNotFoundError(f"Template not found: {template_name}")
 
-        return template_path.read_text(encoding='utf-8')
+        # Shared, stat-validated cache: edits to the template are picked up
+        return get_global_template_cache().get(
+            str(template_path),
+            lambda: template_path.read_text(encoding='utf-8'),
+            source=template_path
+        )
 
     def extract_template_metadata(self, template_content: str) -> Dict[str, str]:
         """
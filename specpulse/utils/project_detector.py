@@ -5,7 +5,6 @@ Automatically detects project type from files and configuration.
 """
 from pathlib import Path
 from typing import Optional
-import yaml
 
 from ..core.custom_validation import ProjectType
 
@@ -68,6 +67,7 @@ class ProjectDetector:
             return ProjectType.UNKNOWN
 
         try:
+            import yaml
             with open(context_file, 'r', encoding='utf-8') as f:
                 context_data = yaml.safe_load(f)
 
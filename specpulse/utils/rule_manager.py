@@ -5,7 +5,6 @@ Provides CRUD operations for managing validation rules.
 """
 from pathlib import Path
 from typing import List, Dict, Optional
-import yaml
 
 from ..core.custom_validation import ValidationRule, RuleEngine, RuleSeverity, ProjectType
 
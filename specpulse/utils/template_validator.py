@@ -3,7 +3,6 @@ Template Content Validator - Advanced security and content validation for templa
 """
 
 import re
-import yaml
 import time
 import signal
 from typing import Dict, List, Tuple, Set, Optional, Any
@@ -24,7 +24,7 @@ import json
 from pathlib import Path
 from typing import Dict, Optional, Set, Tuple, List
 from enum import Enum
-from threading import Lock
+from threading import RLock
 
 class IDType(Enum):
     """Supported ID types with their prefixes and formats."""
@@ -62,8 +62,8 @@ class UniversalIDGenerator:
         self.state_file = self.config_dir / "id_registry.json"
         self.lock_file = self.config_dir / "id_registry.lock"
 
-        # Thread safety
-        self._lock = Lock()
+        # Thread safety (re-entrant: get_next_id saves state while holding it)
+        self._lock = RLock()
 
         # Ensure directory exists
         self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -170,6 +170,10 @@ class UniversalIDGenerator:
             self._acquire_lock()
 
             try:
+                # Another process (or an in-process CLI run beside the daemon)
+                # may have handed out IDs since this instance loaded its state
+                self._load_state()
+
                 type_name = id_type.value[0]
                 prefix = id_type.value[1]
                 padding = id_type.value[2]
@@ -1,13 +1,25 @@
 """
 Version checking utility for SpecPulse
+
+The daily update check never blocks the CLI: the PyPI query runs in a
+detached background process that stores its answer in
+``~/.specpulse/last_version_check``, and later invocations only read
+that cached answer.
 """
 
 import json
-import urllib.request
-import urllib.error
-from typing import Optional, Tuple
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 from packaging import version
-import socket
+
+
+# Check once per day maximum
+CHECK_INTERVAL = timedelta(hours=24)
 
 
 def check_pypi_version(package_name: str = "specpulse", timeout: int = 2) -> Optional[str]:
@@ -21,20 +33,19 @@ def check_pypi_version(package_name: str = "specpulse", timeout: int = 2) -> Opt
     Returns:
         Latest version string or None if check fails
     """
-    try:
-        # Set a short timeout to avoid blocking
-        socket.setdefaulttimeout(timeout)
+    # Networking modules are only needed when a check actually runs
+    import urllib.error
+    import urllib.request
 
+    try:
+        # Per-request timeout; the process-wide socket default is left alone
         url = f"https://pypi.org/pypi/{package_name}/json"
-        with urllib.request.urlopen(url) as response:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
             data = json.loads(response.read())
             return data["info"]["version"]
-    except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError, KeyError, socket.timeout):
+    except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError, KeyError, TimeoutError, OSError):
         # Silently fail - don't interrupt user workflow
         return None
-    finally:
-        # Reset default timeout
-        socket.setdefaulttimeout(None)
 
 
 def compare_versions(current: str, latest: str) -> Tuple[bool, bool]:
@@ -119,33 +130,124 @@ Update with: pip install --upgrade specpulse
     return message, color
 
 
+def get_cache_file() -> Path:
+    """Path of the cached version check result"""
+    return Path.home() / ".specpulse" / "last_version_check"
+
+
+def read_version_cache() -> Optional[Dict[str, Any]]:
+    """
+    Read the cached version check result
+
+    Returns:
+        Dict with ``last_check`` (datetime) and ``latest_version`` (str or
+        None), or None if there is no usable cache
+    """
+    try:
+        data = json.loads(get_cache_file().read_text(encoding='utf-8'))
+        return {
+            "last_check": datetime.fromisoformat(data["last_check"]),
+            "latest_version": data.get("latest_version"),
+        }
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def write_version_cache(latest_version: Optional[str], last_check: Optional[datetime] = None) -> bool:
+    """
+    Atomically write the version check result to the cache file
+
+    Args:
+        latest_version: Latest version found on PyPI (None if unknown)
+        last_check: Time of the check (defaults to now)
+
+    Returns:
+        True if the cache was written
+    """
+    cache_file = get_cache_file()
+    data = {
+        "last_check": (last_check or datetime.now()).isoformat(),
+        "latest_version": latest_version,
+    }
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, prefix=".last_version_check.")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, cache_file)
+        except OSError:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        return True
+    except OSError:
+        return False
+
+
+def get_cached_latest_version() -> Optional[str]:
+    """Latest version recorded by the last background check, if any"""
+    cache = read_version_cache()
+    return cache["latest_version"] if cache else None
+
+
 def should_check_version() -> bool:
     """
     Determine if we should check for updates
 
     Returns:
-        True if we should check, False otherwise
+        True if the cached result is missing or older than a day
     """
-    import os
-    from pathlib import Path
-    from datetime import datetime, timedelta
+    cache = read_version_cache()
+    if cache is None:
+        return True
+    return datetime.now() - cache["last_check"] >= CHECK_INTERVAL
 
-    try:
-        # Check once per day maximum
-        cache_file = Path.home() / ".specpulse" / "last_version_check"
 
-        if cache_file.exists():
-            # Check if last check was within 24 hours
-            last_check = datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if datetime.now() - last_check < timedelta(hours=24):
-                return False
+def refresh_version_cache(package_name: str = "specpulse", timeout: int = 5) -> Optional[str]:
+    """
+    Query PyPI and store the answer in the cache file
 
-        # Create cache directory if needed
-        cache_file.parent.mkdir(parents=True, exist_ok=True)
+    Runs in the detached process started by start_background_version_check.
+    A failed query keeps the previously cached version.
 
-        # Update timestamp
-        cache_file.touch()
+    Returns:
+        Latest version string or None if the check failed
+    """
+    latest = check_pypi_version(package_name, timeout=timeout)
+    write_version_cache(latest or get_cached_latest_version())
+    return latest
+
+
+def start_background_version_check() -> bool:
+    """
+    Refresh the version cache in a detached process without waiting for it
+
+    The cache timestamp is claimed first so that concurrent invocations
+    do not each start a check.
+
+    Returns:
+        True if the background process was started
+    """
+    if not write_version_cache(get_cached_latest_version()):
+        return False
+
+    kwargs: Dict[str, Any] = {
+        "stdin": subprocess.DEVNULL,
+        "stdout": subprocess.DEVNULL,
+        "stderr": subprocess.DEVNULL,
+        "close_fds": True,
+    }
+    if sys.platform == "win32":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+
+    try:
+        subprocess.Popen(
+            [sys.executable, "-c",
+             "from specpulse.utils.version_check import refresh_version_cache; refresh_version_cache()"],
+            **kwargs
+        )
         return True
-    except Exception:
-        # If anything fails, don't check
-        return False
\ No newline at end of file
+    except OSError:
+        return False
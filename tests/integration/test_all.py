@@ -305,7 +305,7 @@ class TestCLICore:
         assert cli.specpulse is not None
 
     @patch('specpulse.cli.handlers.command_handler.should_check_version')
-    @patch('specpulse.cli.handlers.command_handler.check_pypi_version')
+    @patch('specpulse.utils.version_check.check_pypi_version')
     @patch('specpulse.cli.handlers.command_handler.compare_versions')
     @patch('specpulse.cli.handlers.command_handler.get_update_message')
     def test_cli_with_updates(self, mock_msg, mock_compare, mock_check, mock_should):
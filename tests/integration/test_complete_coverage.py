@@ -291,13 +291,14 @@ class TestCompleteCLI:
             shutil.rmtree(self.temp_dir)
 
     @patch('specpulse.cli.handlers.command_handler.should_check_version')
-    @patch('specpulse.cli.handlers.command_handler.check_pypi_version')
+    @patch('specpulse.cli.handlers.command_handler.start_background_version_check')
+    @patch('specpulse.cli.handlers.command_handler.get_cached_latest_version')
     @patch('specpulse.cli.handlers.command_handler.compare_versions')
     @patch('specpulse.cli.handlers.command_handler.get_update_message')
-    def test_cli_check_for_updates(self, mock_msg, mock_compare, mock_check, mock_should):
+    def test_cli_check_for_updates(self, mock_msg, mock_compare, mock_cached, mock_start, mock_should):
         """Test CLI update checking"""
         mock_should.return_value = True
-        mock_check.return_value = "2.0.0"
+        mock_cached.return_value = "2.0.0"
         mock_compare.return_value = (True, True)
         mock_msg.return_value = "Update available"
 
@@ -0,0 +1,92 @@
+"""
+Discovery Cache Tests for Monitor
+
+Unit tests for the stat-fingerprint cache used by
+TaskStateManager.discover_tasks.
+"""
+
+import os
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+from specpulse.monitor.storage import StateStorage
+from specpulse.monitor.state_manager import TaskStateManager
+from specpulse.monitor.models import MonitoringConfig, TaskState
+
+
+FEATURE_ID = "001-discovery"
+
+
+def write_task(tasks_dir: Path, number: int, title: str, checkbox: str = " ") -> Path:
+    """Write a single-task markdown file."""
+    task_file = tasks_dir / f"task-{number:03d}.md"
+    task_file.write_text(f"### T{number:03d}: {title}\n- [{checkbox}] {title}\n", encoding="utf-8")
+    return task_file
+
+
+class TestDiscoveryCache:
+    """Test suite for fingerprint-based task discovery."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """State manager over a feature with three task files."""
+        (tmp_path / ".specpulse" / "memory").mkdir(parents=True)
+        tasks_dir = tmp_path / ".specpulse" / "tasks" / FEATURE_ID
+        tasks_dir.mkdir(parents=True)
+        for number in range(1, 4):
+            write_task(tasks_dir, number, f"Task {number}")
+
+        config = MonitoringConfig()
+        return TaskStateManager(StateStorage(tmp_path, config), config)
+
+    def test_unchanged_files_not_reparsed_or_saved(self, manager):
+        """Test that a second discovery neither parses nor writes."""
+        first = manager.discover_tasks(FEATURE_ID)
+        assert [t.id for t in first] == ["T001", "T002", "T003"]
+
+        with patch.object(manager, "_parse_task_file") as parse, \
+                patch.object(manager.storage, "save_tasks") as save:
+            second = manager.discover_tasks(FEATURE_ID)
+
+        assert second is first
+        parse.assert_not_called()
+        save.assert_not_called()
+
+    def test_only_changed_file_reparsed(self, manager):
+        """Test that a modified file is the only one parsed again."""
+        manager.discover_tasks(FEATURE_ID)
+        tasks_dir = manager.storage.project_path / ".specpulse" / "tasks" / FEATURE_ID
+        changed = write_task(tasks_dir, 2, "Renamed task two")
+        os.utime(changed, ns=(1, 1))
+
+        with patch.object(manager, "_parse_task_file", wraps=manager._parse_task_file) as parse:
+            tasks = manager.discover_tasks(FEATURE_ID)
+
+        assert [call.args[0] for call in parse.call_args_list] == [changed]
+        assert {t.id: t.title for t in tasks}["T002"] == "Renamed task two"
+
+    def test_storage_write_skipped_when_merge_unchanged(self, manager):
+        """Test that an external state change re-merges without rewriting."""
+        manager.discover_tasks(FEATURE_ID)
+        other = TaskStateManager(manager.storage, manager.config)
+        other.start_task(FEATURE_ID, "T001")
+
+        with patch.object(manager.storage, "save_tasks") as save:
+            tasks = manager.discover_tasks(FEATURE_ID)
+
+        save.assert_not_called()
+        assert {t.id: t.state for t in tasks}["T001"] == TaskState.IN_PROGRESS
+
+    def test_new_and_removed_files_detected(self, manager):
+        """Test that added files are discovered and removed ones drop from parse cache."""
+        manager.discover_tasks(FEATURE_ID)
+        tasks_dir = manager.storage.project_path / ".specpulse" / "tasks" / FEATURE_ID
+        write_task(tasks_dir, 4, "Task 4")
+        (tasks_dir / "task-001.md").unlink()
+
+        tasks = manager.discover_tasks(FEATURE_ID)
+
+        # T001 remains as a stored (archived) task
+        assert sorted(t.id for t in tasks) == ["T001", "T002", "T003", "T004"]
+        assert len(manager._parsed_files[FEATURE_ID]) == 3
@@ -0,0 +1,156 @@
+"""
+History Log Tests for Monitor
+
+Unit tests for the append-only task history log, its per-feature offset
+index, compaction, legacy migration and StateStorage integration.
+"""
+
+import json
+import pytest
+from pathlib import Path
+from datetime import datetime, timedelta
+
+from specpulse.monitor.history_log import HistoryLog
+from specpulse.monitor.storage import StateStorage
+from specpulse.monitor.models import TaskHistory, MonitoringConfig, TaskState
+
+
+def make_entry(task_id: str, age: timedelta = timedelta(0)) -> TaskHistory:
+    """Create a history entry `age` before now."""
+    return TaskHistory(
+        task_id=task_id,
+        timestamp=datetime.now() - age,
+        old_state=TaskState.PENDING,
+        new_state=TaskState.IN_PROGRESS,
+    )
+
+
+class TestHistoryLog:
+    """Test suite for HistoryLog."""
+
+    @pytest.fixture
+    def log(self, tmp_path):
+        """Create a HistoryLog in a temporary directory."""
+        return HistoryLog(tmp_path / "task-history.jsonl", tmp_path / "history" / "index.json")
+
+    def test_append_is_one_line_per_entry(self, log):
+        """Test that appending never rewrites existing lines."""
+        log.append([make_entry("T001").to_dict()], "001-a")
+        first = log.log_path.read_bytes()
+        log.append([make_entry("T002").to_dict()], "002-b")
+
+        content = log.log_path.read_bytes()
+        assert content.startswith(first)
+        assert content.count(b"\n") == 2
+
+    def test_read_last_k_per_feature(self, log):
+        """Test per-feature reads return only that feature's last k entries."""
+        for i in range(10):
+            log.append([make_entry(f"T{i:03d}").to_dict()], "001-a" if i % 2 else "002-b")
+
+        entries = log.read("001-a", limit=2)
+        assert [e["task_id"] for e in entries] == ["T007", "T009"]
+        assert len(log.read("002-b")) == 5
+        assert log.read("003-missing") == []
+
+    def test_index_catches_up_with_other_writers(self, log, tmp_path):
+        """Test that entries appended by another instance are picked up."""
+        log.append([make_entry("T001").to_dict()], "001-a")
+        log._save_index()
+
+        other = HistoryLog(log.log_path, log.index_path)
+        other.append([make_entry("T002").to_dict()], "001-a")
+
+        assert [e["task_id"] for e in log.read("001-a")] == ["T001", "T002"]
+
+    def test_torn_tail_is_skipped(self, log):
+        """Test that a partial last line does not corrupt later appends."""
+        log.append([make_entry("T001").to_dict()], "001-a")
+        with open(log.log_path, "ab") as f:
+            f.write(b'{"task_id": "T0')
+
+        fresh = HistoryLog(log.log_path, log.index_path)
+        fresh.append([make_entry("T002").to_dict()], "001-a")
+
+        assert [e["task_id"] for e in fresh.read("001-a")] == ["T001", "T002"]
+        assert fresh.verify() == ["line 2: invalid JSON entry"]
+
+    def test_compact_drops_expired_and_rebuilds_index(self, log):
+        """Test compaction removes old entries and keeps offsets valid."""
+        log.append([make_entry("T001", timedelta(days=40)).to_dict()], "001-a")
+        log.append([make_entry("T002").to_dict()], "001-a")
+
+        removed = log.compact(datetime.now() - timedelta(days=30))
+
+        assert removed == 1
+        assert [e["task_id"] for e in log.read("001-a")] == ["T002"]
+        assert not log.compaction_due(timedelta(days=1))
+
+        other = HistoryLog(log.log_path, log.index_path)
+        assert [e["task_id"] for e in other.read("001-a")] == ["T002"]
+
+    def test_unattributed_indexed_by_task_prefix(self, log):
+        """Test that unattributed reads only touch entries of the matching prefix."""
+        log.append([make_entry(f"002-T{i}").to_dict() for i in range(50)])
+        log.append([make_entry("001-T1").to_dict()])
+
+        assert [e["task_id"] for e in log.read_unattributed("001")] == ["001-T1"]
+        assert len(log._index["unattributed"]["002"]) == 50
+
+        # A rebuilt index keeps the same grouping
+        log.index_path.unlink(missing_ok=True)
+        fresh = HistoryLog(log.log_path, log.index_path)
+        assert [e["task_id"] for e in fresh.read_unattributed("001")] == ["001-T1"]
+        assert len(fresh.read(None)) == 51
+
+
+class TestStorageHistory:
+    """StateStorage history operations backed by the log."""
+
+    @pytest.fixture
+    def storage(self, tmp_path):
+        """Create StateStorage instance for testing."""
+        (tmp_path / ".specpulse" / "memory").mkdir(parents=True)
+        return StateStorage(tmp_path, MonitoringConfig())
+
+    def test_save_and_load_newest_first(self, storage):
+        """Test history round trip ordered newest first."""
+        storage.save_history_entry(make_entry("T001", timedelta(hours=2)), "001-feature")
+        storage.save_history_entry(make_entry("T002", timedelta(hours=1)), "001-feature")
+        storage.save_history_entry(make_entry("T003"), "002-other")
+
+        history = storage.load_history("001-feature")
+        assert [h.task_id for h in history] == ["T002", "T001"]
+        assert [h.task_id for h in storage.load_history("001-feature", limit=1)] == ["T002"]
+
+    def test_retention_applied_on_read_and_cleanup(self, storage):
+        """Test that expired entries are hidden and removed by cleanup."""
+        storage._history.compact(datetime.now())  # mark as recently compacted
+        storage.save_history_entry(make_entry("T001", timedelta(days=45)), "001-feature")
+        storage.save_history_entry(make_entry("T002"), "001-feature")
+
+        assert [h.task_id for h in storage.load_history("001-feature")] == ["T002"]
+        assert storage.cleanup_old_history() == 1
+
+    def test_legacy_history_migrated(self, tmp_path):
+        """Test that task-history.json entries are moved into the log."""
+        memory = tmp_path / ".specpulse" / "memory"
+        memory.mkdir(parents=True)
+        legacy = {"history": [make_entry("001-T1").to_dict()], "metadata": {}}
+        (memory / "task-history.json").write_text(json.dumps(legacy))
+
+        storage = StateStorage(tmp_path, MonitoringConfig())
+
+        assert not (memory / "task-history.json").exists()
+        assert (memory / "backups" / "task-history_legacy.json").exists()
+        assert [h.task_id for h in storage.load_history("001-feature")] == ["001-T1"]
+
+    def test_integrity_reports_corrupt_history(self, storage):
+        """Test that unparseable history lines are reported."""
+        storage.save_history_entry(make_entry("T001"), "001-feature")
+        with open(storage.history_file, "a", encoding="utf-8") as f:
+            f.write("not json\n")
+
+        report = storage.validate_data_integrity()
+        assert report["valid"] is False
+        assert any("task-history.jsonl" in issue for issue in report["issues"])
@@ -490,7 +490,6 @@ class TestMonitoringConfig:
         config = MonitoringConfig()
 
         assert config.auto_discovery is True
-        assert config.update_interval_seconds == 60
         assert config.history_retention_days == 30
         assert config.max_tasks_per_feature == 1000
         assert config.backup_enabled is True
@@ -502,7 +501,7 @@ class TestMonitoringConfig:
         """Test MonitoringConfig with custom values."""
         config = MonitoringConfig(
             auto_discovery=False,
-            update_interval_seconds=60,
+            backup_interval_seconds=10,
             history_retention_days=60,
             max_tasks_per_feature=500,
             backup_enabled=False,
@@ -512,7 +511,7 @@ class TestMonitoringConfig:
         )
 
         assert config.auto_discovery is False
-        assert config.update_interval_seconds == 60
+        assert config.backup_interval_seconds == 10
         assert config.history_retention_days == 60
         assert config.max_tasks_per_feature == 500
         assert config.backup_enabled is False
@@ -524,37 +523,44 @@ class TestMonitoringConfig:
         """Test MonitoringConfig serialization to dictionary."""
         config = MonitoringConfig(
             auto_discovery=False,
-            update_interval_seconds=45
+            cache_ttl_seconds=45
         )
 
         config_dict = config.to_dict()
 
         assert config_dict["auto_discovery"] is False
-        assert config_dict["update_interval_seconds"] == 45
+        assert config_dict["cache_ttl_seconds"] == 45
         assert "history_retention_days" in config_dict
 
     def test_monitoring_config_from_dict(self):
         """Test MonitoringConfig deserialization from dictionary."""
         config_dict = {
             "auto_discovery": False,
-            "update_interval_seconds": 45,
+            "cache_ttl_seconds": 45,
             "history_retention_days": 45
         }
 
         config = MonitoringConfig.from_dict(config_dict)
 
         assert config.auto_discovery is False
-        assert config.update_interval_seconds == 45
+        assert config.cache_ttl_seconds == 45
         assert config.history_retention_days == 45
 
+    def test_monitoring_config_from_dict_ignores_retired_options(self):
+        """Test that configs written by older versions still load."""
+        config = MonitoringConfig.from_dict({"auto_discovery": False, "update_interval_seconds": 60})
+
+        assert config.auto_discovery is False
+        assert "update_interval_seconds" not in config.to_dict()
+
     def test_monitoring_config_validation(self):
         """Test MonitoringConfig value validation."""
         # Test valid values
-        config = MonitoringConfig(update_interval_seconds=30)
-        assert config.update_interval_seconds == 30
+        config = MonitoringConfig(cache_ttl_seconds=30)
+        assert config.cache_ttl_seconds == 30
 
         # Test invalid values (should not raise errors but handle gracefully)
-        config = MonitoringConfig(update_interval_seconds=-1)
+        config = MonitoringConfig(cache_ttl_seconds=-1)
         # Implementation should handle negative values appropriately
 
 
@@ -520,5 +520,5 @@ class TestTaskMonitorIntegration:
         assert reloaded_config.max_tasks_per_feature == 500
 
         # Test configuration validation
-        assert reloaded_config.update_interval_seconds > 0
+        assert reloaded_config.cache_ttl_seconds > 0
         assert reloaded_config.max_backups > 0
\ No newline at end of file
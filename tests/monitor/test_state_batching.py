@@ -0,0 +1,135 @@
+"""
+Batched Update Tests for Monitor
+
+Unit tests for TaskStateManager.batch()/update_many() and the storage
+group-commit helpers.
+"""
+
+import pytest
+from pathlib import Path
+from datetime import datetime
+from unittest.mock import patch
+
+from specpulse.monitor.storage import StateStorage
+from specpulse.monitor.state_manager import TaskStateManager
+from specpulse.monitor.models import TaskInfo, TaskState, MonitoringConfig
+
+
+FEATURE_ID = "001-batch"
+
+
+class TestStateBatching:
+    """Test suite for batched state updates."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """State manager with ten stored pending tasks."""
+        (tmp_path / ".specpulse" / "memory").mkdir(parents=True)
+        config = MonitoringConfig(auto_discovery=False, backup_interval_seconds=0)
+        storage = StateStorage(tmp_path, config)
+        storage.save_tasks([
+            TaskInfo(id=f"T{i:03d}", title=f"Task {i}", state=TaskState.PENDING,
+                     last_updated=datetime.now())
+            for i in range(1, 11)
+        ], FEATURE_ID)
+        return TaskStateManager(storage, config)
+
+    def test_update_many_single_write(self, manager):
+        """Test that a batch writes the shard and history once."""
+        storage = manager.storage
+        updates = {f"T{i:03d}": TaskState.IN_PROGRESS for i in range(1, 11)}
+
+        with patch.object(storage, "_write_shard", wraps=storage._write_shard) as write_shard, \
+                patch.object(storage, "_backup_file", wraps=storage._backup_file) as backup, \
+                patch.object(storage, "save_history_entries",
+                             wraps=storage.save_history_entries) as save_history:
+            results = manager.update_many(FEATURE_ID, updates)
+
+        assert all(results.values())
+        assert write_shard.call_count == 1
+        assert backup.call_count == 1
+        assert save_history.call_count == 1
+        assert {t.state for t in storage.load_tasks(FEATURE_ID)} == {TaskState.IN_PROGRESS}
+        assert len(storage.load_history(FEATURE_ID)) == 10
+
+    def test_same_task_twice_in_batch(self, manager):
+        """Test that later transitions in a batch see earlier ones."""
+        with manager.batch():
+            assert manager.start_task(FEATURE_ID, "T001")
+            assert manager.update_task_state(FEATURE_ID, "T001", TaskState.COMPLETED)
+
+        assert manager.storage.load_tasks(FEATURE_ID)[0].state == TaskState.COMPLETED
+        history = manager.storage.load_history(FEATURE_ID)
+        assert [h.new_state for h in history if h.task_id == "T001"] == \
+            [TaskState.COMPLETED, TaskState.IN_PROGRESS]
+
+    def test_failed_batch_is_discarded(self, manager):
+        """Test that nothing is stored when the batch block raises."""
+        with pytest.raises(RuntimeError):
+            with manager.batch():
+                manager.start_task(FEATURE_ID, "T001")
+                raise RuntimeError("interrupted")
+
+        assert manager.storage.load_tasks(FEATURE_ID)[0].state == TaskState.PENDING
+        assert manager.storage.load_history(FEATURE_ID) == []
+        assert manager.get_task(FEATURE_ID, "T001").state == TaskState.PENDING
+
+    def test_backup_interval_limits_backups(self, manager):
+        """Test that unbatched saves back up at most once per window."""
+        storage = manager.storage
+        storage.config.backup_interval_seconds = 60
+
+        for task_id in ("T001", "T002", "T003"):
+            manager.start_task(FEATURE_ID, task_id)
+
+        assert len(list(storage.backup_dir.glob(f"task-states_{FEATURE_ID}_*.json"))) == 1
+
+    def test_task_file_rewritten_once_per_batch(self, manager):
+        """Test that tasks sharing a file cause one rewrite of it."""
+        tasks_dir = manager.storage.project_path / ".specpulse" / "tasks" / FEATURE_ID
+        tasks_dir.mkdir(parents=True)
+        task_file = tasks_dir / "tasks.md"
+        task_file.write_text(
+            "".join(f"### T{i:03d}: Task {i}\n- [ ] Task {i}\n\n" for i in range(1, 4)),
+            encoding="utf-8"
+        )
+
+        written = []
+        real_open = open
+
+        def tracking_open(file, mode="r", *args, **kwargs):
+            if "w" in mode and Path(file) == task_file:
+                written.append(file)
+            return real_open(file, mode, *args, **kwargs)
+
+        with patch("builtins.open", side_effect=tracking_open):
+            results = manager.update_many(FEATURE_ID, {
+                task_id: TaskState.IN_PROGRESS for task_id in ("T001", "T002", "T003")
+            })
+
+        assert all(results.values())
+        assert len(written) == 1
+        assert "in_progress" in task_file.read_text(encoding="utf-8")
+
+    def test_batch_excludes_other_threads(self, manager):
+        """Test that another thread's update waits instead of joining an open batch."""
+        import threading
+
+        started = threading.Event()
+
+        def other_thread():
+            started.set()
+            manager.start_task(FEATURE_ID, "T002")
+
+        with manager.batch() as journal:
+            manager.start_task(FEATURE_ID, "T001")
+            worker = threading.Thread(target=other_thread)
+            worker.start()
+            started.wait()
+            worker.join(timeout=0.2)
+            assert worker.is_alive()
+            assert set(journal.tasks[FEATURE_ID]) == {"T001"}
+
+        worker.join(timeout=5)
+        states = {t.id: t.state for t in manager.storage.load_tasks(FEATURE_ID)}
+        assert states["T001"] == states["T002"] == TaskState.IN_PROGRESS
@@ -0,0 +1,118 @@
+"""
+Sharded State Tests for Monitor
+
+Unit tests for per-feature task state shards, the feature manifest,
+legacy task-states.json migration and per-shard locking.
+"""
+
+import json
+import threading
+import pytest
+from pathlib import Path
+from datetime import datetime
+
+from specpulse.monitor.storage import StateStorage
+from specpulse.monitor.models import TaskInfo, TaskState, MonitoringConfig
+from specpulse.monitor.errors import StorageError
+
+
+def make_task(task_id: str, state: TaskState = TaskState.PENDING) -> TaskInfo:
+    """Create a task for testing."""
+    return TaskInfo(id=task_id, title=f"Task {task_id}", state=state, last_updated=datetime.now())
+
+
+class TestStateShards:
+    """Test suite for sharded task state."""
+
+    @pytest.fixture
+    def storage(self, tmp_path):
+        """Create StateStorage instance for testing."""
+        (tmp_path / ".specpulse" / "memory").mkdir(parents=True)
+        return StateStorage(tmp_path, MonitoringConfig())
+
+    def test_each_feature_has_its_own_shard(self, storage):
+        """Test that features are written to separate shard files."""
+        storage.save_tasks([make_task("T001")], "001-alpha")
+        storage.save_tasks([make_task("T001"), make_task("T002")], "002-beta")
+
+        alpha = storage.progress_dir / "001-alpha" / "task-states.json"
+        beta = storage.progress_dir / "002-beta" / "task-states.json"
+        assert list(json.loads(alpha.read_text())["tasks"]) == ["T001"]
+        assert list(json.loads(beta.read_text())["tasks"]) == ["T001", "T002"]
+        assert not storage.state_file.exists()
+
+    def test_save_task_state_touches_only_its_shard(self, storage):
+        """Test single task updates leave other features untouched."""
+        storage.save_tasks([make_task("T001")], "001-alpha")
+        storage.save_tasks([make_task("T001")], "002-beta")
+        beta = storage.progress_dir / "002-beta" / "task-states.json"
+        before = beta.stat().st_mtime_ns
+
+        storage.save_task_state(make_task("T001", TaskState.COMPLETED), "001-alpha")
+
+        assert storage.load_tasks("001-alpha")[0].state == TaskState.COMPLETED
+        assert beta.stat().st_mtime_ns == before
+
+    def test_manifest_lists_features(self, storage):
+        """Test that get_all_features reads the manifest."""
+        storage.save_tasks([make_task("T001")], "002-beta")
+        storage.save_tasks([make_task("T001")], "001-alpha")
+
+        assert storage.get_all_features() == ["001-alpha", "002-beta"]
+        manifest = json.loads(storage.manifest_file.read_text())
+        assert manifest["features"] == ["001-alpha", "002-beta"]
+
+    def test_manifest_rebuilt_from_shards(self, storage):
+        """Test that a lost manifest is rebuilt by listing shards."""
+        storage.save_tasks([make_task("T001")], "001-alpha")
+        storage.manifest_file.unlink()
+
+        assert storage.get_all_features() == ["001-alpha"]
+        assert storage.manifest_file.exists()
+
+    def test_reset_removes_shard_and_manifest_entry(self, storage):
+        """Test resetting a feature drops its shard."""
+        storage.save_tasks([make_task("T001")], "001-alpha")
+        storage.reset_feature_data("001-alpha")
+
+        assert storage.load_tasks("001-alpha") == []
+        assert storage.get_all_features() == []
+
+    def test_legacy_state_migrated(self, tmp_path):
+        """Test that a global task-states.json is split into shards."""
+        memory = tmp_path / ".specpulse" / "memory"
+        memory.mkdir(parents=True)
+        legacy = {
+            "tasks": {"001-alpha": {"T001": make_task("T001").to_dict()}},
+            "metadata": {},
+        }
+        (memory / "task-states.json").write_text(json.dumps(legacy))
+
+        storage = StateStorage(tmp_path, MonitoringConfig())
+
+        assert [t.id for t in storage.load_tasks("001-alpha")] == ["T001"]
+        assert storage.get_all_features() == ["001-alpha"]
+        assert (memory / "backups" / "task-states_legacy.json").exists()
+
+    @pytest.mark.parametrize("feature_id", ["", "..", "a/b"])
+    def test_invalid_feature_id_rejected(self, storage, feature_id):
+        """Test that feature IDs cannot escape the progress directory."""
+        with pytest.raises(StorageError):
+            storage.save_tasks([make_task("T001")], feature_id)
+
+    def test_concurrent_writes_to_one_feature(self, storage):
+        """Test that per-shard locking keeps concurrent updates to one feature."""
+        storage.save_tasks([], "001-alpha")
+
+        threads = [
+            threading.Thread(
+                target=storage.save_task_state, args=(make_task(f"T{i:03d}"), "001-alpha")
+            )
+            for i in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(storage.load_tasks("001-alpha")) == 10
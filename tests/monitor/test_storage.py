@@ -431,7 +431,7 @@ class TestStateStorage:
         """Test configuration saving."""
         config = MonitoringConfig(
             auto_discovery=False,
-            update_interval_seconds=60,
+            cache_ttl_seconds=60,
             history_retention_days=45
         )
 
@@ -447,14 +447,14 @@ class TestStateStorage:
             data = json.load(f)
 
         assert data["auto_discovery"] is False
-        assert data["update_interval_seconds"] == 60
+        assert data["cache_ttl_seconds"] == 60
         assert data["history_retention_days"] == 45
 
     def test_load_config(self, storage):
         """Test configuration loading."""
         config = MonitoringConfig(
             auto_discovery=False,
-            update_interval_seconds=60,
+            cache_ttl_seconds=60,
             history_retention_days=45
         )
 
@@ -465,7 +465,7 @@ class TestStateStorage:
         loaded_config = storage.load_config()
 
         assert loaded_config.auto_discovery is False
-        assert loaded_config.update_interval_seconds == 60
+        assert loaded_config.cache_ttl_seconds == 60
         assert loaded_config.history_retention_days == 45
 
     def test_load_config_default(self, storage):
@@ -474,7 +474,7 @@ class TestStateStorage:
 
         # Should return default config
         assert loaded_config.auto_discovery is True
-        assert loaded_config.update_interval_seconds == 30
+        assert loaded_config.cache_ttl_seconds == 300
         assert loaded_config.history_retention_days == 30
 
     def test_validate_data_integrity_valid(self, storage, sample_tasks):
@@ -676,8 +676,8 @@ class TestStateStorage:
         # Save initial data
         storage.save_tasks(sample_tasks, "001-test-feature")
 
-        # Corrupt the main file
-        with open(storage.state_file, 'w') as f:
+        # Corrupt the feature's state shard
+        with open(storage.progress_dir / "001-test-feature" / "task-states.json", 'w') as f:
             f.write("corrupted data")
 
         # Try to load data (should detect corruption)
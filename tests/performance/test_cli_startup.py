@@ -0,0 +1,121 @@
+"""
+CLI startup benchmarks
+
+Agents shell out to the CLI hundreds of times per session, so the fixed
+cost of starting it is budgeted here. Budgets can be tightened or relaxed
+per machine with SPECPULSE_STARTUP_BUDGET_MS (process startup) and
+SPECPULSE_HANDLER_BUDGET_MS (CommandHandler construction).
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from specpulse.cli.handlers.command_handler import CommandHandler
+from specpulse.cli.registry import command_registry
+
+
+STARTUP_BUDGET_MS = float(os.environ.get("SPECPULSE_STARTUP_BUDGET_MS", "150"))
+HANDLER_BUDGET_MS = float(os.environ.get("SPECPULSE_HANDLER_BUDGET_MS", "10"))
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def run_python(code: str, cwd: Path) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    return subprocess.run(
+        [sys.executable, "-c", code], cwd=cwd, env=env,
+        capture_output=True, text=True, timeout=60
+    )
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    """A directory detected as a SpecPulse project"""
+    for name in (".specpulse", ".specpulse/specs", ".specpulse/plans", ".specpulse/tasks",
+                 ".specpulse/memory", ".specpulse/templates"):
+        (tmp_path / name).mkdir(parents=True, exist_ok=True)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.performance
+class TestCLIStartup:
+    """Startup cost of the CLI and CommandHandler"""
+
+    def test_handler_construction_is_lazy(self, project_dir):
+        """Constructing the handler imports no command modules or core components"""
+        code = (
+            "import json, sys\n"
+            "from unittest.mock import patch\n"
+            "with patch('specpulse.cli.handlers.command_handler.should_check_version', return_value=False):\n"
+            "    from specpulse.cli.handlers.command_handler import CommandHandler\n"
+            "    handler = CommandHandler()\n"
+            "print(json.dumps({'modules': sorted(sys.modules), 'attrs': sorted(vars(handler))}))\n"
+        )
+        result = run_python(code, project_dir)
+        assert result.returncode == 0, result.stderr
+        data = json.loads(result.stdout.strip().splitlines()[-1])
+
+        commands = [m for m in data["modules"] if m.startswith("specpulse.cli.commands.")]
+        assert commands == []
+        assert "specpulse.cli.monitor" not in data["modules"]
+        assert not set(command_registry.list_components()) & set(data["attrs"])
+
+    def test_components_resolved_on_first_use(self, project_dir):
+        """Components are constructed once, on first attribute access"""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("specpulse.cli.handlers.command_handler.should_check_version", lambda: False)
+            handler = CommandHandler()
+
+        assert "validator" not in vars(handler)
+        validator = handler.validator
+        assert handler.validator is validator
+        assert type(handler.project_commands).__name__ == "ProjectCommands"
+
+    def test_components_none_outside_project(self, tmp_path, monkeypatch):
+        """Project-dependent components resolve to None outside a project"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("specpulse.cli.handlers.command_handler.should_check_version", lambda: False)
+        handler = CommandHandler()
+
+        assert handler.project_root is None
+        assert handler.sp_task_commands is None
+        assert handler.memory_manager is None
+
+    def test_handler_construction_budget(self, project_dir, monkeypatch):
+        """CommandHandler construction stays within its budget"""
+        monkeypatch.setattr("specpulse.cli.handlers.command_handler.should_check_version", lambda: False)
+        CommandHandler()  # warm up
+
+        runs = 20
+        start = time.perf_counter()
+        for _ in range(runs):
+            CommandHandler()
+        elapsed_ms = (time.perf_counter() - start) * 1000 / runs
+
+        assert elapsed_ms < HANDLER_BUDGET_MS, (
+            f"CommandHandler() took {elapsed_ms:.1f}ms (budget: {HANDLER_BUDGET_MS:.0f}ms)"
+        )
+
+    def test_cli_startup_budget(self, project_dir):
+        """`specpulse --version` starts within the startup budget"""
+        run_python("import specpulse", project_dir)  # warm the bytecode cache
+
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            result = run_python("import sys; sys.argv = ['specpulse', '--version']\n"
+                                "from specpulse.cli.main import main; main()", project_dir)
+            timings.append((time.perf_counter() - start) * 1000)
+            assert result.returncode == 0, result.stderr
+
+        best_ms = min(timings)
+        assert best_ms < STARTUP_BUDGET_MS, (
+            f"CLI startup took {best_ms:.0f}ms (budget: {STARTUP_BUDGET_MS:.0f}ms)"
+        )
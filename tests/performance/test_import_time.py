@@ -0,0 +1,83 @@
+"""
+Import-time regression tests
+
+`specpulse --help` must not pull heavy dependencies (rich, jinja2, yaml,
+git) or the command/core modules onto the startup path. The cumulative
+import budget can be adjusted with SPECPULSE_IMPORT_BUDGET_MS.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+
+IMPORT_BUDGET_MS = float(os.environ.get("SPECPULSE_IMPORT_BUDGET_MS", "150"))
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+HEAVY_MODULES = ("rich", "jinja2", "yaml", "git", "packaging")
+
+
+def run_python(args, cwd: Path, **env) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], cwd=cwd,
+        env=dict(os.environ, PYTHONPATH=str(REPO_ROOT), **env),
+        capture_output=True, text=True, timeout=60
+    )
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Map module name to cumulative import time (us) from -X importtime output"""
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+    return cumulative
+
+
+@pytest.mark.performance
+class TestImportTime:
+    """Modules loaded for `python -X importtime -m specpulse --help`"""
+
+    @pytest.fixture
+    def help_imports(self, tmp_path):
+        run_python(["-c", "import specpulse.cli.main"], tmp_path)  # warm the bytecode cache
+        result = run_python(["-X", "importtime", "-m", "specpulse", "--help"], tmp_path)
+        assert result.returncode == 0, result.stderr
+        return parse_importtime(result.stderr)
+
+    def test_help_skips_heavy_dependencies(self, help_imports):
+        loaded = [name for name in help_imports if name.split(".")[0] in HEAVY_MODULES]
+        assert loaded == []
+
+    def test_help_skips_commands_and_core(self, help_imports):
+        deferred = [
+            name for name in help_imports
+            if name.startswith(("specpulse.cli.commands", "specpulse.cli.handlers", "specpulse.core"))
+        ]
+        assert deferred == []
+
+    def test_help_import_budget(self, help_imports):
+        specpulse_us = sum(
+            cumulative for name, cumulative in help_imports.items()
+            if name in ("specpulse", "specpulse.cli.main", "specpulse.cli")
+        )
+        assert specpulse_us / 1000 < IMPORT_BUDGET_MS, (
+            f"specpulse imports took {specpulse_us / 1000:.1f}ms (budget: {IMPORT_BUDGET_MS:.0f}ms)"
+        )
+
+    def test_import_profile_report(self, tmp_path):
+        """SPECPULSE_IMPORT_PROFILE=1 prints a per-module cost table at exit"""
+        result = run_python(
+            ["-c", "import specpulse; import specpulse.core.memory_manager"], tmp_path,
+            SPECPULSE_IMPORT_PROFILE="1"
+        )
+        assert result.returncode == 0, result.stderr
+        assert "SpecPulse import profile (ms)" in result.stderr
+        assert "specpulse.core.memory_manager" in result.stderr
@@ -99,5 +99,35 @@ class TestProjectCommands:
         assert callable(commands.update)
 
 
+class TestValidateCommand:
+    """Test the top-level validate command"""
+
+    @pytest.mark.parametrize("component,validated,skipped", [
+        ("spec", "001-auth", "002-billing"),
+        ("plan", "002-billing", "001-auth"),
+    ])
+    def test_component_is_honoured(self, tmp_path, component, validated, skipped):
+        """Test that validate <component> only validates that kind of file"""
+        from specpulse.cli.parsers.subcommand_parsers import create_argument_parser
+        from specpulse.core.validator import Validator
+
+        (tmp_path / "specs" / "001-auth").mkdir(parents=True)
+        (tmp_path / "specs" / "001-auth" / "spec.md").write_text("# Auth\n")
+        (tmp_path / "plans" / "002-billing").mkdir(parents=True)
+        (tmp_path / "plans" / "002-billing" / "plan.md").write_text("# Billing\n")
+
+        handler = CommandHandler(no_color=True)
+        handler.project_root = tmp_path
+        handler.validator = Validator(tmp_path)
+
+        args = create_argument_parser().parse_args(["validate", component, "--no-cache"])
+        handler.execute_command(args.command, **vars(args))
+
+        messages = [result["message"] for result in handler.validator.results]
+        assert any(validated in message for message in messages)
+        assert not any(skipped in message for message in messages)
+        assert not any("constitution.md" in message for message in messages)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
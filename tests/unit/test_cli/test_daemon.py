@@ -0,0 +1,159 @@
+"""
+Tests for the warm daemon and its thin client
+"""
+
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from specpulse.cli import daemon
+from specpulse.cli.daemon_client import SOCKET_PATH, forward_to_daemon
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+pytestmark = pytest.mark.skipif(not daemon.is_supported(), reason="requires Unix domain sockets")
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    """A SpecPulse project directory with PYTHONPATH set for child processes"""
+    for name in ("specs", "plans", "tasks", "memory", "templates"):
+        (tmp_path / ".specpulse" / name).mkdir(parents=True, exist_ok=True)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PYTHONPATH", str(REPO_ROOT))
+    monkeypatch.delenv("SPECPULSE_NO_DAEMON", raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def running_daemon(project_dir):
+    status = daemon.start_daemon(project_dir, idle_timeout=60)
+    assert status is not None, "daemon did not start"
+    yield status
+    daemon.stop_daemon(project_dir)
+
+
+def run_cli(*args, **env):
+    return subprocess.run(
+        [sys.executable, "-m", "specpulse", *args],
+        stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=60,
+        env=dict(os.environ, **env)
+    )
+
+
+class TestDaemonClient:
+    """forward_to_daemon decides when to run in-process"""
+
+    def test_no_socket_runs_in_process(self, project_dir):
+        assert forward_to_daemon(["--version"]) is None
+
+    def test_opt_out_env(self, project_dir, monkeypatch):
+        (project_dir / SOCKET_PATH).touch()
+        monkeypatch.setenv("SPECPULSE_NO_DAEMON", "1")
+        assert forward_to_daemon(["--version"]) is None
+
+    def test_stale_socket_falls_back(self, project_dir):
+        (project_dir / SOCKET_PATH).touch()
+        with patch("sys.stdin.isatty", return_value=False):
+            assert forward_to_daemon(["--version"]) is None
+
+    def test_daemon_commands_run_locally(self, project_dir):
+        (project_dir / SOCKET_PATH).touch()
+        with patch("socket.socket") as mock_socket:
+            assert forward_to_daemon(["--no-color", "daemon", "stop"]) is None
+        mock_socket.assert_not_called()
+
+
+class TestDaemonServer:
+    """Commands forwarded to a running daemon"""
+
+    def test_status_and_stop(self, project_dir, running_daemon):
+        status = daemon.daemon_status(project_dir)
+        assert status["pid"] == running_daemon["pid"]
+        assert Path(status["project_root"]) == project_dir.resolve()
+        assert (project_dir / SOCKET_PATH).exists()
+
+        assert daemon.stop_daemon(project_dir) is True
+        deadline = time.monotonic() + 5
+        while (project_dir / SOCKET_PATH).exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not (project_dir / SOCKET_PATH).exists()
+        assert daemon.daemon_status(project_dir) is None
+
+    def test_forwarded_output_matches_in_process(self, project_dir, running_daemon):
+        forwarded = run_cli("--no-color", "sp-task", "list")
+        local = run_cli("--no-color", "sp-task", "list", SPECPULSE_NO_DAEMON="1")
+
+        assert forwarded.returncode == local.returncode
+        assert forwarded.stdout == local.stdout
+        assert daemon.daemon_status(project_dir)["commands_served"] == 1
+
+    def test_exit_codes_are_forwarded(self, project_dir, running_daemon):
+        result = run_cli("no-such-command")
+
+        assert result.returncode == 2
+        assert "invalid choice" in result.stderr
+        assert daemon.daemon_status(project_dir)["commands_served"] == 1
+
+    def test_dead_daemon_falls_back(self, project_dir, running_daemon):
+        os.kill(running_daemon["pid"], signal.SIGKILL)
+        time.sleep(0.2)
+        assert (project_dir / SOCKET_PATH).exists()
+
+        result = run_cli("--version")
+        assert result.returncode == 0
+        assert "SpecPulse" in result.stdout or result.stdout.strip()
+
+
+class TestDaemonProjectState:
+    """Warm handlers follow state written by in-process runs"""
+
+    def request(self, server, *argv):
+        ours, theirs = socket.socketpair()
+        with ours, theirs:
+            return server.run_command(ours, list(argv))
+
+    def test_state_changed_between_requests(self, project_dir):
+        from specpulse.core.memory_manager import MemoryManager
+        from specpulse.utils.universal_id_generator import UniversalIDGenerator, IDType
+
+        server = daemon.DaemonServer(project_dir, idle_timeout=None)
+        warm_ids = UniversalIDGenerator(project_dir)
+        server.warm()
+        args = Namespace(no_color=False, verbose=False)
+        handler = server.handler_for(args)
+
+        # The daemon's own state is not a reason to rebuild
+        self.request(server, "--version")
+        assert server.handler_for(args) is handler
+
+        # An in-process run updates the memory index and hands out an ID
+        MemoryManager(project_dir).update_context("Billing", "001", "spec_created", category="spec")
+        assert UniversalIDGenerator(project_dir).get_next_id(IDType.DECISION) == "DEC-001"
+
+        self.request(server, "--version")
+        memory = server.handler_for(args).memory_manager
+        assert memory is not handler.memory_manager
+        assert [e["feature_name"] for e in memory.memory_index["context_entries"]] == ["Billing"]
+        assert warm_ids.get_next_id(IDType.DECISION) == "DEC-002"
+
+    def test_failing_command_reports_error_and_keeps_serving(self, project_dir):
+        server = daemon.DaemonServer(project_dir, idle_timeout=None)
+        ours, theirs = socket.socketpair()
+        with theirs, patch("specpulse.cli.main.main", side_effect=RuntimeError("boom")):
+            theirs.sendall(json.dumps({"argv": ["--version"], "version": server.version}).encode() + b"\n")
+            server.handle_connection(ours)
+            responses = [json.loads(line) for line in theirs.makefile("r").read().splitlines()]
+
+        assert "boom" in responses[0]["stderr"]
+        assert responses[-1] == {"exit": 1}
@@ -0,0 +1,123 @@
+"""
+Tests for sp-task status transitions, listing and progress
+"""
+
+import stat
+from unittest.mock import MagicMock
+
+import pytest
+
+from specpulse.cli.commands.sp_task_commands import SpTaskCommands
+from specpulse.core.project_session import clear_project_sessions
+
+
+def task_file(task_id: str, status: str = "pending") -> str:
+    return f"""# Task Breakdown
+
+<!-- SPECPULSE_METADATA
+TASK_ID: {task_id}
+STATUS: {status}
+PROGRESS: 0
+-->
+
+### Task: Example
+- **Status**: {status}
+- Notes: STATUS: pending is the initial state
+"""
+
+
+@pytest.fixture
+def commands(tmp_path):
+    clear_project_sessions()
+    for name in ("specs", "plans", "tasks"):
+        (tmp_path / name / "001-auth").mkdir(parents=True)
+    (tmp_path / ".specpulse").mkdir()
+    for task_id in ("001", "002", "003"):
+        (tmp_path / "tasks" / "001-auth" / f"tasks-{task_id}.md").write_text(task_file(task_id))
+
+    commands = SpTaskCommands.__new__(SpTaskCommands)
+    commands.console = MagicMock()
+    commands.project_root = tmp_path
+    yield commands
+    clear_project_sessions()
+
+
+def listed(commands):
+    commands.console.info.reset_mock()
+    assert commands.list_tasks("001")
+    return [call.args[0] for call in commands.console.info.call_args_list]
+
+
+class TestTaskStatus:
+    def test_done_updates_metadata_only(self, commands, tmp_path):
+        assert commands.done("002", "001")
+
+        content = (tmp_path / "tasks" / "001-auth" / "tasks-002.md").read_text()
+        assert "STATUS: completed" in content
+        assert "PROGRESS: 100" in content
+        assert "**Completed**:" in content
+        assert "Notes: STATUS: pending is the initial state" in content
+
+    def test_rewrite_keeps_file_mode(self, commands, tmp_path):
+        task_path = tmp_path / "tasks" / "001-auth" / "tasks-001.md"
+        task_path.chmod(0o644)
+
+        assert commands.start("001", "001")
+        assert stat.S_IMODE(task_path.stat().st_mode) == 0o644
+
+    def test_list_reflects_transitions(self, commands):
+        assert any("tasks-001.md - Status: pending, Progress: 0%" in line for line in listed(commands))
+
+        commands.start("001", "001")
+        commands.done("003", "001")
+        lines = listed(commands)
+        assert any("tasks-001.md - Status: in_progress" in line for line in lines)
+        assert any("tasks-003.md - Status: completed, Progress: 100%" in line for line in lines)
+
+    def test_list_sees_external_edits(self, commands, tmp_path):
+        listed(commands)
+        (tmp_path / "tasks" / "001-auth" / "tasks-004.md").write_text(task_file("004", "blocked"))
+
+        assert any("tasks-004.md - Status: blocked" in line for line in listed(commands))
+
+    def test_progress_counts(self, commands):
+        assert commands.progress("001")
+        messages = [call.args[0] for call in commands.console.info.call_args_list]
+        assert "  Total Tasks: 3" in messages
+
+
+class TestBulkTransitions:
+    def test_done_many_accepts_t_prefix(self, commands, tmp_path, monkeypatch):
+        from specpulse.core.project_session import session_for
+        index = session_for(tmp_path).task_index
+        saves = []
+        original = index.save
+        monkeypatch.setattr(index, "save", lambda: saves.append(1) or original())
+
+        assert commands.done_tasks(["T001", "002"], "001")
+
+        task_dir = tmp_path / "tasks" / "001-auth"
+        assert "STATUS: completed" in (task_dir / "tasks-001.md").read_text()
+        assert "STATUS: completed" in (task_dir / "tasks-002.md").read_text()
+        assert "STATUS: pending" in (task_dir / "tasks-003.md").read_text()
+        assert saves == [1]
+        assert sorted(p.name for p in task_dir.iterdir()) == \
+            ["tasks-001.md", "tasks-002.md", "tasks-003.md"]
+
+    def test_missing_task_aborts_before_writing(self, commands, tmp_path):
+        before = (tmp_path / "tasks" / "001-auth" / "tasks-001.md").read_text()
+
+        assert not commands.done_tasks(["001", "009"], "001")
+        assert (tmp_path / "tasks" / "001-auth" / "tasks-001.md").read_text() == before
+
+    def test_all_tasks_skips_those_already_in_status(self, commands, tmp_path):
+        commands.start("002", "001")
+        task_path = tmp_path / "tasks" / "001-auth" / "tasks-002.md"
+        before = task_path.read_text()
+
+        assert commands.start_tasks([], "001", all_tasks=True)
+        assert task_path.read_text() == before
+        assert all("STATUS: in_progress" in path.read_text()
+                   for path in (tmp_path / "tasks" / "001-auth").glob("tasks-*.md"))
+
+        assert not commands.start_tasks([], "001", all_tasks=True)
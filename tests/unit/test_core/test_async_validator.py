@@ -0,0 +1,106 @@
+"""
+Tests for the parallel validation engine (AsyncValidator)
+
+Verifies:
+- Parallel results match sequential results exactly and in order
+- Thread and process pools
+- Plans and tasks are validated in parallel as well
+- File content cache is populated and invalidated by stat changes
+"""
+
+import pytest
+from pathlib import Path
+
+from specpulse.core.validator import Validator
+from specpulse.core.async_validator import AsyncValidator
+
+
+SPEC_CONTENT = """# Spec
+## Specification: {name}
+## Metadata
+## Functional Requirements
+## User Stories
+## Acceptance Criteria
+- [ ] Works
+needs clarification
+"""
+
+TASK_CONTENT = """# Tasks
+## Tasks
+### T001: First
+**Status**: [ ]
+### Bad header
+## Progress Tracking
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project with several specs, plans and task files"""
+    for dir_name in [".specpulse", "memory", "specs", "plans", "tasks", "templates", "scripts"]:
+        (tmp_path / dir_name).mkdir()
+
+    for i in range(1, 7):
+        feature = f"{i:03d}-feature"
+        (tmp_path / "specs" / feature).mkdir()
+        (tmp_path / "specs" / feature / "spec.md").write_text(SPEC_CONTENT.format(name=feature))
+        (tmp_path / "plans" / feature).mkdir()
+        (tmp_path / "plans" / feature / "plan.md").write_text(f"# Plan {feature}\n")
+        (tmp_path / "tasks" / feature).mkdir()
+        (tmp_path / "tasks" / feature / "tasks.md").write_text(TASK_CONTENT)
+
+    return tmp_path
+
+
+class TestAsyncValidator:
+    """Parallel engine tests"""
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_matches_sequential_results(self, project, executor):
+        """Test that parallel validation merges results deterministically"""
+        sequential = Validator().validate_all(project, use_cache=False)
+        parallel = AsyncValidator(max_workers=4, executor=executor).validate_all_parallel(
+            project, use_cache=False
+        )
+
+        assert parallel == sequential
+
+    def test_specs_parallel_does_not_share_state(self, project):
+        """Test that each spec contributes exactly its own results"""
+        validator = AsyncValidator(max_workers=4)
+        results = validator.validate_specs_parallel(project)
+
+        passed = [r for r in results if r["message"].endswith("Validation passed")]
+        assert len(passed) == 6
+        assert [r["message"].split(":")[0] for r in passed] == [
+            f"{i:03d}-feature" for i in range(1, 7)
+        ]
+
+    def test_plans_and_tasks_parallel(self, project):
+        """Test plan and task validation through the parallel engine"""
+        validator = AsyncValidator(max_workers=3)
+
+        plan_results = validator.validate_plans_parallel(project)
+        assert any("Missing required sections" in r["message"] for r in plan_results)
+
+        task_results = validator.validate_tasks_parallel(project)
+        assert len([r for r in task_results if "Invalid task format" in r["message"]]) == 6
+
+    def test_file_cache_populated_and_invalidated(self, project):
+        """Test the stat-keyed file content cache"""
+        validator = AsyncValidator(max_workers=2)
+        validator.validate_specs_parallel(project)
+
+        spec_path = project / "specs" / "001-feature" / "spec.md"
+        assert spec_path in validator._file_cache
+
+        spec_path.write_text("# Replaced content that is longer than before\n" * 3)
+        assert validator._read_file(spec_path).startswith("# Replaced")
+
+        validator.clear_cache()
+        assert validator._file_cache == {}
+
+    def test_invalid_executor(self):
+        """Test that unknown executor types are rejected"""
+        with pytest.raises(ValueError):
+            AsyncValidator(executor="fiber")
@@ -0,0 +1,132 @@
+"""
+Tests for the append-only event log and its use by the task managers
+"""
+
+import json
+import threading
+
+import pytest
+
+from specpulse.core.event_log import EventLog
+from specpulse.core.llm_task_lifecycle_manager import LLMTaskLifecycleManager, LifecycleEvent
+from specpulse.core.llm_task_status_manager import LLMTaskStatusManager, LLMOperationType
+
+
+def count_events(state, record):
+    state["total"] += 1
+
+
+def open_log(path):
+    return EventLog(path, "task_id", initial_state=lambda: {"total": 0}, reducer=count_events)
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return tmp_path / "events.jsonl"
+
+
+class TestEventLog:
+    def test_records_indexed_by_key(self, log_path):
+        log = open_log(log_path)
+        for i in range(3):
+            log.append({"task_id": "T1", "n": i})
+            log.append({"task_id": "T2", "n": i})
+
+        assert [r["n"] for r in log.records("T1")] == [0, 1, 2]
+        assert [r["n"] for r in log.records("T2", limit=2)] == [1, 2]
+        assert log.state() == {"total": 6}
+        assert len(log_path.read_text().splitlines()) == 6
+
+    def test_other_writers_are_picked_up(self, log_path):
+        first, second = open_log(log_path), open_log(log_path)
+        first.append({"task_id": "T1"})
+        second.append({"task_id": "T1"})
+
+        assert first.state() == {"total": 2}
+        assert len(first.records("T1")) == 2
+
+    def test_snapshot_covers_log_prefix(self, log_path, monkeypatch):
+        monkeypatch.setattr(EventLog, "SNAPSHOT_INTERVAL", 3)
+        log = open_log(log_path)
+        for i in range(4):
+            log.append({"task_id": "T1", "n": i})
+
+        snapshot = json.loads(log.snapshot_path.read_text())
+        assert snapshot["state"] == {"total": 3}
+
+        reopened = open_log(log_path)
+        assert reopened.state() == {"total": 4}
+        assert [r["n"] for r in reopened.records("T1")] == [0, 1, 2, 3]
+
+    def test_concurrent_writers_lose_nothing(self, log_path):
+        def write(worker):
+            log = open_log(log_path)
+            for i in range(50):
+                log.append({"task_id": f"T{worker}", "n": i})
+
+        threads = [threading.Thread(target=write, args=(w,)) for w in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        log = open_log(log_path)
+        assert log.state() == {"total": 200}
+        assert all(len(log.records(f"T{w}")) == 50 for w in range(4))
+
+    def test_torn_line_is_skipped(self, log_path):
+        log = open_log(log_path)
+        log.append({"task_id": "T1"})
+        with open(log_path, "a") as f:
+            f.write('{"task_id": "T1", "tor')
+
+        log.append({"task_id": "T1", "n": 2})
+
+        assert [r.get("n") for r in open_log(log_path).records("T1")] == [None, 2]
+
+    def test_legacy_document_imported_once(self, log_path, tmp_path):
+        legacy = tmp_path / "events.json"
+        legacy.write_text(json.dumps({"events": [{"task_id": "T1"}, {"task_id": "T2"}]}))
+
+        open_log(log_path).import_legacy(legacy, "events")
+        open_log(log_path).import_legacy(legacy, "events")
+
+        assert open_log(log_path).state() == {"total": 2}
+
+
+class TestManagerLogs:
+    def test_session_updates_are_appended(self, tmp_path):
+        manager = LLMTaskStatusManager(tmp_path)
+        context_file = manager.path_manager.memory_dir / "context.md"
+
+        assert manager.start_llm_session("s1", LLMOperationType.MEMORY_UPDATE, task_id="001-T1")
+        assert manager.get_active_sessions() == ["s1"]
+        manager.track_file_operation(context_file, "modified")
+        manager.track_file_operation(context_file, "modified")
+        assert manager.end_llm_session(True)
+
+        operation = manager._load_operation("s1")
+        assert operation["files_modified"] == [str(context_file)]
+        assert operation["status_after"] == "in_progress"
+        assert operation["end_time"] is not None
+        assert manager.get_active_sessions() == []
+
+    def test_violations_update_compliance_score(self, tmp_path):
+        manager = LLMTaskStatusManager(tmp_path)
+        assert manager.get_compliance_score() == 1.0
+
+        manager.track_file_operation(tmp_path / "x.md", "created")  # No session
+
+        assert manager.compliance_log.state()["total_violations"] == 1
+        assert manager.get_compliance_score() == 0.0
+
+    def test_lifecycle_events_per_task(self, tmp_path):
+        manager = LLMTaskLifecycleManager(tmp_path)
+        manager.record_lifecycle_event("001-T1", LifecycleEvent.CREATED)
+        manager.record_lifecycle_event("001-T2", LifecycleEvent.CREATED)
+
+        # CREATED with no dependencies auto-starts the task
+        events = [event["event"] for event in manager.event_log.records("001-T1")]
+        assert events == ["created", "started"]
+        assert manager.get_task_lifecycle_status("001-T1")["total_events"] == 2
+        assert manager.get_lifecycle_summary()["total_events"] == 4
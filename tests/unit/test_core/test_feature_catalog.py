@@ -0,0 +1,97 @@
+"""
+Tests for the persisted feature catalog
+"""
+
+import pytest
+
+from specpulse.core.feature_catalog import FeatureCatalog, artifact_files
+
+
+@pytest.fixture
+def base(tmp_path):
+    base = tmp_path / ".specpulse"
+    for kind in ("specs", "plans", "tasks"):
+        (base / kind / "001-auth").mkdir(parents=True)
+    (base / "specs" / "001-auth" / "spec-001.md").write_text("# Spec")
+    (base / "plans" / "001-auth" / "plan-001.md").write_text("# Plan")
+    (base / "specs" / "002-payments").mkdir()
+    return base
+
+
+def make_catalog(base):
+    return FeatureCatalog(base, base / "cache" / "features.json")
+
+
+def count_scans(catalog, monkeypatch):
+    scans = []
+    original = catalog._scan_kind
+
+    def scan(feature_dir, kind):
+        scans.append((feature_dir, kind))
+        return original(feature_dir, kind)
+
+    monkeypatch.setattr(catalog, "_scan_kind", scan)
+    return scans
+
+
+class TestFeatureCatalog:
+    def test_refresh_lists_features_and_artifacts(self, base):
+        entries = make_catalog(base).refresh()
+
+        assert list(entries) == ["001-auth", "002-payments"]
+        assert entries["001-auth"]["id"] == "001"
+        assert entries["001-auth"]["name"] == "auth"
+        assert artifact_files(entries["001-auth"], "specs") == ["spec-001.md"]
+        assert artifact_files(entries["002-payments"], "plans") == []
+
+    def test_unchanged_directories_are_not_rescanned(self, base, monkeypatch):
+        make_catalog(base).refresh()
+
+        catalog = make_catalog(base)
+        scans = count_scans(catalog, monkeypatch)
+        catalog.refresh()
+        assert scans == []
+
+        (base / "tasks" / "001-auth" / "tasks-001.md").write_text("# Tasks")
+        entries = catalog.refresh()
+        assert scans == [("001-auth", "tasks")]
+        assert artifact_files(entries["001-auth"], "tasks") == ["tasks-001.md"]
+
+    def test_features_added_and_removed_on_disk(self, base):
+        catalog = make_catalog(base)
+        catalog.refresh()
+
+        (base / "specs" / "002-payments").rmdir()
+        (base / "specs" / "003-search").mkdir()
+        assert list(catalog.refresh()) == ["001-auth", "003-search"]
+
+    def test_find_by_id_and_name(self, base):
+        catalog = make_catalog(base)
+
+        assert catalog.find("001") == "001-auth"
+        assert catalog.find("PAY") == "002-payments"
+        assert catalog.find("billing") is None
+
+    def test_record_and_remove(self, base):
+        catalog = make_catalog(base)
+        catalog.refresh()
+
+        (base / "specs" / "003-search").mkdir()
+        catalog.record("003-search")
+        assert "003-search" in make_catalog(base).refresh()
+
+        catalog.remove("002-payments")
+        assert "002-payments" not in make_catalog(base)._load()
+
+    def test_get_checks_single_feature(self, base):
+        catalog = make_catalog(base)
+        assert artifact_files(catalog.get("001-auth"), "plans", "plan-*.md") == ["plan-001.md"]
+        assert artifact_files(catalog.get("009-missing"), "specs") == []
+        assert "009-missing" not in catalog.refresh()
+
+    def test_not_persisted_without_specpulse_dir(self, tmp_path):
+        (tmp_path / "specs" / "001-auth").mkdir(parents=True)
+        catalog = FeatureCatalog(tmp_path, tmp_path / ".specpulse" / "cache" / "features-root.json")
+
+        assert list(catalog.refresh()) == ["001-auth"]
+        assert not (tmp_path / ".specpulse").exists()
@@ -0,0 +1,76 @@
+"""
+Tests for per-task event summaries and the periodic lifecycle sweep
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from specpulse.core.llm_task_lifecycle_manager import LLMTaskLifecycleManager, LifecycleEvent
+from specpulse.core.llm_task_status_manager import TaskStatus
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return LLMTaskLifecycleManager(tmp_path)
+
+
+def start(manager, task_id):
+    manager.status_manager.update_task_status(task_id, TaskStatus.IN_PROGRESS)
+    manager.record_lifecycle_event(task_id, LifecycleEvent.IN_PROGRESS)
+
+
+def complete(manager, task_id):
+    manager.status_manager.update_task_status(task_id, TaskStatus.COMPLETED)
+    manager.record_lifecycle_event(task_id, LifecycleEvent.COMPLETED)
+
+
+class TestTaskEventSummary:
+    def test_summary_tracks_last_events(self, manager):
+        start(manager, "001-T1")
+        complete(manager, "001-T1")
+
+        summary = manager.get_task_event_summary("001-T1")
+        assert summary["event_count"] == 2
+        assert summary["last_in_progress"] <= summary["last_completed"]
+        assert manager.get_task_event_summary("001-T9")["event_count"] == 0
+
+    def test_summary_rebuilt_from_older_snapshot(self, manager, tmp_path):
+        start(manager, "001-T1")
+        manager.event_log.snapshot()
+
+        # Snapshot written before summaries existed
+        snapshot = json.loads(manager.event_log.snapshot_path.read_text())
+        snapshot["state_version"] = 1
+        snapshot["state"] = {"total_events": 1}
+        manager.event_log.snapshot_path.write_text(json.dumps(snapshot))
+
+        reopened = LLMTaskLifecycleManager(tmp_path)
+        assert reopened.get_task_event_summary("001-T1")["event_count"] == 1
+
+
+class TestSweep:
+    def test_times_out_only_stale_in_progress_tasks(self, manager):
+        start(manager, "001-T1")
+        start(manager, "001-T2")
+        complete(manager, "001-T2")
+
+        assert manager.sweep()["timed_out"] == []
+
+        result = manager.sweep(now=datetime.now() + timedelta(hours=25))
+        assert result == {"timed_out": ["001-T1"], "cleaned_up": []}
+        assert manager.status_manager.get_task_status("001-T1") == TaskStatus.BLOCKED
+
+        # Already blocked: not timed out again
+        assert manager.sweep(now=datetime.now() + timedelta(hours=50))["timed_out"] == []
+
+    def test_cleanup_runs_when_enabled(self, manager):
+        start(manager, "001-T1")
+        complete(manager, "001-T1")
+        later = datetime.now() + timedelta(days=31)
+
+        assert manager.sweep(now=later)["cleaned_up"] == []
+
+        manager.lifecycle_rules["auto_cleanup"].is_enabled = True
+        assert manager.sweep(now=later)["cleaned_up"] == ["001-T1"]
@@ -0,0 +1,77 @@
+"""
+Tests for in-process and isolated command execution of the LLM CLI interface
+"""
+
+from pathlib import Path
+
+import pytest
+
+from specpulse.core.llm_cli_interface import LLMCLIInterface
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    """A SpecPulse project directory with PYTHONPATH set for child processes"""
+    for name in ("specs", "plans", "tasks", "memory", "templates"):
+        (tmp_path / ".specpulse" / name).mkdir(parents=True, exist_ok=True)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PYTHONPATH", str(REPO_ROOT))
+    monkeypatch.setenv("SPECPULSE_NO_DAEMON", "1")
+    return tmp_path
+
+
+@pytest.fixture
+def cli(project_dir):
+    return LLMCLIInterface(project_dir)
+
+
+class TestInProcessExecution:
+    def test_output_and_touched_files(self, cli, project_dir, monkeypatch):
+        monkeypatch.chdir(project_dir.parent)
+
+        result = cli.execute_command("feature", ["init", "user-auth"])
+
+        assert result.return_code == 0
+        assert not result.isolated
+        assert "user-auth" in result.stdout
+        assert "\x1b[" not in result.stdout
+        assert result.files_created == [".specpulse/memory/context.md"]
+        assert result.files_affected == [".specpulse/memory/context.md"]
+        assert Path.cwd() == project_dir.parent
+
+    def test_exit_code_of_rejected_arguments(self, cli):
+        result = cli.execute_command("spec", ["list"])
+
+        assert result.return_code == 2
+        assert "invalid choice" in result.stderr
+        assert not result.success
+
+    def test_handler_kept_warm_until_state_changes(self, cli, project_dir):
+        cli.execute_command("feature", ["init", "first"])
+        handler = cli._handlers[False]
+
+        cli.execute_command("feature", ["init", "second"])
+        assert cli._handlers[False] is handler
+
+        (project_dir / ".specpulse" / "id_registry.json").write_text("{}")
+        cli.execute_command("feature", ["init", "third"])
+        assert cli._handlers[False] is not handler
+
+    def test_diff_files(self):
+        before = {"a": (1, 1, 1, 1), "b": (1, 1, 2, 1), "c": (1, 1, 3, 1)}
+        after = {"a": (1, 1, 1, 1), "b": (2, 5, 2, 1), "d": (1, 1, 4, 1)}
+
+        assert LLMCLIInterface._diff_files(before, after) == (["d"], ["b"], ["c"])
+
+
+class TestIsolatedExecution:
+    def test_matches_in_process(self, cli):
+        in_process = cli.execute_command("feature", ["init", "billing"])
+        isolated = cli.execute_command("feature", ["init", "payments"], isolated=True)
+
+        assert isolated.isolated
+        assert isolated.return_code == in_process.return_code == 0
+        assert isolated.files_affected == in_process.files_affected
@@ -0,0 +1,143 @@
+"""
+Tests for the memory search index
+"""
+
+import json
+import pytest
+from datetime import datetime, timedelta
+
+from specpulse.core.memory_manager import MemoryManager, DecisionRecord
+from specpulse.core.memory_search import MemorySearchIndex, tokenize
+
+
+def make_decision(decision_id: str, title: str) -> DecisionRecord:
+    return DecisionRecord(
+        id=decision_id, title=title, status="accepted",
+        date=datetime.now().isoformat(), author="team",
+        rationale=f"Rationale for {title}", alternatives_considered=[],
+        consequences=[], related_decisions=[], tags=[]
+    )
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = MemoryManager(tmp_path)
+    manager.update_context("User Authentication", "001", "spec_created",
+                           {"ai_assistant": "claude"}, category="spec")
+    manager.update_context("Payment Gateway", "002", "plan_created",
+                           {"provider": "stripe"}, category="plan")
+    manager.update_context("Authorization Rules", "003", "spec_created",
+                           {"note": "authentication roles"}, category="spec")
+    return manager
+
+
+def context_features(results):
+    return [r["data"].get("feature_name") for r in results if r["type"] == "context"]
+
+
+class TestTokenize:
+    def test_keys_values_and_underscore_parts(self):
+        tokens = set(tokenize({"ai_assistant": ["Claude", {"Mode": 2}]}))
+        assert {"ai_assistant", "ai", "assistant", "claude", "mode", "2"} <= tokens
+
+
+class TestMemorySearch:
+    def test_terms_are_anded(self, manager):
+        results = manager.search_memory("authentication roles")
+        assert context_features(results) == ["Authorization Rules"]
+
+    def test_or_groups(self, manager):
+        results = manager.search_memory("stripe OR claude")
+        assert set(context_features(results)) == {"Payment Gateway", "User Authentication"}
+
+    def test_match_any(self, manager):
+        results = manager.search_memory("stripe claude", match_all=False)
+        assert set(context_features(results)) == {"Payment Gateway", "User Authentication"}
+
+    def test_prefix_matching(self, manager):
+        assert set(context_features(manager.search_memory("auth"))) == {
+            "User Authentication", "Authorization Rules"
+        }
+        assert context_features(manager.search_memory("auth", prefix=False)) == []
+        assert len(context_features(manager.search_memory("auth*", prefix=False))) == 2
+
+    def test_exact_match_ranks_before_prefix_match(self, manager):
+        results = [r for r in manager.search_memory("authentication") if r["type"] == "context"]
+        assert [r["data"]["feature_name"] for r in results] == [
+            "User Authentication", "Authorization Rules"
+        ]
+        assert results[0]["score"] >= results[1]["score"] > 0
+
+    def test_category_and_date_filters(self, manager):
+        assert len(context_features(manager.search_memory("", category="spec"))) == 2
+
+        today = datetime.now()
+        in_range = (today - timedelta(days=1)).isoformat(), (today + timedelta(days=1)).isoformat()
+        out_of_range = (today - timedelta(days=10)).isoformat(), (today - timedelta(days=5)).isoformat()
+        assert len(context_features(manager.search_memory("", date_range=in_range))) == 3
+        assert manager.search_memory("", date_range=out_of_range) == []
+
+    def test_empty_query_returns_memory_order(self, manager):
+        manager.add_decision_record(make_decision("ADR-001", "Use PostgreSQL"))
+        types = [r["type"] for r in manager.search_memory("")]
+        assert types == ["context"] * 3 + ["decision"] + ["feature"] * 3
+
+    def test_decisions_and_features_indexed_incrementally(self, manager):
+        manager.add_decision_record(make_decision("ADR-001", "Use PostgreSQL"))
+        results = manager.search_memory("postgresql")
+        assert [(r["type"], r["id"]) for r in results] == [("decision", "ADR-001")]
+
+        manager.update_context("Payment Gateway", "002", "task_completed", {})
+        feature = [r for r in manager.search_memory("task_completed") if r["type"] == "feature"]
+        assert [r["id"] for r in feature] == ["002"]
+
+    def test_index_persisted_and_reused(self, manager, tmp_path):
+        assert manager.memory_search_index_path.exists()
+
+        reloaded = MemoryManager(tmp_path)
+        index = MemorySearchIndex(reloaded.memory_search_index_path)
+        assert index.load(reloaded.memory_index["last_updated"],
+                          len(reloaded.memory_index["context_entries"]))
+        assert len(context_features(reloaded.search_memory("stripe"))) == 1
+
+    def test_stale_index_is_rebuilt(self, manager, tmp_path):
+        # Another writer changed the memory index without updating the search index
+        data = json.loads(manager.memory_index_path.read_text())
+        data["context_entries"][1]["details"]["provider"] = "adyen"
+        data["last_updated"] = datetime.now().isoformat() + "x"
+        manager.memory_index_path.write_text(json.dumps(data))
+
+        reloaded = MemoryManager(tmp_path)
+        assert context_features(reloaded.search_memory("stripe")) == []
+        assert context_features(reloaded.search_memory("adyen")) == ["Payment Gateway"]
+
+    def test_cleanup_rebuilds_index(self, manager):
+        old = (datetime.now() - timedelta(days=200)).isoformat()
+        manager.memory_index["context_entries"][0]["timestamp"] = old
+
+        assert manager.cleanup_old_entries(days=90) >= 1
+        assert set(context_features(manager.search_memory("auth"))) == {"Authorization Rules"}
+
+    def test_updates_are_journaled_not_rewritten(self, manager, tmp_path):
+        snapshot = manager.memory_search_index_path.read_bytes()
+        manager.add_decision_record(make_decision("ADR-001", "Use PostgreSQL"))
+        manager.update_context("Payment Gateway", "002", "task_completed", {})
+
+        assert manager.memory_search_index_path.read_bytes() == snapshot
+        assert len(manager.memory_search_journal_path.read_text().splitlines()) == 5
+
+        reloaded = MemoryManager(tmp_path)
+        index = MemorySearchIndex(reloaded.memory_search_index_path)
+        assert index.load(reloaded.memory_index["last_updated"],
+                          len(reloaded.memory_index["context_entries"]))
+        assert [r["id"] for r in reloaded.search_memory("postgresql")] == ["ADR-001"]
+
+    def test_long_journal_is_compacted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("specpulse.core.memory_search.JOURNAL_COMPACT_BATCHES", 2)
+        manager = MemoryManager(tmp_path)
+        for number in range(4):
+            manager.update_context(f"Feature {number}", f"00{number}", "spec_created", {})
+
+        assert len(manager.memory_search_journal_path.read_text().splitlines()) < 2
+        reloaded = MemoryManager(tmp_path)
+        assert len(context_features(reloaded.search_memory("spec_created"))) == 4
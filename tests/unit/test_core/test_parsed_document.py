@@ -0,0 +1,131 @@
+"""
+Tests for the shared pre-parsed document model used by validation rules
+
+Verifies:
+- Heading, list item and marker tokenization with line numbers
+- Section span lookup
+- Rules produce the same results with and without a shared document
+"""
+
+import pytest
+from pathlib import Path
+
+from specpulse.core.validation_rules import (
+    ParsedDocument,
+    ValidationRulesRegistry,
+    ClarificationMarkerRule,
+    TaskFormatRule,
+    AcceptanceCriteriaRule,
+)
+
+
+SPEC_CONTENT = """# Spec
+## User Stories
+**As a** user **I want** search **so that** I find things
+## Acceptance Criteria
+- [ ] Response should be fast
+- [x] Done item
+1. Numbered item
+[NEEDS CLARIFICATION]
+## Notes
+needs clarification on wording
+"""
+
+TASK_CONTENT = """# Tasks
+### T001: First
+**Status**: [ ]
+**Dependencies**: T002
+### Bad header
+### T002: Second
+"""
+
+
+class TestParsedDocument:
+    """Tokenization and lookup tests"""
+
+    def test_headings(self):
+        """Test heading levels, text and line numbers"""
+        document = ParsedDocument(SPEC_CONTENT)
+
+        assert [(h.level, h.text, h.line) for h in document.headings] == [
+            (1, "# Spec", 0),
+            (2, "## User Stories", 1),
+            (2, "## Acceptance Criteria", 3),
+            (2, "## Notes", 8),
+        ]
+
+    def test_list_items(self):
+        """Test bullets, checkbox state and line numbers"""
+        document = ParsedDocument(SPEC_CONTENT)
+
+        assert [(i.bullet, i.checkbox, i.line) for i in document.list_items] == [
+            ("-", " ", 4),
+            ("-", "x", 5),
+            ("1.", None, 6),
+        ]
+
+    def test_markers(self):
+        """Test bracketed and bare clarification markers"""
+        document = ParsedDocument(SPEC_CONTENT)
+
+        assert [(m.bracketed, m.line) for m in document.markers] == [(True, 7), (False, 9)]
+
+    def test_find_sections(self):
+        """Test section spans stop at the next level-2 heading"""
+        document = ParsedDocument(SPEC_CONTENT)
+        (start, end), = document.find_sections("## acceptance criteria")
+
+        section = SPEC_CONTENT[start:end]
+        assert section.startswith("## Acceptance Criteria")
+        assert "## Notes" not in section
+        assert len(list(document.iter_list_items(start, end))) == 3
+
+    def test_list_items_in_range_before_and_after_full_parse(self):
+        """Test range lookup agrees whether or not items were tokenized"""
+        document = ParsedDocument(SPEC_CONTENT)
+        (start, end), = document.find_sections("## Acceptance Criteria")
+
+        lazy = list(document.iter_list_items(start, end))
+        document.list_items
+        assert list(document.iter_list_items(start, end)) == lazy
+
+    def test_missing_section(self):
+        """Test that unknown sections yield no spans"""
+        assert ParsedDocument(SPEC_CONTENT).find_sections("## Missing") == []
+
+
+class TestSharedDocument:
+    """Rules must behave the same with or without a shared document"""
+
+    @pytest.mark.parametrize("rule,content", [
+        (ClarificationMarkerRule(), SPEC_CONTENT),
+        (AcceptanceCriteriaRule(), SPEC_CONTENT),
+        (TaskFormatRule(), TASK_CONTENT),
+    ])
+    def test_rule_results_identical(self, rule, content):
+        """Test rule output with a pre-built document"""
+        path = Path("spec.md")
+        standalone = rule.validate(content, path)
+        shared = rule.validate(content, path, ParsedDocument(content))
+
+        assert [(r.message, r.location, r.severity) for r in shared] == \
+            [(r.message, r.location, r.severity) for r in standalone]
+
+    def test_clarification_markers_reported_once(self):
+        """Test that each misformatted marker yields one result"""
+        content = "[NEEDS CLARIFICATION]\n[needs clarification]\nneeds clarification\n"
+        results = ClarificationMarkerRule().validate(content, Path("spec.md"))
+
+        invalid = [r.message for r in results if r.status == "invalid_clarification_format"]
+        assert invalid == [
+            "Invalid clarification format at position 22: [needs clarification]",
+            "Invalid clarification format at position 44: needs clarification",
+        ]
+        assert any(r.status == "clarifications_needed" for r in results)
+
+    def test_registry_validates_file(self):
+        """Test that the registry runs all rules over one parsed document"""
+        registry = ValidationRulesRegistry()
+        results = registry.validate_file(Path("tasks.md"), TASK_CONTENT)
+
+        assert any("Invalid task format" in r.message for r in results)
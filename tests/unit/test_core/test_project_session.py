@@ -0,0 +1,85 @@
+"""
+Tests for the per-process project session
+"""
+
+import pytest
+
+from specpulse.core.project_session import (
+    ProjectSession, get_project_session, clear_project_sessions, missing_project_dirs, session_for
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_sessions():
+    clear_project_sessions()
+    yield
+    clear_project_sessions()
+
+
+@pytest.fixture
+def project(tmp_path):
+    for name in ('specs', 'plans', 'tasks', 'memory', 'templates'):
+        (tmp_path / name).mkdir()
+    return tmp_path
+
+
+class TestProjectDiscovery:
+    def test_walks_up_from_subdirectory(self, project):
+        nested = project / "specs" / "001-auth"
+        nested.mkdir()
+
+        session = get_project_session(nested)
+        assert session is not None
+        assert session.root == project
+
+    def test_outside_project(self, tmp_path):
+        assert get_project_session(tmp_path) is None
+
+    def test_shared_per_root(self, project):
+        assert get_project_session(project) is get_project_session(project / "specs")
+        assert session_for(project) is get_project_session(project)
+
+    def test_missing_dirs_follow_structure_changes(self, project):
+        session = ProjectSession(project)
+        assert session.is_project
+
+        (project / "templates").rmdir()
+        assert session.missing_dirs == ["templates"]
+        assert missing_project_dirs(project) == ["templates"]
+
+    def test_new_structure(self, tmp_path):
+        for name in ('specs', 'plans', 'tasks', 'memory'):
+            (tmp_path / '.specpulse' / name).mkdir(parents=True)
+        assert missing_project_dirs(tmp_path) == ['.specpulse/templates']
+
+
+class TestCurrentFeature:
+    def test_feature_from_context(self, project):
+        (project / "specs" / "001-auth").mkdir()
+        (project / "specs" / "002-payments").mkdir()
+        context = project / "memory" / "context.md"
+        context.write_text("- Feature ID: 001\n", encoding="utf-8")
+
+        session = ProjectSession(project)
+        assert session.current_feature_dir(context, project / "specs").name == "001-auth"
+
+        # Rewrites are picked up without explicit invalidation
+        context.write_text("- Feature ID: 002 (switched)\n", encoding="utf-8")
+        assert session.current_feature_dir(context, project / "specs").name == "002-payments"
+
+    def test_falls_back_to_latest_feature(self, project):
+        session = ProjectSession(project)
+        context = project / "memory" / "context.md"
+        assert session.current_feature_dir(context, project / "specs") is None
+
+        (project / "specs" / "001-auth").mkdir()
+        (project / "specs" / "002-payments").mkdir()
+        assert session.current_feature_dir(context, project / "specs").name == "002-payments"
+
+    def test_explicit_name_and_partial_match(self, project):
+        (project / "specs" / "001-user-auth").mkdir()
+        session = ProjectSession(project)
+
+        assert session.find_feature_dir(project / "specs", "001").name == "001-user-auth"
+        assert session.find_feature_dir(project / "specs", "AUTH").name == "001-user-auth"
+        assert session.find_feature_dir(project / "specs", "billing") is None
@@ -0,0 +1,96 @@
+"""
+Tests for the task dependency graph and its use by the lifecycle manager
+"""
+
+import pytest
+
+from specpulse.core.llm_task_lifecycle_manager import LLMTaskLifecycleManager, LifecycleEvent
+from specpulse.core.llm_task_status_manager import TaskStatus
+from specpulse.core.task_graph import TaskGraph
+
+
+def edge(task_id, depends_on, dependency_type="completion"):
+    return {"task_id": task_id, "depends_on": depends_on,
+            "dependency_type": dependency_type, "description": ""}
+
+
+@pytest.fixture
+def graph():
+    # T1 -> T2 -> T4, T1 -> T3 -> T4, T3 -> T5
+    return TaskGraph.from_records([
+        edge("T2", "T1"), edge("T3", "T1"), edge("T4", "T2"), edge("T4", "T3"), edge("T5", "T3"),
+    ])
+
+
+class TestTaskGraph:
+    def test_adjacency(self, graph):
+        assert set(graph.prerequisites("T4")) == {"T2", "T3"}
+        assert graph.dependents("T3") == {"T4", "T5"}
+        assert graph.edge_count == 5
+
+    def test_cycles_are_rejected(self, graph):
+        assert graph.would_create_cycle("T1", "T4")
+        assert not graph.add(edge("T1", "T5"))
+        assert not graph.add(edge("T6", "T6"))
+        assert graph.add(edge("T5", "T2"))
+
+    def test_cyclic_records_skipped_on_load(self):
+        graph = TaskGraph.from_records([edge("B", "A"), edge("A", "B")])
+        assert graph.edge_count == 1
+
+    def test_transitive_dependents_nearest_first(self, graph):
+        assert graph.transitive_dependents("T1") == ["T2", "T3", "T4", "T5"]
+        assert graph.transitive_dependents("T4") == []
+
+    def test_topological_levels(self, graph):
+        assert graph.topological_levels() == [["T1"], ["T2", "T3"], ["T4", "T5"]]
+
+        graph.add(edge("T5", "T4"))
+        assert graph.topological_levels()[-1] == ["T5"]
+
+    def test_critical_path(self, graph):
+        assert graph.critical_path() == ["T1", "T2", "T4"]
+        assert graph.critical_path(durations={"T3": 5}) == ["T1", "T3", "T4"]
+        assert graph.critical_path(tasks=["T1", "T3", "T5"]) == ["T1", "T3", "T5"]
+
+    def test_to_dict(self, graph):
+        data = graph.to_dict()
+        assert data["prerequisites"]["T4"] == {"T2": "completion", "T3": "completion"}
+        assert data["dependents"]["T1"] == ["T2", "T3"]
+        assert data["levels"] == graph.topological_levels()
+
+
+class TestLifecycleDependencies:
+    @pytest.fixture
+    def manager(self, tmp_path):
+        manager = LLMTaskLifecycleManager(tmp_path)
+        manager.add_task_dependency("001-T2", "001-T1")
+        manager.add_task_dependency("001-T3", "001-T2")
+        return manager
+
+    def test_cycle_not_persisted(self, manager):
+        assert not manager.add_task_dependency("001-T1", "001-T3")
+        assert manager._load_dependencies()["dependency_graph"]["levels"] == \
+            [["001-T1"], ["001-T2"], ["001-T3"]]
+
+    def test_ready_tasks_follow_completion(self, manager):
+        assert manager.get_ready_tasks() == ["001-T1"]
+
+        manager.status_manager.update_task_status("001-T1", TaskStatus.IN_PROGRESS)
+        manager.status_manager.update_task_status("001-T1", TaskStatus.COMPLETED)
+        assert manager.get_ready_tasks(manager._dependency_graph().dependents("001-T1")) == ["001-T2"]
+
+    def test_graph_reloaded_after_external_change(self, manager, tmp_path):
+        other = LLMTaskLifecycleManager(tmp_path)
+        other.add_task_dependency("001-T4", "001-T3")
+
+        assert manager.get_critical_path("001") == ["001-T1", "001-T2", "001-T3", "001-T4"]
+
+    def test_failure_blocks_transitive_dependents(self, manager):
+        for task_id in ("001-T1", "001-T2", "001-T3"):
+            manager.status_manager.update_task_status(task_id, TaskStatus.IN_PROGRESS)
+
+        manager.record_lifecycle_event("001-T1", LifecycleEvent.FAILED)
+
+        statuses = manager.status_manager.get_task_statuses(["001-T2", "001-T3"])
+        assert statuses == {"001-T2": TaskStatus.BLOCKED, "001-T3": TaskStatus.BLOCKED}
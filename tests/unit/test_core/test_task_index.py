@@ -0,0 +1,93 @@
+"""
+Tests for the task metadata index
+"""
+
+import pytest
+
+from specpulse.core import task_index as task_index_module
+from specpulse.core.task_index import TaskIndex, parse_task_header, count_tasks
+
+
+TASK_FILE = """# Task Breakdown
+
+<!-- SPECPULSE_METADATA
+FEATURE_ID: 001
+TASK_ID: 001
+STATUS: in_progress
+PROGRESS: 40
+-->
+
+**Started**: 2026-01-02 10:00:00
+
+### Task: First
+- **Status**: completed
+
+### Task: Second
+- **Status**: pending
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".specpulse").mkdir()
+    (tmp_path / "tasks" / "001-auth").mkdir(parents=True)
+    return tmp_path
+
+
+def make_index(project):
+    return TaskIndex(project, project / ".specpulse" / "cache" / "task-index.json")
+
+
+class TestParsing:
+    def test_header_fields(self):
+        header = parse_task_header(TASK_FILE)
+        assert header["task_id"] == "001"
+        assert header["status"] == "in_progress"
+        assert header["progress"] == 40
+        assert header["started"] == "2026-01-02 10:00:00"
+        assert header["completed"] is None
+
+    def test_defaults_without_metadata(self):
+        header = parse_task_header("# Tasks\n")
+        assert (header["status"], header["progress"]) == ("pending", 0)
+
+    def test_counts(self):
+        assert count_tasks(TASK_FILE) == {"total": 2, "completed": 1, "in_progress": 0, "pending": 1}
+
+
+class TestTaskIndex:
+    def test_unchanged_files_are_not_read(self, project, monkeypatch):
+        path = project / "tasks" / "001-auth" / "tasks-001.md"
+        path.write_text(TASK_FILE)
+        index = make_index(project)
+        index.get(path)
+        index.counts(path)
+        assert index.save()
+
+        reads = []
+        monkeypatch.setattr(task_index_module, "read_task_header",
+                            lambda p, limit=4096: reads.append(p) or "")
+        fresh = make_index(project)
+        assert fresh.get(path)["status"] == "in_progress"
+        assert fresh.counts(path)["total"] == 2
+        assert reads == []
+
+    def test_changed_files_read_header_only(self, project):
+        path = project / "tasks" / "001-auth" / "tasks-001.md"
+        path.write_text(TASK_FILE)
+        index = make_index(project)
+        index.get(path)
+
+        body = "\n".join(f"### Task: T{i}\n- **Status**: pending" for i in range(2000))
+        path.write_text(TASK_FILE.replace("STATUS: in_progress", "STATUS: completed") + body)
+        assert index.get(path)["status"] == "completed"
+        assert index.get(path)["counts"] is None
+        assert index.counts(path)["pending"] == 2001
+
+    def test_record_uses_written_content(self, project):
+        path = project / "tasks" / "001-auth" / "tasks-001.md"
+        path.write_text(TASK_FILE)
+        index = make_index(project)
+        index.record(path, TASK_FILE)
+
+        assert index.get(path)["counts"]["completed"] == 1
@@ -0,0 +1,87 @@
+"""
+Tests for lease-based scheduling of ready tasks
+"""
+
+import json
+
+import pytest
+
+from specpulse.core.llm_task_lifecycle_manager import LLMTaskLifecycleManager, LifecycleEvent
+from specpulse.core.llm_task_status_manager import TaskStatus
+from specpulse.core.task_scheduler import TaskScheduler
+
+
+@pytest.fixture
+def manager(tmp_path):
+    # T1 -> T2 -> T3 is the long chain, T9 -> T4 the short one
+    manager = LLMTaskLifecycleManager(tmp_path)
+    manager.add_task_dependency("001-T2", "001-T1")
+    manager.add_task_dependency("001-T3", "001-T2")
+    manager.add_task_dependency("001-T4", "001-T9")
+    return manager
+
+
+@pytest.fixture
+def scheduler(tmp_path, manager):
+    return TaskScheduler(tmp_path, manager)
+
+
+def expire(scheduler, task_id):
+    state = json.loads(scheduler.leases_file.read_text())
+    state["leases"][task_id]["expires_at"] = "2000-01-01T00:00:00"
+    scheduler.leases_file.write_text(json.dumps(state))
+
+
+class TestTaskScheduler:
+    def test_claim_hands_out_critical_path_first(self, scheduler, manager):
+        leases = scheduler.claim("agent-1", max_tasks=1)
+
+        assert [lease["task_id"] for lease in leases] == ["001-T1"]
+        assert manager.status_manager.get_task_status("001-T1") == TaskStatus.IN_PROGRESS
+
+    def test_agents_never_share_a_task(self, scheduler):
+        first = scheduler.claim("agent-1", max_tasks=5)
+        second = scheduler.claim("agent-2", max_tasks=5)
+
+        assert [lease["task_id"] for lease in first] == ["001-T1", "001-T9"]
+        assert second == []
+        assert set(scheduler.get_leases()) == {"001-T1", "001-T9"}
+
+    def test_complete_returns_unblocked_dependents(self, scheduler, manager):
+        scheduler.claim("agent-1", max_tasks=2)
+
+        assert scheduler.complete("agent-2", "001-T1") == []
+        assert scheduler.complete("agent-1", "001-T1") == ["001-T2"]
+        assert manager.status_manager.get_task_status("001-T1") == TaskStatus.COMPLETED
+        assert [lease["task_id"] for lease in scheduler.claim("agent-2")] == ["001-T2"]
+
+    def test_expired_lease_is_reclaimed_and_reissued(self, scheduler, manager):
+        scheduler.claim("agent-1")
+        expire(scheduler, "001-T1")
+
+        assert scheduler.reclaim_expired() == ["001-T1"]
+        assert manager.status_manager.get_task_status("001-T1") == TaskStatus.BLOCKED
+        last_event = manager.get_task_lifecycle_status("001-T1")["last_event"]
+        assert last_event["event"] == LifecycleEvent.TIMEOUT.value
+
+        leases = scheduler.claim("agent-2", max_tasks=2)
+        assert [lease["task_id"] for lease in leases] == ["001-T1", "001-T9"]
+        assert manager.status_manager.get_task_status("001-T1") == TaskStatus.IN_PROGRESS
+
+    def test_reclaimed_task_cancelled_before_reissue(self, scheduler, manager):
+        scheduler.claim("agent-1")
+        expire(scheduler, "001-T1")
+        scheduler.reclaim_expired()
+        manager.status_manager.update_task_status("001-T1", TaskStatus.CANCELLED)
+
+        assert [lease["task_id"] for lease in scheduler.claim("agent-2")] == ["001-T9"]
+        assert json.loads(scheduler.leases_file.read_text())["reclaimed"] == []
+        assert manager.status_manager.get_task_status("001-T1") == TaskStatus.CANCELLED
+
+    def test_renew_only_by_holder(self, scheduler):
+        scheduler.claim("agent-1", lease_seconds=60)
+        before = scheduler.get_leases()["001-T1"]["expires_at"]
+
+        assert not scheduler.renew("agent-2", "001-T1")
+        assert scheduler.renew("agent-1", "001-T1", lease_seconds=600)
+        assert scheduler.get_leases()["001-T1"]["expires_at"] > before
@@ -1,7 +1,9 @@
 """
-Tests for Time-Based Template Cache
+Tests for Template Cache
 
 Verifies:
+- Source file validation
+- LRU size bounds
 - TTL expiration
 - Manual invalidation
 - Thread safety
@@ -294,6 +296,131 @@ class TestGlobalCache:
         assert result == "shared_value"
 
 
+class TestSourceValidation:
+    """Entries tied to a source file follow its stat signature"""
+
+    def test_unchanged_source_is_not_reloaded(self, tmp_path):
+        """Test that an unchanged file is served from memory"""
+        path = tmp_path / "spec.md"
+        path.write_text("v1")
+        cache = TemplateCache()
+        loader = Mock(side_effect=lambda: path.read_text())
+
+        assert cache.get("spec", loader, source=path) == "v1"
+        assert cache.get("spec", loader, source=path) == "v1"
+        loader.assert_called_once()
+
+    def test_changed_source_is_reloaded(self, tmp_path):
+        """Test that an edited file is picked up on the next access"""
+        path = tmp_path / "spec.md"
+        path.write_text("v1")
+        cache = TemplateCache()
+
+        cache.get("spec", path.read_text, source=path)
+        path.write_text("version 2")
+
+        assert cache.get("spec", path.read_text, source=path) == "version 2"
+
+    def test_missing_source_reloaded_once_created(self, tmp_path):
+        """Test that a fallback for a missing file is replaced when it appears"""
+        path = tmp_path / "spec.md"
+        cache = TemplateCache()
+
+        assert cache.get("spec", lambda: "fallback", source=path) == "fallback"
+        assert cache.get("spec", lambda: "unused", source=path) == "fallback"
+
+        path.write_text("from file")
+        assert cache.get("spec", path.read_text, source=path) == "from file"
+
+    def test_no_expiry_without_ttl(self):
+        """Test that entries do not expire by default"""
+        cache = TemplateCache()
+        cache.get("key", lambda: "value")
+
+        assert cache.contains("key")
+        assert cache.get_stats()['ttl_seconds'] is None
+
+
+class TestBounds:
+    """LRU eviction by entry count and size"""
+
+    def test_max_entries_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted first"""
+        cache = TemplateCache(max_entries=2)
+        cache.get("a", lambda: "1")
+        cache.get("b", lambda: "2")
+        cache.get("a", lambda: "unused")  # a is now most recently used
+        cache.get("c", lambda: "3")
+
+        assert cache.contains("a")
+        assert not cache.contains("b")
+        assert cache.contains("c")
+        assert cache.get_stats()['evictions'] == 1
+
+    def test_max_bytes(self):
+        """Test that the total size of cached values is bounded"""
+        cache = TemplateCache(max_bytes=10)
+        cache.get("a", lambda: "x" * 6)
+        cache.get("b", lambda: "y" * 6)
+
+        stats = cache.get_stats()
+        assert stats['size'] == 1
+        assert stats['bytes'] == 6
+        assert cache.contains("b")
+
+    def test_single_oversized_value_is_cached(self):
+        """Test that a value larger than the bound is still served from cache"""
+        cache = TemplateCache(max_bytes=4)
+        loader = Mock(return_value="x" * 8)
+
+        cache.get("big", loader)
+        cache.get("big", loader)
+        loader.assert_called_once()
+
+
+class TestPerKeyLoading:
+    """Misses on different keys do not serialize"""
+
+    def test_different_keys_load_concurrently(self):
+        """Test that two slow loaders for different keys overlap"""
+        cache = TemplateCache()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def loader(value):
+            barrier.wait()  # Deadlocks (times out) if loads are serialized
+            return value
+
+        results = {}
+        threads = [
+            threading.Thread(target=lambda k=k: results.update({k: cache.get(k, lambda: loader(k))}))
+            for k in ("a", "b")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {"a": "a", "b": "b"}
+
+    def test_same_key_loads_once(self):
+        """Test that concurrent misses on one key call the loader once"""
+        cache = TemplateCache()
+        calls = []
+
+        def slow_loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return "template"
+
+        threads = [threading.Thread(target=cache.get, args=("key", slow_loader)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+
+
 class TestPerformance:
     """Performance tests"""
 
@@ -0,0 +1,102 @@
+"""
+Tests for cached template compilation and streaming previews
+"""
+
+import pytest
+
+from specpulse.core import template_manager
+from specpulse.core.template_manager import TemplateManager
+from specpulse.utils.error_handler import TemplateError
+
+
+@pytest.fixture
+def manager(temp_project_dir):
+    return TemplateManager(temp_project_dir)
+
+
+def write_template(manager, name, content):
+    path = manager.templates_dir / name
+    path.write_text(content)
+    return path
+
+
+def count_scans(manager, monkeypatch):
+    scans = []
+    original = manager.validator.validate_template
+
+    def validate(content, path=None):
+        scans.append(path)
+        return original(content, path)
+
+    monkeypatch.setattr(manager.validator, "validate_template", validate)
+    return scans
+
+
+class TestTemplatePreview:
+    def test_security_scanned_once_per_content(self, manager, monkeypatch):
+        path = write_template(manager, "spec.md", "# {{ feature_name }}")
+        scans = count_scans(manager, monkeypatch)
+
+        assert manager.get_template_preview(path) == "# User Authentication"
+        assert manager.get_template_preview(path) == "# User Authentication"
+        assert len(scans) == 1
+
+        path.write_text("## {{ feature_name }}")
+        assert manager.get_template_preview(path) == "## User Authentication"
+        assert len(scans) == 2
+
+    def test_unsafe_verdict_is_remembered(self, manager):
+        path = write_template(manager, "bad.md", "{{ config.items() }}")
+
+        for _ in range(2):
+            with pytest.raises(TemplateError, match="security vulnerabilities"):
+                manager.get_template_preview(path)
+
+    def test_compiled_template_shared_between_managers(self, manager, temp_project_dir):
+        path = write_template(manager, "plan.md", "Stack: {{ backend_stack }}")
+        manager.get_template_preview(path)
+
+        checksum = manager._calculate_checksum(path.read_text())
+        compiled = template_manager._compiled_templates[checksum]
+
+        other = TemplateManager(temp_project_dir)
+        assert other.get_template_preview(path, {"backend_stack": "Go"}) == "Stack: Go"
+        assert template_manager._compiled_templates[checksum] is compiled
+
+    def test_compiled_cache_is_bounded(self, manager, monkeypatch):
+        monkeypatch.setattr(template_manager, "COMPILED_TEMPLATE_LIMIT", 2)
+        for i in range(4):
+            path = write_template(manager, f"t{i}.md", f"{i} {{{{ spec_id }}}}")
+            manager.get_template_preview(path)
+
+        assert len(template_manager._compiled_templates) <= 2
+
+    def test_security_verdicts_are_bounded(self, manager, monkeypatch):
+        monkeypatch.setattr(template_manager, "COMPILED_TEMPLATE_LIMIT", 2)
+        scans = count_scans(manager, monkeypatch)
+        paths = [write_template(manager, f"v{i}.md", f"{i} {{{{ spec_id }}}}") for i in range(3)]
+
+        for path in paths:
+            manager.get_template_preview(path)
+        manager.get_template_preview(paths[2])
+
+        assert len(manager._security_verdicts) == 2
+        assert len(scans) == 3
+
+        manager.get_template_preview(paths[0])  # Evicted, scanned again
+        assert len(scans) == 4
+
+    def test_stream_matches_render(self, manager):
+        content = "{% for line in lines %}- {{ line }}\n{% endfor %}"
+        path = write_template(manager, "list.md", content)
+        data = {"lines": ["a", "b", "<c>"]}
+
+        chunks = list(manager.stream_template_preview(path, data))
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == manager.get_template_preview(path, data)
+        assert "&lt;c&gt;" in "".join(chunks)
+
+    def test_stream_reports_errors_before_rendering(self, manager, temp_project_dir):
+        with pytest.raises(TemplateError):
+            manager.stream_template_preview(temp_project_dir / "missing.md")
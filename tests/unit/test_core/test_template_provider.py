@@ -86,6 +86,25 @@ class TestTemplateProvider:
 
         assert result == "Feature: user-auth, ID: 001"
 
+    def test_cache_sees_template_edits(self, temp_resources):
+        """Test that a modified template file is not served stale"""
+        provider = TemplateProvider(temp_resources, use_cache=True)
+        spec_path = temp_resources / "templates" / "spec.md"
+
+        provider.get_spec_template()
+        spec_path.write_text("# Edited spec template\n")
+
+        assert provider.get_spec_template() == "# Edited spec template\n"
+
+    def test_generic_templates_are_cached(self, temp_resources):
+        """Test that get_template goes through the cache too"""
+        provider = TemplateProvider(temp_resources, use_cache=True)
+        template_path = temp_resources / "templates" / "spec.md"
+
+        provider.get_template("spec.md")
+
+        assert provider._cache.contains(str(template_path))
+
 
 class TestCaching:
     """Test caching behavior"""
@@ -0,0 +1,150 @@
+"""
+Tests for the persistent validation result cache
+
+Verifies:
+- Content-hash keyed hits and misses
+- Invalidation on content, rule-set and strictness changes
+- Persistence under .specpulse/cache/
+- Integration with Validator.validate_all (hit/miss reporting, use_cache=False)
+"""
+
+import pytest
+from pathlib import Path
+
+from specpulse.core.validation_cache import ValidationCache
+from specpulse.core.validator import Validator
+
+
+SPEC_CONTENT = """# Spec
+## Specification: Test
+## Metadata
+## Functional Requirements
+## User Stories
+## Acceptance Criteria
+- [ ] Works
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Minimal project with one spec and one plan"""
+    for dir_name in [".specpulse", "memory", "specs", "plans", "templates", "scripts"]:
+        (tmp_path / dir_name).mkdir()
+    (tmp_path / "specs" / "001-test").mkdir()
+    (tmp_path / "specs" / "001-test" / "spec.md").write_text(SPEC_CONTENT)
+    (tmp_path / "plans" / "001-test").mkdir()
+    (tmp_path / "plans" / "001-test" / "plan.md").write_text("# Plan\n## Architecture Overview\n")
+    return tmp_path
+
+
+class TestValidationCache:
+    """Unit tests for ValidationCache"""
+
+    def test_miss_then_hit(self, project):
+        """Test that stored results are returned for identical content"""
+        spec_path = project / "specs" / "001-test" / "spec.md"
+        cache = ValidationCache(project, "standard", "v1")
+
+        assert cache.get(spec_path, SPEC_CONTENT) is None
+        cache.put(spec_path, SPEC_CONTENT, [{"status": "success", "message": "ok"}])
+
+        assert cache.get(spec_path, SPEC_CONTENT) == [{"status": "success", "message": "ok"}]
+        stats = cache.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+
+    def test_content_change_is_miss(self, project):
+        """Test that modified content is not served from cache"""
+        spec_path = project / "specs" / "001-test" / "spec.md"
+        cache = ValidationCache(project, "standard", "v1")
+        cache.put(spec_path, SPEC_CONTENT, [{"status": "success", "message": "ok"}])
+
+        assert cache.get(spec_path, SPEC_CONTENT + "\nchanged") is None
+
+    def test_persisted_across_instances(self, project):
+        """Test that saved entries are loaded by a new cache instance"""
+        spec_path = project / "specs" / "001-test" / "spec.md"
+        cache = ValidationCache(project, "standard", "v1")
+        cache.put(spec_path, SPEC_CONTENT, [{"status": "success", "message": "ok"}])
+        assert cache.save() is True
+        assert (project / ".specpulse" / "cache" / "validation_cache.json").exists()
+
+        reloaded = ValidationCache(project, "standard", "v1")
+        assert reloaded.get(spec_path, SPEC_CONTENT) is not None
+
+    @pytest.mark.parametrize("strictness,rules_version", [
+        ("strict", "v1"),
+        ("standard", "v2"),
+    ])
+    def test_strictness_and_rules_version_in_key(self, project, strictness, rules_version):
+        """Test that strictness and rule-set changes invalidate entries"""
+        spec_path = project / "specs" / "001-test" / "spec.md"
+        cache = ValidationCache(project, "standard", "v1")
+        cache.put(spec_path, SPEC_CONTENT, [{"status": "success", "message": "ok"}])
+        cache.save()
+
+        other = ValidationCache(project, strictness, rules_version)
+        assert other.get(spec_path, SPEC_CONTENT) is None
+
+    def test_corrupted_cache_file_ignored(self, project):
+        """Test that an unreadable cache file is treated as empty"""
+        cache_dir = project / ".specpulse" / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "validation_cache.json").write_text("{not json")
+
+        cache = ValidationCache(project, "standard", "v1")
+        assert cache.get_stats()['size'] == 0
+
+    def test_no_specpulse_dir_not_persisted(self, tmp_path):
+        """Test that the cache never creates .specpulse/ as a side effect"""
+        cache = ValidationCache(tmp_path, "standard", "v1")
+        cache.put(tmp_path / "spec.md", SPEC_CONTENT, [])
+
+        assert cache.save() is False
+        assert not (tmp_path / ".specpulse").exists()
+
+
+class TestValidatorCaching:
+    """Integration of ValidationCache with Validator.validate_all"""
+
+    def test_second_run_served_from_cache(self, project):
+        """Test that unchanged files hit the cache on the next run"""
+        first = Validator().validate_all(project)
+        validator = Validator()
+        second = validator.validate_all(project)
+
+        assert validator.cache_stats == {
+            'hits': 2, 'misses': 0, 'hit_rate': 100.0, 'size': 2
+        }
+        strip = [r for r in first if "cache_hits" not in r]
+        assert strip == [r for r in second if "cache_hits" not in r]
+        assert any(r.get("cache_hits") == 2 for r in second)
+
+    def test_modified_file_revalidated(self, project):
+        """Test that only the modified file misses the cache"""
+        Validator().validate_all(project)
+        spec_path = project / "specs" / "001-test" / "spec.md"
+        spec_path.write_text(SPEC_CONTENT.replace("## User Stories\n", ""))
+
+        validator = Validator()
+        results = validator.validate_all(project)
+
+        assert validator.cache_stats['hits'] == 1
+        assert validator.cache_stats['misses'] == 1
+        assert any("Missing required sections" in r["message"] for r in results)
+
+    def test_use_cache_false_bypasses_cache(self, project):
+        """Test the --no-cache escape hatch"""
+        Validator().validate_all(project)
+
+        validator = Validator()
+        results = validator.validate_all(project, use_cache=False)
+
+        assert validator.cache_stats is None
+        assert not any("cache_hits" in r for r in results)
+
+    def test_rules_version_is_stable(self):
+        """Test that the registry fingerprint is deterministic"""
+        validator = Validator()
+        assert validator.rules_registry.get_rules_version() == \
+            validator.rules_registry.get_rules_version()
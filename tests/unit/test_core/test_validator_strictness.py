@@ -0,0 +1,88 @@
+"""
+Tests for Validator.validate_all strictness levels
+"""
+
+import pytest
+
+from specpulse.core.validator import Validator
+
+
+SPEC_CONTENT = """# Spec
+## Specification: Test
+## Metadata
+## Functional Requirements
+## User Stories
+## Acceptance Criteria
+- [ ] Works
+needs clarification on scope
+"""
+
+TASK_CONTENT = """# Tasks
+### T001: First
+### Bad header
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project with a spec, a plan and a task breakdown"""
+    for dir_name in [".specpulse", "memory", "specs", "plans", "tasks", "templates"]:
+        (tmp_path / dir_name).mkdir()
+    for kind in ("specs", "plans", "tasks"):
+        (tmp_path / kind / "001-test").mkdir()
+    (tmp_path / "specs" / "001-test" / "spec.md").write_text(SPEC_CONTENT)
+    (tmp_path / "plans" / "001-test" / "plan.md").write_text("# Plan\n## Architecture Overview\n")
+    (tmp_path / "tasks" / "001-test" / "tasks.md").write_text(TASK_CONTENT)
+    return tmp_path
+
+
+def file_results(results, prefix):
+    return [r for r in results if r.get("message", "").startswith(prefix)]
+
+
+class TestStrictnessLevels:
+    """Every strictness level runs and validates task breakdowns"""
+
+    @pytest.mark.parametrize("strictness", ["basic", "standard", "comprehensive", "strict"])
+    def test_level_runs_and_validates_tasks(self, project, strictness):
+        """Test that each level completes and reports on the task file"""
+        results = Validator().validate_all(project, strictness=strictness, use_cache=False)
+
+        assert file_results(results, "001-test/tasks.md")
+
+    def test_basic_keeps_only_errors(self, project):
+        """Test that basic validation drops warnings and info"""
+        results = Validator().validate_all(project, strictness="basic", use_cache=False)
+
+        statuses = {r["status"] for r in file_results(results, "001-test")}
+        assert statuses <= {"error", "success"}
+
+    def test_standard_reports_warnings_and_task_errors(self, project):
+        """Test that standard validation reports spec warnings and task errors"""
+        results = Validator().validate_all(project, use_cache=False)
+
+        assert any(r["status"] == "warning" for r in file_results(results, "001-test:"))
+        assert any("Invalid task format" in r["message"]
+                   for r in file_results(results, "001-test/tasks.md"))
+
+    def test_strict_checks_naming_and_references(self, project):
+        """Test the cross-reference and naming checks of strict validation"""
+        (project / "plans" / "002-orphan").mkdir()
+        (project / "specs" / "Bad_Name").mkdir()
+
+        results = Validator().validate_all(project, strictness="strict", use_cache=False)
+        messages = [r["message"] for r in results]
+
+        assert "002-orphan: plans exist without a specification" in messages
+        assert any(m.startswith("specs/Bad_Name:") for m in messages)
+
+    @pytest.mark.parametrize("strictness", ["basic", "comprehensive"])
+    def test_levels_are_cached(self, project, strictness):
+        """Test that non-standard levels are served from the cache too"""
+        first = Validator().validate_all(project, strictness=strictness)
+        validator = Validator()
+        second = validator.validate_all(project, strictness=strictness)
+
+        assert validator.cache_stats['hits'] == 3
+        assert [r for r in first if "cache_hits" not in r] == \
+            [r for r in second if "cache_hits" not in r]
@@ -394,6 +394,44 @@ class TestMemoryManager:
         assert isinstance(stats.memory_size_mb, float)
         assert stats.memory_size_mb >= 0
 
+    def test_incremental_stats_match_full_recalculation(self):
+        """Test that stats maintained per update equal a full recount"""
+        manager = MemoryManager(self.project_path)
+
+        manager.update_context(feature_name="Feature A", feature_id="001", action="feature_created")
+        manager.update_context(feature_name="Feature B", feature_id="002", action="feature_created")
+        manager.update_context(feature_name="Feature A", feature_id="001", action="feature_completed")
+        manager.add_decision_record(DecisionRecord(
+            id="001", title="Test Decision", status="accepted", date="2024-01-01",
+            author="Test Author", rationale="Test rationale", alternatives_considered=[],
+            consequences=[], related_decisions=[], tags=[]
+        ))
+
+        stats = manager.memory_stats
+        full = manager._calculate_memory_stats()
+        assert (stats.total_context_entries, stats.total_decisions) == (3, 1)
+        assert (stats.active_features, stats.completed_features) == (1, 1)
+        assert stats.memory_size_bytes == full.memory_size_bytes
+
+    def test_update_does_not_scan_memory_dir(self):
+        """Test that memory updates do not walk the memory directory"""
+        manager = MemoryManager(self.project_path)
+
+        with patch.object(Path, "rglob", side_effect=AssertionError("full scan")):
+            assert manager.update_context(feature_name="Feature A", feature_id="001", action="feature_created")
+            assert MemoryManager(self.project_path).memory_stats.total_context_entries == 1
+
+    def test_stats_recalculated_on_drift(self):
+        """Test that stats are recounted when they no longer match the index"""
+        manager = MemoryManager(self.project_path)
+        manager.update_context(feature_name="Feature A", feature_id="001", action="feature_created")
+
+        data = json.loads(manager.memory_stats_path.read_text())
+        data["total_context_entries"] = 42
+        manager.memory_stats_path.write_text(json.dumps(data))
+
+        assert MemoryManager(self.project_path).memory_stats.total_context_entries == 1
+
     def test_update_context_file(self):
         """Test context.md file update"""
         manager = MemoryManager(self.project_path)
@@ -500,4 +538,63 @@ class TestMemoryStats:
 
         assert stats.total_decisions == 5
         assert stats.active_features == 2
-        assert stats.memory_size_mb == 1.5
\ No newline at end of file
+        assert stats.memory_size_mb == 1.5
+
+
+class TestTaggedContextCache:
+    """Test parsed tagged sections of context.md"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.project_path = Path(self.temp_dir)
+        (self.project_path / "memory").mkdir(exist_ok=True)
+        self.manager = MemoryManager(self.project_path)
+        self.manager._initialize_tagged_memory()
+        self.manager.add_decision("Use PostgreSQL", "Relational data", ["001"])
+        self.manager.add_decision("Use Redis", "Caching", ["001", "002"])
+        self.manager.add_pattern("Repository pattern", "class Repo: ...", ["002"])
+
+    def teardown_method(self):
+        """Clean up test fixtures"""
+        if Path(self.temp_dir).exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_query_relevant_by_feature(self):
+        """Test per-feature lookups"""
+        assert [e.id for e in self.manager.query_relevant("001")] == ["DEC-001", "DEC-002"]
+        assert [e.id for e in self.manager.query_relevant("002")] == ["DEC-002"]
+        assert self.manager.query_relevant("999") == []
+        assert [e.id for e in self.manager.query_by_tag("decision", feature="002")] == ["DEC-002"]
+
+    def test_context_parsed_once_until_changed(self):
+        """Test that repeated queries reuse the parsed context"""
+        self.manager.query_by_tag("decision")
+
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            self.manager.query_by_tag("pattern")
+            self.manager.query_relevant("001")
+
+        self.manager.add_constraint("No global state", "Keep modules pure")
+        assert [e.id for e in self.manager.query_by_tag("constraint")] == ["CONST-001"]
+
+    def test_recent_limit_does_not_mutate_cache(self):
+        """Test that returned lists can be modified by callers"""
+        entries = self.manager.query_by_tag("decision")
+        entries.clear()
+        assert len(self.manager.query_by_tag("decision", recent=1)) == 1
+        assert len(self.manager.query_by_tag("decision")) == 2
+
+    def test_returned_entries_are_copies(self):
+        """Test that mutating a returned entry does not change later results"""
+        entry = self.manager.query_by_tag("decision")[0]
+        entry.title = "Changed"
+        entry.related_features.append("999")
+
+        relevant = self.manager.query_relevant("001")[0]
+        relevant.tags.clear()
+
+        fresh = self.manager.query_by_tag("decision")[0]
+        assert fresh.title != "Changed"
+        assert "999" not in fresh.related_features
+        assert fresh.tags
@@ -7,13 +7,20 @@ from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
 import json
 from pathlib import Path
+import subprocess
 import tempfile
 
+from specpulse.utils import version_check
 from specpulse.utils.version_check import (
     check_pypi_version,
     compare_versions,
     should_check_version,
-    get_update_message
+    get_update_message,
+    get_cached_latest_version,
+    read_version_cache,
+    refresh_version_cache,
+    start_background_version_check,
+    write_version_cache
 )
 
 
@@ -126,4 +133,79 @@ class TestVersionCheck:
         # When versions are the same, there should be no update message
         message = get_update_message("1.2.3", "1.2.3", False)
         # The message format depends on implementation
-        assert isinstance(message, str)
\ No newline at end of file
+        assert isinstance(message, str)
+
+
+class TestVersionCache:
+    """Test the persisted, background-refreshed version check"""
+
+    @pytest.fixture(autouse=True)
+    def home(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        return tmp_path
+
+    def test_should_check_without_cache(self):
+        assert read_version_cache() is None
+        assert should_check_version() is True
+
+    def test_should_not_check_with_recent_cache(self):
+        assert write_version_cache("1.2.3")
+        assert should_check_version() is False
+        assert get_cached_latest_version() == "1.2.3"
+
+    def test_should_check_with_stale_or_legacy_cache(self, home):
+        write_version_cache("1.2.3", last_check=datetime.now() - timedelta(hours=25))
+        assert should_check_version() is True
+
+        # Older releases only touched an empty file
+        (home / ".specpulse" / "last_version_check").write_text("")
+        assert should_check_version() is True
+
+    def test_refresh_stores_latest_version(self):
+        with patch.object(version_check, "check_pypi_version", return_value="9.9.9"):
+            assert refresh_version_cache() == "9.9.9"
+        assert get_cached_latest_version() == "9.9.9"
+        assert should_check_version() is False
+
+    def test_failed_refresh_keeps_previous_version(self):
+        write_version_cache("1.2.3", last_check=datetime.now() - timedelta(hours=25))
+        with patch.object(version_check, "check_pypi_version", return_value=None):
+            assert refresh_version_cache() is None
+        assert get_cached_latest_version() == "1.2.3"
+        assert should_check_version() is False
+
+    def test_background_check_is_detached(self):
+        write_version_cache("1.2.3", last_check=datetime.now() - timedelta(hours=25))
+        with patch("subprocess.Popen") as mock_popen:
+            assert start_background_version_check() is True
+
+        args, kwargs = mock_popen.call_args
+        assert "refresh_version_cache" in args[0][-1]
+        assert kwargs["stdout"] == kwargs["stderr"] == subprocess.DEVNULL
+        mock_popen.return_value.wait.assert_not_called()
+        # The slot is claimed before the check finishes
+        assert should_check_version() is False
+        assert get_cached_latest_version() == "1.2.3"
+
+    def test_check_pypi_version_leaves_socket_default(self):
+        import socket
+
+        with patch("urllib.request.urlopen", side_effect=OSError("offline")) as mock_urlopen:
+            assert check_pypi_version(timeout=1) is None
+
+        assert mock_urlopen.call_args.kwargs["timeout"] == 1
+        assert socket.getdefaulttimeout() is None
+
+    def test_handler_reports_cached_version_without_network(self, tmp_path, monkeypatch):
+        from specpulse.cli.handlers.command_handler import CommandHandler
+
+        monkeypatch.chdir(tmp_path)
+        write_version_cache("999.0.0", last_check=datetime.now() - timedelta(hours=25))
+        with patch.object(version_check, "check_pypi_version") as mock_check, \
+                patch("subprocess.Popen") as mock_popen, \
+                patch("specpulse.utils.console.Console.info") as mock_info:
+            CommandHandler(no_color=True)
+
+        mock_check.assert_not_called()
+        mock_popen.assert_called_once()
+        assert any("999.0.0" in str(call.args[0]) for call in mock_info.call_args_list)